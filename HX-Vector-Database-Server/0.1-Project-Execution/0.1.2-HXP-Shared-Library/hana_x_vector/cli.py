@@ -0,0 +1,153 @@
+"""
+Command Line Interface
+======================
+
+hana-x-vector command for offline data movement.
+
+Commands:
+- load: Bulk load a .npy, .fvecs or Arrow IPC vector file into a collection
+- export: Export a collection to a directory of columnar segments
+- import: Import an exported collection
+"""
+
+from typing import Dict, Any, List, Optional
+import argparse
+import asyncio
+import json
+import sys
+from .qdrant.client import QdrantClient
+from .utils.config import ConfigManager
+from .utils.exceptions import VectorDatabaseError
+from .vector_ops.batch import BatchProcessor
+from .vector_ops.bulk_loader import BulkLoader, VectorFile
+from .vector_ops.transfer import CollectionExporter, CollectionImporter, read_manifest
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(prog="hana-x-vector", description="HANA-X Vector data tools")
+    parser.add_argument("--config", help="JSON or YAML configuration file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    load = commands.add_parser("load", help="Bulk load a vector file into a collection")
+    load.add_argument("collection", help="Target collection")
+    load.add_argument("vectors", help=".npy, .fvecs or Arrow IPC vector file")
+    load.add_argument("--payloads", help="JSON lines or Parquet payload sidecar")
+    load.add_argument("--format", choices=["npy", "fvecs", "arrow"], help="Vector file format")
+    load.add_argument("--start-id", type=int, default=0, help="First id for rows without an id")
+    load.add_argument("--window-size", type=int, help="Rows per window")
+    load.add_argument("--parallelism", type=int, help="Windows inserted concurrently")
+    load.add_argument("--create", action="store_true", help="Create the collection if missing")
+    load.add_argument("--distance", default="Cosine", help="Distance metric for --create")
+    
+    export = commands.add_parser("export", help="Export a collection")
+    export.add_argument("collection", help="Collection to export")
+    export.add_argument("directory", help="Export directory; an unfinished export is resumed")
+    export.add_argument("--partitions", type=int, help="Id-range partitions scrolled in parallel")
+    
+    restore = commands.add_parser("import", help="Import an exported collection")
+    restore.add_argument("directory", help="Export directory")
+    restore.add_argument("--collection", help="Target collection, defaults to the exported one")
+    restore.add_argument("--parallelism", type=int, help="Segments inserted concurrently")
+    restore.add_argument("--create", action="store_true", help="Create the collection if missing")
+    restore.add_argument("--distance", default="Cosine", help="Distance metric for --create")
+    
+    return parser
+
+
+async def _ensure_collection(client: QdrantClient, name: str, dimension: int, distance: str):
+    """Create a collection unless it already exists."""
+    try:
+        await client.get_collection_info(name)
+    except Exception:
+        await client.create_collection(name=name, vector_size=dimension, distance=distance)
+
+
+async def _load(args: argparse.Namespace, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the load command."""
+    if args.window_size:
+        config.setdefault("bulk_load", {})["window_size"] = args.window_size
+    
+    batch_processor = BatchProcessor(config)
+    loader = BulkLoader(config, batch_processor)
+    await batch_processor.startup()
+    try:
+        if args.create:
+            vector_file = VectorFile(args.vectors, args.format, loader.vector_column, loader.id_column)
+            await _ensure_collection(
+                batch_processor.qdrant_client, args.collection, vector_file.dimension, args.distance
+            )
+        return await loader.load(
+            args.collection,
+            args.vectors,
+            payload_path=args.payloads,
+            format=args.format,
+            start_id=args.start_id,
+            parallelism=args.parallelism
+        )
+    finally:
+        await batch_processor.shutdown()
+
+
+async def _export(args: argparse.Namespace, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the export command."""
+    client = QdrantClient(config)
+    exporter = CollectionExporter(config, client)
+    await client.startup()
+    try:
+        return await exporter.export_collection(args.collection, args.directory, args.partitions)
+    finally:
+        await client.shutdown()
+
+
+async def _import(args: argparse.Namespace, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the import command."""
+    batch_processor = BatchProcessor(config)
+    importer = CollectionImporter(config, batch_processor)
+    await batch_processor.startup()
+    try:
+        if args.create:
+            manifest = read_manifest(args.directory)
+            await _ensure_collection(
+                batch_processor.qdrant_client,
+                args.collection or manifest["collection"],
+                manifest["dimension"],
+                args.distance
+            )
+        return await importer.import_collection(args.directory, args.collection, args.parallelism)
+    finally:
+        await batch_processor.shutdown()
+
+
+COMMANDS = {
+    "load": _load,
+    "export": _export,
+    "import": _import
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the hana-x-vector command.
+    
+    Args:
+        argv: Command line arguments, defaults to sys.argv
+    
+    Returns:
+        Exit status
+    """
+    args = build_parser().parse_args(argv)
+    
+    try:
+        config = ConfigManager(args.config).get_all_config()
+        result = asyncio.run(COMMANDS[args.command](args, config))
+    except VectorDatabaseError as e:
+        print(f"hana-x-vector {args.command}: {e}", file=sys.stderr)
+        return 1
+    
+    print(json.dumps(result, indent=2, default=str))
+    return 1 if result.get("error_count") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
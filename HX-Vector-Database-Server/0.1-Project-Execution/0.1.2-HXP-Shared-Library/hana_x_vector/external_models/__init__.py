@@ -9,14 +9,23 @@ Components:
 - IntegrationPatternManager: Manages different integration patterns
 - ModelClients: Client connections to external AI models
 - ConnectionPool: Connection pooling and management
+- EmbeddingBatcher: Micro-batching of concurrent embedding requests
+- EmbeddingCache: Content-addressed cache of embeddings
+- TokenPacker: Token-budget packing of embedding requests
 """
 
 from .integration_patterns import IntegrationPatternManager
 from .model_clients import ModelClients
 from .connection_pool import ConnectionPool
+from .batching import EmbeddingBatcher
+from .embedding_cache import EmbeddingCache
+from .token_packing import TokenPacker
 
 __all__ = [
     "IntegrationPatternManager",
     "ModelClients",
-    "ConnectionPool"
+    "ConnectionPool",
+    "EmbeddingBatcher",
+    "EmbeddingCache",
+    "TokenPacker"
 ]
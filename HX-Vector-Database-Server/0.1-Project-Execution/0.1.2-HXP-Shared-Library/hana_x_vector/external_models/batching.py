@@ -0,0 +1,204 @@
+"""
+Embedding Batcher
+=================
+
+Dynamic micro-batching of embedding requests per model.
+Texts from concurrent callers are gathered for a few milliseconds and
+sent as one request; the embeddings are scattered back to each caller's
+future in order.
+"""
+
+from typing import Dict, Any, List, Set, Callable, Awaitable, Optional
+import asyncio
+import time
+from ..monitoring.metrics import MetricsCollector
+
+
+class PendingEmbedding:
+    """One caller's texts waiting for the next request of a model."""
+    
+    __slots__ = ("texts", "future", "priority", "queued_at")
+    
+    def __init__(self, texts: List[str], future: asyncio.Future, priority: str):
+        self.texts = texts
+        self.future = future
+        self.priority = priority
+        self.queued_at = time.monotonic()
+
+
+class ModelQueue:
+    """Callers waiting for the next request of one model."""
+    
+    __slots__ = ("high", "normal", "texts", "timer", "deadline")
+    
+    def __init__(self):
+        self.high: List[PendingEmbedding] = []
+        self.normal: List[PendingEmbedding] = []
+        self.texts = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.deadline = float("inf")
+
+
+class EmbeddingBatcher:
+    """
+    Per-model embedding request scheduler.
+    
+    A model's queued texts are sent when they reach max_batch_size or when
+    the oldest caller has waited max_delay. High priority (real-time)
+    callers shorten the wait to realtime_max_delay and go first into the
+    next request. A caller's texts are never split across requests, and
+    callers with more than max_batch_size texts are sent on their own.
+    """
+    
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        send_func: Callable[[str, List[str], str], Awaitable[Dict[str, Any]]]
+    ):
+        batching_config = config.get("embedding_batching", {})
+        self.enabled = batching_config.get("enabled", True)
+        self.max_batch_size = batching_config.get("max_batch_size", 64)
+        self.max_delay = batching_config.get("max_delay", 0.003)
+        self.realtime_max_delay = batching_config.get("realtime_max_delay", 0.0005)
+        
+        self.send_func = send_func
+        self.metrics = MetricsCollector()
+        
+        self._queues: Dict[str, ModelQueue] = {}
+        self._send_tasks: Set[asyncio.Task] = set()
+    
+    def accepts(self, texts: List[str]) -> bool:
+        """Check whether a request is small enough to be batched."""
+        return self.enabled and 0 < len(texts) <= self.max_batch_size
+    
+    def submit(self, model_name: str, texts: List[str], priority: str = "normal") -> asyncio.Future:
+        """
+        Queue texts for the model's next request.
+        
+        Args:
+            model_name: Name of the model
+            texts: Texts to embed
+            priority: "high" for real-time callers
+        
+        Returns:
+            Future resolving to this caller's embeddings and request metadata
+        """
+        queue = self._queues.get(model_name)
+        if queue is None:
+            queue = self._queues[model_name] = ModelQueue()
+        
+        future = asyncio.get_running_loop().create_future()
+        entry = PendingEmbedding(texts, future, priority)
+        (queue.high if priority == "high" else queue.normal).append(entry)
+        queue.texts += len(texts)
+        
+        if queue.texts >= self.max_batch_size:
+            self._flush(model_name)
+        else:
+            delay = self.realtime_max_delay if priority == "high" else self.max_delay
+            self._schedule(model_name, queue, time.monotonic() + delay)
+        return future
+    
+    async def flush(self):
+        """Send every queued text and wait for all requests to finish."""
+        for model_name in list(self._queues):
+            while model_name in self._queues:
+                self._flush(model_name)
+        if self._send_tasks:
+            await asyncio.gather(*self._send_tasks, return_exceptions=True)
+    
+    async def shutdown(self):
+        """Send queued texts before the connections close."""
+        await self.flush()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queued texts per model."""
+        return {
+            "enabled": self.enabled,
+            "queued_texts": {name: queue.texts for name, queue in self._queues.items()},
+            "requests_in_flight": len(self._send_tasks)
+        }
+    
+    def _schedule(self, model_name: str, queue: ModelQueue, deadline: float):
+        """Arm the model's flush timer unless it already fires sooner."""
+        if deadline >= queue.deadline:
+            return
+        if queue.timer is not None:
+            queue.timer.cancel()
+        queue.deadline = deadline
+        queue.timer = asyncio.get_running_loop().call_later(
+            max(deadline - time.monotonic(), 0), self._flush, model_name
+        )
+    
+    def _flush(self, model_name: str):
+        """Send the next request's worth of queued texts."""
+        queue = self._queues.pop(model_name, None)
+        if queue is None:
+            return
+        if queue.timer is not None:
+            queue.timer.cancel()
+        
+        # Real-time callers first, then the rest in arrival order
+        waiting = queue.high + queue.normal
+        entries, size = [], 0
+        for entry in waiting:
+            if entries and size + len(entry.texts) > self.max_batch_size:
+                break
+            entries.append(entry)
+            size += len(entry.texts)
+        
+        rest = waiting[len(entries):]
+        if rest:
+            # Callers that did not fit start the model's next request
+            remaining = self._queues[model_name] = ModelQueue()
+            for entry in rest:
+                (remaining.high if entry.priority == "high" else remaining.normal).append(entry)
+                remaining.texts += len(entry.texts)
+            if remaining.texts >= self.max_batch_size:
+                asyncio.get_running_loop().call_soon(self._flush, model_name)
+            else:
+                deadline = min(
+                    entry.queued_at + (self.realtime_max_delay if entry.priority == "high" else self.max_delay)
+                    for entry in rest
+                )
+                self._schedule(model_name, remaining, deadline)
+        
+        task = asyncio.create_task(self._send(model_name, entries))
+        self._send_tasks.add(task)
+        task.add_done_callback(self._send_tasks.discard)
+    
+    async def _send(self, model_name: str, entries: List[PendingEmbedding]):
+        """Embed one request's texts and resolve its callers' futures."""
+        texts = [text for entry in entries for text in entry.texts]
+        priority = "high" if any(entry.priority == "high" for entry in entries) else "normal"
+        now = time.monotonic()
+        for entry in entries:
+            self.metrics.record_histogram("embedding_batch_wait_latency", now - entry.queued_at,
+                                          tags={"model": model_name, "priority": entry.priority})
+        self.metrics.record_histogram("embedding_batch_texts", len(texts), tags={"model": model_name})
+        self.metrics.record_histogram("embedding_batch_callers", len(entries), tags={"model": model_name})
+        
+        try:
+            result = await self.send_func(model_name, texts, priority)
+            embeddings = result["embeddings"]
+            if len(embeddings) != len(texts):
+                raise ValueError(f"expected {len(texts)} embeddings, got {len(embeddings)}")
+        
+        except Exception as e:
+            self.metrics.increment_counter("embedding_batch_errors", tags={"model": model_name})
+            for entry in entries:
+                if not entry.future.done():
+                    entry.future.set_exception(e)
+            return
+        
+        offset = 0
+        for entry in entries:
+            count = len(entry.texts)
+            if not entry.future.done():
+                entry.future.set_result({
+                    **result,
+                    "embeddings": embeddings[offset:offset + count],
+                    "batch_size": len(texts),
+                    "coalesced_count": len(entries)
+                })
+            offset += count
@@ -3,22 +3,103 @@ Connection Pool
 ==============
 
 Connection pooling and management for external AI model connections.
-Provides efficient connection reuse and load balancing.
+Models served by the same host:port share one HTTP session whose
+keep-alive connector reuses sockets and caches DNS lookups; each model
+has its own limit on concurrent requests.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Deque
+from collections import deque
 import asyncio
 import time
-from collections import defaultdict
 import aiohttp
 from ..monitoring.metrics import MetricsCollector
 from ..utils.exceptions import ExternalModelError
 
 
+PRIORITIES = ("high", "normal", "low")
+
+
+class ModelSlots:
+    """
+    Concurrency limit of one model.
+    
+    A resizable semaphore with a FIFO queue of waiters per priority lane.
+    A released slot is handed straight to the oldest waiter of the highest
+    non-empty lane, so waiters are woken without polling and a newcomer
+    never overtakes a queued request.
+    """
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+        self.lanes: Dict[str, Deque[asyncio.Future]] = {priority: deque() for priority in PRIORITIES}
+    
+    @property
+    def waiting(self) -> int:
+        """Number of queued waiters."""
+        return sum(len(lane) for lane in self.lanes.values())
+    
+    async def acquire(self, priority: str, timeout: float):
+        """
+        Take a free slot or queue for one.
+        
+        Args:
+            priority: Lane to queue in
+            timeout: Longest time to wait
+        
+        Raises:
+            asyncio.TimeoutError: If no slot frees up within timeout
+        """
+        if self.in_use < self.limit and not self.waiting:
+            self.in_use += 1
+            return
+        
+        future = asyncio.get_running_loop().create_future()
+        lane = self.lanes[priority]
+        lane.append(future)
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # The slot was handed over as the wait ended; pass it on
+                self.release()
+            else:
+                future.cancel()
+                lane.remove(future)
+            raise
+    
+    def release(self):
+        """Free a slot, handing it to the next waiter if there is one."""
+        if self.in_use <= self.limit and self._hand_over():
+            return
+        self.in_use = max(self.in_use - 1, 0)
+    
+    def resize(self, limit: int):
+        """Change the limit, waking waiters that now fit."""
+        self.limit = limit
+        while self.in_use < self.limit and self.waiting:
+            self.in_use += 1
+            self._hand_over()
+    
+    def _hand_over(self) -> bool:
+        """Give a held slot to the oldest waiter of the highest lane."""
+        for priority in PRIORITIES:
+            lane = self.lanes[priority]
+            if lane:
+                lane.popleft().set_result(None)
+                return True
+        return False
+
+
 class ConnectionPool:
     """
     Connection pool manager for external AI model connections.
-    Provides efficient connection reuse and load balancing.
+    
+    Holds one aiohttp session per upstream host:port. A "connection"
+    handed out by get_connection is that shared session together with a
+    slot of the model's concurrency limit; return_connection gives the
+    slot back while the sockets stay open for the next request.
     """
     
     def __init__(self, config: Dict[str, Any], model_configs: Dict[str, Any]):
@@ -29,88 +110,89 @@ class ConnectionPool:
         # Pool configuration
         pool_config = config.get("connection_pool", {})
         self.max_connections_per_model = pool_config.get("max_connections_per_model", 10)
-        self.min_connections_per_model = pool_config.get("min_connections_per_model", 2)
+        self.max_connections_per_host = pool_config.get("max_connections_per_host")
         self.connection_timeout = pool_config.get("connection_timeout", 30.0)
+        self.acquire_timeout = pool_config.get("acquire_timeout", 30.0)
         self.idle_timeout = pool_config.get("idle_timeout", 300.0)  # 5 minutes
+        self.dns_cache_ttl = pool_config.get("dns_cache_ttl", 300)
+        self.health_check_interval = pool_config.get("health_check_interval", 300)
         self.max_retries = pool_config.get("max_retries", 3)
         
-        # Connection pools per model
-        self.pools = {}
-        self.pool_stats = defaultdict(lambda: {
-            "active_connections": 0,
-            "idle_connections": 0,
-            "total_requests": 0,
-            "failed_requests": 0,
-            "last_used": 0
-        })
-        
-        # Connection tracking
-        self.active_connections = defaultdict(set)
-        self.idle_connections = defaultdict(list)
-        self.connection_locks = defaultdict(asyncio.Lock)
+        # Models grouped by upstream host:port
+        self.model_hosts = {
+            model_name: self._host_key(model_config)
+            for model_name, model_config in model_configs.items()
+        }
+        self.host_models: Dict[str, List[str]] = {}
+        for model_name, host in self.model_hosts.items():
+            self.host_models.setdefault(host, []).append(model_name)
+        
+        # One session per host, one slot limit per model
+        self.sessions: Dict[str, aiohttp.ClientSession] = {}
+        self.slots = {
+            model_name: ModelSlots(self.max_connections_per_model)
+            for model_name in model_configs
+        }
+        self.pool_stats = {
+            model_name: {"total_requests": 0, "failed_requests": 0, "last_used": 0}
+            for model_name in model_configs
+        }
         
         # Background tasks
-        self.cleanup_task = None
         self.health_check_task = None
     
     async def startup(self):
         """Initialize connection pool."""
-        # Initialize pools for each model
-        for model_name in self.model_configs.keys():
-            await self._initialize_model_pool(model_name)
+        for host in self.host_models:
+            self._get_session(host)
         
         # Start background tasks
-        self.cleanup_task = asyncio.create_task(self._cleanup_idle_connections())
         self.health_check_task = asyncio.create_task(self._health_check_connections())
     
     async def shutdown(self):
         """Cleanup connection pool."""
         # Cancel background tasks
-        if self.cleanup_task:
-            self.cleanup_task.cancel()
         if self.health_check_task:
             self.health_check_task.cancel()
         
-        # Close all connections
-        for model_name in self.model_configs.keys():
-            await self._close_model_pool(model_name)
+        # Close all host sessions
+        for host in list(self.sessions):
+            await self._close_session(host)
     
-    async def get_connection(self, model_name: str) -> aiohttp.ClientSession:
+    async def get_connection(self, model_name: str, priority: str = "normal") -> aiohttp.ClientSession:
         """
         Get a connection from the pool.
         
+        Waits for a slot of the model's concurrency limit and returns the
+        session shared by all models on the model's host.
+        
         Args:
             model_name: Name of the model
-            
+            priority: Waiting lane when the model is saturated: high, normal or low
+        
         Returns:
             HTTP client session
         """
         if model_name not in self.model_configs:
-            raise ExternalModelError(f"Unknown model: {model_name}")
-        
-        async with self.connection_locks[model_name]:
-            # Try to get idle connection first
-            if self.idle_connections[model_name]:
-                connection = self.idle_connections[model_name].pop()
-                self.active_connections[model_name].add(connection)
-                self.pool_stats[model_name]["idle_connections"] -= 1
-                self.pool_stats[model_name]["active_connections"] += 1
-                return connection
-            
-            # Create new connection if under limit
-            if len(self.active_connections[model_name]) < self.max_connections_per_model:
-                connection = await self._create_connection(model_name)
-                self.active_connections[model_name].add(connection)
-                self.pool_stats[model_name]["active_connections"] += 1
-                return connection
-            
-            # Wait for available connection
-            return await self._wait_for_connection(model_name)
+            raise ExternalModelError(f"Unknown model: {model_name}", model_name)
+        
+        await self._wait_for_connection(model_name, priority)
+        
+        stats = self.pool_stats[model_name]
+        stats["total_requests"] += 1
+        stats["last_used"] = time.time()
+        
+        try:
+            return self._get_session(self.model_hosts[model_name])
+        except Exception:
+            self.slots[model_name].release()
+            raise
     
     async def return_connection(
         self,
         model_name: str,
-        connection: aiohttp.ClientSession
+        connection: aiohttp.ClientSession,
+        failed: bool = False
     ):
         """
         Return a connection to the pool.
@@ -118,23 +200,14 @@ class ConnectionPool:
         Args:
             model_name: Name of the model
             connection: HTTP client session to return
+            failed: Whether the request made with it failed
         """
         if model_name not in self.model_configs:
             return
         
-        async with self.connection_locks[model_name]:
-            if connection in self.active_connections[model_name]:
-                self.active_connections[model_name].remove(connection)
-                self.pool_stats[model_name]["active_connections"] -= 1
-                
-                # Check if connection is still healthy
-                if not connection.closed:
-                    self.idle_connections[model_name].append(connection)
-                    self.pool_stats[model_name]["idle_connections"] += 1
-                    self.pool_stats[model_name]["last_used"] = time.time()
-                else:
-                    # Connection is closed, don't return to pool
-                    await connection.close()
+        if failed:
+            self.pool_stats[model_name]["failed_requests"] += 1
+        self.slots[model_name].release()
     
     async def get_pool_status(self, model_name: str) -> Dict[str, Any]:
         """
@@ -142,7 +215,7 @@ class ConnectionPool:
         
         Args:
             model_name: Name of the model
-            
+        
         Returns:
             Pool status information
         """
@@ -150,13 +223,17 @@ class ConnectionPool:
             return {"error": f"Unknown model: {model_name}"}
         
         stats = self.pool_stats[model_name]
+        slots = self.slots[model_name]
+        host = self.model_hosts[model_name]
         
         return {
             "model": model_name,
-            "active_connections": stats["active_connections"],
-            "idle_connections": stats["idle_connections"],
-            "total_connections": stats["active_connections"] + stats["idle_connections"],
-            "max_connections": self.max_connections_per_model,
+            "host": host,
+            "active_connections": slots.in_use,
+            "available_connections": max(slots.limit - slots.in_use, 0),
+            "max_connections": slots.limit,
+            "waiting": {priority: len(lane) for priority, lane in slots.lanes.items()},
+            "session_open": host in self.sessions and not self.sessions[host].closed,
             "total_requests": stats["total_requests"],
             "failed_requests": stats["failed_requests"],
             "success_rate": (stats["total_requests"] - stats["failed_requests"]) / stats["total_requests"] if stats["total_requests"] > 0 else 0,
@@ -170,8 +247,7 @@ class ConnectionPool:
         Returns:
             Pool metrics
         """
-        total_active = sum(stats["active_connections"] for stats in self.pool_stats.values())
-        total_idle = sum(stats["idle_connections"] for stats in self.pool_stats.values())
+        total_active = sum(slots.in_use for slots in self.slots.values())
         total_requests = sum(stats["total_requests"] for stats in self.pool_stats.values())
         total_failures = sum(stats["failed_requests"] for stats in self.pool_stats.values())
         
@@ -179,222 +255,133 @@ class ConnectionPool:
         for model_name in self.model_configs.keys():
             model_stats[model_name] = await self.get_pool_status(model_name)
         
+        host_stats = {}
+        for host, models in self.host_models.items():
+            session = self.sessions.get(host)
+            host_stats[host] = {
+                "models": list(models),
+                "session_open": session is not None and not session.closed,
+                "connection_limit": self._host_limit(host),
+                "active_connections": sum(self.slots[model].in_use for model in models)
+            }
+        
+        self.metrics.record_gauge("connection_pool_active", total_active)
+        
         return {
             "total_active_connections": total_active,
-            "total_idle_connections": total_idle,
-            "total_connections": total_active + total_idle,
+            "total_waiting": sum(slots.waiting for slots in self.slots.values()),
+            "total_sessions": sum(1 for session in self.sessions.values() if not session.closed),
             "total_requests": total_requests,
             "total_failures": total_failures,
             "overall_success_rate": (total_requests - total_failures) / total_requests if total_requests > 0 else 0,
+            "hosts": host_stats,
             "models": model_stats
         }
     
-    async def _initialize_model_pool(self, model_name: str):
-        """Initialize connection pool for a model."""
-        # Create minimum connections
-        for _ in range(self.min_connections_per_model):
-            try:
-                connection = await self._create_connection(model_name)
-                self.idle_connections[model_name].append(connection)
-                self.pool_stats[model_name]["idle_connections"] += 1
-            except Exception as e:
-                print(f"Warning: Failed to create initial connection for {model_name}: {e}")
-    
-    async def _close_model_pool(self, model_name: str):
-        """Close all connections for a model."""
-        # Close active connections
-        for connection in list(self.active_connections[model_name]):
-            try:
-                await connection.close()
-            except Exception:
-                pass
-        self.active_connections[model_name].clear()
+    def _get_session(self, host: str) -> aiohttp.ClientSession:
+        """Get the host's shared session, opening it if needed."""
+        session = self.sessions.get(host)
+        if session is not None and not session.closed:
+            return session
         
-        # Close idle connections
-        for connection in self.idle_connections[model_name]:
-            try:
-                await connection.close()
-            except Exception:
-                pass
-        self.idle_connections[model_name].clear()
-        
-        # Reset stats
-        self.pool_stats[model_name] = {
-            "active_connections": 0,
-            "idle_connections": 0,
-            "total_requests": 0,
-            "failed_requests": 0,
-            "last_used": 0
-        }
-    
-    async def _create_connection(self, model_name: str) -> aiohttp.ClientSession:
-        """Create a new connection for a model."""
-        model_config = self.model_configs[model_name]
-        
-        # Configure connection
-        timeout = aiohttp.ClientTimeout(total=self.connection_timeout)
+        # Keep-alive connector shared by every model on the host
+        limit = self._host_limit(host)
         connector = aiohttp.TCPConnector(
-            limit=self.max_connections_per_model,
-            limit_per_host=self.max_connections_per_model,
-            keepalive_timeout=self.idle_timeout
+            limit=limit,
+            limit_per_host=limit,
+            keepalive_timeout=self.idle_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl
         )
         
-        # Create session
         session = aiohttp.ClientSession(
-            timeout=timeout,
+            timeout=aiohttp.ClientTimeout(total=self.connection_timeout),
             connector=connector,
             headers={
                 "Content-Type": "application/json",
                 "User-Agent": "HANA-X-Vector-Database/2.0.0"
             }
         )
-        
+        self.sessions[host] = session
+        self.metrics.increment_counter("connection_pool_sessions_opened", tags={"host": host})
         return session
     
-    async def _wait_for_connection(self, model_name: str) -> aiohttp.ClientSession:
-        """Wait for an available connection."""
-        # Simple implementation - in production, use proper queuing
-        max_wait_time = 30.0  # 30 seconds
-        wait_interval = 0.1   # 100ms
-        waited = 0
-        
-        while waited < max_wait_time:
-            # Check if connection became available
-            if self.idle_connections[model_name]:
-                connection = self.idle_connections[model_name].pop()
-                self.active_connections[model_name].add(connection)
-                self.pool_stats[model_name]["idle_connections"] -= 1
-                self.pool_stats[model_name]["active_connections"] += 1
-                return connection
-            
-            # Check if we can create new connection
-            if len(self.active_connections[model_name]) < self.max_connections_per_model:
-                connection = await self._create_connection(model_name)
-                self.active_connections[model_name].add(connection)
-                self.pool_stats[model_name]["active_connections"] += 1
-                return connection
-            
-            # Wait and retry
-            await asyncio.sleep(wait_interval)
-            waited += wait_interval
-        
-        raise ExternalModelError(f"Timeout waiting for connection to {model_name}")
-    
-    async def _cleanup_idle_connections(self):
-        """Background task to cleanup idle connections."""
-        while True:
+    async def _close_session(self, host: str):
+        """Close a host's session and its sockets."""
+        session = self.sessions.pop(host, None)
+        if session is not None:
             try:
-                current_time = time.time()
-                
-                for model_name in self.model_configs.keys():
-                    async with self.connection_locks[model_name]:
-                        # Check idle connections
-                        connections_to_remove = []
-                        
-                        for connection in self.idle_connections[model_name]:
-                            # Check if connection is too old or closed
-                            if (connection.closed or 
-                                current_time - self.pool_stats[model_name]["last_used"] > self.idle_timeout):
-                                connections_to_remove.append(connection)
-                        
-                        # Remove old connections
-                        for connection in connections_to_remove:
-                            self.idle_connections[model_name].remove(connection)
-                            self.pool_stats[model_name]["idle_connections"] -= 1
-                            
-                            try:
-                                await connection.close()
-                            except Exception:
-                                pass
-                        
-                        # Ensure minimum connections
-                        current_total = (self.pool_stats[model_name]["active_connections"] + 
-                                       self.pool_stats[model_name]["idle_connections"])
-                        
-                        if current_total < self.min_connections_per_model:
-                            needed = self.min_connections_per_model - current_total
-                            for _ in range(needed):
-                                try:
-                                    connection = await self._create_connection(model_name)
-                                    self.idle_connections[model_name].append(connection)
-                                    self.pool_stats[model_name]["idle_connections"] += 1
-                                except Exception as e:
-                                    print(f"Warning: Failed to create connection for {model_name}: {e}")
-                                    break
-                
-                # Update metrics
-                self.metrics.record_gauge("connection_pool_active", 
-                                        sum(stats["active_connections"] for stats in self.pool_stats.values()))
-                self.metrics.record_gauge("connection_pool_idle",
-                                        sum(stats["idle_connections"] for stats in self.pool_stats.values()))
-                
-                # Sleep before next cleanup
-                await asyncio.sleep(60)  # Cleanup every minute
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                print(f"Error in connection cleanup: {e}")
-                await asyncio.sleep(60)
+                await session.close()
+            except Exception:
+                pass
+    
+    def _host_limit(self, host: str) -> int:
+        """Socket limit of a host: its models' slot limits combined by default."""
+        if self.max_connections_per_host:
+            return self.max_connections_per_host
+        return sum(self.slots[model].limit for model in self.host_models[host])
+    
+    def _host_key(self, model_config: Dict[str, Any]) -> str:
+        """host:port a model is served from."""
+        return f"{model_config['server']}:{model_config['port']}"
+    
+    async def _wait_for_connection(self, model_name: str, priority: str):
+        """Wait for a free slot of the model's concurrency limit."""
+        if priority not in PRIORITIES:
+            priority = "normal"
+        tags = {"model": model_name, "priority": priority}
+        start_time = time.monotonic()
+        
+        try:
+            await self.slots[model_name].acquire(priority, self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self.metrics.increment_counter("connection_pool_wait_timeouts", tags=tags)
+            raise ExternalModelError(f"Timeout waiting for connection to {model_name}", model_name)
+        finally:
+            self.metrics.record_histogram("model_connection_wait_latency", time.monotonic() - start_time, tags=tags)
     
     async def _health_check_connections(self):
-        """Background task to health check connections."""
+        """Background task to health check upstream hosts."""
         while True:
             try:
-                for model_name in self.model_configs.keys():
-                    # Simple health check - test a connection
+                for host, models in self.host_models.items():
+                    # One check per host covers every model it serves
+                    tags = {"host": host}
                     try:
-                        connection = await self.get_connection(model_name)
-                        
-                        # Test connection with simple request
-                        model_config = self.model_configs[model_name]
-                        url = f"http://{model_config['server']}:{model_config['port']}/health"
-                        
-                        try:
-                            async with connection.get(url) as response:
-                                if response.status == 200:
-                                    self.metrics.increment_counter("connection_health_checks_success",
-                                                                 tags={"model": model_name})
-                                else:
-                                    self.metrics.increment_counter("connection_health_checks_failed",
-                                                                 tags={"model": model_name})
-                        except Exception:
-                            self.metrics.increment_counter("connection_health_checks_failed",
-                                                         tags={"model": model_name})
-                        
-                        # Return connection
-                        await self.return_connection(model_name, connection)
-                        
+                        async with self._get_session(host).get(f"http://{host}/health") as response:
+                            if response.status == 200:
+                                self.metrics.increment_counter("connection_health_checks_success", tags=tags)
+                            else:
+                                self.metrics.increment_counter("connection_health_checks_failed", tags=tags)
                     except Exception as e:
-                        print(f"Health check failed for {model_name}: {e}")
-                        self.metrics.increment_counter("connection_health_checks_failed",
-                                                     tags={"model": model_name})
+                        print(f"Health check failed for {host} ({', '.join(models)}): {e}")
+                        self.metrics.increment_counter("connection_health_checks_failed", tags=tags)
                 
                 # Sleep before next health check
-                await asyncio.sleep(300)  # Health check every 5 minutes
-                
+                await asyncio.sleep(self.health_check_interval)
+            
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 print(f"Error in health check: {e}")
-                await asyncio.sleep(300)
+                await asyncio.sleep(self.health_check_interval)
     
     async def invalidate_connections(self, model_name: str):
         """
         Invalidate all connections for a model.
         
+        Closes the session of the model's host, so every model on that
+        host reconnects on its next request.
+        
         Args:
             model_name: Name of the model
         """
         if model_name not in self.model_configs:
             return
         
-        async with self.connection_locks[model_name]:
-            # Close all connections
-            await self._close_model_pool(model_name)
-            
-            # Reinitialize pool
-            await self._initialize_model_pool(model_name)
+        host = self.model_hosts[model_name]
+        await self._close_session(host)
+        self._get_session(host)
     
     async def scale_pool(self, model_name: str, target_size: int):
         """
@@ -402,40 +389,10 @@ class ConnectionPool:
         
         Args:
             model_name: Name of the model
-            target_size: Target number of connections
+            target_size: Target number of concurrent requests
         """
         if model_name not in self.model_configs:
             return
         
-        target_size = min(target_size, self.max_connections_per_model)
-        
-        async with self.connection_locks[model_name]:
-            current_size = (self.pool_stats[model_name]["active_connections"] + 
-                          self.pool_stats[model_name]["idle_connections"])
-            
-            if target_size > current_size:
-                # Add connections
-                needed = target_size - current_size
-                for _ in range(needed):
-                    try:
-                        connection = await self._create_connection(model_name)
-                        self.idle_connections[model_name].append(connection)
-                        self.pool_stats[model_name]["idle_connections"] += 1
-                    except Exception as e:
-                        print(f"Warning: Failed to scale up connection for {model_name}: {e}")
-                        break
-            
-            elif target_size < current_size:
-                # Remove idle connections
-                to_remove = min(current_size - target_size, 
-                              self.pool_stats[model_name]["idle_connections"])
-                
-                for _ in range(to_remove):
-                    if self.idle_connections[model_name]:
-                        connection = self.idle_connections[model_name].pop()
-                        self.pool_stats[model_name]["idle_connections"] -= 1
-                        
-                        try:
-                            await connection.close()
-                        except Exception:
-                            pass
+        target_size = max(min(target_size, self.max_connections_per_model), 1)
+        self.slots[model_name].resize(target_size)
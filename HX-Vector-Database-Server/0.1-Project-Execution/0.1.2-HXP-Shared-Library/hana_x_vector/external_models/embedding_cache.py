@@ -0,0 +1,219 @@
+"""
+Embedding Cache
+===============
+
+Content-addressed cache of embeddings.
+Entries are keyed by a hash of the model name and the normalized text and
+hold the embedding as a float32 blob. An in-process LRU tier sits in front
+of Redis, and lookups are batched so a request only sends its misses to
+the model server.
+"""
+
+from typing import Dict, Any, List, Optional, Sequence
+import hashlib
+import unicodedata
+import numpy as np
+import redis.asyncio as redis
+from ..monitoring.metrics import MetricsCollector
+from ..utils.local_cache import LocalResultCache
+
+
+class EmbeddingCache:
+    """
+    Two-tier embedding cache.
+    
+    Texts are normalized (Unicode NFC, whitespace collapsed) before
+    hashing, so texts differing only in spacing share an entry. Redis
+    shares entries between workers and restarts; when it is unreachable
+    the in-process tier keeps working on its own.
+    """
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+        self.metrics = MetricsCollector()
+        
+        # Redis connection settings are shared with the result cache
+        cache_config = config.get("cache", {})
+        self.redis_host = cache_config.get("host", "192.168.10.35")
+        self.redis_port = cache_config.get("port", 6379)
+        self.redis_db = cache_config.get("db", 0)
+        self.redis_password = cache_config.get("password")
+        
+        embedding_config = config.get("embedding_cache", {})
+        self.enabled = embedding_config.get("enabled", True)
+        self.redis_enabled = embedding_config.get("redis_enabled", True)
+        self.ttl = embedding_config.get("ttl", 7 * 24 * 3600)  # 7 days
+        self.normalize = embedding_config.get("normalize", True)
+        self.key_prefix = embedding_config.get(
+            "key_prefix", f"{cache_config.get('key_prefix', 'hana_x_vector:')}embedding:"
+        )
+        self.l1_cache = LocalResultCache(
+            max_entries=embedding_config.get("l1_max_entries", 100000),
+            max_bytes=embedding_config.get("l1_max_bytes", 256 * 1024 * 1024),  # 256 MB
+            ttl=embedding_config.get("l1_ttl", 3600)
+        )
+        
+        self.redis_client = None
+        self.redis_pool = None
+        self.hits = 0
+        self.misses = 0
+    
+    async def startup(self):
+        """Connect the Redis tier."""
+        if not self.enabled or not self.redis_enabled:
+            return
+        
+        try:
+            self.redis_pool = redis.ConnectionPool(
+                host=self.redis_host,
+                port=self.redis_port,
+                db=self.redis_db,
+                password=self.redis_password,
+                decode_responses=False,
+                max_connections=10
+            )
+            self.redis_client = redis.Redis(connection_pool=self.redis_pool)
+            await self.redis_client.ping()
+        
+        except Exception as e:
+            print(f"Warning: Embedding cache Redis tier unavailable: {e}")
+            self.redis_client = None
+    
+    async def shutdown(self):
+        """Close the Redis connection."""
+        if self.redis_client:
+            await self.redis_client.close()
+        if self.redis_pool:
+            await self.redis_pool.disconnect()
+    
+    def normalize_text(self, text: str) -> str:
+        """Normalize text before hashing."""
+        if not self.normalize:
+            return text
+        return " ".join(unicodedata.normalize("NFC", text).split())
+    
+    def cache_key(self, model_name: str, text: str) -> str:
+        """
+        Content address of a text's embedding.
+        
+        Args:
+            model_name: Name of the model
+            text: Text to embed
+        
+        Returns:
+            Cache key
+        """
+        digest = hashlib.sha256(
+            model_name.encode("utf-8") + b"\0" + self.normalize_text(text).encode("utf-8")
+        ).hexdigest()
+        return f"{self.key_prefix}{model_name}:{digest}"
+    
+    async def get_many(self, model_name: str, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up the embeddings of several texts.
+        
+        Args:
+            model_name: Name of the model
+            texts: Texts to look up
+        
+        Returns:
+            float32 embedding per text, None for misses
+        """
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        if not self.enabled or not texts:
+            return results
+        
+        keys = [self.cache_key(model_name, text) for text in texts]
+        missing = []
+        for i, key in enumerate(keys):
+            results[i] = self.l1_cache.get(key)
+            if results[i] is None:
+                missing.append(i)
+        self._record("l1", model_name, len(texts) - len(missing), len(missing))
+        
+        if missing and self.redis_client:
+            try:
+                blobs = await self.redis_client.mget([keys[i] for i in missing])
+            except Exception as e:
+                self.metrics.increment_counter("cache_errors", tags={"type": "embedding"})
+                print(f"Embedding cache get error: {e}")
+                blobs = [None] * len(missing)
+            
+            found = 0
+            for i, blob in zip(missing, blobs):
+                if blob:
+                    embedding = np.frombuffer(blob, dtype=np.float32)
+                    self.l1_cache.put(keys[i], embedding, embedding.nbytes)
+                    results[i] = embedding
+                    found += 1
+            self._record("l2", model_name, found, len(missing) - found)
+        
+        hits = sum(1 for embedding in results if embedding is not None)
+        self.hits += hits
+        self.misses += len(texts) - hits
+        self.metrics.record_gauge("embedding_cache_hit_ratio", self.hit_ratio, tags={"cache_type": "embedding"})
+        return results
+    
+    async def put_many(self, model_name: str, texts: Sequence[str], embeddings: Sequence[Any]) -> int:
+        """
+        Store the embeddings of several texts.
+        
+        Args:
+            model_name: Name of the model
+            texts: Embedded texts
+            embeddings: Embedding per text
+        
+        Returns:
+            Number of entries stored
+        """
+        if not self.enabled or not texts:
+            return 0
+        
+        entries = {}
+        for text, embedding in zip(texts, embeddings):
+            vector = np.asarray(embedding, dtype=np.float32)
+            key = self.cache_key(model_name, text)
+            self.l1_cache.put(key, vector, vector.nbytes)
+            entries[key] = vector.tobytes()
+        
+        if self.redis_client:
+            try:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for key, blob in entries.items():
+                        pipe.set(key, blob, ex=self.ttl)
+                    await pipe.execute()
+            except Exception as e:
+                self.metrics.increment_counter("cache_errors", tags={"type": "embedding"})
+                print(f"Embedding cache set error: {e}")
+        
+        self.metrics.increment_counter("cache_writes", len(entries), tags={"type": "embedding"})
+        return len(entries)
+    
+    @property
+    def hit_ratio(self) -> float:
+        """Share of looked up texts found in either tier."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit counts and tier statistics."""
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hit_ratio,
+            "redis_connected": self.redis_client is not None,
+            "l1": self.l1_cache.get_stats()
+        }
+    
+    def clear_local(self):
+        """Drop the in-process tier."""
+        self.l1_cache.clear()
+    
+    def _record(self, tier: str, model_name: str, hits: int, misses: int):
+        """Count hits and misses of one tier."""
+        tags = {"type": "embedding", "tier": tier, "model": model_name}
+        if hits:
+            self.metrics.increment_counter("cache_hits", hits, tags=tags)
+        if misses:
+            self.metrics.increment_counter("cache_misses", misses, tags=tags)
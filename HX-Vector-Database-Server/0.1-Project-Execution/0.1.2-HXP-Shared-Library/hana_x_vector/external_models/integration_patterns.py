@@ -6,14 +6,15 @@ Manages different integration patterns for external AI models.
 Supports real-time, hybrid, and bulk integration patterns.
 """
 
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 import asyncio
 import time
 from enum import Enum
 from ..monitoring.metrics import MetricsCollector
 from ..utils.exceptions import ExternalModelError
 from .model_clients import ModelClients
-from .connection_pool import ConnectionPool
+from .embedding_cache import EmbeddingCache
+from .token_packing import TokenPacker, PackPlan
 
 
 class IntegrationPattern(Enum):
@@ -110,9 +111,11 @@ class IntegrationPatternManager:
             }
         }
         
-        # Initialize components
+        # Initialize components; the model clients own the connection pool
         self.model_clients = ModelClients(config, self.model_configs)
-        self.connection_pool = ConnectionPool(config, self.model_configs)
+        self.connection_pool = self.model_clients.connection_pool
+        self.embedding_cache = EmbeddingCache(config)
+        self.token_packer = TokenPacker(config)
         
         # Pattern handlers
         self.pattern_handlers = {
@@ -125,12 +128,12 @@ class IntegrationPatternManager:
     async def startup(self):
         """Initialize integration pattern manager."""
         await self.model_clients.startup()
-        await self.connection_pool.startup()
+        await self.embedding_cache.startup()
     
     async def shutdown(self):
         """Cleanup integration pattern manager."""
         await self.model_clients.shutdown()
-        await self.connection_pool.shutdown()
+        await self.embedding_cache.shutdown()
     
     async def process_embedding_request(
         self,
@@ -142,6 +145,10 @@ class IntegrationPatternManager:
         """
         Process embedding request using specified integration pattern.
         
+        Cached embeddings are served from the embedding cache and repeated
+        texts are embedded once; only the remaining texts are sent through
+        the pattern. Pass options={"use_cache": False} to skip the cache.
+        
         Args:
             model_name: Name of the AI model
             text_data: List of text to embed
@@ -166,7 +173,7 @@ class IntegrationPatternManager:
                 raise ExternalModelError(f"Unknown integration pattern: {pattern}")
             
             # Process request
-            result = await handler(model_name, text_data, options)
+            embeddings, cache_hits = await self._embed_with_cache(model_name, text_data, handler, options)
             
             # Update metrics
             duration = time.time() - start_time
@@ -175,11 +182,12 @@ class IntegrationPatternManager:
                                          tags={"model": model_name, "pattern": pattern.value})
             
             return {
-                "embeddings": result["embeddings"],
+                "embeddings": embeddings,
                 "model": model_name,
                 "pattern": pattern.value,
                 "duration": duration,
-                "processed_count": len(text_data)
+                "processed_count": len(text_data),
+                "cache_hits": cache_hits
             }
             
         except Exception as e:
@@ -302,6 +310,43 @@ class IntegrationPatternManager:
         except Exception as e:
             raise ExternalModelError(f"Status check failed: {str(e)}")
     
+    async def _embed_with_cache(
+        self,
+        model_name: str,
+        text_data: List[str],
+        handler: Callable,
+        options: Dict[str, Any]
+    ) -> Tuple[List[List[float]], int]:
+        """Embed texts, sending only cache misses to the model."""
+        if not options.get("use_cache", True) or not self.embedding_cache.enabled:
+            result = await handler(model_name, text_data, options)
+            return result["embeddings"], 0
+        
+        cached = await self.embedding_cache.get_many(model_name, text_data)
+        embeddings = [None if embedding is None else embedding.tolist() for embedding in cached]
+        
+        # Texts that normalize alike are embedded once
+        misses: Dict[str, List[int]] = {}
+        for i, embedding in enumerate(embeddings):
+            if embedding is None:
+                misses.setdefault(self.embedding_cache.normalize_text(text_data[i]), []).append(i)
+        
+        if misses:
+            miss_texts = [text_data[indices[0]] for indices in misses.values()]
+            result = await handler(model_name, miss_texts, options)
+            if len(result["embeddings"]) != len(miss_texts):
+                raise ExternalModelError(
+                    f"Expected {len(miss_texts)} embeddings from {model_name}, got {len(result['embeddings'])}",
+                    model_name
+                )
+            
+            for indices, embedding in zip(misses.values(), result["embeddings"]):
+                for i in indices:
+                    embeddings[i] = embedding
+            await self.embedding_cache.put_many(model_name, miss_texts, result["embeddings"])
+        
+        return embeddings, len(text_data) - sum(len(indices) for indices in misses.values())
+    
     async def _handle_real_time(
         self,
         model_name: str,
@@ -340,23 +385,22 @@ class IntegrationPatternManager:
         options: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Handle bulk integration pattern."""
-        batch_size = options.get("batch_size", 1000)
+        plan = self._pack(model_name, text_data, options.get("batch_size", 1000))
         
-        # Process in batches
-        all_embeddings = []
+        # Process packed requests
+        request_embeddings = []
         
-        for i in range(0, len(text_data), batch_size):
-            batch = text_data[i:i + batch_size]
-            
+        for request in plan.requests:
             batch_result = await self.model_clients.get_embeddings(
                 model_name=model_name,
-                text_data=batch,
-                priority="normal"
+                text_data=request,
+                priority="normal",
+                coalesce=False
             )
             
-            all_embeddings.extend(batch_result["embeddings"])
+            request_embeddings.append(batch_result["embeddings"])
         
-        return {"embeddings": all_embeddings}
+        return {"embeddings": plan.assemble(request_embeddings), "request_count": plan.request_count}
     
     async def _handle_streaming(
         self,
@@ -366,26 +410,33 @@ class IntegrationPatternManager:
     ) -> Dict[str, Any]:
         """Handle streaming integration pattern."""
         # Process with streaming for large datasets
-        chunk_size = options.get("chunk_size", 50)
+        plan = self._pack(model_name, text_data, options.get("chunk_size", 50))
         
         async def stream_processor():
-            for i in range(0, len(text_data), chunk_size):
-                chunk = text_data[i:i + chunk_size]
-                
+            for request in plan.requests:
                 chunk_result = await self.model_clients.get_embeddings(
                     model_name=model_name,
-                    text_data=chunk,
-                    priority="normal"
+                    text_data=request,
+                    priority="normal",
+                    coalesce=False
                 )
                 
                 yield chunk_result["embeddings"]
         
         # Collect all streaming results
-        all_embeddings = []
+        request_embeddings = []
         async for chunk_embeddings in stream_processor():
-            all_embeddings.extend(chunk_embeddings)
+            request_embeddings.append(chunk_embeddings)
         
-        return {"embeddings": all_embeddings}
+        return {"embeddings": plan.assemble(request_embeddings), "request_count": plan.request_count}
+    
+    def _pack(self, model_name: str, text_data: List[str], max_texts: int) -> PackPlan:
+        """Pack texts into requests within the model's token limit."""
+        plan = self.token_packer.pack(
+            model_name, text_data, self.model_configs[model_name]["max_tokens"], max_texts
+        )
+        self.metrics.record_histogram("embedding_pack_requests", plan.request_count, tags={"model": model_name})
+        return plan
     
     def get_model_config(self, model_name: str) -> Dict[str, Any]:
         """
@@ -468,6 +519,7 @@ class IntegrationPatternManager:
             return {
                 "connection_pool": pool_metrics,
                 "model_clients": client_metrics,
+                "embedding_cache": self.embedding_cache.get_stats(),
                 "available_models": len(self.model_configs),
                 "supported_patterns": len(self.pattern_handlers)
             }
@@ -13,6 +13,7 @@ import aiohttp
 from ..monitoring.metrics import MetricsCollector
 from ..utils.exceptions import ExternalModelError
 from .connection_pool import ConnectionPool
+from .batching import EmbeddingBatcher
 
 
 class ModelClients:
@@ -31,57 +32,69 @@ class ModelClients:
         self.timeout = client_config.get("timeout", 30.0)
         self.max_retries = client_config.get("max_retries", 3)
         self.retry_delay = client_config.get("retry_delay", 1.0)
+        self.request_timeout = aiohttp.ClientTimeout(total=self.timeout)
         
-        # Connection pool
+        # Connection pool, shared sessions per model host
         self.connection_pool = ConnectionPool(config, model_configs)
         
-        # HTTP session
-        self.session = None
+        # Coalesces concurrent small requests per model
+        self.batcher = EmbeddingBatcher(config, self._request_embeddings)
     
     async def startup(self):
         """Initialize model clients."""
-        # Create HTTP session
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        self.session = aiohttp.ClientSession(timeout=timeout)
-        
-        # Initialize connection pool
         await self.connection_pool.startup()
     
     async def shutdown(self):
         """Cleanup model clients."""
-        if self.session:
-            await self.session.close()
-        
+        await self.batcher.shutdown()
         await self.connection_pool.shutdown()
     
     async def get_embeddings(
         self,
         model_name: str,
         text_data: List[str],
-        priority: str = "normal"
+        priority: str = "normal",
+        coalesce: bool = True
     ) -> Dict[str, Any]:
         """
         Get embeddings from external model.
         
+        Small requests are batched with concurrent requests for the same
+        model; "high" priority requests wait the shortest.
+        
         Args:
             model_name: Name of the model
             text_data: List of text to embed
             priority: Request priority
+            coalesce: Whether the request may be batched with others; pass
+                False for requests already packed to the model's token limit
             
         Returns:
             Dict with embeddings and metadata
         """
+        if model_name not in self.model_configs:
+            raise ExternalModelError(f"Unknown model: {model_name}", model_name)
+        
+        if coalesce and self.batcher.accepts(text_data):
+            return await self.batcher.submit(model_name, text_data, priority)
+        
+        return await self._request_embeddings(model_name, text_data, priority)
+    
+    async def _request_embeddings(
+        self,
+        model_name: str,
+        text_data: List[str],
+        priority: str = "normal"
+    ) -> Dict[str, Any]:
+        """Send one embedding request to the model server."""
         start_time = time.time()
         
         try:
-            # Validate model
-            if model_name not in self.model_configs:
-                raise ExternalModelError(f"Unknown model: {model_name}")
-            
             model_config = self.model_configs[model_name]
             
             # Get connection from pool
-            connection = await self.connection_pool.get_connection(model_name)
+            connection = await self.connection_pool.get_connection(model_name, priority)
+            failed = True
             
             try:
                 # Prepare request
@@ -100,6 +113,7 @@ class ModelClients:
                 embeddings = []
                 for item in response_data.get("data", []):
                     embeddings.append(item["embedding"])
+                failed = False
                 
                 # Update metrics
                 duration = time.time() - start_time
@@ -117,7 +131,7 @@ class ModelClients:
                 
             finally:
                 # Return connection to pool
-                await self.connection_pool.return_connection(model_name, connection)
+                await self.connection_pool.return_connection(model_name, connection, failed)
                 
         except Exception as e:
             self.metrics.increment_counter("model_requests_total",
@@ -225,8 +239,8 @@ class ModelClients:
             return {
                 "total_models": len(self.model_configs),
                 "connection_pool": pool_metrics,
-                "models": model_metrics,
-                "session_active": self.session is not None and not self.session.closed
+                "batching": self.batcher.get_stats(),
+                "models": model_metrics
             }
             
         except Exception as e:
@@ -250,7 +264,7 @@ class ModelClients:
                 url = f"http://{model_config['server']}:{model_config['port']}{model_config['endpoint']}"
                 
                 # Make request
-                async with connection.post(url, json=request_data) as response:
+                async with connection.post(url, json=request_data, timeout=self.request_timeout) as response:
                     if response.status == 200:
                         return await response.json()
                     else:
@@ -0,0 +1,186 @@
+"""
+Token Packing
+=============
+
+Token-budget packing of embedding requests.
+Texts are sorted by length and packed into requests of at most max_texts
+pieces and, when configured, a per-request token budget; texts longer than
+a model's input limit are split into deterministic chunks whose
+embeddings are pooled back into one.
+"""
+
+from typing import Dict, Any, List, Optional, Callable, Tuple
+import math
+import numpy as np
+
+
+class PackPlan:
+    """
+    Requests built from a list of texts.
+    
+    Each request is a list of text pieces. assemble() maps the embeddings
+    of the requests back to one embedding per original text.
+    """
+    
+    def __init__(self, text_count: int):
+        self.text_count = text_count
+        self.requests: List[List[str]] = []
+        # Per request: (text index, piece tokens) of each piece
+        self.sources: List[List[Tuple[int, int]]] = []
+    
+    @property
+    def request_count(self) -> int:
+        """Number of requests in the plan."""
+        return len(self.requests)
+    
+    def assemble(self, request_embeddings: List[List[List[float]]]) -> List[List[float]]:
+        """
+        Put embeddings back in text order.
+        
+        Texts split into several chunks get the token-weighted mean of the
+        chunk embeddings, scaled to unit length.
+        
+        Args:
+            request_embeddings: Embeddings returned for each request
+        
+        Returns:
+            One embedding per original text
+        """
+        pieces: List[List[Tuple[List[float], int]]] = [[] for _ in range(self.text_count)]
+        for sources, embeddings in zip(self.sources, request_embeddings):
+            if len(embeddings) != len(sources):
+                raise ValueError(f"Expected {len(sources)} embeddings, got {len(embeddings)}")
+            for (index, tokens), embedding in zip(sources, embeddings):
+                pieces[index].append((embedding, tokens))
+        
+        results = []
+        for index, text_pieces in enumerate(pieces):
+            if not text_pieces:
+                raise ValueError(f"No embeddings for text {index}")
+            if len(text_pieces) == 1:
+                results.append(text_pieces[0][0])
+                continue
+            
+            vectors = np.asarray([embedding for embedding, _ in text_pieces], dtype=np.float64)
+            weights = np.asarray([tokens for _, tokens in text_pieces], dtype=np.float64)
+            pooled = weights @ vectors / weights.sum()
+            norm = np.linalg.norm(pooled)
+            results.append((pooled / norm if norm else pooled).tolist())
+        return results
+
+
+class TokenPacker:
+    """
+    Builds embedding requests that fit a model's token limits.
+    
+    Token counts come from the pluggable tokenizer when given, otherwise
+    from a fast estimate of chars_per_token characters (and at least one
+    token) per word. A model's max_tokens limits each input only. The
+    per-request budget comes from request_tokens for the model, or
+    batch_tokens for all models; requests are charged as padded batches,
+    i.e. their piece count times their longest piece, which sorting keeps
+    close to the real token count. Without a budget, requests are bounded
+    by max_texts alone.
+    """
+    
+    def __init__(self, config: Dict[str, Any], tokenizer: Optional[Callable[[str], int]] = None):
+        packing_config = config.get("token_packing", {})
+        self.chars_per_token = packing_config.get("chars_per_token", 4.0)
+        self.fill_ratio = packing_config.get("fill_ratio", 0.9)
+        self.overflow = packing_config.get("overflow", "chunk")
+        self.request_tokens = packing_config.get("request_tokens", {})
+        self.batch_tokens = packing_config.get("batch_tokens")
+        
+        self.tokenizer = tokenizer
+    
+    def count_tokens(self, text: str) -> int:
+        """Count or estimate the tokens of a text."""
+        if self.tokenizer is not None:
+            return self.tokenizer(text)
+        return max(math.ceil(len(text) / self.chars_per_token), len(text.split()), 1)
+    
+    def pack(
+        self,
+        model_name: str,
+        texts: List[str],
+        max_tokens: int,
+        max_texts: Optional[int] = None
+    ) -> PackPlan:
+        """
+        Plan the requests for a list of texts.
+        
+        Args:
+            model_name: Name of the model, for per-model request budgets
+            texts: Texts to embed
+            max_tokens: Model's token limit per input, used to split long texts
+            max_texts: Most pieces per request
+        
+        Returns:
+            Pack plan
+        """
+        piece_limit = max(int(max_tokens * self.fill_ratio), 1)
+        request_limit = None
+        request_tokens = self.request_tokens.get(model_name, self.batch_tokens)
+        if request_tokens is not None:
+            request_limit = max(int(request_tokens * self.fill_ratio), piece_limit)
+        
+        pieces = []
+        for index, text in enumerate(texts):
+            for piece in self._split(text, piece_limit):
+                pieces.append((self.count_tokens(piece), index, piece))
+        
+        # Similar lengths share requests, so padding stays small
+        pieces.sort(key=lambda piece: (piece[0], piece[1]))
+        
+        plan = PackPlan(len(texts))
+        request, sources = [], []
+        for tokens, index, piece in pieces:
+            # Sorted ascending, so this piece is the request's longest
+            full = max_texts is not None and len(request) >= max_texts
+            over_budget = request_limit is not None and (len(request) + 1) * tokens > request_limit
+            if request and (full or over_budget):
+                plan.requests.append(request)
+                plan.sources.append(sources)
+                request, sources = [], []
+            request.append(piece)
+            sources.append((index, tokens))
+        
+        if request:
+            plan.requests.append(request)
+            plan.sources.append(sources)
+        return plan
+    
+    def _split(self, text: str, limit: int) -> List[str]:
+        """Split a text into pieces of at most limit tokens."""
+        if self.count_tokens(text) <= limit:
+            return [text]
+        if not text.split():
+            # Whitespace-only text has no words to chunk; embed it as one empty piece
+            return [""]
+        
+        pieces, words, tokens = [], [], 0
+        for word in self._words(text, limit):
+            # Counting the separator keeps the joined piece within the limit
+            word_tokens = self.count_tokens(word + " ")
+            if words and tokens + word_tokens > limit:
+                pieces.append(" ".join(words))
+                if self.overflow == "truncate":
+                    return pieces
+                words, tokens = [], 0
+            words.append(word)
+            tokens += word_tokens
+        
+        if words:
+            pieces.append(" ".join(words))
+        return pieces[:1] if self.overflow == "truncate" else pieces
+    
+    def _words(self, text: str, limit: int) -> List[str]:
+        """Whitespace-separated words, with words over the limit cut into slices."""
+        width = max(int((limit - 1) * self.chars_per_token), 1)
+        words = []
+        for word in text.split():
+            if self.count_tokens(word) <= limit:
+                words.append(word)
+            else:
+                words.extend(word[i:i + width] for i in range(0, len(word), width))
+        return words
@@ -6,13 +6,16 @@ GraphQL schema and resolver implementation for vector database operations.
 Provides schema-based queries and mutations for vector operations.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
 import strawberry
 from strawberry.fastapi import GraphQLRouter
 from strawberry.types import Info
+from strawberry.types.nodes import SelectedField
 from ..vector_ops.operations import VectorOperationsManager
 from ..monitoring.metrics import MetricsCollector
 from ..utils.exceptions import VectorOperationError
+from ..utils.vector_batch import VectorBatch
 
 
 @strawberry.type
@@ -21,6 +24,7 @@ class VectorResult:
     id: str
     score: float
     metadata: Optional[Dict[str, Any]] = None
+    vector: Optional[List[float]] = None
 
 
 @strawberry.type
@@ -65,6 +69,31 @@ class SearchFilters:
     score_threshold: Optional[float] = None
 
 
+def _result_projection(info: Info) -> Tuple[bool, bool]:
+    """
+    Derive Qdrant vector/payload projection from the query selection.
+    
+    Vectors and payloads are only fetched when the query selects the
+    "vector" or "metadata" fields of its results.
+    """
+    selected = set()
+    
+    def collect(selections, depth):
+        for selection in selections:
+            if not isinstance(selection, SelectedField):
+                # Fragments contribute their own selections at this level
+                collect(selection.selections, depth)
+            elif depth == 1:
+                selected.add(selection.name)
+            elif selection.name == "results":
+                collect(selection.selections, depth + 1)
+    
+    for field in info.selected_fields:
+        collect(field.selections, 0)
+    
+    return "vector" in selected, "metadata" in selected
+
+
 class GraphQLHandler:
     """GraphQL API handler for vector database operations."""
     
@@ -126,13 +155,18 @@ class Query:
                 search_filters = filters.filters
                 score_threshold = filters.score_threshold
             
+            # Fetch only the result fields the query selects
+            with_vectors, with_payload = _result_projection(info)
+            
             # Perform search
             result = await vector_ops.similarity_search(
                 collection_name=collection,
                 query_vector=query_vector,
                 limit=limit,
                 filters=search_filters,
-                score_threshold=score_threshold
+                score_threshold=score_threshold,
+                with_vectors=with_vectors,
+                with_payload=with_payload
             )
             
             # Convert results to GraphQL types
@@ -140,7 +174,8 @@ class Query:
                 VectorResult(
                     id=r["id"],
                     score=r["score"],
-                    metadata=r.get("metadata")
+                    metadata=r.get("metadata"),
+                    vector=r.get("vector")
                 )
                 for r in result["results"]
             ]
@@ -161,6 +196,68 @@ class Query:
             metrics.increment_counter("graphql_search_errors")
             raise Exception(f"Internal error: {str(e)}")
     
+    @strawberry.field
+    async def multi_vector_search(
+        self,
+        info: Info,
+        collection: str,
+        query_vectors: List[List[float]],
+        limit: int = 10,
+        aggregation: str = "average",
+        filters: Optional[SearchFilters] = None
+    ) -> SearchResponse:
+        """Search with several query vectors in one batch."""
+        try:
+            vector_ops = info.context["vector_ops"]
+            metrics = info.context["metrics"]
+            
+            # Extract filters
+            search_filters = None
+            score_threshold = None
+            if filters:
+                search_filters = filters.filters
+                score_threshold = filters.score_threshold
+            
+            # Fetch only the result fields the query selects
+            with_vectors, with_payload = _result_projection(info)
+            
+            result = await vector_ops.multi_vector_search(
+                collection_name=collection,
+                query_vectors=query_vectors,
+                limit=limit,
+                filters=search_filters,
+                score_threshold=score_threshold,
+                aggregation_method=aggregation,
+                with_vectors=with_vectors,
+                with_payload=with_payload
+            )
+            
+            vector_results = [
+                VectorResult(
+                    id=r["id"],
+                    score=r["score"],
+                    metadata=r.get("metadata"),
+                    vector=r.get("vector")
+                )
+                for r in result["results"]
+            ]
+            
+            metrics.increment_counter("graphql_searches", len(query_vectors))
+            metrics.record_histogram("graphql_search_latency", result["duration"])
+            
+            return SearchResponse(
+                results=vector_results,
+                count=len(vector_results),
+                duration=result["duration"]
+            )
+            
+        except VectorOperationError as e:
+            metrics.increment_counter("graphql_search_errors")
+            raise Exception(f"Search error: {str(e)}")
+        except Exception as e:
+            metrics.increment_counter("graphql_search_errors")
+            raise Exception(f"Internal error: {str(e)}")
+    
     @strawberry.field
     async def get_collection_info(
         self,
@@ -241,22 +338,19 @@ class Mutation:
         info: Info,
         collection: str,
         vectors: List[VectorInput],
-        batch_size: int = 1000
+        batch_size: Optional[int] = None
     ) -> OperationResponse:
         """Insert vectors into a collection."""
         try:
             vector_ops = info.context["vector_ops"]
             metrics = info.context["metrics"]
             
-            # Convert GraphQL input to dict format
-            vector_data = [
-                {
-                    "id": v.id,
-                    "vector": v.vector,
-                    "metadata": v.metadata or {}
-                }
-                for v in vectors
-            ]
+            # Convert GraphQL input to a vector batch
+            vector_data = VectorBatch(
+                [v.id for v in vectors],
+                np.asarray([v.vector for v in vectors], dtype=np.float32),
+                [v.metadata or {} for v in vectors]
+            )
             
             # Insert vectors
             result = await vector_ops.insert_vectors(
@@ -6,17 +6,27 @@ gRPC service implementation for high-performance vector database operations.
 Provides protocol buffer-based API for vector operations.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 import asyncio
+import numpy as np
 import grpc
 from grpc import aio
 from concurrent import futures
 from ..vector_ops.operations import VectorOperationsManager
 from ..monitoring.metrics import MetricsCollector
-from ..utils.exceptions import VectorOperationError
+from ..utils.exceptions import VectorOperationError, ValidationError
+from ..utils.vector_batch import VectorBatch
 from ..schemas.grpc_proto import vector_service_pb2, vector_service_pb2_grpc
 
 
+def _payload_projection(request) -> Union[bool, List[str]]:
+    """Read the payload projection of a search request."""
+    if request.payload_fields:
+        return list(request.payload_fields)
+    # with_payload is an optional field that defaults to true when unset
+    return request.with_payload if request.HasField("with_payload") else True
+
+
 class VectorServiceServicer(vector_service_pb2_grpc.VectorServiceServicer):
     """gRPC service implementation for vector operations."""
     
@@ -27,20 +37,28 @@ class VectorServiceServicer(vector_service_pb2_grpc.VectorServiceServicer):
     async def InsertVectors(self, request, context):
         """Insert vectors into a collection."""
         try:
-            # Convert protobuf request to dict format
-            vectors = []
+            # Convert protobuf request to a vector batch
+            ids, rows, payloads = [], [], []
             for vector_data in request.vectors:
-                vectors.append({
-                    "id": vector_data.id,
-                    "vector": list(vector_data.vector),
-                    "metadata": dict(vector_data.metadata) if vector_data.metadata else {}
-                })
+                ids.append(vector_data.id)
+                if vector_data.vector_data:
+                    # Packed float32 bytes are wrapped without conversion
+                    rows.append(np.frombuffer(vector_data.vector_data, dtype="<f4"))
+                else:
+                    rows.append(np.asarray(vector_data.vector, dtype=np.float32))
+                payloads.append(dict(vector_data.metadata) if vector_data.metadata else {})
+            
+            if not rows:
+                raise VectorOperationError("No vectors to insert", "insert")
+            if len({row.shape[0] for row in rows}) > 1:
+                raise VectorOperationError("Vectors must have the same dimensions", "insert", len(rows))
+            vectors = VectorBatch(ids, np.vstack(rows), payloads).validate()
             
             # Insert vectors
             result = await self.vector_ops.insert_vectors(
                 collection_name=request.collection,
                 vectors=vectors,
-                batch_size=request.batch_size or 1000
+                batch_size=request.batch_size or None
             )
             
             self.metrics.increment_counter("grpc_inserts", len(vectors))
@@ -51,7 +69,7 @@ class VectorServiceServicer(vector_service_pb2_grpc.VectorServiceServicer):
                 duration=result["duration"]
             )
             
-        except VectorOperationError as e:
+        except (VectorOperationError, ValidationError) as e:
             self.metrics.increment_counter("grpc_insert_errors")
             context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
             context.set_details(str(e))
@@ -75,7 +93,9 @@ class VectorServiceServicer(vector_service_pb2_grpc.VectorServiceServicer):
                 query_vector=list(request.query_vector),
                 limit=request.limit or 10,
                 filters=filters,
-                score_threshold=score_threshold
+                score_threshold=score_threshold,
+                with_vectors=request.with_vector,
+                with_payload=_payload_projection(request)
             )
             
             # Convert results to protobuf format
@@ -87,6 +107,8 @@ class VectorServiceServicer(vector_service_pb2_grpc.VectorServiceServicer):
                 )
                 if r.get("metadata"):
                     search_result.metadata.update(r["metadata"])
+                if r.get("vector") is not None:
+                    search_result.vector.extend(r["vector"])
                 search_results.append(search_result)
             
             self.metrics.increment_counter("grpc_searches")
@@ -109,6 +131,57 @@ class VectorServiceServicer(vector_service_pb2_grpc.VectorServiceServicer):
             context.set_details(f"Internal error: {str(e)}")
             return vector_service_pb2.SearchResponse()
     
+    async def MultiVectorSearch(self, request, context):
+        """Search with several query vectors in one batch."""
+        try:
+            filters = dict(request.filters) if request.filters else None
+            score_threshold = request.score_threshold if request.score_threshold > 0 else None
+            query_vectors = [list(query.vector) for query in request.queries]
+            
+            result = await self.vector_ops.multi_vector_search(
+                collection_name=request.collection,
+                query_vectors=query_vectors,
+                limit=request.limit or 10,
+                filters=filters,
+                score_threshold=score_threshold,
+                aggregation_method=request.aggregation or "average",
+                with_vectors=request.with_vector,
+                with_payload=_payload_projection(request)
+            )
+            
+            # Convert results to protobuf format
+            search_results = []
+            for r in result["results"]:
+                search_result = vector_service_pb2.SearchResult(
+                    id=r["id"],
+                    score=r["score"]
+                )
+                if r.get("metadata"):
+                    search_result.metadata.update(r["metadata"])
+                if r.get("vector") is not None:
+                    search_result.vector.extend(r["vector"])
+                search_results.append(search_result)
+            
+            self.metrics.increment_counter("grpc_searches", len(query_vectors))
+            self.metrics.record_histogram("grpc_search_latency", result["duration"])
+            
+            return vector_service_pb2.SearchResponse(
+                results=search_results,
+                count=len(search_results),
+                duration=result["duration"]
+            )
+            
+        except VectorOperationError as e:
+            self.metrics.increment_counter("grpc_search_errors")
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(str(e))
+            return vector_service_pb2.SearchResponse()
+        except Exception as e:
+            self.metrics.increment_counter("grpc_search_errors")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Internal error: {str(e)}")
+            return vector_service_pb2.SearchResponse()
+    
     async def UpdateVector(self, request, context):
         """Update a vector in a collection."""
         try:
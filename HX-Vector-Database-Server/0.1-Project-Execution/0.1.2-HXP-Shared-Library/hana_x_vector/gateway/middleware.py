@@ -15,6 +15,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import redis.asyncio as redis
 from ..monitoring.metrics import MetricsCollector
 from ..utils.exceptions import AuthenticationError, ValidationError
+from ..utils.codec import CacheCodec
 from ..utils.validators import validate_api_key, validate_request_data
 
 
@@ -162,6 +163,7 @@ class CachingMiddleware:
         self.cache_enabled = config.get("cache", {}).get("enabled", True)
         self.cache_ttl = config.get("cache", {}).get("ttl", 300)  # 5 minutes
         self.cache_key_prefix = config.get("cache", {}).get("key_prefix", "hana_x_vector:")
+        self.codec = CacheCodec.from_config(config.get("cache", {}))
         
         # Redis connection
         self.redis_client = None
@@ -174,7 +176,7 @@ class CachingMiddleware:
                 host=redis_config.get("host", "localhost"),
                 port=redis_config.get("port", 6379),
                 db=redis_config.get("db", 0),
-                decode_responses=True
+                decode_responses=False
             )
     
     async def shutdown(self):
@@ -199,9 +201,12 @@ class CachingMiddleware:
             cached_response = await self.redis_client.get(cache_key)
             if cached_response:
                 self.metrics.increment_counter("cache_hits")
-                response_data = json.loads(cached_response)
+                response_data = self.codec.decode(cached_response)
+                content = response_data.get("content")
+                if content is None:
+                    content = self._render_json(response_data["json"])
                 return Response(
-                    content=response_data["content"],
+                    content=content,
                     status_code=response_data["status_code"],
                     headers=response_data["headers"],
                     media_type=response_data["media_type"]
@@ -262,17 +267,25 @@ class CachingMiddleware:
             
             # Prepare cache data
             cache_data = {
-                "content": response_body.decode(),
                 "status_code": response.status_code,
                 "headers": dict(response.headers),
                 "media_type": response.media_type
             }
             
+            # JSON bodies are stored parsed, so result vectors are packed as float32
+            body_json = self._parse_json_body(response, response_body)
+            if body_json is not None:
+                cache_data["json"] = body_json
+                # The body is rendered again on a hit and may change length
+                cache_data["headers"].pop("content-length", None)
+            else:
+                cache_data["content"] = response_body
+            
             # Store in cache
             await self.redis_client.setex(
                 cache_key,
                 self.cache_ttl,
-                json.dumps(cache_data)
+                self.codec.encode(cache_data)
             )
             
             # Recreate response with same content
@@ -282,6 +295,22 @@ class CachingMiddleware:
             # Log error but don't fail the request
             print(f"Cache storage error: {e}")
     
+    def _parse_json_body(self, response: Response, body: bytes) -> Optional[Any]:
+        """Parse a JSON response body, or return None for other bodies."""
+        content_type = response.headers.get("content-type", "")
+        if not content_type.startswith("application/json"):
+            return None
+        try:
+            return json.loads(body)
+        except ValueError:
+            return None
+    
+    def _render_json(self, data: Any) -> bytes:
+        """Render a cached JSON body the way JSONResponse does."""
+        return json.dumps(
+            data, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+    
     def _create_body_iterator(self, content: bytes):
         """Create a body iterator from content."""
         async def body_iterator():
@@ -6,21 +6,44 @@ FastAPI-based REST API implementation for vector database operations.
 Provides JSON/HTTP endpoints for all vector operations.
 """
 
-from typing import Dict, Any, List, Optional
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from typing import Dict, Any, List, Literal, Optional, Union
+from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
 import asyncio
+import base64
 from ..vector_ops.operations import VectorOperationsManager
+from ..vector_ops.ingest_queue import IngestQueue
 from ..monitoring.metrics import MetricsCollector
-from ..utils.exceptions import VectorOperationError
-from ..utils.validators import validate_vector_data
+from ..utils.exceptions import VectorOperationError, ValidationError, RateLimitError
+from ..utils.validators import validate_batch_vectors
+from ..utils.vector_batch import VectorBatch
 
 
 class VectorInsertRequest(BaseModel):
-    """Request model for vector insertion."""
+    """
+    Request model for vector insertion.
+    
+    Vectors are sent either as records in "vectors" or packed in
+    "vector_data" with one entry per row in "ids" and "metadata".
+    """
     collection: str = Field(..., description="Collection name")
-    vectors: List[Dict[str, Any]] = Field(..., description="Vector data with metadata")
-    batch_size: int = Field(1000, description="Batch size for insertion")
+    vectors: Optional[List[Dict[str, Any]]] = Field(None, description="Vector data with metadata")
+    ids: Optional[List[Union[str, int]]] = Field(None, description="Point IDs for the rows of vector_data")
+    vector_data: Optional[str] = Field(None, description="Base64 row-major little-endian float32 vectors")
+    dimension: Optional[int] = Field(None, description="Vector dimension of vector_data")
+    metadata: Optional[List[Dict[str, Any]]] = Field(None, description="Metadata for the rows of vector_data")
+    batch_size: Optional[int] = Field(None, description="Batch size for insertion; tuned by the server when omitted")
+    
+    def to_batch(self) -> VectorBatch:
+        """Decode the request into a vector batch."""
+        if self.vector_data is not None:
+            return VectorBatch.from_buffer(
+                self.ids or [],
+                base64.b64decode(self.vector_data),
+                self.dimension or 0,
+                self.metadata
+            )
+        return VectorBatch.from_records(self.vectors or [])
 
 
 class VectorSearchRequest(BaseModel):
@@ -30,6 +53,20 @@ class VectorSearchRequest(BaseModel):
     limit: int = Field(10, description="Number of results to return")
     filters: Optional[Dict[str, Any]] = Field(None, description="Metadata filters")
     score_threshold: Optional[float] = Field(None, description="Minimum similarity score")
+    with_vector: bool = Field(False, description="Include vector in results")
+    with_payload: Union[bool, List[str]] = Field(True, description="Include payload in results, or only the listed fields")
+
+
+class MultiVectorSearchRequest(BaseModel):
+    """Request model for multi-vector search."""
+    collection: str = Field(..., description="Collection name")
+    query_vectors: List[List[float]] = Field(..., description="Query vectors")
+    limit: int = Field(10, description="Number of results to return")
+    filters: Optional[Dict[str, Any]] = Field(None, description="Metadata filters")
+    score_threshold: Optional[float] = Field(None, description="Minimum similarity score")
+    aggregation: Literal["average", "max", "weighted"] = Field("average", description="Aggregation method")
+    with_vector: bool = Field(False, description="Include vector in results")
+    with_payload: Union[bool, List[str]] = Field(True, description="Include payload in results, or only the listed fields")
 
 
 class VectorUpdateRequest(BaseModel):
@@ -40,6 +77,11 @@ class VectorUpdateRequest(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(None, description="New metadata")
 
 
+class BatchOperationsRequest(BaseModel):
+    """Request model for asynchronous batch jobs."""
+    operations: List[Dict[str, Any]] = Field(..., description="Insert, update and delete operations")
+
+
 class CollectionCreateRequest(BaseModel):
     """Request model for collection creation."""
     name: str = Field(..., description="Collection name")
@@ -55,6 +97,7 @@ class RestHandler:
         self.config = config
         self.router = APIRouter()
         self.vector_ops = VectorOperationsManager(config)
+        self.ingest_queue = IngestQueue(config, self.vector_ops.batch_insert)
         self.metrics = MetricsCollector()
         
         self._setup_routes()
@@ -62,9 +105,11 @@ class RestHandler:
     async def startup(self):
         """Initialize REST handler."""
         await self.vector_ops.startup()
+        await self.ingest_queue.startup()
     
     async def shutdown(self):
         """Cleanup REST handler."""
+        await self.ingest_queue.shutdown()
         await self.vector_ops.shutdown()
     
     def _setup_routes(self):
@@ -74,25 +119,26 @@ class RestHandler:
         async def insert_vectors(request: VectorInsertRequest):
             """Insert vectors into a collection."""
             try:
-                # Validate vector data
-                validate_vector_data(request.vectors)
+                # Decode and validate vector data
+                batch = request.to_batch().validate()
                 
                 # Insert vectors
                 result = await self.vector_ops.insert_vectors(
                     collection_name=request.collection,
-                    vectors=request.vectors,
+                    vectors=batch,
                     batch_size=request.batch_size
                 )
                 
-                self.metrics.increment_counter("vectors_inserted", len(request.vectors))
+                self.metrics.increment_counter("vectors_inserted", result["inserted_count"])
                 return {
-                    "status": "success",
+                    "status": "partial" if result["failed_points"] else "success",
                     "inserted_count": result["inserted_count"],
                     "collection": request.collection,
-                    "duration": result["duration"]
+                    "duration": result["duration"],
+                    "failed_points": result["failed_points"]
                 }
                 
-            except VectorOperationError as e:
+            except (VectorOperationError, ValidationError) as e:
                 self.metrics.increment_counter("vector_insert_errors")
                 raise HTTPException(status_code=400, detail=str(e))
             except Exception as e:
@@ -103,13 +149,17 @@ class RestHandler:
         async def search_vectors(request: VectorSearchRequest):
             """Search for similar vectors."""
             try:
+                await self._validate_query_vectors(request.collection, [request.query_vector])
+                
                 # Perform similarity search
                 result = await self.vector_ops.similarity_search(
                     collection_name=request.collection,
                     query_vector=request.query_vector,
                     limit=request.limit,
                     filters=request.filters,
-                    score_threshold=request.score_threshold
+                    score_threshold=request.score_threshold,
+                    with_vectors=request.with_vector,
+                    with_payload=request.with_payload
                 )
                 
                 self.metrics.increment_counter("vector_searches")
@@ -122,7 +172,42 @@ class RestHandler:
                     "duration": result["duration"]
                 }
                 
-            except VectorOperationError as e:
+            except (VectorOperationError, ValidationError) as e:
+                self.metrics.increment_counter("vector_search_errors")
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                self.metrics.increment_counter("vector_search_errors")
+                raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+        
+        @self.router.post("/vectors/search/multi")
+        async def multi_vector_search(request: MultiVectorSearchRequest):
+            """Search with several query vectors in one batch."""
+            try:
+                await self._validate_query_vectors(request.collection, request.query_vectors)
+                
+                result = await self.vector_ops.multi_vector_search(
+                    collection_name=request.collection,
+                    query_vectors=request.query_vectors,
+                    limit=request.limit,
+                    filters=request.filters,
+                    score_threshold=request.score_threshold,
+                    aggregation_method=request.aggregation,
+                    with_vectors=request.with_vector,
+                    with_payload=request.with_payload
+                )
+                
+                self.metrics.increment_counter("vector_searches", len(request.query_vectors))
+                self.metrics.record_histogram("search_latency", result["duration"])
+                
+                return {
+                    "status": "success",
+                    "results": result["results"],
+                    "count": len(result["results"]),
+                    "query_count": result["query_count"],
+                    "duration": result["duration"]
+                }
+                
+            except (VectorOperationError, ValidationError) as e:
                 self.metrics.increment_counter("vector_search_errors")
                 raise HTTPException(status_code=400, detail=str(e))
             except Exception as e:
@@ -256,22 +341,66 @@ class RestHandler:
                 self.metrics.increment_counter("collection_delete_errors")
                 raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
         
-        @self.router.post("/vectors/batch")
-        async def batch_operations(background_tasks: BackgroundTasks):
-            """Handle batch vector operations."""
+        @self.router.post("/vectors/batch", status_code=202)
+        async def batch_operations(request: BatchOperationsRequest):
+            """Queue batch vector operations as a durable job."""
             try:
-                # Implement batch processing logic
-                background_tasks.add_task(self._process_batch_operations)
+                self._validate_batch_operations(request.operations)
+                job_id = await self.ingest_queue.submit(request.operations)
                 
+                self.metrics.increment_counter("batch_jobs_accepted")
                 return {
                     "status": "accepted",
-                    "message": "Batch operations queued for processing"
+                    "job_id": job_id,
+                    "operation_count": len(request.operations)
                 }
                 
+            except ValidationError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except RateLimitError as e:
+                raise HTTPException(status_code=429, detail=str(e))
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+        
+        @self.router.get("/vectors/batch")
+        async def list_batch_jobs():
+            """List pending and recently finished batch jobs."""
+            return {
+                "status": "success",
+                "jobs": self.ingest_queue.list_jobs()
+            }
+        
+        @self.router.get("/vectors/batch/{job_id}")
+        async def get_batch_job(job_id: str):
+            """Get status and progress of a batch job."""
+            job = self.ingest_queue.get_job(job_id)
+            if job is None:
+                raise HTTPException(status_code=404, detail=f"Batch job not found: {job_id}")
+            
+            return {
+                "status": "success",
+                "job": job
+            }
     
-    async def _process_batch_operations(self):
-        """Process batch operations in the background."""
-        # Implement batch processing logic
-        pass
+    async def _validate_query_vectors(self, collection: str, vectors: List[List[float]]):
+        """Check query vectors against the collection's dimension from the registry."""
+        info = await self.vector_ops.collection_registry.get(collection)
+        validate_batch_vectors(vectors, info.vector_size if info is not None else None)
+    
+    def _validate_batch_operations(self, operations: List[Dict[str, Any]]):
+        """Reject malformed operations before they reach the job log."""
+        if not operations:
+            raise ValidationError("Batch must contain at least one operation", field="operations")
+        
+        for index, op in enumerate(operations):
+            op_type = op.get("type", "insert")
+            if op_type not in ("insert", "update", "delete"):
+                raise ValidationError(f"Operation {index} has unknown type: {op_type}", field="operations")
+            if "collection" not in op:
+                raise ValidationError(f"Operation {index} is missing a collection", field="operations")
+            if op_type == "insert" and "data" not in op:
+                raise ValidationError(f"Operation {index} is missing data", field="operations")
+            if op_type == "update" and "vector_id" not in op:
+                raise ValidationError(f"Operation {index} is missing vector_id", field="operations")
+            if op_type == "delete" and "vector_id" not in op and "filters" not in op:
+                raise ValidationError(f"Operation {index} needs vector_id or filters", field="operations")
@@ -95,6 +95,42 @@ class MetricsCollector:
             registry=self.registry
         )
         
+        self.qdrant_executor_in_flight = Gauge(
+            'qdrant_executor_in_flight',
+            'Qdrant calls submitted and not yet completed',
+            ['pool'],
+            registry=self.registry
+        )
+        
+        self.qdrant_executor_queue_depth = Gauge(
+            'qdrant_executor_queue_depth',
+            'Qdrant calls waiting for a worker thread',
+            ['pool'],
+            registry=self.registry
+        )
+        
+        self.adaptive_batch_size = Gauge(
+            'adaptive_batch_size',
+            'Insert batch size chosen by the adaptive controller',
+            ['collection'],
+            registry=self.registry
+        )
+        
+        self.adaptive_batch_parallelism = Gauge(
+            'adaptive_batch_parallelism',
+            'Concurrent insert batches chosen by the adaptive controller',
+            ['collection'],
+            registry=self.registry
+        )
+        
+        self.qdrant_queue_wait_latency = Histogram(
+            'qdrant_queue_wait_seconds',
+            'Time Qdrant calls wait for a worker thread',
+            ['pool'],
+            buckets=[0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0],
+            registry=self.registry
+        )
+        
         # External model metrics
         self.external_model_requests_total = PrometheusCounter(
             'external_model_requests_total',
@@ -110,6 +146,14 @@ class MetricsCollector:
             registry=self.registry
         )
         
+        self.external_model_connection_wait_latency = Histogram(
+            'external_model_connection_wait_seconds',
+            'Time external model requests wait for a connection slot',
+            ['model', 'priority'],
+            buckets=[0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0],
+            registry=self.registry
+        )
+        
         # Cache metrics
         self.cache_operations_total = PrometheusCounter(
             'cache_operations_total',
@@ -125,6 +169,27 @@ class MetricsCollector:
             registry=self.registry
         )
         
+        self.cache_tier_requests_total = PrometheusCounter(
+            'cache_tier_requests_total',
+            'Total number of cache lookups by tier',
+            ['tier', 'result'],
+            registry=self.registry
+        )
+        
+        self.cache_tier_entries = Gauge(
+            'cache_tier_entries',
+            'Number of entries held by a cache tier',
+            ['tier'],
+            registry=self.registry
+        )
+        
+        self.cache_tier_bytes = Gauge(
+            'cache_tier_bytes',
+            'Approximate bytes held by a cache tier',
+            ['tier'],
+            registry=self.registry
+        )
+        
         # System metrics
         self.active_connections = Gauge(
             'active_connections',
@@ -425,6 +490,13 @@ class MetricsCollector:
             operation=operation,
             status=status
         ).inc(value)
+        
+        tier = tags.get("tier")
+        if tier and name in ("cache_hits", "cache_misses"):
+            self.cache_tier_requests_total.labels(
+                tier=tier,
+                result="hit" if name == "cache_hits" else "miss"
+            ).inc(value)
     
     def _update_duration_metrics(self, name: str, value: float, tags: Optional[Dict[str, str]]):
         """Update duration metrics."""
@@ -451,6 +523,13 @@ class MetricsCollector:
         elif "model_latency" in name:
             model = tags.get("model", "unknown")
             self.external_model_latency.labels(model=model).observe(value)
+        elif name == "qdrant_queue_wait_latency":
+            self.qdrant_queue_wait_latency.labels(pool=tags.get("pool", "unknown")).observe(value)
+        elif name == "model_connection_wait_latency":
+            self.external_model_connection_wait_latency.labels(
+                model=tags.get("model", "unknown"),
+                priority=tags.get("priority", "unknown")
+            ).observe(value)
     
     def _update_gauge_metrics(self, name: str, value: float, tags: Optional[Dict[str, str]]):
         """Update gauge metrics."""
@@ -463,6 +542,18 @@ class MetricsCollector:
         elif "cache_hit_ratio" in name:
             cache_type = tags.get("cache_type", "unknown")
             self.cache_hit_ratio.labels(cache_type=cache_type).set(value)
+        elif name == "cache_tier_entries":
+            self.cache_tier_entries.labels(tier=tags.get("tier", "unknown")).set(value)
+        elif name == "cache_tier_bytes":
+            self.cache_tier_bytes.labels(tier=tags.get("tier", "unknown")).set(value)
+        elif name == "qdrant_executor_in_flight":
+            self.qdrant_executor_in_flight.labels(pool=tags.get("pool", "unknown")).set(value)
+        elif name == "qdrant_executor_queue_depth":
+            self.qdrant_executor_queue_depth.labels(pool=tags.get("pool", "unknown")).set(value)
+        elif name == "adaptive_batch_size":
+            self.adaptive_batch_size.labels(collection=tags.get("collection", "unknown")).set(value)
+        elif name == "adaptive_batch_parallelism":
+            self.adaptive_batch_parallelism.labels(collection=tags.get("collection", "unknown")).set(value)
     
     def _percentile(self, values: List[float], percentile: int) -> float:
         """Calculate percentile of values."""
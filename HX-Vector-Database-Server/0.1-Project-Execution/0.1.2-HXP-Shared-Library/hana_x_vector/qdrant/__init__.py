@@ -8,18 +8,22 @@ collection management, and indexing optimization.
 Components:
 - QdrantClient: Main database client wrapper
 - CollectionManager: Collection schema and lifecycle management
+- CollectionRegistry: Shared cache of collection metadata
 - IndexOptimizer: Performance optimization for vector indices
 - ConfigManager: Qdrant-specific configuration management
 """
 
 from .client import QdrantClient
 from .collections import CollectionManager
+from .registry import CollectionInfo, CollectionRegistry
 from .indexing import IndexOptimizer
 from .config import QdrantConfigManager
 
 __all__ = [
     "QdrantClient",
     "CollectionManager",
+    "CollectionInfo",
+    "CollectionRegistry",
     "IndexOptimizer",
     "QdrantConfigManager"
 ]
@@ -8,23 +8,51 @@ Provides high-performance interface with connection pooling and error handling.
 
 from typing import Dict, Any, List, Optional, Union
 import asyncio
+import inspect
+import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from qdrant_client import QdrantClient as QdrantClientBase
 from qdrant_client.http import models
 from qdrant_client.http.exceptions import UnexpectedResponse
 from ..monitoring.metrics import MetricsCollector
 from ..utils.exceptions import QdrantConnectionError, VectorOperationError
+from ..utils.vector_batch import VectorBatch
+from ..utils.retry import RetryBudget, is_retryable_error
 from .collections import CollectionManager
 from .indexing import IndexOptimizer
 from .config import QdrantConfigManager
 
+try:
+    from qdrant_client import AsyncQdrantClient
+except ImportError:
+    AsyncQdrantClient = None
+
 
 class QdrantClient:
     """
     Optimized Qdrant client wrapper with performance enhancements.
     Provides connection pooling, retry logic, and comprehensive error handling.
+    
+    Calls run either on a native AsyncQdrantClient (engine "async") or on
+    dedicated thread pools per operation class (engine "executor"), so
+    Qdrant traffic never competes for the event loop's default executor.
     """
     
+    # Operation class of each client call; unlisted calls are "admin"
+    OPERATION_CLASSES = {
+        "_search_points": "search",
+        "_search_batch_points": "search",
+        "_retrieve_points": "search",
+        "_scroll_points": "search",
+        "_get_point": "search",
+        "_insert_points": "write",
+        "_update_point": "write",
+        "_delete_point": "write",
+        "_batch_update_points": "write",
+        "_delete_points": "write"
+    }
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.metrics = MetricsCollector()
@@ -46,43 +74,77 @@ class QdrantClient:
         self.batch_size = qdrant_config.get("batch_size", 1000)
         self.parallel_operations = qdrant_config.get("parallel_operations", 4)
         
+        # Execution engine: "executor" (sized thread pools) or "async" (AsyncQdrantClient)
+        self.engine = qdrant_config.get("engine", "executor")
+        if self.engine == "async" and AsyncQdrantClient is None:
+            print("Warning: AsyncQdrantClient not available, falling back to executor engine")
+            self.engine = "executor"
+        
+        executor_workers = qdrant_config.get("executor_workers", {})
+        self.executor_workers = {
+            "search": executor_workers.get("search", 16),
+            "write": executor_workers.get("write", 4),
+            "admin": executor_workers.get("admin", 2)
+        }
+        self.executors: Dict[str, ThreadPoolExecutor] = {}
+        
+        # Calls submitted but not yet completed, per operation class
+        self._in_flight = {operation_class: 0 for operation_class in self.executor_workers}
+        
         # Initialize components
-        self.collection_manager = CollectionManager(config)
-        self.index_optimizer = IndexOptimizer(config)
+        self.collection_manager = CollectionManager(self, config)
+        self.collection_registry = self.collection_manager.registry
+        self.index_optimizer = IndexOptimizer(self, qdrant_config)
         self.config_manager = QdrantConfigManager(config)
         
         # Client instances
         self.client = None
         self.grpc_client = None
+        self.async_client = None
         self._connection_lock = asyncio.Lock()
     
     async def startup(self):
         """Initialize Qdrant client connections."""
         async with self._connection_lock:
             try:
-                # Initialize HTTP client
-                self.client = QdrantClientBase(
-                    host=self.host,
-                    port=self.port,
-                    timeout=self.timeout
-                )
-                
-                # Initialize gRPC client if preferred
-                if self.prefer_grpc:
-                    self.grpc_client = QdrantClientBase(
+                # Initialize the execution engine
+                if self.engine == "async":
+                    # The async client serves every call; no sync clients are needed
+                    self.async_client = AsyncQdrantClient(
+                        host=self.host,
+                        port=self.port,
+                        grpc_port=self.grpc_port,
+                        prefer_grpc=self.prefer_grpc,
+                        timeout=self.timeout
+                    )
+                else:
+                    # Initialize HTTP client
+                    self.client = QdrantClientBase(
                         host=self.host,
-                        port=self.grpc_port,
-                        prefer_grpc=True,
+                        port=self.port,
                         timeout=self.timeout
                     )
+                    
+                    # Initialize gRPC client if preferred
+                    if self.prefer_grpc:
+                        self.grpc_client = QdrantClientBase(
+                            host=self.host,
+                            port=self.grpc_port,
+                            prefer_grpc=True,
+                            timeout=self.timeout
+                        )
+                    
+                    self.executors = {
+                        operation_class: ThreadPoolExecutor(
+                            max_workers=workers,
+                            thread_name_prefix=f"qdrant-{operation_class}"
+                        )
+                        for operation_class, workers in self.executor_workers.items()
+                    }
                 
                 # Test connections
                 await self._test_connections()
                 
-                # Initialize components
-                await self.collection_manager.startup()
-                await self.index_optimizer.startup()
-                
                 self.metrics.increment_counter("qdrant_connections_established")
                 
             except Exception as e:
@@ -93,16 +155,21 @@ class QdrantClient:
         """Cleanup Qdrant client connections."""
         async with self._connection_lock:
             try:
-                if self.collection_manager:
-                    await self.collection_manager.shutdown()
                 if self.index_optimizer:
-                    await self.index_optimizer.shutdown()
+                    await self.index_optimizer.cleanup()
                 
                 # Close clients
                 if self.client:
                     self.client.close()
                 if self.grpc_client:
                     self.grpc_client.close()
+                if self.async_client:
+                    await self.async_client.close()
+                    self.async_client = None
+                
+                for executor in self.executors.values():
+                    executor.shutdown(wait=False)
+                self.executors = {}
                 
                 self.metrics.increment_counter("qdrant_connections_closed")
                 
@@ -171,14 +238,18 @@ class QdrantClient:
     async def insert_vectors(
         self,
         collection_name: str,
-        vectors: List[Dict[str, Any]]
+        vectors: Union[List[Dict[str, Any]], VectorBatch],
+        wait: bool = True,
+        retry_budget: Optional[RetryBudget] = None
     ) -> Dict[str, Any]:
         """
         Insert vectors into a collection.
         
         Args:
             collection_name: Name of the collection
-            vectors: List of vector data
+            vectors: Vector batch, or list of vector data
+            wait: Wait until the upsert is applied, not only accepted
+            retry_budget: Retry budget shared with the caller's job
             
         Returns:
             Dict with insertion results
@@ -186,36 +257,36 @@ class QdrantClient:
         start_time = time.time()
         
         try:
-            # Convert to Qdrant points format
-            points = []
-            for vector_data in vectors:
-                point = models.PointStruct(
-                    id=vector_data["id"],
-                    vector=vector_data["vector"],
-                    payload=vector_data.get("metadata", {})
-                )
-                points.append(point)
+            # Send the batch in columnar form instead of one PointStruct per vector
+            batch = VectorBatch.coerce(vectors)
+            points = models.Batch(
+                ids=batch.ids,
+                vectors=batch.vectors.tolist(),
+                payloads=batch.payloads
+            )
             
             # Perform insertion with retry logic
             result = await self._execute_with_retry(
                 self._insert_points,
                 collection_name,
-                points
+                points,
+                wait,
+                retry_budget=retry_budget
             )
             
             duration = time.time() - start_time
             self.metrics.record_histogram("qdrant_insert_duration", duration)
-            self.metrics.increment_counter("qdrant_vectors_inserted", len(vectors))
+            self.metrics.increment_counter("qdrant_vectors_inserted", len(batch))
             
             return {
-                "inserted_count": len(vectors),
+                "inserted_count": len(batch),
                 "duration": duration,
                 "operation_id": result.operation_id if hasattr(result, 'operation_id') else None
             }
             
         except Exception as e:
             self.metrics.increment_counter("qdrant_insert_errors")
-            raise VectorOperationError(f"Vector insertion failed: {str(e)}")
+            raise VectorOperationError(f"Vector insertion failed: {str(e)}", "insert", len(vectors))
     
     async def search_vectors(
         self,
@@ -224,7 +295,10 @@ class QdrantClient:
         limit: int = 10,
         filters: Optional[Dict[str, Any]] = None,
         score_threshold: Optional[float] = None,
-        search_params: Optional[Dict[str, Any]] = None
+        search_params: Optional[Dict[str, Any]] = None,
+        offset: Optional[int] = None,
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True
     ) -> List[Dict[str, Any]]:
         """
         Search for similar vectors.
@@ -236,6 +310,9 @@ class QdrantClient:
             filters: Search filters
             score_threshold: Minimum similarity score
             search_params: Additional search parameters
+            offset: Number of top results to skip
+            with_vectors: Include stored vectors in the results
+            with_payload: Include payloads, or only the listed payload fields
             
         Returns:
             List of search results
@@ -257,20 +334,14 @@ class QdrantClient:
                 limit,
                 qdrant_filter,
                 score_threshold,
-                search_params
+                search_params,
+                offset,
+                with_vectors,
+                with_payload
             )
             
             # Convert results to standard format
-            formatted_results = []
-            for result in results:
-                formatted_result = {
-                    "id": str(result.id),
-                    "score": result.score,
-                    "metadata": result.payload or {}
-                }
-                if hasattr(result, 'vector') and result.vector:
-                    formatted_result["vector"] = result.vector
-                formatted_results.append(formatted_result)
+            formatted_results = self._format_search_results(results)
             
             duration = time.time() - start_time
             self.metrics.record_histogram("qdrant_search_duration", duration)
@@ -280,7 +351,73 @@ class QdrantClient:
             
         except Exception as e:
             self.metrics.increment_counter("qdrant_search_errors")
-            raise VectorOperationError(f"Vector search failed: {str(e)}")
+            raise VectorOperationError(f"Vector search failed: {str(e)}", "search")
+    
+    async def search_vectors_batch(
+        self,
+        collection_name: str,
+        query_vectors: List[List[float]],
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        score_threshold: Optional[float] = None,
+        search_params: Optional[Dict[str, Any]] = None,
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several query vectors in a single request.
+        
+        Args:
+            collection_name: Name of the collection
+            query_vectors: Query vectors
+            limit: Maximum number of results per query
+            filters: Search filters applied to every query
+            score_threshold: Minimum similarity score
+            search_params: Additional search parameters
+            with_vectors: Include stored vectors in the results
+            with_payload: Include payloads, or only the listed payload fields
+            
+        Returns:
+            One list of search results per query vector, in query order
+        """
+        start_time = time.time()
+        
+        try:
+            qdrant_filter = self._convert_filters(filters) if filters else None
+            search_params = search_params or {}
+            
+            requests = [
+                models.SearchRequest(
+                    vector=query_vector,
+                    filter=qdrant_filter,
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    params=models.SearchParams(**search_params) if search_params else None,
+                    with_vector=with_vectors,
+                    with_payload=with_payload
+                )
+                for query_vector in query_vectors
+            ]
+            
+            batch_results = await self._execute_with_retry(
+                self._search_batch_points,
+                collection_name,
+                requests
+            )
+            
+            formatted_results = [
+                self._format_search_results(results) for results in batch_results
+            ]
+            
+            duration = time.time() - start_time
+            self.metrics.record_histogram("qdrant_search_batch_duration", duration)
+            self.metrics.increment_counter("qdrant_searches_performed", len(query_vectors))
+            
+            return formatted_results
+            
+        except Exception as e:
+            self.metrics.increment_counter("qdrant_search_errors")
+            raise VectorOperationError(f"Batch vector search failed: {str(e)}", "search_batch", len(query_vectors))
     
     async def update_vector(
         self,
@@ -326,7 +463,7 @@ class QdrantClient:
             
         except Exception as e:
             self.metrics.increment_counter("qdrant_update_errors")
-            raise VectorOperationError(f"Vector update failed: {str(e)}")
+            raise VectorOperationError(f"Vector update failed: {str(e)}", "update")
     
     async def delete_vector(
         self,
@@ -360,12 +497,104 @@ class QdrantClient:
             
         except Exception as e:
             self.metrics.increment_counter("qdrant_delete_errors")
-            raise VectorOperationError(f"Vector deletion failed: {str(e)}")
+            raise VectorOperationError(f"Vector deletion failed: {str(e)}", "delete")
+    
+    async def update_points(
+        self,
+        collection_name: str,
+        updates: List[Dict[str, Any]],
+        merge_payload: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Update many points in a single batch_update_points request.
+        
+        Vector changes are sent as one UpdateVectors operation. Points that
+        receive the same payload share one payload operation.
+        
+        Args:
+            collection_name: Name of the collection
+            updates: List of {"vector_id", "vector", "metadata"} updates
+            merge_payload: Merge metadata into the payload instead of replacing it
+            
+        Returns:
+            Dict with update results
+        """
+        try:
+            operations = self._build_update_operations(updates, merge_payload)
+            if not operations:
+                return {"updated_count": 0, "operation_id": None}
+            
+            results = await self._execute_with_retry(
+                self._batch_update_points,
+                collection_name,
+                operations
+            )
+            
+            self.metrics.increment_counter("qdrant_vectors_updated", len(updates))
+            
+            return {
+                "updated_count": len(updates),
+                "operation_id": results[-1].operation_id if results else None
+            }
+            
+        except Exception as e:
+            self.metrics.increment_counter("qdrant_update_errors")
+            raise VectorOperationError(f"Bulk vector update failed: {str(e)}", "update_points", len(updates))
+    
+    async def delete_points(
+        self,
+        collection_name: str,
+        vector_ids: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Delete points by id list or by filter in a single request.
+        
+        Args:
+            collection_name: Name of the collection
+            vector_ids: IDs of the points to delete
+            filters: Payload filter selecting the points to delete
+            
+        Returns:
+            Dict with deletion results; deleted_count is None for filter deletes
+        """
+        if (vector_ids is None) == (filters is None):
+            raise VectorOperationError("Provide either vector_ids or filters", "delete_points")
+        
+        try:
+            if vector_ids is not None:
+                selector = models.PointIdsList(points=list(vector_ids))
+            else:
+                selector = models.FilterSelector(filter=self._convert_filters(filters))
+            
+            result = await self._execute_with_retry(
+                self._delete_points,
+                collection_name,
+                selector
+            )
+            
+            deleted_count = len(vector_ids) if vector_ids is not None else None
+            self.metrics.increment_counter("qdrant_vectors_deleted", deleted_count or 0)
+            
+            return {
+                "deleted_count": deleted_count,
+                "operation_id": result.operation_id if hasattr(result, 'operation_id') else None
+            }
+            
+        except Exception as e:
+            self.metrics.increment_counter("qdrant_delete_errors")
+            raise VectorOperationError(
+                f"Bulk vector deletion failed: {str(e)}",
+                "delete_points",
+                len(vector_ids) if vector_ids is not None else None
+            )
     
     async def get_vector(
         self,
         collection_name: str,
-        vector_id: str
+        vector_id: str,
+        with_vectors: bool = True,
+        with_payload: Union[bool, List[str]] = True
     ) -> Dict[str, Any]:
         """
         Get a specific vector by ID.
@@ -373,40 +602,79 @@ class QdrantClient:
         Args:
             collection_name: Name of the collection
             vector_id: ID of the vector to retrieve
+            with_vectors: Include the stored vector
+            with_payload: Include the payload, or only the listed payload fields
             
         Returns:
             Dict with vector data
         """
         try:
             # Perform retrieval with retry logic
-            result = await self._execute_with_retry(
+            points = await self._execute_with_retry(
                 self._get_point,
                 collection_name,
-                vector_id
+                vector_id,
+                with_vectors,
+                with_payload
             )
             
-            if result:
+            if points:
                 return {
                     "found": True,
-                    "vector": {
-                        "id": str(result.id),
-                        "vector": result.vector,
-                        "metadata": result.payload or {}
-                    }
+                    "vector": self._format_points(points[:1])[0]
                 }
             else:
                 return {"found": False}
                 
         except Exception as e:
             self.metrics.increment_counter("qdrant_retrieval_errors")
-            raise VectorOperationError(f"Vector retrieval failed: {str(e)}")
+            raise VectorOperationError(f"Vector retrieval failed: {str(e)}", "get")
+    
+    async def retrieve_points(
+        self,
+        collection_name: str,
+        vector_ids: List[str],
+        with_vectors: bool = False,
+        with_payload: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve several points by ID.
+        
+        Args:
+            collection_name: Name of the collection
+            vector_ids: IDs of the points to retrieve
+            with_vectors: Include vectors in the results
+            with_payload: Include payloads in the results
+            
+        Returns:
+            List of found points (missing IDs are skipped)
+        """
+        if not vector_ids:
+            return []
+        
+        try:
+            points = await self._execute_with_retry(
+                self._retrieve_points,
+                collection_name,
+                vector_ids,
+                with_vectors,
+                with_payload
+            )
+            return self._format_points(points)
+            
+        except Exception as e:
+            self.metrics.increment_counter("qdrant_retrieval_errors")
+            raise VectorOperationError(f"Point retrieval failed: {str(e)}", "retrieve", len(vector_ids))
     
     async def scroll_points(
         self,
         collection_name: str,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
-        offset: Optional[str] = None
+        offset: Optional[str] = None,
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True,
+        vector_ids: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Scroll through points in a collection.
@@ -416,92 +684,195 @@ class QdrantClient:
             filters: Search filters
             limit: Maximum number of results
             offset: Pagination offset
+            with_vectors: Include vectors in the results
+            with_payload: Include payloads, or only the listed payload fields
+            vector_ids: Restrict the scroll to these point IDs
             
         Returns:
             List of points
         """
+        page = await self.scroll_page(
+            collection_name, filters, limit, offset,
+            with_vectors=with_vectors,
+            with_payload=with_payload,
+            vector_ids=vector_ids
+        )
+        return page["points"]
+    
+    async def scroll_page(
+        self,
+        collection_name: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        offset: Optional[str] = None,
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True,
+        vector_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch one page of a scroll together with the next page offset.
+        
+        Args:
+            collection_name: Name of the collection
+            filters: Search filters
+            limit: Maximum number of results
+            offset: Offset returned by the previous page
+            with_vectors: Include vectors in the results
+            with_payload: Include payloads, or only the listed payload fields
+            vector_ids: Restrict the scroll to these point IDs
+            
+        Returns:
+            Dict with "points" and "next_offset" (None on the last page)
+        """
         try:
             # Convert filters to Qdrant format
             qdrant_filter = self._convert_filters(filters) if filters else None
             
+            if vector_ids is not None:
+                id_condition = models.HasIdCondition(has_id=list(vector_ids))
+                if qdrant_filter:
+                    qdrant_filter.must = list(qdrant_filter.must or []) + [id_condition]
+                else:
+                    qdrant_filter = models.Filter(must=[id_condition])
+            
             # Perform scroll with retry logic
-            result = await self._execute_with_retry(
+            points, next_offset = await self._execute_with_retry(
                 self._scroll_points,
                 collection_name,
                 qdrant_filter,
                 limit,
-                offset
+                offset,
+                with_vectors,
+                with_payload
             )
             
-            # Convert results to standard format
-            formatted_results = []
-            for point in result[0]:  # result is (points, next_page_offset)
-                formatted_result = {
-                    "id": str(point.id),
-                    "metadata": point.payload or {}
-                }
-                if hasattr(point, 'vector') and point.vector:
-                    formatted_result["vector"] = point.vector
-                formatted_results.append(formatted_result)
-            
-            return formatted_results
+            return {
+                "points": self._format_points(points),
+                "next_offset": next_offset
+            }
             
         except Exception as e:
             self.metrics.increment_counter("qdrant_scroll_errors")
-            raise VectorOperationError(f"Point scrolling failed: {str(e)}")
+            raise VectorOperationError(f"Point scrolling failed: {str(e)}", "scroll")
     
     async def _test_connections(self):
-        """Test Qdrant connections."""
+        """Test Qdrant connections on the configured engine."""
         try:
+            if self.async_client is not None:
+                await self.async_client.get_collections()
+                return
+            
             # Test HTTP connection
             if self.client:
-                await asyncio.get_event_loop().run_in_executor(
-                    None, self.client.get_collections
+                await asyncio.get_running_loop().run_in_executor(
+                    self.executors.get("admin"), self.client.get_collections
                 )
             
             # Test gRPC connection
             if self.grpc_client:
-                await asyncio.get_event_loop().run_in_executor(
-                    None, self.grpc_client.get_collections
+                await asyncio.get_running_loop().run_in_executor(
+                    self.executors.get("admin"), self.grpc_client.get_collections
                 )
                 
         except Exception as e:
             raise QdrantConnectionError(f"Connection test failed: {str(e)}")
     
-    async def _execute_with_retry(self, func, *args, **kwargs):
-        """Execute function with retry logic."""
-        last_exception = None
+    async def _execute_with_retry(self, func, *args, retry_budget: Optional[RetryBudget] = None, **kwargs):
+        """
+        Execute function with retry logic.
         
-        for attempt in range(self.max_retries):
+        Transient failures are retried while the budget allows; errors that
+        would fail the same way again are raised immediately.
+        """
+        operation_class = self.OPERATION_CLASSES.get(func.__name__, "admin")
+        if retry_budget is None:
+            retry_budget = RetryBudget(min_retries=self.max_retries - 1, ratio=0.0, retry_delay=self.retry_delay)
+        
+        attempt = 0
+        while True:
+            retry_budget.record_attempt()
             try:
-                # Use gRPC client if available and preferred
-                client = self.grpc_client if self.grpc_client else self.client
-                
-                # Execute in thread pool to avoid blocking
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None, func, client, *args, **kwargs
-                )
-                
-                return result
+                return await self._execute(operation_class, func, *args, **kwargs)
                 
             except Exception as e:
-                last_exception = e
-                
-                if attempt == self.max_retries - 1:
-                    break
-                
-                # Wait before retry
-                await asyncio.sleep(self.retry_delay * (attempt + 1))
+                if not is_retryable_error(e) or not await retry_budget.acquire(attempt):
+                    # Retries exhausted or pointless
+                    self.metrics.increment_counter("qdrant_retry_failures")
+                    raise
+                attempt += 1
+    
+    async def _execute(self, operation_class: str, func, *args, **kwargs):
+        """Run one client call on the configured engine."""
+        self._in_flight[operation_class] += 1
+        self._record_queue_metrics(operation_class)
+        
+        try:
+            if self.async_client is not None:
+                # Native async client: the call returns a coroutine
+                result = func(self.async_client, *args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+            
+            # Use gRPC client if available and preferred
+            client = self.grpc_client if self.grpc_client else self.client
+            submitted_at = time.perf_counter()
+            started_at = submitted_at
+            
+            def run():
+                nonlocal started_at
+                started_at = time.perf_counter()
+                return func(client, *args, **kwargs)
+            
+            # Execute in the operation class's own thread pool
+            executor = self.executors.get(operation_class)
+            result = await asyncio.get_running_loop().run_in_executor(executor, run)
+            
+            self.metrics.record_histogram(
+                "qdrant_queue_wait_latency", started_at - submitted_at,
+                tags={"pool": operation_class}
+            )
+            return result
+            
+        finally:
+            self._in_flight[operation_class] -= 1
+            self._record_queue_metrics(operation_class)
+    
+    def _record_queue_metrics(self, operation_class: str):
+        """Publish in-flight calls and queue depth for an operation class."""
+        in_flight = self._in_flight[operation_class]
+        tags = {"pool": operation_class}
+        
+        self.metrics.record_gauge("qdrant_executor_in_flight", in_flight, tags=tags)
+        if self.async_client is None:
+            # Calls beyond the pool's worker count wait in its queue
+            queue_depth = max(in_flight - self.executor_workers[operation_class], 0)
+            self.metrics.record_gauge("qdrant_executor_queue_depth", queue_depth, tags=tags)
+    
+    def get_executor_stats(self) -> Dict[str, Any]:
+        """
+        Get execution engine statistics.
         
-        # All retries failed
-        self.metrics.increment_counter("qdrant_retry_failures")
-        raise last_exception
+        Returns:
+            Dict with the engine and per-class in-flight and queued calls
+        """
+        pools = {}
+        for operation_class, in_flight in self._in_flight.items():
+            workers = self.executor_workers[operation_class]
+            pools[operation_class] = {
+                "in_flight": in_flight,
+                "workers": workers if self.async_client is None else None,
+                "queue_depth": max(in_flight - workers, 0) if self.async_client is None else 0
+            }
+        
+        return {"engine": self.engine, "pools": pools}
     
-    def _insert_points(self, client, collection_name: str, points: List[models.PointStruct]):
+    def _insert_points(self, client, collection_name: str, points: models.Batch, wait: bool = True):
         """Insert points using Qdrant client."""
         return client.upsert(
             collection_name=collection_name,
-            points=points
+            points=points,
+            wait=wait
         )
     
     def _search_points(
@@ -512,7 +883,10 @@ class QdrantClient:
         limit: int,
         qdrant_filter: Optional[models.Filter],
         score_threshold: Optional[float],
-        search_params: Dict[str, Any]
+        search_params: Dict[str, Any],
+        offset: Optional[int] = None,
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True
     ):
         """Search points using Qdrant client."""
         return client.search(
@@ -520,10 +894,52 @@ class QdrantClient:
             query_vector=query_vector,
             query_filter=qdrant_filter,
             limit=limit,
+            offset=offset,
             score_threshold=score_threshold,
-            search_params=models.SearchParams(**search_params) if search_params else None
+            search_params=models.SearchParams(**search_params) if search_params else None,
+            with_vectors=with_vectors,
+            with_payload=with_payload
+        )
+    
+    def _search_batch_points(
+        self,
+        client,
+        collection_name: str,
+        requests: List["models.SearchRequest"]
+    ):
+        """Search several queries using Qdrant client."""
+        return client.search_batch(
+            collection_name=collection_name,
+            requests=requests
         )
     
+    def _format_points(self, points) -> List[Dict[str, Any]]:
+        """Convert Qdrant records to the standard point format."""
+        formatted_points = []
+        for point in points:
+            formatted_point = {
+                "id": str(point.id),
+                "metadata": point.payload or {}
+            }
+            if getattr(point, 'vector', None) is not None:
+                formatted_point["vector"] = point.vector
+            formatted_points.append(formatted_point)
+        return formatted_points
+    
+    def _format_search_results(self, results) -> List[Dict[str, Any]]:
+        """Convert Qdrant scored points to the standard result format."""
+        formatted_results = []
+        for result in results:
+            formatted_result = {
+                "id": str(result.id),
+                "score": result.score,
+                "metadata": result.payload or {}
+            }
+            if getattr(result, 'vector', None) is not None:
+                formatted_result["vector"] = result.vector
+            formatted_results.append(formatted_result)
+        return formatted_results
+    
     def _update_point(
         self,
         client,
@@ -542,6 +958,71 @@ class QdrantClient:
             points=[point]
         )
     
+    def _build_update_operations(
+        self,
+        updates: List[Dict[str, Any]],
+        merge_payload: bool
+    ) -> List[Any]:
+        """
+        Group point updates into batch_update_points operations.
+        
+        Repeated updates of a point are collapsed first, in submission order
+        (the last vector wins; payloads are replaced or merged in turn), so
+        grouping points by payload cannot reorder them.
+        """
+        point_vectors: Dict[Any, Any] = {}
+        point_payloads: Dict[Any, Dict[str, Any]] = {}
+        
+        for update in updates:
+            point_id = update["vector_id"]
+            if update.get("vector") is not None:
+                point_vectors[point_id] = update["vector"]
+            if update.get("metadata") is not None:
+                if merge_payload and point_id in point_payloads:
+                    point_payloads[point_id] = {**point_payloads[point_id], **update["metadata"]}
+                else:
+                    point_payloads[point_id] = update["metadata"]
+        
+        payload_groups: Dict[str, Dict[str, Any]] = {}
+        for point_id, payload in point_payloads.items():
+            key = json.dumps(payload, sort_keys=True, default=str)
+            group = payload_groups.setdefault(key, {"payload": payload, "points": []})
+            group["points"].append(point_id)
+        
+        operations = []
+        if point_vectors:
+            operations.append(
+                models.UpdateVectorsOperation(
+                    update_vectors=models.UpdateVectors(points=[
+                        models.PointVectors(id=point_id, vector=vector)
+                        for point_id, vector in point_vectors.items()
+                    ])
+                )
+            )
+        
+        for group in payload_groups.values():
+            payload = models.SetPayload(payload=group["payload"], points=group["points"])
+            if merge_payload:
+                operations.append(models.SetPayloadOperation(set_payload=payload))
+            else:
+                operations.append(models.OverwritePayloadOperation(overwrite_payload=payload))
+        
+        return operations
+    
+    def _batch_update_points(self, client, collection_name: str, operations: List[Any]):
+        """Apply grouped update operations using Qdrant client."""
+        return client.batch_update_points(
+            collection_name=collection_name,
+            update_operations=operations
+        )
+    
+    def _delete_points(self, client, collection_name: str, selector: Any):
+        """Delete points by selector using Qdrant client."""
+        return client.delete(
+            collection_name=collection_name,
+            points_selector=selector
+        )
+    
     def _delete_point(self, client, collection_name: str, vector_id: str):
         """Delete point using Qdrant client."""
         return client.delete(
@@ -551,15 +1032,21 @@ class QdrantClient:
             )
         )
     
-    def _get_point(self, client, collection_name: str, vector_id: str):
+    def _get_point(
+        self,
+        client,
+        collection_name: str,
+        vector_id: str,
+        with_vectors: bool = True,
+        with_payload: Union[bool, List[str]] = True
+    ):
         """Get point using Qdrant client."""
-        result = client.retrieve(
+        return client.retrieve(
             collection_name=collection_name,
             ids=[vector_id],
-            with_vectors=True,
-            with_payload=True
+            with_vectors=with_vectors,
+            with_payload=with_payload
         )
-        return result[0] if result else None
     
     def _scroll_points(
         self,
@@ -567,7 +1054,9 @@ class QdrantClient:
         collection_name: str,
         qdrant_filter: Optional[models.Filter],
         limit: int,
-        offset: Optional[str]
+        offset: Optional[str],
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True
     ):
         """Scroll points using Qdrant client."""
         return client.scroll(
@@ -575,8 +1064,24 @@ class QdrantClient:
             scroll_filter=qdrant_filter,
             limit=limit,
             offset=offset,
-            with_vectors=True,
-            with_payload=True
+            with_vectors=with_vectors,
+            with_payload=with_payload
+        )
+    
+    def _retrieve_points(
+        self,
+        client,
+        collection_name: str,
+        vector_ids: List[str],
+        with_vectors: bool,
+        with_payload: bool
+    ):
+        """Retrieve points using Qdrant client."""
+        return client.retrieve(
+            collection_name=collection_name,
+            ids=vector_ids,
+            with_vectors=with_vectors,
+            with_payload=with_payload
         )
     
     def _convert_filters(self, filters: Dict[str, Any]) -> models.Filter:
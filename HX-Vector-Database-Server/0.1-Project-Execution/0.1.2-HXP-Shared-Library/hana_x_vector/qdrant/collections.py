@@ -7,15 +7,19 @@ Handles collection creation, configuration, and lifecycle management.
 """
 
 from typing import Dict, Any, List, Optional
-import asyncio
-from ..utils.exceptions import QdrantError, CollectionError
+from qdrant_client.http import models
+from ..utils.exceptions import QdrantError, CollectionError, CollectionNotFoundError
 from ..utils.validators import CollectionValidator
+from .registry import CollectionInfo, CollectionRegistry
 
 
 class CollectionManager:
     """
     Qdrant collection management.
     Handles collection creation, configuration, and lifecycle management.
+    
+    Metadata reads go through the collection registry; creates, updates
+    and deletes update the registry as they complete.
     """
     
     def __init__(self, qdrant_client, config: Dict[str, Any]):
@@ -23,17 +27,18 @@ class CollectionManager:
         self.config = config
         
         # Collection configuration
-        self.default_vector_size = config.get("default_vector_size", 384)
-        self.default_distance = config.get("default_distance", "cosine")
-        self.default_shard_number = config.get("default_shard_number", 1)
-        self.default_replication_factor = config.get("default_replication_factor", 1)
+        collection_config = config.get("collections", {})
+        self.default_vector_size = collection_config.get("default_vector_size", 384)
+        self.default_distance = collection_config.get("default_distance", "Cosine")
+        self.default_shard_number = collection_config.get("default_shard_number", 1)
+        self.default_replication_factor = collection_config.get("default_replication_factor", 1)
         
-        # Collection cache
-        self.collection_cache = {}
-        self.cache_ttl = config.get("cache_ttl", 300)  # 5 minutes
+        # Collection metadata cache
+        self.registry = CollectionRegistry(config, self.load_collection, self.list_collection_names)
     
-    async def create_collection(self, name: str, vector_size: int, 
-                              distance: str = "cosine", **kwargs) -> Dict[str, Any]:
+    async def create_collection(self, name: str, vector_size: int,
+                              distance: str = "Cosine", config: Optional[Dict[str, Any]] = None,
+                              **kwargs) -> Dict[str, Any]:
         """
         Create a new collection.
         
@@ -41,11 +46,12 @@ class CollectionManager:
             name: Collection name
             vector_size: Vector dimension
             distance: Distance metric
+            config: Additional configuration
             **kwargs: Additional configuration
-            
+        
         Returns:
             Collection information
-            
+        
         Raises:
             CollectionError: If creation fails
         """
@@ -53,102 +59,132 @@ class CollectionManager:
         validated_name = CollectionValidator.validate_collection_name(name)
         validated_size = CollectionValidator.validate_vector_size(vector_size)
         validated_distance = CollectionValidator.validate_distance_metric(distance)
+        options = {**(config or {}), **kwargs}
         
         try:
             # Create collection configuration
-            config = {
-                "vectors": {
-                    "size": validated_size,
-                    "distance": validated_distance
-                },
-                "shard_number": kwargs.get("shard_number", self.default_shard_number),
-                "replication_factor": kwargs.get("replication_factor", self.default_replication_factor),
-                "write_consistency_factor": kwargs.get("write_consistency_factor", 1)
+            collection_config = {
+                "shard_number": options.get("shard_number", self.default_shard_number),
+                "replication_factor": options.get("replication_factor", self.default_replication_factor),
+                "write_consistency_factor": options.get("write_consistency_factor", 1)
             }
             
             # Create collection via Qdrant client
-            result = await self.qdrant_client.create_collection(validated_name, config)
+            await self.qdrant_client._execute_with_retry(
+                self._create_collection,
+                validated_name,
+                models.VectorParams(size=validated_size, distance=models.Distance(validated_distance)),
+                collection_config
+            )
             
-            # Cache collection info
-            self.collection_cache[validated_name] = {
-                "name": validated_name,
+            self.registry.put(CollectionInfo(
+                name=validated_name,
+                vector_size=validated_size,
+                distance=validated_distance,
+                config=collection_config
+            ))
+            
+            return {
+                "created": True,
+                "collection": validated_name,
                 "vector_size": validated_size,
-                "distance": validated_distance,
-                "config": config,
-                "created_at": asyncio.get_event_loop().time()
+                "distance": validated_distance
             }
-            
-            return result
-            
+        
         except Exception as e:
+            self.registry.invalidate(validated_name)
             raise CollectionError(f"Failed to create collection {validated_name}: {str(e)}", validated_name)
     
-    async def get_collection(self, name: str) -> Optional[Dict[str, Any]]:
+    async def get_collection(self, name: str) -> Optional[CollectionInfo]:
         """
         Get collection information.
         
         Args:
             name: Collection name
-            
+        
         Returns:
             Collection information or None if not found
         """
-        # Check cache first
-        if name in self.collection_cache:
-            cached = self.collection_cache[name]
-            if asyncio.get_event_loop().time() - cached["created_at"] < self.cache_ttl:
-                return cached
-        
         try:
-            # Get from Qdrant
-            result = await self.qdrant_client.get_collection(name)
-            
-            # Update cache
-            if result:
-                self.collection_cache[name] = {
-                    **result,
-                    "created_at": asyncio.get_event_loop().time()
-                }
-            
-            return result
-            
+            return await self.registry.get(name)
         except Exception as e:
             raise CollectionError(f"Failed to get collection {name}: {str(e)}", name)
     
-    async def list_collections(self) -> List[Dict[str, Any]]:
+    async def get_collection_info(self, name: str) -> Dict[str, Any]:
+        """
+        Get collection information.
+        
+        Args:
+            name: Collection name
+        
+        Returns:
+            Dict with collection information
+        
+        Raises:
+            CollectionNotFoundError: If the collection does not exist
+        """
+        info = await self.get_collection(name)
+        if info is None:
+            raise CollectionNotFoundError(f"Collection {name} not found", name)
+        return {"info": info.to_dict()}
+    
+    async def list_collections(self) -> Dict[str, Any]:
         """
         List all collections.
         
         Returns:
-            List of collection information
+            Dict with collection names
         """
         try:
-            return await self.qdrant_client.list_collections()
+            return {"collections": await self.list_collection_names()}
         except Exception as e:
             raise QdrantError(f"Failed to list collections: {str(e)}")
     
-    async def delete_collection(self, name: str) -> bool:
+    async def list_collection_names(self) -> List[str]:
+        """List the names of all collections in Qdrant."""
+        response = await self.qdrant_client._execute_with_retry(self._list_collections)
+        return [collection.name for collection in response.collections]
+    
+    async def load_collection(self, name: str) -> Optional[CollectionInfo]:
+        """
+        Read collection metadata from Qdrant, bypassing the registry.
+        
+        Args:
+            name: Collection name
+        
+        Returns:
+            Collection metadata, or None if the collection does not exist
+        """
+        try:
+            info = await self.qdrant_client._execute_with_retry(self._get_collection, name)
+        except Exception as e:
+            if self._is_not_found(e):
+                return None
+            raise
+        
+        return self._to_collection_info(name, info)
+    
+    async def delete_collection(self, name: str) -> Dict[str, Any]:
         """
         Delete a collection.
         
         Args:
             name: Collection name
-            
+        
         Returns:
-            True if successful
-            
+            Dict with deletion results
+        
         Raises:
             CollectionError: If deletion fails
         """
         try:
-            result = await self.qdrant_client.delete_collection(name)
-            
-            # Remove from cache
-            self.collection_cache.pop(name, None)
-            
-            return result
+            deleted = await self.qdrant_client._execute_with_retry(self._delete_collection, name)
+            self.registry.mark_missing(name)
             
+            return {"deleted": bool(deleted), "collection": name}
+        
         except Exception as e:
+            self.registry.invalidate(name)
             raise CollectionError(f"Failed to delete collection {name}: {str(e)}", name)
     
     async def update_collection(self, name: str, config: Dict[str, Any]) -> Dict[str, Any]:
@@ -157,28 +193,25 @@ class CollectionManager:
         
         Args:
             name: Collection name
-            config: New configuration
-            
+            config: New optimizer and HNSW configuration
+        
         Returns:
-            Updated collection information
+            Dict with update results
         """
-        # Validate configuration
-        validated_config = CollectionValidator.validate_collection_config(config)
-        
         try:
-            result = await self.qdrant_client.update_collection(name, validated_config)
-            
-            # Update cache
-            if name in self.collection_cache:
-                self.collection_cache[name].update({
-                    "config": validated_config,
-                    "created_at": asyncio.get_event_loop().time()
-                })
-            
-            return result
-            
+            updated = await self.qdrant_client._execute_with_retry(
+                self._update_collection,
+                name,
+                config.get("optimizers_config"),
+                config.get("hnsw_config")
+            )
+            return {"updated": bool(updated), "collection": name}
+        
         except Exception as e:
             raise CollectionError(f"Failed to update collection {name}: {str(e)}", name)
+        
+        finally:
+            self.registry.invalidate(name)
     
     async def collection_exists(self, name: str) -> bool:
         """
@@ -186,7 +219,7 @@ class CollectionManager:
         
         Args:
             name: Collection name
-            
+        
         Returns:
             True if collection exists
         """
@@ -202,19 +235,98 @@ class CollectionManager:
         
         Args:
             name: Collection name
-            
+        
         Returns:
             Collection statistics
         """
         try:
-            return await self.qdrant_client.get_collection_stats(name)
+            info = await self.qdrant_client._execute_with_retry(self._get_collection, name)
+            return {
+                "points_count": info.points_count or 0,
+                "indexed_vectors_count": info.indexed_vectors_count or 0,
+                "segments_count": info.segments_count,
+                "status": getattr(info.status, "value", info.status)
+            }
         except Exception as e:
             raise CollectionError(f"Failed to get collection stats for {name}: {str(e)}", name)
     
     def clear_cache(self):
         """Clear collection cache."""
-        self.collection_cache.clear()
+        self.registry.invalidate()
     
     def get_cached_collections(self) -> List[str]:
         """Get list of cached collection names."""
-        return list(self.collection_cache.keys())
+        return self.registry.get_stats()["cached"]
+    
+    def _create_collection(
+        self,
+        client,
+        name: str,
+        vectors_config: models.VectorParams,
+        collection_config: Dict[str, Any]
+    ):
+        """Create a collection using Qdrant client."""
+        return client.create_collection(
+            collection_name=name,
+            vectors_config=vectors_config,
+            **collection_config
+        )
+    
+    def _get_collection(self, client, name: str):
+        """Get collection information using Qdrant client."""
+        return client.get_collection(collection_name=name)
+    
+    def _list_collections(self, client):
+        """List collections using Qdrant client."""
+        return client.get_collections()
+    
+    def _delete_collection(self, client, name: str):
+        """Delete a collection using Qdrant client."""
+        return client.delete_collection(collection_name=name)
+    
+    def _update_collection(
+        self,
+        client,
+        name: str,
+        optimizers_config: Optional[Dict[str, Any]],
+        hnsw_config: Optional[Dict[str, Any]]
+    ):
+        """Update collection configuration using Qdrant client."""
+        return client.update_collection(
+            collection_name=name,
+            optimizers_config=models.OptimizersConfigDiff(**optimizers_config) if optimizers_config else None,
+            hnsw_config=models.HnswConfigDiff(**hnsw_config) if hnsw_config else None
+        )
+    
+    def _to_collection_info(self, name: str, info) -> CollectionInfo:
+        """Convert a Qdrant collection description to registry metadata."""
+        params = info.config.params
+        vectors = params.vectors
+        if isinstance(vectors, dict):
+            # Named vectors: report the first one
+            vectors = next(iter(vectors.values()), None)
+        
+        return CollectionInfo(
+            name=name,
+            vector_size=getattr(vectors, "size", None),
+            distance=getattr(getattr(vectors, "distance", None), "value", None),
+            points_count=info.points_count or 0,
+            status=getattr(info.status, "value", info.status),
+            config={
+                "shard_number": params.shard_number,
+                "replication_factor": params.replication_factor,
+                "write_consistency_factor": params.write_consistency_factor
+            }
+        )
+    
+    def _is_not_found(self, error: Exception) -> bool:
+        """Check whether Qdrant reported a missing collection."""
+        if getattr(error, "status_code", None) == 404:
+            return True
+        code = getattr(error, "code", None)
+        if callable(code):
+            try:
+                return getattr(code(), "name", None) == "NOT_FOUND"
+            except Exception:
+                return False
+        return "not found" in str(error).lower()
@@ -423,11 +423,11 @@ class QdrantConfigManager:
         """
         base_batch_size = self.performance.batch_size
         
-        # Adjust based on vector size
-        if vector_size > 1000:
-            base_batch_size = max(100, base_batch_size // 2)
-        elif vector_size > 2000:
+        # Adjust based on vector size, largest first
+        if vector_size > 2000:
             base_batch_size = max(50, base_batch_size // 4)
+        elif vector_size > 1000:
+            base_batch_size = max(100, base_batch_size // 2)
         
         # Adjust based on operation
         if operation == "search":
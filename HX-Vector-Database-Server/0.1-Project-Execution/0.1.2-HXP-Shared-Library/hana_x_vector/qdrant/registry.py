@@ -0,0 +1,199 @@
+"""
+Collection Registry
+===================
+
+Shared cache of collection metadata.
+Holds schema, vector dimension, distance and an estimated point count per
+collection so that writes and validation do not ask Qdrant whether a
+collection exists. Entries expire after a TTL and are replaced or dropped
+immediately when this process creates, updates or deletes a collection.
+"""
+
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable
+from dataclasses import dataclass, field, asdict
+import asyncio
+import time
+from ..monitoring.metrics import MetricsCollector
+from ..utils.exceptions import CollectionNotFoundError, VectorValidationError
+
+
+@dataclass
+class CollectionInfo:
+    """Cached metadata of one collection."""
+    name: str
+    vector_size: Optional[int]
+    distance: Optional[str]
+    points_count: int = 0
+    status: Optional[str] = None
+    config: Dict[str, Any] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Collection information as returned by the API."""
+        return asdict(self)
+
+
+class CollectionRegistry:
+    """
+    TTL and event invalidated collection metadata cache.
+    
+    Missing collections are cached too, for a shorter negative_ttl, so
+    lookups of unknown names do not reach Qdrant on every request.
+    Concurrent lookups of the same uncached name share one load.
+    """
+    
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        loader: Callable[[str], Awaitable[Optional[CollectionInfo]]],
+        lister: Callable[[], Awaitable[List[str]]]
+    ):
+        registry_config = config.get("collection_registry", {})
+        self.ttl = registry_config.get("ttl", 300)
+        self.negative_ttl = registry_config.get("negative_ttl", 5)
+        self.prefetch_on_startup = registry_config.get("prefetch", True)
+        
+        self.loader = loader
+        self.lister = lister
+        self.metrics = MetricsCollector()
+        
+        # name -> (info or None when missing, expiry on the monotonic clock)
+        self._entries: Dict[str, Tuple[Optional[CollectionInfo], float]] = {}
+        self._loads: Dict[str, asyncio.Future] = {}
+        self._generations: Dict[str, int] = {}
+    
+    async def get(self, name: str) -> Optional[CollectionInfo]:
+        """
+        Get collection metadata, loading it on a miss.
+        
+        Args:
+            name: Collection name
+        
+        Returns:
+            Collection metadata, or None if the collection does not exist
+        """
+        entry = self._entries.get(name)
+        if entry is not None and entry[1] > time.monotonic():
+            self.metrics.increment_counter(
+                "collection_registry_hits" if entry[0] is not None else "collection_registry_negative_hits"
+            )
+            return entry[0]
+        
+        pending = self._loads.get(name)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        self.metrics.increment_counter("collection_registry_misses")
+        generation = self._generations.get(name, 0)
+        future = asyncio.get_running_loop().create_future()
+        self._loads[name] = future
+        
+        try:
+            info = await self.loader(name)
+        except asyncio.CancelledError:
+            # The loading caller was cancelled; waiters must not hang on its load
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Waiters re-raise it; do not report it as never retrieved
+            future.exception()
+            raise
+        finally:
+            self._loads.pop(name, None)
+        
+        if self._generations.get(name, 0) == generation:
+            # Only cache if no create or delete happened during the load
+            self._store(name, info)
+        future.set_result(info)
+        return info
+    
+    async def require(self, name: str) -> CollectionInfo:
+        """
+        Get metadata of a collection that must exist.
+        
+        Raises:
+            CollectionNotFoundError: If the collection does not exist
+        """
+        info = await self.get(name)
+        if info is None:
+            raise CollectionNotFoundError(f"Collection {name} not found", name)
+        return info
+    
+    async def check_dimension(self, name: str, dimension: int) -> CollectionInfo:
+        """
+        Check vectors against the collection's dimension.
+        
+        Args:
+            name: Collection name
+            dimension: Dimension of the vectors to write
+        
+        Returns:
+            Collection metadata
+        
+        Raises:
+            CollectionNotFoundError: If the collection does not exist
+            VectorValidationError: If the dimension does not match
+        """
+        info = await self.require(name)
+        if info.vector_size is not None and dimension != info.vector_size:
+            raise VectorValidationError(
+                f"Vector dimension mismatch for {name}: expected {info.vector_size}, got {dimension}",
+                vector_dimension=dimension,
+                expected_dimension=info.vector_size
+            )
+        return info
+    
+    async def prefetch(self) -> int:
+        """
+        Load metadata of every existing collection.
+        
+        Returns:
+            Number of collections cached
+        """
+        names = await self.lister()
+        results = await asyncio.gather(*[self.get(name) for name in names], return_exceptions=True)
+        loaded = sum(1 for result in results if isinstance(result, CollectionInfo))
+        self.metrics.record_gauge("collection_registry_size", len(self._entries))
+        return loaded
+    
+    def put(self, info: CollectionInfo):
+        """Cache metadata of a collection that was just created or updated."""
+        self._bump(info.name)
+        self._store(info.name, info)
+    
+    def mark_missing(self, name: str):
+        """Cache a collection that was just deleted as missing."""
+        self._bump(name)
+        self._store(name, None)
+    
+    def invalidate(self, name: Optional[str] = None):
+        """Drop one collection, or all of them, so the next lookup reloads it."""
+        names = [name] if name is not None else list(self._entries)
+        for entry_name in names:
+            self._bump(entry_name)
+            self._entries.pop(entry_name, None)
+    
+    def record_points(self, name: str, count: int):
+        """Adjust the estimated point count after a write."""
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] is not None:
+            entry[0].points_count = max(entry[0].points_count + count, 0)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cached collections and their state."""
+        now = time.monotonic()
+        return {
+            "cached": sorted(name for name, (info, expiry) in self._entries.items() if info is not None),
+            "missing": sorted(name for name, (info, expiry) in self._entries.items() if info is None),
+            "expired": sum(1 for _, expiry in self._entries.values() if expiry <= now),
+            "loading": len(self._loads)
+        }
+    
+    def _store(self, name: str, info: Optional[CollectionInfo]):
+        """Cache an entry with the TTL for its kind."""
+        ttl = self.ttl if info is not None else self.negative_ttl
+        self._entries[name] = (info, time.monotonic() + ttl)
+    
+    def _bump(self, name: str):
+        """Mark loads started before this point as stale."""
+        self._generations[name] = self._generations.get(name, 0) + 1
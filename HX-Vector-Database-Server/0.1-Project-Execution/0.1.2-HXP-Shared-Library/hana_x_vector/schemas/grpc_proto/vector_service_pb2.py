@@ -15,11 +15,13 @@ class VectorRequest(_message.Message):
     """Vector request message."""
     
     def __init__(self, id: str = "", vector: List[float] = None, 
-                 payload: Dict[str, Any] = None, collection: str = ""):
+                 payload: Dict[str, Any] = None, collection: str = "",
+                 vector_data: bytes = b""):
         self.id = id
         self.vector = vector or []
         self.payload = payload or {}
         self.collection = collection
+        self.vector_data = vector_data
 
 class VectorResponse(_message.Message):
     """Vector response message."""
@@ -35,11 +37,26 @@ class SearchRequest(_message.Message):
     """Search request message."""
     
     def __init__(self, vector: List[float] = None, collection: str = "", 
-                 limit: int = 10, filter: Dict[str, Any] = None):
+                 limit: int = 10, filter: Dict[str, Any] = None,
+                 with_payload: bool = True, with_vector: bool = False,
+                 payload_fields: List[str] = None):
         self.vector = vector or []
         self.collection = collection
         self.limit = limit
         self.filter = filter or {}
+        self.with_payload = with_payload
+        self.with_vector = with_vector
+        self.payload_fields = payload_fields or []
+
+class SearchResult(_message.Message):
+    """Search result message."""
+    
+    def __init__(self, id: str = "", score: float = 0.0,
+                 metadata: Dict[str, Any] = None, vector: List[float] = None):
+        self.id = id
+        self.score = score
+        self.metadata = metadata or {}
+        self.vector = vector or []
 
 class SearchResponse(_message.Message):
     """Search response message."""
@@ -50,6 +67,30 @@ class SearchResponse(_message.Message):
         self.total_count = total_count
         self.query_time = query_time
 
+class QueryVector(_message.Message):
+    """Query vector message."""
+    
+    def __init__(self, vector: List[float] = None):
+        self.vector = vector or []
+
+class MultiVectorSearchRequest(_message.Message):
+    """Multi-vector search request message."""
+    
+    def __init__(self, collection: str = "", queries: List[QueryVector] = None,
+                 limit: int = 10, filters: Dict[str, str] = None,
+                 score_threshold: float = 0.0, aggregation: str = "average",
+                 with_payload: bool = True, with_vector: bool = False,
+                 payload_fields: List[str] = None):
+        self.collection = collection
+        self.queries = queries or []
+        self.limit = limit
+        self.filters = filters or {}
+        self.score_threshold = score_threshold
+        self.aggregation = aggregation
+        self.with_payload = with_payload
+        self.with_vector = with_vector
+        self.payload_fields = payload_fields or []
+
 class CollectionRequest(_message.Message):
     """Collection request message."""
     
@@ -26,6 +26,11 @@ class VectorServiceStub(object):
             request_serializer=vector__service__pb2.SearchRequest.SerializeToString,
             response_deserializer=vector__service__pb2.SearchResponse.FromString,
         )
+        self.MultiVectorSearch = channel.unary_unary(
+            '/vectorservice.VectorService/MultiVectorSearch',
+            request_serializer=vector__service__pb2.MultiVectorSearchRequest.SerializeToString,
+            response_deserializer=vector__service__pb2.SearchResponse.FromString,
+        )
         self.CreateCollection = channel.unary_unary(
             '/vectorservice.VectorService/CreateCollection',
             request_serializer=vector__service__pb2.CollectionRequest.SerializeToString,
@@ -53,6 +58,12 @@ class VectorServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def MultiVectorSearch(self, request, context):
+        """Search with several query vectors in one batch."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CreateCollection(self, request, context):
         """Create a new vector collection."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -79,6 +90,11 @@ def add_VectorServiceServicer_to_server(servicer, server):
             request_deserializer=vector__service__pb2.SearchRequest.FromString,
             response_serializer=vector__service__pb2.SearchResponse.SerializeToString,
         ),
+        'MultiVectorSearch': grpc.unary_unary_rpc_method_handler(
+            servicer.MultiVectorSearch,
+            request_deserializer=vector__service__pb2.MultiVectorSearchRequest.FromString,
+            response_serializer=vector__service__pb2.SearchResponse.SerializeToString,
+        ),
         'CreateCollection': grpc.unary_unary_rpc_method_handler(
             servicer.CreateCollection,
             request_deserializer=vector__service__pb2.CollectionRequest.FromString,
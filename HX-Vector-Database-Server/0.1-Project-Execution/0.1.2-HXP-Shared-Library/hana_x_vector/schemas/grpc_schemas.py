@@ -687,6 +687,7 @@ service VectorService {
     // Vector operations
     rpc InsertVector(VectorRequest) returns (VectorResponse);
     rpc SearchVectors(SearchRequest) returns (SearchResponse);
+    rpc MultiVectorSearch(MultiVectorSearchRequest) returns (SearchResponse);
     rpc UpdateVector(VectorRequest) returns (VectorResponse);
     rpc DeleteVector(DeleteRequest) returns (BatchResponse);
     rpc BatchOperation(BatchRequest) returns (BatchResponse);
@@ -710,6 +711,7 @@ message VectorRequest {
     repeated float vector = 2;
     map<string, string> payload = 3;
     string collection = 4;
+    bytes vector_data = 5;  // packed little-endian float32, used instead of vector
 }
 
 message VectorResponse {
@@ -728,8 +730,9 @@ message SearchRequest {
     int32 offset = 4;
     map<string, string> filter = 5;
     float score_threshold = 6;
-    bool with_payload = 7;
+    optional bool with_payload = 7;  // defaults to true when unset
     bool with_vector = 8;
+    repeated string payload_fields = 9;  // return only these payload fields
 }
 
 message SearchResult {
@@ -746,6 +749,22 @@ message SearchResponse {
     string collection = 4;
 }
 
+message QueryVector {
+    repeated float vector = 1;
+}
+
+message MultiVectorSearchRequest {
+    string collection = 1;
+    repeated QueryVector queries = 2;
+    int32 limit = 3;
+    map<string, string> filters = 4;
+    float score_threshold = 5;
+    string aggregation = 6;
+    optional bool with_payload = 7;  // defaults to true when unset
+    bool with_vector = 8;
+    repeated string payload_fields = 9;  // return only these payload fields
+}
+
 message BatchRequest {
     string operation = 1;
     repeated VectorRequest vectors = 2;
@@ -130,7 +130,7 @@ class SearchRequestModel(BaseModel):
     offset: int = Field(0, description="Results offset", ge=0)
     filter: Optional[Dict[str, Any]] = Field(None, description="Search filter")
     score_threshold: Optional[float] = Field(None, description="Minimum score threshold", ge=0, le=1)
-    with_payload: bool = Field(True, description="Include payload in results")
+    with_payload: Union[bool, List[str]] = Field(True, description="Include payload in results, or only the listed fields")
     with_vector: bool = Field(False, description="Include vector in results")
     
     @validator('vector')
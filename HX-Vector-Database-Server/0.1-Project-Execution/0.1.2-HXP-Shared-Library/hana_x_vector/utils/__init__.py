@@ -17,6 +17,10 @@ from .exceptions import (
     AuthenticationError,
     RateLimitError
 )
+from .codec import CacheCodec
+from .local_cache import LocalResultCache
+from .vector_batch import VectorBatch
+from .retry import RetryBudget, is_retryable_error, is_point_rejection
 from .validators import (
     VectorValidator,
     CollectionValidator,
@@ -38,6 +42,16 @@ __all__ = [
     'AuthenticationError',
     'RateLimitError',
     
+    # Serialization
+    'CacheCodec',
+    'LocalResultCache',
+    'VectorBatch',
+    
+    # Retries
+    'RetryBudget',
+    'is_retryable_error',
+    'is_point_rejection',
+    
     # Validators
     'VectorValidator',
     'CollectionValidator',
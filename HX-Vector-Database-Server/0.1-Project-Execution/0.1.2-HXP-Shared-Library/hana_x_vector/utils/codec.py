@@ -0,0 +1,259 @@
+"""
+Cache Codec
+===========
+
+Binary serialization for cached payloads stored in Redis.
+Packs vector fields as float32 buffers, optionally compresses the payload
+and prefixes every entry with a small format header.
+"""
+
+from typing import Dict, Any, Optional, Iterable, Union
+import json
+import zlib
+import base64
+import numpy as np
+from .exceptions import SerializationError
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+
+class CacheCodec:
+    """
+    Pluggable encoder/decoder for cache entries.
+    
+    Entries are laid out as a three byte header (format version, serializer,
+    compression) followed by the serialized payload. Legacy JSON text entries
+    without a header are still decoded.
+    
+    Only vector fields outside of opaque fields are packed, so user metadata
+    that happens to hold a "vector" key is stored as given.
+    """
+    
+    FORMAT_VERSION = 1
+    
+    SERIALIZERS = {"json": 0, "msgpack": 1}
+    COMPRESSIONS = {"none": 0, "zlib": 1, "zstd": 2, "lz4": 3}
+    
+    # msgpack extension type and JSON marker used for packed float32 vectors
+    FLOAT32_EXT_TYPE = 1
+    FLOAT32_MARKER = "__f32__"
+    BYTES_MARKER = "__bytes__"
+    
+    def __init__(
+        self,
+        serializer: str = "msgpack",
+        compression: str = "none",
+        compression_level: Optional[int] = None,
+        compression_threshold: int = 1024,
+        vector_fields: Iterable[str] = ("vector", "query_vector"),
+        opaque_fields: Iterable[str] = ("metadata", "payload")
+    ):
+        if serializer not in self.SERIALIZERS:
+            raise SerializationError(f"Unknown cache serializer: {serializer}", data_format=serializer)
+        if compression not in self.COMPRESSIONS:
+            raise SerializationError(f"Unknown cache compression: {compression}", data_format=compression)
+        
+        if serializer == "msgpack" and msgpack is None:
+            print("Warning: msgpack not installed, falling back to JSON cache serialization")
+            serializer = "json"
+        
+        if (compression == "zstd" and zstandard is None) or (compression == "lz4" and lz4_frame is None):
+            print(f"Warning: {compression} not installed, falling back to zlib cache compression")
+            compression = "zlib"
+        
+        self.serializer = serializer
+        self.compression = compression
+        self.compression_level = compression_level
+        self.compression_threshold = compression_threshold
+        self.vector_fields = frozenset(vector_fields)
+        self.opaque_fields = frozenset(opaque_fields)
+    
+    @classmethod
+    def from_config(cls, cache_config: Dict[str, Any]) -> "CacheCodec":
+        """
+        Create a codec from a cache configuration section.
+        
+        Entries above compression_threshold bytes are zlib-compressed unless
+        compression is set otherwise; zlib needs no extra dependency.
+        
+        Args:
+            cache_config: The "cache" section of the configuration
+        
+        Returns:
+            Configured codec
+        """
+        return cls(
+            serializer=cache_config.get("serializer", "msgpack"),
+            compression=cache_config.get("compression", "zlib"),
+            compression_level=cache_config.get("compression_level"),
+            compression_threshold=cache_config.get("compression_threshold", 1024)
+        )
+    
+    def encode(self, data: Any) -> bytes:
+        """
+        Encode data into a cache entry.
+        
+        Args:
+            data: JSON-compatible data, optionally containing bytes values
+        
+        Returns:
+            Encoded cache entry
+        """
+        try:
+            if self.serializer == "msgpack":
+                body = msgpack.packb(self._pack_vectors(data), default=self._msgpack_default)
+            else:
+                body = json.dumps(
+                    self._pack_vectors(data),
+                    separators=(",", ":"),
+                    default=self._json_default
+                ).encode()
+            
+            compression = self.compression
+            if compression == "none" or len(body) < self.compression_threshold:
+                compression = "none"
+            else:
+                body = self._compress(body, compression)
+            
+            header = bytes((
+                self.FORMAT_VERSION,
+                self.SERIALIZERS[self.serializer],
+                self.COMPRESSIONS[compression]
+            ))
+            return header + body
+        
+        except SerializationError:
+            raise
+        except Exception as e:
+            raise SerializationError(f"Cache encode failed: {str(e)}", data_format=self.serializer)
+    
+    def decode(self, payload: Union[bytes, str]) -> Any:
+        """
+        Decode a cache entry.
+        
+        Args:
+            payload: Encoded cache entry or legacy JSON text
+        
+        Returns:
+            Decoded data with vector fields restored to lists of floats
+        """
+        if isinstance(payload, str):
+            payload = payload.encode()
+        
+        # Legacy entries are plain JSON text
+        if payload[:1] in (b"{", b"["):
+            return json.loads(payload)
+        
+        if len(payload) < 3:
+            raise SerializationError("Cache entry is truncated")
+        
+        version, serializer_id, compression_id = payload[0], payload[1], payload[2]
+        if version > self.FORMAT_VERSION:
+            raise SerializationError(f"Unsupported cache format version: {version}")
+        
+        try:
+            body = self._decompress(bytes(payload[3:]), compression_id)
+            
+            if serializer_id == self.SERIALIZERS["msgpack"]:
+                if msgpack is None:
+                    raise SerializationError("msgpack is required to decode this entry", data_format="msgpack")
+                return msgpack.unpackb(body, ext_hook=self._msgpack_ext_hook, strict_map_key=False)
+            
+            return json.loads(body, object_hook=self._json_object_hook)
+        
+        except SerializationError:
+            raise
+        except Exception as e:
+            raise SerializationError(f"Cache decode failed: {str(e)}")
+    
+    def _pack_vectors(self, data: Any) -> Any:
+        """Replace vector fields with float32 arrays."""
+        if isinstance(data, dict):
+            packed = {}
+            for key, value in data.items():
+                if key in self.opaque_fields:
+                    packed[key] = value
+                    continue
+                if key in self.vector_fields and isinstance(value, list) and value:
+                    try:
+                        packed[key] = np.asarray(value, dtype=np.float32)
+                        continue
+                    except (TypeError, ValueError):
+                        pass
+                packed[key] = self._pack_vectors(value)
+            return packed
+        if isinstance(data, (list, tuple)):
+            return [self._pack_vectors(item) for item in data]
+        return data
+    
+    def _msgpack_default(self, value: Any) -> Any:
+        """Serialize float32 arrays as msgpack extension types."""
+        if isinstance(value, np.ndarray):
+            return msgpack.ExtType(self.FLOAT32_EXT_TYPE, value.astype(np.float32).tobytes())
+        if isinstance(value, np.generic):
+            return value.item()
+        raise TypeError(f"Cannot serialize {type(value).__name__}")
+    
+    def _msgpack_ext_hook(self, code: int, data: bytes) -> Any:
+        """Restore float32 vectors from msgpack extension types."""
+        if code == self.FLOAT32_EXT_TYPE:
+            return np.frombuffer(data, dtype=np.float32).tolist()
+        return msgpack.ExtType(code, data)
+    
+    def _json_default(self, value: Any) -> Any:
+        """Serialize float32 arrays and bytes for the JSON fallback."""
+        if isinstance(value, np.ndarray):
+            return {self.FLOAT32_MARKER: base64.b64encode(value.astype(np.float32).tobytes()).decode("ascii")}
+        if isinstance(value, (bytes, bytearray)):
+            return {self.BYTES_MARKER: base64.b64encode(value).decode("ascii")}
+        if isinstance(value, np.generic):
+            return value.item()
+        raise TypeError(f"Cannot serialize {type(value).__name__}")
+    
+    def _json_object_hook(self, obj: Dict[str, Any]) -> Any:
+        """Restore float32 vectors and bytes from the JSON fallback."""
+        if len(obj) == 1:
+            if self.FLOAT32_MARKER in obj:
+                return np.frombuffer(base64.b64decode(obj[self.FLOAT32_MARKER]), dtype=np.float32).tolist()
+            if self.BYTES_MARKER in obj:
+                return base64.b64decode(obj[self.BYTES_MARKER])
+        return obj
+    
+    def _compress(self, body: bytes, compression: str) -> bytes:
+        """Compress a serialized payload."""
+        if compression == "zlib":
+            return zlib.compress(body, self.compression_level if self.compression_level is not None else 6)
+        if compression == "zstd":
+            return zstandard.ZstdCompressor(level=self.compression_level or 3).compress(body)
+        if compression == "lz4":
+            return lz4_frame.compress(body, compression_level=self.compression_level or 0)
+        return body
+    
+    def _decompress(self, body: bytes, compression_id: int) -> bytes:
+        """Decompress a payload according to its header."""
+        if compression_id == self.COMPRESSIONS["none"]:
+            return body
+        if compression_id == self.COMPRESSIONS["zlib"]:
+            return zlib.decompress(body)
+        if compression_id == self.COMPRESSIONS["zstd"]:
+            if zstandard is None:
+                raise SerializationError("zstandard is required to decode this entry", data_format="zstd")
+            return zstandard.ZstdDecompressor().decompress(body)
+        if compression_id == self.COMPRESSIONS["lz4"]:
+            if lz4_frame is None:
+                raise SerializationError("lz4 is required to decode this entry", data_format="lz4")
+            return lz4_frame.decompress(body)
+        raise SerializationError(f"Unknown cache compression id: {compression_id}")
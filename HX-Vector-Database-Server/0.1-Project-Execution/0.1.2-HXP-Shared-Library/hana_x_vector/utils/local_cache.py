@@ -0,0 +1,110 @@
+"""
+Local Result Cache
+==================
+
+Bounded in-process LRU cache.
+Used as the L1 tier in front of Redis by the search result cache and the
+embedding cache.
+"""
+
+from typing import Dict, Any, Optional, Tuple
+from collections import OrderedDict
+import time
+
+
+class LocalResultCache:
+    """
+    Bounded in-process LRU cache used as the L1 tier in front of Redis.
+    Evicts least recently used entries once either the entry count or the
+    approximate byte budget is exceeded.
+    """
+    
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        
+        # key -> (value, size, expires_at)
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value and mark it as most recently used.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        value, size, expires_at = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def put(self, key: str, value: Any, size: int):
+        """
+        Store a value, evicting older entries to stay within budget.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Approximate size of the value in bytes
+        """
+        if size > self.max_bytes:
+            return
+        
+        if key in self._entries:
+            self._remove(key)
+        
+        self._entries[key] = (value, size, time.monotonic() + self.ttl)
+        self.total_bytes += size
+        
+        while self._entries and (
+            len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes
+        ):
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+    
+    def clear(self):
+        """Remove all entries."""
+        self._entries.clear()
+        self.total_bytes = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get L1 tier statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _remove(self, key: str):
+        """Remove an entry and release its byte budget."""
+        _, size, _ = self._entries.pop(key)
+        self.total_bytes -= size
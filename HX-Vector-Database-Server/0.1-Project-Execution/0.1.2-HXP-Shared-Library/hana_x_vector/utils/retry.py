@@ -0,0 +1,154 @@
+"""
+Retry Budget
+============
+
+Retry allowance shared by every layer that works on one job.
+Keeps nested retry loops from multiplying write traffic, and tells
+transient failures apart from requests that will never succeed.
+"""
+
+from typing import Optional
+import asyncio
+from .exceptions import ValidationError
+
+
+# gRPC status codes for requests that fail the same way on every attempt
+_PERMANENT_GRPC_CODES = frozenset({
+    "INVALID_ARGUMENT",
+    "NOT_FOUND",
+    "ALREADY_EXISTS",
+    "FAILED_PRECONDITION",
+    "OUT_OF_RANGE",
+    "UNIMPLEMENTED",
+    "PERMISSION_DENIED",
+    "UNAUTHENTICATED"
+})
+
+
+class RetryBudget:
+    """
+    Token bucket of retries for one job.
+    
+    Every attempt deposits `ratio` tokens and every retry withdraws one, on
+    top of `min_retries` tokens available from the start. Nested layers that
+    share a budget can together never retry more than
+    min_retries + ratio * attempts times.
+    """
+    
+    def __init__(
+        self,
+        min_retries: int = 2,
+        ratio: float = 0.1,
+        retry_delay: float = 1.0,
+        max_delay: float = 30.0
+    ):
+        self.tokens = float(min_retries)
+        self.ratio = ratio
+        self.retry_delay = retry_delay
+        self.max_delay = max_delay
+        self.attempts = 0
+        self.retries = 0
+    
+    def record_attempt(self):
+        """Record one request attempt."""
+        self.attempts += 1
+        self.tokens += self.ratio
+    
+    def can_retry(self) -> bool:
+        """Check whether a retry token is available."""
+        return self.tokens >= 1.0
+    
+    async def acquire(self, attempt: int = 0) -> bool:
+        """
+        Take a retry token and wait out the backoff.
+        
+        Args:
+            attempt: Zero-based retry number at the caller, for backoff
+        
+        Returns:
+            False when the budget is exhausted
+        """
+        if not self.can_retry():
+            return False
+        
+        self.tokens -= 1.0
+        self.retries += 1
+        await asyncio.sleep(min(self.retry_delay * (attempt + 1), self.max_delay))
+        return True
+
+
+def is_retryable_error(error: Optional[BaseException]) -> bool:
+    """
+    Check whether an error may succeed on retry.
+    
+    Client errors (HTTP 4xx other than 408/429, permanent gRPC codes,
+    validation and local value errors) are not retryable. The cause and context chain is
+    followed so wrapped errors are classified by their origin.
+    
+    Args:
+        error: Raised exception
+    
+    Returns:
+        False for errors that will fail the same way again
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        
+        status_code = getattr(error, "status_code", None)
+        if isinstance(status_code, int) and 400 <= status_code < 500 and status_code not in (408, 429):
+            return False
+        
+        code = getattr(error, "code", None)
+        if callable(code):
+            try:
+                if getattr(code(), "name", None) in _PERMANENT_GRPC_CODES:
+                    return False
+            except Exception:
+                pass
+        
+        if isinstance(error, (ValueError, TypeError, ValidationError)):
+            return False
+        
+        error = error.__cause__ or error.__context__
+    
+    return True
+
+
+def is_point_rejection(error: Optional[BaseException]) -> bool:
+    """
+    Check whether an error may be caused by single points of a batch.
+    
+    Only malformed requests (HTTP 400/422, gRPC INVALID_ARGUMENT, validation
+    and local value errors) qualify. Missing collections, authentication
+    failures and other errors reject every point of a batch alike.
+    
+    Args:
+        error: Raised exception
+    
+    Returns:
+        True when splitting the batch may isolate the rejected points
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        
+        status_code = getattr(error, "status_code", None)
+        if isinstance(status_code, int):
+            return status_code in (400, 422)
+        
+        code = getattr(error, "code", None)
+        if callable(code):
+            try:
+                name = getattr(code(), "name", None)
+            except Exception:
+                name = None
+            if name is not None:
+                return name == "INVALID_ARGUMENT"
+        
+        if isinstance(error, (ValueError, TypeError, ValidationError)):
+            return True
+        
+        error = error.__cause__ or error.__context__
+    
+    return False
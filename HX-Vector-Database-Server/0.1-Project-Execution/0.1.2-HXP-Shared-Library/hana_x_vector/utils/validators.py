@@ -42,48 +42,50 @@ class VectorValidator:
         if vector is None:
             raise VectorValidationError("Vector cannot be None")
         
-        # Convert to list if numpy array
-        if isinstance(vector, np.ndarray):
-            if vector.ndim != 1:
-                raise VectorValidationError(
-                    f"Vector must be 1-dimensional, got {vector.ndim} dimensions"
-                )
-            vector = vector.tolist()
-        
-        if not isinstance(vector, list):
+        if not isinstance(vector, (list, np.ndarray)):
             raise VectorValidationError("Vector must be a list or numpy array")
         
         if len(vector) == 0:
             raise VectorValidationError("Vector cannot be empty")
         
-        # Validate all elements are numeric
-        validated_vector = []
-        for i, value in enumerate(vector):
-            if not isinstance(value, (int, float)):
+        # Convert all elements in one pass instead of one float() per element
+        try:
+            array = np.asarray(vector, dtype=np.float64)
+        except (ValueError, TypeError):
+            array = None
+        
+        if array is None or array.ndim != 1:
+            if isinstance(vector, np.ndarray):
+                raise VectorValidationError(
+                    f"Vector must be 1-dimensional, got {vector.ndim} dimensions"
+                )
+            # Locate the offending element for the error message
+            for i, value in enumerate(vector):
                 try:
-                    value = float(value)
+                    float(value)
                 except (ValueError, TypeError):
                     raise VectorValidationError(
                         f"Vector element at index {i} must be numeric, got {type(value).__name__}"
                     )
-            
-            if not np.isfinite(value):
-                raise VectorValidationError(
-                    f"Vector element at index {i} must be finite, got {value}"
-                )
-            
-            validated_vector.append(float(value))
+            raise VectorValidationError("Vector must be 1-dimensional")
+        
+        finite = np.isfinite(array)
+        if not finite.all():
+            i = int(np.argmin(finite))
+            raise VectorValidationError(
+                f"Vector element at index {i} must be finite, got {array[i]}"
+            )
         
         # Validate dimension
         if expected_dimension is not None:
-            if len(validated_vector) != expected_dimension:
+            if len(array) != expected_dimension:
                 raise VectorValidationError(
-                    f"Vector dimension mismatch: expected {expected_dimension}, got {len(validated_vector)}",
-                    vector_dimension=len(validated_vector),
+                    f"Vector dimension mismatch: expected {expected_dimension}, got {len(array)}",
+                    vector_dimension=len(array),
                     expected_dimension=expected_dimension
                 )
         
-        return validated_vector
+        return array.tolist()
     
     @staticmethod
     def validate_batch_vectors(vectors: List[Union[List[float], np.ndarray]], 
@@ -107,6 +109,24 @@ class VectorValidator:
         if len(vectors) == 0:
             raise VectorValidationError("Vector batch cannot be empty")
         
+        # Fast path: validate the whole batch as one matrix
+        try:
+            matrix = np.asarray(vectors, dtype=np.float64)
+        except (ValueError, TypeError):
+            matrix = None
+        
+        if matrix is not None and matrix.ndim == 2 and matrix.shape[1] > 0:
+            if expected_dimension is not None and matrix.shape[1] != expected_dimension:
+                raise VectorValidationError(
+                    f"Vector dimension mismatch: expected {expected_dimension}, got {matrix.shape[1]}",
+                    vector_dimension=matrix.shape[1],
+                    expected_dimension=expected_dimension
+                )
+            finite = np.isfinite(matrix)
+            if finite.all():
+                return matrix.tolist()
+        
+        # Slow path: validate vector by vector for a precise error message
         validated_vectors = []
         
         # Validate first vector to determine dimension
@@ -173,6 +193,51 @@ class CollectionValidator:
             raise ValidationError("Collection name must start with a letter or underscore")
         
         return name
+    
+    @staticmethod
+    def validate_vector_size(vector_size: int) -> int:
+        """
+        Validate collection vector size.
+        
+        Args:
+            vector_size: Vector dimension
+            
+        Returns:
+            Validated vector size
+            
+        Raises:
+            ValidationError: If validation fails
+        """
+        if not isinstance(vector_size, int) or isinstance(vector_size, bool) or vector_size <= 0:
+            raise ValidationError("Vector size must be a positive integer")
+        
+        if vector_size > 65536:
+            raise ValidationError("Vector size cannot exceed 65536")
+        
+        return vector_size
+    
+    @staticmethod
+    def validate_distance_metric(distance: str) -> str:
+        """
+        Validate distance metric.
+        
+        Args:
+            distance: Distance metric name, case-insensitive
+            
+        Returns:
+            Distance metric name as Qdrant spells it
+            
+        Raises:
+            ValidationError: If validation fails
+        """
+        metrics = {"cosine": "Cosine", "euclid": "Euclid", "dot": "Dot", "manhattan": "Manhattan"}
+        
+        if not isinstance(distance, str) or distance.lower() not in metrics:
+            raise ValidationError(
+                f"Distance metric must be one of: {', '.join(metrics.values())}"
+            )
+        
+        return metrics[distance.lower()]
 
 
 class SearchValidator:
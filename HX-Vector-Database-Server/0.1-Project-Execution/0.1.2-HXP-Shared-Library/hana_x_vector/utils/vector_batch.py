@@ -0,0 +1,210 @@
+"""
+Vector Batch
+============
+
+Columnar container for vectors on the write path.
+Holds a contiguous float32 matrix with id and payload side arrays so that
+vectors travel from request decoding to the Qdrant client without being
+converted element by element.
+"""
+
+from typing import List, Dict, Any, Optional, Union, Iterator, Sequence
+import numpy as np
+from .exceptions import VectorValidationError
+
+
+PointId = Union[str, int]
+
+
+class VectorBatch:
+    """
+    Contiguous float32 vector matrix with ids and payloads.
+    Slices share the underlying buffer instead of copying it.
+    """
+    
+    __slots__ = ("ids", "vectors", "payloads")
+    
+    def __init__(
+        self,
+        ids: Sequence[PointId],
+        vectors: np.ndarray,
+        payloads: Optional[Sequence[Dict[str, Any]]] = None
+    ):
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2:
+            raise VectorValidationError(
+                f"Vector batch must be 2-dimensional, got {vectors.ndim} dimensions"
+            )
+        if len(ids) != vectors.shape[0]:
+            raise VectorValidationError(
+                f"Vector batch has {vectors.shape[0]} vectors but {len(ids)} ids"
+            )
+        if payloads is not None and len(payloads) != vectors.shape[0]:
+            raise VectorValidationError(
+                f"Vector batch has {vectors.shape[0]} vectors but {len(payloads)} payloads"
+            )
+        
+        self.ids = list(ids)
+        self.vectors = vectors
+        self.payloads = list(payloads) if payloads is not None else [{} for _ in self.ids]
+    
+    @classmethod
+    def from_records(cls, records: Sequence[Dict[str, Any]]) -> "VectorBatch":
+        """
+        Build a batch from vector dictionaries.
+        
+        Args:
+            records: Dicts with "id", "vector" and optional "metadata"
+        
+        Returns:
+            Vector batch
+        
+        Raises:
+            VectorValidationError: If vectors are missing, ragged or non-numeric
+        """
+        if not records:
+            raise VectorValidationError("Vector batch cannot be empty")
+        
+        try:
+            ids = [record["id"] for record in records]
+            vectors = [record["vector"] for record in records]
+        except (KeyError, TypeError) as e:
+            raise VectorValidationError(f"Vector records must have 'id' and 'vector' fields: {e}")
+        
+        try:
+            # One C-level pass over all components
+            matrix = np.asarray(vectors, dtype=np.float32)
+        except (ValueError, TypeError) as e:
+            raise VectorValidationError(f"Vectors must be numeric with equal dimensions: {e}")
+        
+        payloads = [record.get("metadata") or {} for record in records]
+        return cls(ids, matrix, payloads)
+    
+    @classmethod
+    def from_buffer(
+        cls,
+        ids: Sequence[PointId],
+        buffer: Union[bytes, bytearray, memoryview],
+        dimension: int,
+        payloads: Optional[Sequence[Dict[str, Any]]] = None
+    ) -> "VectorBatch":
+        """
+        Wrap a packed little-endian float32 buffer without copying it.
+        
+        Args:
+            ids: Point ids, one per row
+            buffer: Row-major float32 data
+            dimension: Vector dimension
+            payloads: Optional payload per row
+        
+        Returns:
+            Vector batch backed by the buffer
+        """
+        if dimension <= 0 or len(buffer) % (4 * dimension):
+            raise VectorValidationError(
+                f"Vector buffer of {len(buffer)} bytes does not hold float32 vectors of dimension {dimension}"
+            )
+        
+        matrix = np.frombuffer(buffer, dtype="<f4").reshape(-1, dimension)
+        return cls(ids, matrix, payloads)
+    
+    @classmethod
+    def coerce(cls, vectors: Union["VectorBatch", Sequence[Dict[str, Any]]]) -> "VectorBatch":
+        """Return vectors as a batch, converting vector dictionaries if needed."""
+        if isinstance(vectors, cls):
+            return vectors
+        return cls.from_records(vectors)
+    
+    @classmethod
+    def concat(cls, batches: Sequence["VectorBatch"]) -> "VectorBatch":
+        """Join batches of equal dimension into one (copies their vectors into one matrix)."""
+        if len(batches) == 1:
+            return batches[0]
+        return cls(
+            [point_id for batch in batches for point_id in batch.ids],
+            np.concatenate([batch.vectors for batch in batches]),
+            [payload for batch in batches for payload in batch.payloads]
+        )
+    
+    @property
+    def dimension(self) -> int:
+        """Vector dimension."""
+        return self.vectors.shape[1]
+    
+    @property
+    def nbytes(self) -> int:
+        """Size of the vector buffer in bytes."""
+        return self.vectors.nbytes
+    
+    def validate(self, expected_dimension: Optional[int] = None) -> "VectorBatch":
+        """
+        Validate the whole batch with vectorized checks.
+        
+        Args:
+            expected_dimension: Expected vector dimension
+        
+        Returns:
+            The batch itself
+        
+        Raises:
+            VectorValidationError: If validation fails
+        """
+        if len(self) == 0 or self.dimension == 0:
+            raise VectorValidationError("Vector batch cannot be empty")
+        
+        if expected_dimension is not None and self.dimension != expected_dimension:
+            raise VectorValidationError(
+                f"Vector dimension mismatch: expected {expected_dimension}, got {self.dimension}",
+                vector_dimension=self.dimension,
+                expected_dimension=expected_dimension
+            )
+        
+        finite = np.isfinite(self.vectors)
+        if not finite.all():
+            row, column = np.argwhere(~finite)[0]
+            raise VectorValidationError(
+                f"Vector at index {row} has a non-finite element at index {column}"
+            )
+        
+        return self
+    
+    def slice(self, start: int, stop: int) -> "VectorBatch":
+        """Return rows [start, stop) as a batch sharing this batch's buffer."""
+        return VectorBatch(self.ids[start:stop], self.vectors[start:stop], self.payloads[start:stop])
+    
+    def take(self, indices: Sequence[int]) -> "VectorBatch":
+        """Return the given rows as a new batch (copies the selected vectors)."""
+        return VectorBatch(
+            [self.ids[i] for i in indices],
+            self.vectors[list(indices)],
+            [self.payloads[i] for i in indices]
+        )
+    
+    def split(self, batch_size: int) -> Iterator["VectorBatch"]:
+        """Yield consecutive slices of at most batch_size rows."""
+        for start in range(0, len(self), batch_size):
+            yield self.slice(start, start + batch_size)
+    
+    def to_records(self, include_vectors: bool = True) -> List[Dict[str, Any]]:
+        """
+        Convert back to vector dictionaries.
+        
+        Args:
+            include_vectors: Include the vectors as lists of floats
+        
+        Returns:
+            Vector dictionaries
+        """
+        if not include_vectors:
+            return [
+                {"id": point_id, "metadata": payload}
+                for point_id, payload in zip(self.ids, self.payloads)
+            ]
+        
+        return [
+            {"id": point_id, "vector": vector, "metadata": payload}
+            for point_id, vector, payload in zip(self.ids, self.vectors.tolist(), self.payloads)
+        ]
+    
+    def __len__(self) -> int:
+        return len(self.ids)
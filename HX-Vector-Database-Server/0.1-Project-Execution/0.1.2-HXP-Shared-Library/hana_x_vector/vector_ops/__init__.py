@@ -10,16 +10,19 @@ Components:
 - SearchEngine: Similarity search algorithms
 - BatchProcessor: Bulk operations handler
 - CacheManager: Redis-based caching layer
+- BulkLoader: Memory-mapped vector file ingestion
 """
 
 from .operations import VectorOperationsManager
 from .search import SearchEngine
 from .batch import BatchProcessor
 from .cache import CacheManager
+from .bulk_loader import BulkLoader
 
 __all__ = [
     "VectorOperationsManager",
     "SearchEngine",
     "BatchProcessor", 
-    "CacheManager"
+    "CacheManager",
+    "BulkLoader"
 ]
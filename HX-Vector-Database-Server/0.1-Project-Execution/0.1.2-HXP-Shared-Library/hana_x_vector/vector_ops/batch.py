@@ -6,14 +6,18 @@ High-performance batch processing for vector operations.
 Handles bulk insertions, updates, and deletions with optimization.
 """
 
-from typing import List, Dict, Any, Optional, AsyncGenerator
+from typing import List, Dict, Any, Optional, AsyncGenerator, Union, Tuple
 import asyncio
+import hashlib
 import time
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from ..qdrant.client import QdrantClient
 from ..monitoring.metrics import MetricsCollector
 from ..utils.exceptions import VectorOperationError
-from ..utils.validators import validate_vector_data
+from ..utils.vector_batch import VectorBatch
+from ..utils.retry import RetryBudget, is_retryable_error, is_point_rejection
+from .batch_tuning import AdaptiveBatchController
 
 
 class BatchProcessor:
@@ -39,6 +43,26 @@ class BatchProcessor:
         self.chunk_size = batch_config.get("chunk_size", 100)
         self.max_retries = batch_config.get("max_retries", 3)
         self.retry_delay = batch_config.get("retry_delay", 1.0)
+        self.retry_budget_ratio = batch_config.get("retry_budget_ratio", 0.1)
+        self.bisect_failures = batch_config.get("bisect_failures", True)
+        self.bisect_max_depth = batch_config.get("bisect_max_depth", 10)
+        
+        # Streaming ingest pipeline
+        self.stream_max_in_flight = batch_config.get("stream_max_in_flight", self.parallel_batches)
+        self.stream_wait = batch_config.get("stream_wait", True)
+        
+        # Bulk update/delete requests
+        self.bulk_chunk_size = batch_config.get("bulk_chunk_size", self.default_batch_size)
+        self.merge_payload = batch_config.get("merge_payload", False)
+        
+        # Batch size and parallelism tuned per collection from upsert outcomes
+        self.batch_controller = AdaptiveBatchController(
+            batch_config.get("adaptive", {}),
+            default_batch_size=self.default_batch_size,
+            max_batch_size=self.max_batch_size,
+            default_parallelism=self.parallel_batches,
+            metrics=self.metrics
+        )
         
         # Thread pool for parallel processing
         self.thread_pool = ThreadPoolExecutor(max_workers=self.parallel_batches)
@@ -101,52 +125,68 @@ class BatchProcessor:
             
         except Exception as e:
             self.metrics.increment_counter("batch_processing_errors")
-            raise VectorOperationError(f"Batch processing failed: {str(e)}")
+            raise VectorOperationError(f"Batch processing failed: {str(e)}", "batch")
     
     async def insert_batch(
         self,
         collection_name: str,
-        vectors: List[Dict[str, Any]],
-        batch_size: int = None
+        vectors: Union[List[Dict[str, Any]], VectorBatch],
+        batch_size: int = None,
+        retry_budget: Optional[RetryBudget] = None
     ) -> Dict[str, Any]:
         """
         Insert vectors in batches with optimization.
         
+        Without an explicit batch_size, batch size and parallelism follow
+        the adaptive controller when batch.adaptive is enabled and may
+        change between batches. Failed
+        points are reported individually; upserts are keyed by point id,
+        so resubmitting only the failed points is safe.
+        
         Args:
             collection_name: Name of the collection
-            vectors: List of vector data
+            vectors: Vector batch, or list of vector data
             batch_size: Size of each batch
+            retry_budget: Retry budget shared by every batch of the job
             
         Returns:
-            Dict with insertion results
+            Dict with insertion results and failed_points
         """
         start_time = time.time()
         
         try:
             # Validate input
-            validate_vector_data(vectors)
-            batch_size = min(batch_size or self.default_batch_size, self.max_batch_size)
+            vectors = VectorBatch.coerce(vectors).validate()
+            adaptive = batch_size is None and self.batch_controller.enabled
+            batch_size = min(
+                batch_size or self._target_batch_size(collection_name, vectors.dimension),
+                self.max_batch_size
+            )
+            retry_budget = retry_budget or self._new_retry_budget()
             
             # Process in batches
             total_inserted = 0
             total_errors = 0
             batch_results = []
+            failed_points = []
             
             if self.use_parallel_processing and len(vectors) > batch_size * 2:
                 # Use parallel processing for large datasets
                 result = await self._parallel_insert_batches(
-                    collection_name, vectors, batch_size
+                    collection_name, vectors, batch_size, adaptive, retry_budget
                 )
                 total_inserted = result["inserted_count"]
                 total_errors = result["error_count"]
                 batch_results = result["batch_results"]
+                failed_points = result["failed_points"]
             else:
                 # Use sequential processing
                 async for batch_result in self._sequential_insert_batches(
-                    collection_name, vectors, batch_size
+                    collection_name, vectors, batch_size, adaptive, retry_budget
                 ):
                     total_inserted += batch_result["inserted_count"]
                     total_errors += batch_result["error_count"]
+                    failed_points.extend(batch_result["failed_points"])
                     batch_results.append(batch_result)
             
             duration = time.time() - start_time
@@ -159,12 +199,14 @@ class BatchProcessor:
                 "batch_count": len(batch_results),
                 "duration": duration,
                 "collection": collection_name,
-                "batch_results": batch_results
+                "batch_results": batch_results,
+                "failed_points": failed_points,
+                "retries": retry_budget.retries
             }
             
         except Exception as e:
             self.metrics.increment_counter("batch_insert_errors")
-            raise VectorOperationError(f"Batch insertion failed: {str(e)}")
+            raise VectorOperationError(f"Batch insertion failed: {str(e)}", "batch_insert")
     
     async def update_batch(
         self,
@@ -214,7 +256,7 @@ class BatchProcessor:
             
         except Exception as e:
             self.metrics.increment_counter("batch_update_errors")
-            raise VectorOperationError(f"Batch update failed: {str(e)}")
+            raise VectorOperationError(f"Batch update failed: {str(e)}", "batch_update")
     
     async def delete_batch(
         self,
@@ -223,6 +265,8 @@ class BatchProcessor:
         """
         Delete vectors in batches.
         
+        Operations carry either a "vector_id" or a "filters" selector.
+        
         Args:
             operations: List of delete operations
             
@@ -234,8 +278,12 @@ class BatchProcessor:
         try:
             # Group by collection for efficiency
             collection_groups = {}
+            filter_deletions = []
             for op in operations:
                 collection = op["collection"]
+                if "filters" in op:
+                    filter_deletions.append((collection, op["filters"]))
+                    continue
                 if collection not in collection_groups:
                     collection_groups[collection] = []
                 collection_groups[collection].append(op["vector_id"])
@@ -251,6 +299,15 @@ class BatchProcessor:
                 total_deleted += result["deleted_count"]
                 total_errors += result["error_count"]
             
+            # Filter deletes are one request each; Qdrant does not report a count
+            filters_applied = 0
+            for collection_name, filters in filter_deletions:
+                try:
+                    await self.qdrant_client.delete_points(collection_name, filters=filters)
+                    filters_applied += 1
+                except Exception:
+                    total_errors += 1
+            
             duration = time.time() - start_time
             self.metrics.record_histogram("batch_delete_duration", duration)
             self.metrics.increment_counter("batch_vectors_deleted", total_deleted)
@@ -259,55 +316,117 @@ class BatchProcessor:
                 "deleted_count": total_deleted,
                 "error_count": total_errors,
                 "duration": duration,
-                "collections_processed": len(collection_groups)
+                "collections_processed": len(collection_groups),
+                "filters_applied": filters_applied
             }
             
         except Exception as e:
             self.metrics.increment_counter("batch_delete_errors")
-            raise VectorOperationError(f"Batch deletion failed: {str(e)}")
+            raise VectorOperationError(f"Batch deletion failed: {str(e)}", "batch_delete")
     
     async def stream_insert(
         self,
         collection_name: str,
         vector_stream: AsyncGenerator[Dict[str, Any], None],
-        batch_size: int = None
+        batch_size: int = None,
+        max_in_flight: int = None,
+        wait: bool = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
-        Stream insert vectors with real-time processing.
+        Stream insert vectors through a bounded upsert pipeline.
+        
+        Up to max_in_flight batches are upserted concurrently while the
+        next batch is read from the stream. The stream is not read further
+        while the pipeline is full. Results are yielded in batch order.
+        
+        With wait=False, upserts return once Qdrant has accepted them. The
+        last batch is held back and sent with wait=True after every earlier
+        batch is acknowledged. That final upsert is the barrier that marks
+        the stream as applied.
         
         Args:
             collection_name: Name of the collection
             vector_stream: Async generator of vector data
-            batch_size: Size of each batch
+            batch_size: Size of each batch, configured or adaptive when omitted
+            max_in_flight: Maximum concurrent batch upserts
+            wait: Wait for each upsert to be applied
             
         Yields:
-            Dict with batch results
+            Dict with batch results, including the batch sequence number
         """
-        batch_size = batch_size or self.default_batch_size
+        max_in_flight = max(max_in_flight or self.stream_max_in_flight, 1)
+        wait = self.stream_wait if wait is None else wait
+        
+        retry_budget = self._new_retry_budget()
+        in_flight = deque()
         current_batch = []
+        held_batch = None
+        sequence = 0
+        target_size = batch_size or self._target_batch_size(collection_name)
+        
+        def submit(batch, wait_for_apply):
+            nonlocal sequence
+            task = asyncio.create_task(
+                self._insert_single_batch(
+                    collection_name, batch, wait=wait_for_apply, retry_budget=retry_budget
+                )
+            )
+            in_flight.append((sequence, task))
+            sequence += 1
+            self.metrics.record_gauge("batch_stream_in_flight", len(in_flight))
+        
+        def enqueue(batch):
+            nonlocal held_batch
+            if wait:
+                submit(batch, True)
+            else:
+                # Keep the newest batch back for the final barrier
+                if held_batch is not None:
+                    submit(held_batch, False)
+                held_batch = batch
+        
+        async def acknowledge():
+            batch_sequence, task = in_flight.popleft()
+            result = await task
+            result["sequence"] = batch_sequence
+            self.metrics.record_gauge("batch_stream_in_flight", len(in_flight))
+            return result
         
         try:
             async for vector_data in vector_stream:
                 current_batch.append(vector_data)
                 
-                if len(current_batch) >= batch_size:
-                    # Process current batch
-                    result = await self._insert_single_batch(
-                        collection_name, current_batch
-                    )
-                    yield result
+                if len(current_batch) >= target_size:
+                    enqueue(current_batch)
                     current_batch = []
+                    target_size = batch_size or self._target_batch_size(collection_name)
+                    
+                    # Backpressure: stop reading until a slot frees up
+                    while len(in_flight) >= max_in_flight:
+                        yield await acknowledge()
             
             # Process remaining vectors
             if current_batch:
-                result = await self._insert_single_batch(
-                    collection_name, current_batch
-                )
-                yield result
+                enqueue(current_batch)
+            
+            # Drain the pipeline in order
+            while in_flight:
+                yield await acknowledge()
+            
+            # Barrier: the held batch is applied after everything before it
+            if held_batch is not None:
+                submit(held_batch, True)
+                held_batch = None
+                yield await acknowledge()
                 
         except Exception as e:
             self.metrics.increment_counter("stream_insert_errors")
-            raise VectorOperationError(f"Stream insertion failed: {str(e)}")
+            raise VectorOperationError(f"Stream insertion failed: {str(e)}", "stream_insert")
+        
+        finally:
+            # Drop acknowledgements nobody will consume
+            for _, task in in_flight:
+                task.cancel()
     
     def _group_operations(self, operations: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """Group operations by type."""
@@ -365,110 +484,257 @@ class BatchProcessor:
     async def _parallel_insert_batches(
         self,
         collection_name: str,
-        vectors: List[Dict[str, Any]],
-        batch_size: int
+        vectors: VectorBatch,
+        batch_size: int,
+        adaptive: bool = False,
+        retry_budget: Optional[RetryBudget] = None
     ) -> Dict[str, Any]:
         """Insert vectors using parallel batch processing."""
-        # Split vectors into chunks for parallel processing
-        chunks = [vectors[i:i + batch_size] for i in range(0, len(vectors), batch_size)]
-        
-        # Create tasks for parallel processing
-        tasks = []
-        for chunk in chunks:
-            task = self._insert_single_batch(collection_name, chunk)
-            tasks.append(task)
-        
-        # Process batches in parallel (with concurrency limit)
-        semaphore = asyncio.Semaphore(self.parallel_batches)
-        
-        async def process_with_semaphore(task):
-            async with semaphore:
-                return await task
-        
-        # Execute tasks
-        batch_results = await asyncio.gather(
-            *[process_with_semaphore(task) for task in tasks],
-            return_exceptions=True
-        )
+        submitted = []
+        pending = set()
+        offset = 0
+        
+        # Slice chunks (views of the same buffer) as slots free up, so an
+        # adaptive run picks up new batch sizes and parallelism mid-insert
+        while offset < len(vectors) or pending:
+            limit = self.batch_controller.parallelism(collection_name) if adaptive else self.parallel_batches
+            while offset < len(vectors) and len(pending) < limit:
+                size = self.batch_controller.batch_size(collection_name) if adaptive else batch_size
+                chunk = vectors.slice(offset, offset + size)
+                task = asyncio.ensure_future(
+                    self._insert_single_batch(collection_name, chunk, retry_budget=retry_budget)
+                )
+                submitted.append((chunk, task))
+                pending.add(task)
+                offset += len(chunk)
+            
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
         
         # Aggregate results
         total_inserted = 0
         total_errors = 0
         successful_batches = []
+        failed_points = []
         
-        for result in batch_results:
-            if isinstance(result, Exception):
-                total_errors += batch_size  # Assume entire batch failed
+        for chunk, task in submitted:
+            if task.exception() is not None:
+                # Entire batch failed
+                total_errors += len(chunk)
+                failed_points.extend(self._failed_points(chunk.ids, task.exception()))
             else:
+                result = task.result()
                 total_inserted += result["inserted_count"]
                 total_errors += result["error_count"]
+                failed_points.extend(result["failed_points"])
                 successful_batches.append(result)
         
         return {
             "inserted_count": total_inserted,
             "error_count": total_errors,
-            "batch_results": successful_batches
+            "batch_results": successful_batches,
+            "failed_points": failed_points
         }
     
     async def _sequential_insert_batches(
         self,
         collection_name: str,
-        vectors: List[Dict[str, Any]],
-        batch_size: int
+        vectors: VectorBatch,
+        batch_size: int,
+        adaptive: bool = False,
+        retry_budget: Optional[RetryBudget] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Insert vectors using sequential batch processing."""
-        for i in range(0, len(vectors), batch_size):
-            batch = vectors[i:i + batch_size]
-            result = await self._insert_single_batch(collection_name, batch)
+        offset = 0
+        while offset < len(vectors):
+            size = self.batch_controller.batch_size(collection_name) if adaptive else batch_size
+            batch = vectors.slice(offset, offset + size)
+            result = await self._insert_single_batch(collection_name, batch, retry_budget=retry_budget)
+            offset += len(batch)
             yield result
     
     async def _insert_single_batch(
         self,
         collection_name: str,
-        vectors: List[Dict[str, Any]]
+        vectors: Union[List[Dict[str, Any]], VectorBatch],
+        wait: bool = True,
+        retry_budget: Optional[RetryBudget] = None,
+        operation_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Insert a single batch of vectors with retry logic."""
-        for attempt in range(self.max_retries):
-            try:
-                start_time = time.time()
-                
-                # Perform the insertion
-                result = await self.qdrant_client.insert_vectors(
-                    collection_name=collection_name,
-                    vectors=vectors
+        """
+        Insert a single batch of vectors.
+        
+        Transient failures are retried by the Qdrant client against the
+        shared retry budget. A batch rejected for single points (HTTP 400,
+        validation errors) is bisected until the rejected points are
+        isolated, so one bad point does not fail or resend the rest of the
+        batch. Batch-wide rejections such as a missing collection are not
+        split.
+        """
+        ids = self._point_ids(vectors)
+        operation_id = operation_id or self._operation_id(collection_name, ids)
+        retry_budget = retry_budget or self._new_retry_budget()
+        start_time = time.time()
+        
+        result, error = await self._upsert_batch(collection_name, vectors, wait, retry_budget, operation_id)
+        if error is not None and self._should_bisect(vectors, error):
+            result = await self._bisect_batch(
+                collection_name, vectors, wait, retry_budget, operation_id, error, depth=1
+            )
+            result["duration"] = time.time() - start_time
+        
+        if result["error_count"]:
+            self.metrics.increment_counter("batch_points_failed", result["error_count"])
+        return result
+    
+    async def _upsert_batch(
+        self,
+        collection_name: str,
+        vectors: Union[List[Dict[str, Any]], VectorBatch],
+        wait: bool,
+        retry_budget: RetryBudget,
+        operation_id: str
+    ) -> Tuple[Dict[str, Any], Optional[Exception]]:
+        """Send one upsert request and return its result and error."""
+        start_time = time.time()
+        
+        try:
+            await self.qdrant_client.insert_vectors(
+                collection_name=collection_name,
+                vectors=vectors,
+                wait=wait,
+                retry_budget=retry_budget
+            )
+            
+            duration = time.time() - start_time
+            self.batch_controller.observe(
+                collection_name, len(vectors), duration, self._request_bytes(vectors)
+            )
+            
+            return {
+                "operation_id": operation_id,
+                "inserted_count": len(vectors),
+                "error_count": 0,
+                "duration": duration,
+                "batch_size": len(vectors),
+                "failed_points": []
+            }, None
+            
+        except Exception as e:
+            duration = time.time() - start_time
+            if is_retryable_error(e):
+                # Rejected points say nothing about server load; bisection handles them
+                self.batch_controller.observe(
+                    collection_name, len(vectors), duration,
+                    self._request_bytes(vectors), success=False
                 )
-                
-                duration = time.time() - start_time
-                
-                return {
-                    "inserted_count": len(vectors),
-                    "error_count": 0,
-                    "duration": duration,
-                    "batch_size": len(vectors)
-                }
-                
-            except Exception as e:
-                if attempt == self.max_retries - 1:
-                    # Final attempt failed
-                    return {
-                        "inserted_count": 0,
-                        "error_count": len(vectors),
-                        "duration": 0,
-                        "batch_size": len(vectors),
-                        "error": str(e)
-                    }
-                
-                # Wait before retry
-                await asyncio.sleep(self.retry_delay * (attempt + 1))
+            
+            return {
+                "operation_id": operation_id,
+                "inserted_count": 0,
+                "error_count": len(vectors),
+                "duration": duration,
+                "batch_size": len(vectors),
+                "failed_points": self._failed_points(self._point_ids(vectors), e),
+                "error": str(e)
+            }, e
+    
+    async def _bisect_batch(
+        self,
+        collection_name: str,
+        vectors: Union[List[Dict[str, Any]], VectorBatch],
+        wait: bool,
+        retry_budget: RetryBudget,
+        operation_id: str,
+        error: Exception,
+        depth: int
+    ) -> Dict[str, Any]:
+        """
+        Insert both halves of a rejected batch separately and merge the results.
         
-        # Should never reach here
-        return {
-            "inserted_count": 0,
-            "error_count": len(vectors),
-            "duration": 0,
+        Rejected halves are split again until bisect_max_depth is reached.
+        When both halves fail with the error of their parent, the rejection
+        is not caused by single points and splitting stops.
+        """
+        self.metrics.increment_counter("batch_bisections")
+        start_time = time.time()
+        middle = len(vectors) // 2
+        
+        halves = []
+        for index, (start, stop) in enumerate(((0, middle), (middle, len(vectors)))):
+            half = vectors.slice(start, stop) if isinstance(vectors, VectorBatch) else vectors[start:stop]
+            half_id = f"{operation_id}.{index}"
+            result, half_error = await self._upsert_batch(collection_name, half, wait, retry_budget, half_id)
+            halves.append((half, half_id, result, half_error))
+        
+        batch_wide = all(
+            half_error is not None and str(half_error) == str(error) for _, _, _, half_error in halves
+        )
+        
+        results = []
+        for half, half_id, result, half_error in halves:
+            if (half_error is not None and not batch_wide and depth < self.bisect_max_depth
+                    and self._should_bisect(half, half_error)):
+                result = await self._bisect_batch(
+                    collection_name, half, wait, retry_budget, half_id, half_error, depth + 1
+                )
+            results.append(result)
+        
+        failed_points = results[0]["failed_points"] + results[1]["failed_points"]
+        result = {
+            "operation_id": operation_id,
+            "inserted_count": results[0]["inserted_count"] + results[1]["inserted_count"],
+            "error_count": len(failed_points),
+            "duration": time.time() - start_time,
             "batch_size": len(vectors),
-            "error": "Max retries exceeded"
+            "failed_points": failed_points
         }
+        if failed_points:
+            result["error"] = failed_points[0]["error"]
+        return result
+    
+    def _should_bisect(self, vectors: Union[List[Dict[str, Any]], VectorBatch], error: Exception) -> bool:
+        """Check whether splitting a rejected batch may isolate the rejected points."""
+        return self.bisect_failures and len(vectors) > 1 and is_point_rejection(error)
+    
+    def _new_retry_budget(self) -> RetryBudget:
+        """Retry budget for one insert job."""
+        return RetryBudget(
+            min_retries=self.max_retries - 1,
+            ratio=self.retry_budget_ratio,
+            retry_delay=self.retry_delay
+        )
+    
+    def _point_ids(self, vectors: Union[List[Dict[str, Any]], VectorBatch]) -> List[Any]:
+        """Point ids of a batch."""
+        if isinstance(vectors, VectorBatch):
+            return vectors.ids
+        return [v["id"] for v in vectors]
+    
+    def _operation_id(self, collection_name: str, ids: List[Any]) -> str:
+        """Stable id of a batch, identical across retries and resubmissions."""
+        digest = hashlib.sha1(collection_name.encode())
+        for point_id in ids:
+            digest.update(b"\x1f")
+            digest.update(str(point_id).encode())
+        return digest.hexdigest()[:16]
+    
+    def _failed_points(self, ids: List[Any], error: Exception) -> List[Dict[str, Any]]:
+        """Per-point failure records for a failed batch."""
+        retryable = is_retryable_error(error)
+        message = str(error)
+        return [{"id": point_id, "error": message, "retryable": retryable} for point_id in ids]
+    
+    def _target_batch_size(self, collection_name: str, dimension: Optional[int] = None) -> int:
+        """Current insert batch size for a collection."""
+        if self.batch_controller.enabled:
+            return self.batch_controller.batch_size(collection_name, dimension)
+        return self.default_batch_size
+    
+    def _request_bytes(self, vectors: Union[List[Dict[str, Any]], VectorBatch]) -> int:
+        """Vector bytes sent in one upsert request."""
+        if isinstance(vectors, VectorBatch):
+            return vectors.nbytes
+        return sum(len(v["vector"]) for v in vectors) * 4
     
     async def _process_collection_updates(
         self,
@@ -479,30 +745,20 @@ class BatchProcessor:
         updated_count = 0
         error_count = 0
         
-        # Process updates in chunks
-        for i in range(0, len(operations), self.chunk_size):
-            chunk = operations[i:i + self.chunk_size]
+        # One batch_update_points request per chunk; chunks run in order so
+        # repeated updates to a point apply in submission order
+        for i in range(0, len(operations), self.bulk_chunk_size):
+            chunk = operations[i:i + self.bulk_chunk_size]
             
-            # Process chunk
-            chunk_tasks = []
-            for op in chunk:
-                task = self.qdrant_client.update_vector(
+            try:
+                result = await self.qdrant_client.update_points(
                     collection_name=collection_name,
-                    vector_id=op["vector_id"],
-                    vector=op.get("vector"),
-                    metadata=op.get("metadata")
+                    updates=chunk,
+                    merge_payload=self.merge_payload
                 )
-                chunk_tasks.append(task)
-            
-            # Execute chunk updates
-            chunk_results = await asyncio.gather(*chunk_tasks, return_exceptions=True)
-            
-            # Count results
-            for result in chunk_results:
-                if isinstance(result, Exception):
-                    error_count += 1
-                else:
-                    updated_count += 1 if result.get("updated") else 0
+                updated_count += result["updated_count"]
+            except Exception:
+                error_count += len(chunk)
         
         return {
             "updated_count": updated_count,
@@ -518,28 +774,18 @@ class BatchProcessor:
         deleted_count = 0
         error_count = 0
         
-        # Process deletions in chunks
-        for i in range(0, len(vector_ids), self.chunk_size):
-            chunk = vector_ids[i:i + self.chunk_size]
+        # One PointIdsList delete per chunk
+        for i in range(0, len(vector_ids), self.bulk_chunk_size):
+            chunk = vector_ids[i:i + self.bulk_chunk_size]
             
-            # Process chunk
-            chunk_tasks = []
-            for vector_id in chunk:
-                task = self.qdrant_client.delete_vector(
+            try:
+                result = await self.qdrant_client.delete_points(
                     collection_name=collection_name,
-                    vector_id=vector_id
+                    vector_ids=chunk
                 )
-                chunk_tasks.append(task)
-            
-            # Execute chunk deletions
-            chunk_results = await asyncio.gather(*chunk_tasks, return_exceptions=True)
-            
-            # Count results
-            for result in chunk_results:
-                if isinstance(result, Exception):
-                    error_count += 1
-                else:
-                    deleted_count += 1 if result.get("deleted") else 0
+                deleted_count += result["deleted_count"]
+            except Exception:
+                error_count += len(chunk)
         
         return {
             "deleted_count": deleted_count,
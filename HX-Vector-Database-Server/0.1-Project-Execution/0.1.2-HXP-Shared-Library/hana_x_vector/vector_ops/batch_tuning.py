@@ -0,0 +1,175 @@
+"""
+Adaptive Batch Tuning
+=====================
+
+AIMD controller for insert batch size and parallelism.
+Tunes each collection from observed upsert latency, failures and
+request bytes, within configured bounds.
+"""
+
+from typing import Dict, Any, Optional
+from dataclasses import dataclass
+import threading
+from ..monitoring.metrics import MetricsCollector
+
+
+@dataclass
+class BatchTuningState:
+    """Current decisions and observations for one collection."""
+    batch_size: int
+    parallelism: int
+    latency: Optional[float] = None
+    bytes_per_point: Optional[float] = None
+    observations: int = 0
+    failures: int = 0
+
+
+class AdaptiveBatchController:
+    """
+    Additive-increase / multiplicative-decrease batch size controller.
+    
+    Batch size grows by a fixed step while upserts stay under the target
+    latency and shrinks by a factor when they run slow or fail. Once the
+    batch size reaches its ceiling, parallelism grows instead. The ceiling
+    is the lower of the configured maximum and the request byte budget
+    divided by the observed bytes per point.
+    
+    Tuning is off unless batch.adaptive.enabled is set, so the configured
+    batch_size and parallel_batches stay in effect by default.
+    """
+    
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        default_batch_size: int = 1000,
+        max_batch_size: int = 10000,
+        default_parallelism: int = 4,
+        metrics: Optional[MetricsCollector] = None
+    ):
+        self.enabled = config.get("enabled", False)
+        self.target_latency = config.get("target_latency", 1.0)
+        self.min_batch_size = config.get("min_batch_size", 64)
+        self.max_batch_size = config.get("max_batch_size", max_batch_size)
+        self.increase_step = config.get("increase_step", 64)
+        self.decrease_factor = config.get("decrease_factor", 0.5)
+        self.min_parallelism = config.get("min_parallelism", 1)
+        self.max_parallelism = config.get("max_parallelism", default_parallelism * 2)
+        self.max_request_bytes = config.get("max_request_bytes", 8 * 1024 * 1024)
+        self.smoothing = config.get("smoothing", 0.3)
+        
+        self.default_batch_size = default_batch_size
+        self.default_parallelism = default_parallelism
+        self.metrics = metrics or MetricsCollector()
+        
+        self.states: Dict[str, BatchTuningState] = {}
+        self._lock = threading.Lock()
+    
+    def batch_size(self, collection_name: str, dimension: Optional[int] = None) -> int:
+        """
+        Get the current batch size for a collection.
+        
+        Args:
+            collection_name: Name of the collection
+            dimension: Vector dimension, used to seed the byte budget
+        
+        Returns:
+            Batch size to use for the next upsert
+        """
+        return self._state(collection_name, dimension).batch_size
+    
+    def parallelism(self, collection_name: str) -> int:
+        """Get the current number of concurrent upserts for a collection."""
+        return self._state(collection_name).parallelism
+    
+    def observe(
+        self,
+        collection_name: str,
+        batch_size: int,
+        duration: float,
+        request_bytes: int,
+        success: bool = True
+    ):
+        """
+        Record the outcome of one upsert and adjust the collection's decisions.
+        
+        Args:
+            collection_name: Name of the collection
+            batch_size: Number of points in the upsert
+            duration: Upsert latency in seconds
+            request_bytes: Vector bytes sent in the upsert
+            success: Whether the upsert succeeded
+        """
+        if not self.enabled or batch_size <= 0:
+            return
+        
+        with self._lock:
+            state = self._state(collection_name)
+            state.observations += 1
+            state.bytes_per_point = self._smooth(state.bytes_per_point, request_bytes / batch_size)
+            ceiling = self._ceiling(state)
+            
+            if not success:
+                state.failures += 1
+                state.batch_size = int(state.batch_size * self.decrease_factor)
+                state.parallelism = max(self.min_parallelism, state.parallelism // 2)
+            else:
+                state.latency = self._smooth(state.latency, duration)
+                if duration > self.target_latency:
+                    state.batch_size = int(state.batch_size * self.decrease_factor)
+                    state.parallelism = max(self.min_parallelism, state.parallelism - 1)
+                elif state.batch_size < ceiling:
+                    state.batch_size += self.increase_step
+                elif state.parallelism < self.max_parallelism:
+                    state.parallelism += 1
+            
+            state.batch_size = max(self.min_batch_size, min(state.batch_size, ceiling))
+            self._publish(collection_name, state)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get current decisions per collection."""
+        with self._lock:
+            return {
+                name: {
+                    "batch_size": state.batch_size,
+                    "parallelism": state.parallelism,
+                    "latency": state.latency,
+                    "bytes_per_point": state.bytes_per_point,
+                    "observations": state.observations,
+                    "failures": state.failures
+                }
+                for name, state in self.states.items()
+            }
+    
+    def _state(self, collection_name: str, dimension: Optional[int] = None) -> BatchTuningState:
+        """Get or create the tuning state for a collection."""
+        state = self.states.get(collection_name)
+        if state is None:
+            batch_size = self.default_batch_size
+            if dimension:
+                # Seed within the byte budget before any upsert is observed
+                batch_size = min(batch_size, self.max_request_bytes // (dimension * 4))
+            state = BatchTuningState(
+                batch_size=max(self.min_batch_size, min(batch_size, self.max_batch_size)),
+                parallelism=max(self.min_parallelism, min(self.default_parallelism, self.max_parallelism))
+            )
+            self.states[collection_name] = state
+        return state
+    
+    def _ceiling(self, state: BatchTuningState) -> int:
+        """Largest batch size allowed by the configured bounds and byte budget."""
+        ceiling = self.max_batch_size
+        if state.bytes_per_point:
+            ceiling = min(ceiling, int(self.max_request_bytes / state.bytes_per_point))
+        return max(self.min_batch_size, ceiling)
+    
+    def _smooth(self, current: Optional[float], value: float) -> float:
+        """Exponentially weighted moving average."""
+        if current is None:
+            return value
+        return current + self.smoothing * (value - current)
+    
+    def _publish(self, collection_name: str, state: BatchTuningState):
+        """Publish current decisions as gauges."""
+        tags = {"collection": collection_name}
+        self.metrics.record_gauge("adaptive_batch_size", state.batch_size, tags)
+        self.metrics.record_gauge("adaptive_batch_parallelism", state.parallelism, tags)
@@ -0,0 +1,336 @@
+"""
+Bulk Loader
+===========
+
+Bulk ingestion of embedding files.
+Memory-maps .npy, .fvecs or Arrow IPC vector files, pairs them with an
+optional JSON lines or Parquet payload sidecar and streams fixed-size
+windows of rows into the batch processor. Vectors are never converted to
+Python objects on the load path.
+"""
+
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+import asyncio
+import itertools
+import json
+import os
+import time
+import numpy as np
+from ..monitoring.metrics import MetricsCollector
+from ..utils.exceptions import VectorOperationError
+from ..utils.vector_batch import VectorBatch, PointId
+from .batch import BatchProcessor
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+VECTOR_FORMATS = {
+    ".npy": "npy",
+    ".fvecs": "fvecs",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow"
+}
+
+
+def _require_pyarrow(path: str):
+    """Fail with a clear message when Arrow or Parquet support is missing."""
+    if pyarrow is None:
+        raise VectorOperationError(f"pyarrow is required to read {path}", "bulk_load")
+
+
+class VectorFile:
+    """
+    Memory-mapped vector matrix.
+    
+    Windows of .npy and single-chunk Arrow files are views of the mapping.
+    .fvecs rows carry a leading dimension word, so each window is copied
+    once into a contiguous block; the file itself is never read whole.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        format: Optional[str] = None,
+        vector_column: str = "vector",
+        id_column: str = "id"
+    ):
+        self.path = path
+        self.format = format or VECTOR_FORMATS.get(os.path.splitext(path)[1].lower())
+        self._chunks: List[np.ndarray] = []
+        self._id_chunks: Optional[List[Any]] = None
+        
+        if self.format == "npy":
+            matrix = np.load(path, mmap_mode="r")
+            if matrix.ndim != 2:
+                raise VectorOperationError(
+                    f"{path} must hold a 2-dimensional array, got {matrix.ndim} dimensions", "bulk_load"
+                )
+            self._chunks = [matrix]
+        elif self.format == "fvecs":
+            self._chunks = [self._map_fvecs(path)]
+        elif self.format == "arrow":
+            self._map_arrow(path, vector_column, id_column)
+        else:
+            raise VectorOperationError(f"Unsupported vector file format: {path}", "bulk_load")
+        
+        self._offsets = np.cumsum([0] + [len(chunk) for chunk in self._chunks])
+        self.rows = int(self._offsets[-1])
+        self.dimension = int(self._chunks[0].shape[1]) if self._chunks else 0
+    
+    def window(self, start: int, stop: int) -> np.ndarray:
+        """
+        Get rows [start, stop) of the vector matrix.
+        
+        Args:
+            start: First row
+            stop: Row after the last
+        
+        Returns:
+            View of the mapping when the window lies in one chunk
+        """
+        pieces = [chunk[lo:hi] for chunk, lo, hi in self._locate(start, stop)]
+        if len(pieces) == 1:
+            return pieces[0]
+        return np.concatenate(pieces)
+    
+    def ids(self, start: int, stop: int) -> Optional[List[PointId]]:
+        """Get the file's point ids for rows [start, stop), if it has any."""
+        if self._id_chunks is None:
+            return None
+        ids = []
+        for index, lo, hi in self._locate(start, stop, indices=True):
+            ids.extend(self._id_chunks[index].slice(lo, hi - lo).to_pylist())
+        return ids
+    
+    def _locate(self, start: int, stop: int, indices: bool = False) -> Iterator[Tuple[Any, int, int]]:
+        """Split a row range into (chunk, start, stop) pieces."""
+        for index, chunk in enumerate(self._chunks):
+            base = int(self._offsets[index])
+            lo = max(start - base, 0)
+            hi = min(stop - base, len(chunk))
+            if lo < hi:
+                yield (index if indices else chunk), lo, hi
+    
+    def _map_fvecs(self, path: str) -> np.ndarray:
+        """Map an .fvecs file as a strided (rows, dimension) view."""
+        words = np.memmap(path, dtype="<f4", mode="r")
+        if words.size == 0:
+            return np.empty((0, 0), dtype=np.float32)
+        
+        dimension = int(words[:1].view("<i4")[0])
+        if dimension <= 0 or words.size % (dimension + 1):
+            raise VectorOperationError(f"{path} is not a valid .fvecs file", "bulk_load")
+        return words.reshape(-1, dimension + 1)[:, 1:]
+    
+    def _map_arrow(self, path: str, vector_column: str, id_column: str):
+        """Map the record batches of an Arrow IPC file."""
+        _require_pyarrow(path)
+        reader = pyarrow.ipc.open_file(pyarrow.memory_map(path, "r"))
+        names = reader.schema.names
+        if vector_column not in names:
+            raise VectorOperationError(f"{path} has no '{vector_column}' column", "bulk_load")
+        
+        if id_column in names:
+            self._id_chunks = []
+        for i in range(reader.num_record_batches):
+            record_batch = reader.get_batch(i)
+            column = record_batch.column(vector_column)
+            if not pyarrow.types.is_fixed_size_list(column.type):
+                raise VectorOperationError(
+                    f"Column '{vector_column}' in {path} must be a fixed size list", "bulk_load"
+                )
+            
+            values = column.flatten().to_numpy(zero_copy_only=pyarrow.types.is_float32(column.type.value_type))
+            self._chunks.append(values.reshape(-1, column.type.list_size))
+            if self._id_chunks is not None:
+                self._id_chunks.append(record_batch.column(id_column))
+
+
+def iter_payload_rows(path: str, batch_size: int = 10000) -> Iterator[Dict[str, Any]]:
+    """
+    Stream payload rows from a JSON lines or Parquet sidecar.
+    
+    Args:
+        path: Sidecar file, one row per vector in file order
+        batch_size: Parquet rows decoded at a time
+    
+    Yields:
+        Payload dictionaries
+    """
+    if os.path.splitext(path)[1].lower() == ".parquet":
+        _require_pyarrow(path)
+        for record_batch in pyarrow.parquet.ParquetFile(path).iter_batches(batch_size=batch_size):
+            yield from record_batch.to_pylist()
+        return
+    
+    with open(path, "r", encoding="utf-8") as sidecar:
+        for line in sidecar:
+            if line.strip():
+                yield json.loads(line)
+
+
+def count_payload_rows(path: str) -> int:
+    """
+    Count the rows of a JSON lines or Parquet sidecar without decoding them.
+    
+    Args:
+        path: Sidecar file
+    
+    Returns:
+        Number of payload rows
+    """
+    if os.path.splitext(path)[1].lower() == ".parquet":
+        _require_pyarrow(path)
+        return pyarrow.parquet.ParquetFile(path).metadata.num_rows
+    
+    with open(path, "r", encoding="utf-8") as sidecar:
+        return sum(1 for line in sidecar if line.strip())
+
+
+class BulkLoader:
+    """
+    Streaming loader from vector files into a collection.
+    
+    Windows of window_size rows are sliced from the mapped file, paired
+    with the next rows of the payload sidecar and handed to
+    BatchProcessor.insert_batch, which splits them into upserts. At most
+    `parallelism` windows are in flight, and the sidecar is read no
+    further ahead than that.
+    """
+    
+    def __init__(self, config: Dict[str, Any], batch_processor: Optional[BatchProcessor] = None):
+        loader_config = config.get("bulk_load", {})
+        self.window_size = loader_config.get("window_size", 50000)
+        self.parallelism = loader_config.get("parallelism", 2)
+        self.id_field = loader_config.get("id_field", "id")
+        self.vector_column = loader_config.get("vector_column", "vector")
+        self.id_column = loader_config.get("id_column", "id")
+        
+        self.batch_processor = batch_processor or BatchProcessor(config)
+        self.metrics = MetricsCollector()
+    
+    async def load(
+        self,
+        collection_name: str,
+        vector_path: str,
+        payload_path: Optional[str] = None,
+        format: Optional[str] = None,
+        start_id: int = 0,
+        parallelism: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Load a vector file into a collection.
+        
+        Point ids are taken from the sidecar's id field, then from the
+        Arrow id column, and otherwise numbered from start_id by row.
+        
+        Args:
+            collection_name: Name of the collection
+            vector_path: .npy, .fvecs or Arrow IPC vector file
+            payload_path: JSON lines or Parquet payload sidecar
+            format: Vector file format, detected from the extension by default
+            start_id: First id for rows without an id
+            parallelism: Windows inserted concurrently
+        
+        Returns:
+            Dict with load results
+        """
+        start_time = time.time()
+        parallelism = parallelism or self.parallelism
+        pending = set()
+        
+        try:
+            vector_file = await asyncio.to_thread(
+                VectorFile, vector_path, format, self.vector_column, self.id_column
+            )
+            payload_rows = None
+            if payload_path:
+                # Reject a mismatched sidecar before any window is inserted
+                payload_count = await asyncio.to_thread(count_payload_rows, payload_path)
+                if payload_count != vector_file.rows:
+                    raise VectorOperationError(
+                        f"{payload_path} has {payload_count} rows but {vector_path} has {vector_file.rows}",
+                        "bulk_load"
+                    )
+                payload_rows = iter_payload_rows(payload_path, self.window_size)
+            totals = {"inserted_count": 0, "error_count": 0, "failed_points": []}
+            
+            def collect(done):
+                for task in done:
+                    result = task.result()
+                    totals["inserted_count"] += result["inserted_count"]
+                    totals["error_count"] += result["error_count"]
+                    totals["failed_points"].extend(result.get("failed_points", []))
+            
+            for start in range(0, vector_file.rows, self.window_size):
+                if len(pending) >= parallelism:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    collect(done)
+                
+                stop = min(start + self.window_size, vector_file.rows)
+                ids, payloads = await asyncio.to_thread(
+                    self._window_rows, vector_file, payload_rows, start, stop, start_id
+                )
+                batch = VectorBatch(ids, vector_file.window(start, stop), payloads)
+                pending.add(asyncio.create_task(
+                    self.batch_processor.insert_batch(collection_name, batch)
+                ))
+            
+            if pending:
+                done, pending = await asyncio.wait(pending)
+                collect(done)
+            
+            duration = time.time() - start_time
+            self.metrics.record_histogram("bulk_load_duration", duration)
+            self.metrics.increment_counter("bulk_load_points", totals["inserted_count"])
+            
+            return {
+                "collection": collection_name,
+                "rows": vector_file.rows,
+                "dimension": vector_file.dimension,
+                "window_count": -(-vector_file.rows // self.window_size),
+                "inserted_count": totals["inserted_count"],
+                "error_count": totals["error_count"],
+                "failed_points": totals["failed_points"],
+                "duration": duration
+            }
+        
+        except VectorOperationError:
+            self.metrics.increment_counter("bulk_load_errors")
+            raise
+        except Exception as e:
+            self.metrics.increment_counter("bulk_load_errors")
+            raise VectorOperationError(f"Bulk load failed: {str(e)}", "bulk_load")
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    def _window_rows(
+        self,
+        vector_file: VectorFile,
+        payload_rows: Optional[Iterator[Dict[str, Any]]],
+        start: int,
+        stop: int,
+        start_id: int
+    ) -> Tuple[List[PointId], List[Dict[str, Any]]]:
+        """Ids and payloads for rows [start, stop)."""
+        ids = vector_file.ids(start, stop) or list(range(start_id + start, start_id + stop))
+        if payload_rows is None:
+            return ids, [{} for _ in ids]
+        
+        payloads = list(itertools.islice(payload_rows, stop - start))
+        if len(payloads) < stop - start:
+            raise VectorOperationError(
+                f"Payload sidecar ends at row {start + len(payloads)} of {vector_file.rows}", "bulk_load"
+            )
+        
+        for row, payload in enumerate(payloads):
+            if self.id_field in payload:
+                ids[row] = payload.pop(self.id_field)
+        return ids, payloads
@@ -6,14 +6,19 @@ Redis-based caching layer for vector operations.
 Provides intelligent caching strategies for search results and metadata.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Union
 import json
+import base64
 import hashlib
 import time
+import uuid
 import asyncio
+import numpy as np
 import redis.asyncio as redis
 from ..monitoring.metrics import MetricsCollector
 from ..utils.exceptions import VectorOperationError
+from ..utils.codec import CacheCodec
+from ..utils.local_cache import LocalResultCache
 
 
 class CacheManager:
@@ -45,6 +50,10 @@ class CacheManager:
         self.search_prefix = f"{self.key_prefix}search:"
         self.metadata_prefix = f"{self.key_prefix}metadata:"
         self.collection_prefix = f"{self.key_prefix}collection:"
+        self.generation_prefix = f"{self.key_prefix}generation:"
+        self.global_generation_key = f"{self.key_prefix}generation"
+        self.semantic_prefix = f"{self.key_prefix}semantic:"
+        self.lock_prefix = f"{self.key_prefix}lock:"
         
         # Cache strategies
         self.cache_strategies = {
@@ -53,6 +62,39 @@ class CacheManager:
             "collection": cache_config.get("collection_strategy", "write_through")
         }
         
+        # In-process L1 tier for search results (Redis is L2)
+        self.l1_enabled = cache_config.get("l1_enabled", True)
+        self.l1_cache = LocalResultCache(
+            max_entries=cache_config.get("l1_max_entries", 10000),
+            max_bytes=cache_config.get("l1_max_bytes", 64 * 1024 * 1024),  # 64 MB
+            ttl=cache_config.get("l1_ttl", min(self.search_cache_ttl, 60))
+        )
+        
+        # Generation tokens are re-read from Redis at most every
+        # l1_generation_ttl seconds, which bounds how long another worker's
+        # invalidation can go unnoticed by this process's L1 tier.
+        self.l1_generation_ttl = cache_config.get("l1_generation_ttl", 1.0)
+        self._local_generations: Dict[str, Tuple[str, float]] = {}
+        
+        # Semantic search cache: query vectors are bucketed with a random
+        # hyperplane LSH and a cached result is reused when a bucketed
+        # query lies within semantic_tolerance cosine distance.
+        self.semantic_enabled = cache_config.get("semantic_enabled", False)
+        self.semantic_tolerance = cache_config.get("semantic_tolerance", 0.02)
+        self.semantic_hash_bits = cache_config.get("semantic_hash_bits", 16)
+        self.semantic_bucket_size = cache_config.get("semantic_bucket_size", 16)
+        self.semantic_seed = cache_config.get("semantic_seed", 42)
+        self._semantic_planes: Dict[int, np.ndarray] = {}
+        
+        # Cross-worker search locks: one worker computes a missing search
+        # result while the others poll the cache for it
+        self.search_lock_enabled = cache_config.get("search_lock_enabled", False)
+        self.search_lock_ttl = cache_config.get("search_lock_ttl", 5.0)
+        self.search_lock_poll_interval = cache_config.get("search_lock_poll_interval", 0.05)
+        
+        # Codec for cached search results (binary, optionally compressed)
+        self.codec = CacheCodec.from_config(cache_config)
+        
         # Redis client
         self.redis_client = None
         self.redis_pool = None
@@ -69,7 +111,7 @@ class CacheManager:
                 port=self.redis_port,
                 db=self.redis_db,
                 password=self.redis_password,
-                decode_responses=True,
+                decode_responses=False,
                 max_connections=20
             )
             
@@ -99,40 +141,85 @@ class CacheManager:
         query_vector: List[float],
         limit: int,
         filters: Optional[Dict[str, Any]] = None,
-        score_threshold: Optional[float] = None
+        score_threshold: Optional[float] = None,
+        generation: str = "0.0",
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True
     ) -> str:
         """
         Generate cache key for search operations.
         
+        The key embeds the collection name and its current generation, so
+        bumping the generation makes every older entry unreachable.
+        
         Args:
             collection_name: Name of the collection
             query_vector: Query vector
             limit: Result limit
             filters: Search filters
             score_threshold: Score threshold
+            generation: Generation token from get_search_generation
+            with_vectors: Whether results include stored vectors
+            with_payload: Payload projection of the results
             
         Returns:
             Cache key string
         """
-        # Create key data
-        key_data = {
-            "collection": collection_name,
-            "vector_hash": self._hash_vector(query_vector),
-            "limit": limit,
-            "filters": filters,
-            "score_threshold": score_threshold
-        }
+        key_hash = self._search_params_hash(
+            limit, filters, score_threshold, with_vectors, with_payload,
+            vector_hash=self._hash_vector(query_vector)
+        )
         
-        # Generate hash
-        key_string = json.dumps(key_data, sort_keys=True)
-        key_hash = hashlib.md5(key_string.encode()).hexdigest()
+        return f"{self.search_prefix}{collection_name}:{generation}:{key_hash}"
+    
+    async def get_search_generation(self, collection_name: str) -> str:
+        """
+        Get the current search cache generation for a collection.
+        
+        The token combines the global generation (bumped when the whole
+        search cache is invalidated) with the per-collection generation.
+        
+        Args:
+            collection_name: Collection name
+            
+        Returns:
+            Generation token used in search cache keys
+        """
+        if not self.cache_enabled or not self.redis_client:
+            return "0.0"
+        
+        if self.l1_enabled:
+            local_generation = self._local_generations.get(collection_name)
+            if local_generation and local_generation[1] > time.monotonic():
+                return local_generation[0]
         
-        return f"{self.search_prefix}{key_hash}"
+        try:
+            global_generation, collection_generation = await self.redis_client.mget(
+                self.global_generation_key,
+                self._generation_key(collection_name)
+            )
+            generation = f"{int(global_generation or 0)}.{int(collection_generation or 0)}"
+            
+            if self.l1_enabled:
+                self._local_generations[collection_name] = (
+                    generation,
+                    time.monotonic() + self.l1_generation_ttl
+                )
+            
+            return generation
+            
+        except Exception as e:
+            self.metrics.increment_counter("cache_errors", tags={"type": "generation"})
+            print(f"Cache generation lookup error: {e}")
+            return "0.0"
     
     async def get_cached_search(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """
         Get cached search results.
         
+        Checks the in-process L1 tier first and falls back to Redis. Results
+        served from L1 are shared between callers and must not be mutated.
+        
         Args:
             cache_key: Cache key
             
@@ -142,21 +229,31 @@ class CacheManager:
         if not self.cache_enabled or not self.redis_client:
             return None
         
+        if self.l1_enabled:
+            result = self.l1_cache.get(cache_key)
+            if result is not None:
+                self.metrics.increment_counter("cache_hits", tags={"type": "search", "tier": "l1"})
+                return result
+            self.metrics.increment_counter("cache_misses", tags={"type": "search", "tier": "l1"})
+        
         try:
             # Get from cache
             cached_data = await self.redis_client.get(cache_key)
             
             if cached_data:
-                result = json.loads(cached_data)
+                result = self.codec.decode(cached_data)
                 
                 # Update access time for LRU
                 if self.cache_strategies["search"] == "lru":
                     await self.redis_client.expire(cache_key, self.search_cache_ttl)
                 
-                self.metrics.increment_counter("cache_hits", tags={"type": "search"})
+                if self.l1_enabled:
+                    self.l1_cache.put(cache_key, result, len(cached_data))
+                
+                self.metrics.increment_counter("cache_hits", tags={"type": "search", "tier": "l2"})
                 return result
             
-            self.metrics.increment_counter("cache_misses", tags={"type": "search"})
+            self.metrics.increment_counter("cache_misses", tags={"type": "search", "tier": "l2"})
             return None
             
         except Exception as e:
@@ -187,13 +284,16 @@ class CacheManager:
             result["cached_at"] = time.time()
             
             # Serialize and cache
-            cached_data = json.dumps(result)
+            cached_data = self.codec.encode(result)
             await self.redis_client.setex(
                 cache_key,
                 self.search_cache_ttl,
                 cached_data
             )
             
+            if self.l1_enabled:
+                self.l1_cache.put(cache_key, result, len(cached_data))
+            
             self.metrics.increment_counter("cache_writes", tags={"type": "search"})
             return True
             
@@ -202,6 +302,231 @@ class CacheManager:
             print(f"Cache set error: {e}")
             return False
     
+    async def get_semantic_search(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        limit: int,
+        filters: Optional[Dict[str, Any]] = None,
+        score_threshold: Optional[float] = None,
+        generation: str = "0.0",
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get cached search results for a nearby query vector.
+        
+        Only queries with the same limit, filters, score threshold and
+        projection that fall into the same LSH bucket are considered.
+        
+        Args:
+            collection_name: Collection name
+            query_vector: Query vector
+            limit: Result limit
+            filters: Search filters
+            score_threshold: Score threshold
+            generation: Generation token from get_search_generation
+            with_vectors: Whether results include stored vectors
+            with_payload: Payload projection of the results
+            
+        Returns:
+            Cached search results or None
+        """
+        if not self.semantic_enabled or not self.cache_enabled or not self.redis_client:
+            return None
+        
+        try:
+            vector = self._normalize_vector(query_vector)
+            if vector is None:
+                return None
+            
+            bucket_key = self._semantic_bucket_key(
+                collection_name, vector, limit, filters, score_threshold, generation,
+                with_vectors, with_payload
+            )
+            entries = await self.redis_client.lrange(bucket_key, 0, -1)
+            
+            candidate_keys = []
+            candidate_vectors = []
+            for entry in entries:
+                data = json.loads(entry)
+                candidate = np.frombuffer(base64.b64decode(data["vector"]), dtype=np.float32)
+                if candidate.shape == vector.shape:
+                    candidate_keys.append(data["key"])
+                    candidate_vectors.append(candidate)
+            
+            if candidate_vectors:
+                similarities = np.stack(candidate_vectors) @ vector
+                best = int(np.argmax(similarities))
+                
+                if 1.0 - float(similarities[best]) <= self.semantic_tolerance:
+                    result = await self.get_cached_search(candidate_keys[best])
+                    if result is not None:
+                        self.metrics.increment_counter("cache_hits", tags={"type": "semantic"})
+                        return result
+            
+            self.metrics.increment_counter("cache_misses", tags={"type": "semantic"})
+            return None
+            
+        except Exception as e:
+            self.metrics.increment_counter("cache_errors", tags={"type": "semantic"})
+            print(f"Semantic cache get error: {e}")
+            return None
+    
+    async def cache_semantic_search(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        score_threshold: Optional[float],
+        generation: str,
+        cache_key: str,
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True
+    ) -> bool:
+        """
+        Register a cached search result in its semantic bucket.
+        
+        Args:
+            collection_name: Collection name
+            query_vector: Query vector
+            limit: Result limit
+            filters: Search filters
+            score_threshold: Score threshold
+            generation: Generation token from get_search_generation
+            cache_key: Exact cache key the result was stored under
+            with_vectors: Whether results include stored vectors
+            with_payload: Payload projection of the results
+            
+        Returns:
+            True if registered successfully
+        """
+        if not self.semantic_enabled or not self.cache_enabled or not self.redis_client:
+            return False
+        
+        try:
+            vector = self._normalize_vector(query_vector)
+            if vector is None:
+                return False
+            
+            bucket_key = self._semantic_bucket_key(
+                collection_name, vector, limit, filters, score_threshold, generation,
+                with_vectors, with_payload
+            )
+            entry = json.dumps({
+                "key": cache_key,
+                "vector": base64.b64encode(vector.tobytes()).decode("ascii")
+            })
+            
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.lpush(bucket_key, entry)
+                pipe.ltrim(bucket_key, 0, self.semantic_bucket_size - 1)
+                pipe.expire(bucket_key, self.search_cache_ttl)
+                await pipe.execute()
+            
+            self.metrics.increment_counter("cache_writes", tags={"type": "semantic"})
+            return True
+            
+        except Exception as e:
+            self.metrics.increment_counter("cache_errors", tags={"type": "semantic"})
+            print(f"Semantic cache set error: {e}")
+            return False
+    
+    async def acquire_search_lock(self, cache_key: str) -> Optional[str]:
+        """
+        Try to take the cross-worker lock for computing a search result.
+        
+        Args:
+            cache_key: Search cache key
+            
+        Returns:
+            Lock token, or None if another worker holds the lock
+        """
+        if not self.search_lock_enabled or not self.cache_enabled or not self.redis_client:
+            return ""
+        
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.redis_client.set(
+                f"{self.lock_prefix}{cache_key}",
+                token,
+                nx=True,
+                px=int(self.search_lock_ttl * 1000)
+            )
+            return token if acquired else None
+            
+        except Exception as e:
+            self.metrics.increment_counter("cache_errors", tags={"type": "lock"})
+            print(f"Search lock error: {e}")
+            return ""
+    
+    async def release_search_lock(self, cache_key: str, token: str) -> bool:
+        """
+        Release a search lock taken with acquire_search_lock.
+        
+        Args:
+            cache_key: Search cache key
+            token: Token returned by acquire_search_lock
+            
+        Returns:
+            True if the lock was released
+        """
+        if not token or not self.redis_client:
+            return False
+        
+        try:
+            # Only delete the lock if it is still ours
+            released = await self.redis_client.eval(
+                "if redis.call('get', KEYS[1]) == ARGV[1] then "
+                "return redis.call('del', KEYS[1]) else return 0 end",
+                1,
+                f"{self.lock_prefix}{cache_key}",
+                token
+            )
+            return bool(released)
+            
+        except Exception as e:
+            self.metrics.increment_counter("cache_errors", tags={"type": "lock"})
+            print(f"Search lock release error: {e}")
+            return False
+    
+    async def wait_for_cached_search(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Wait for another worker to publish a search result.
+        
+        Polls the cache until the result appears, the lock is released or
+        the lock TTL has elapsed.
+        
+        Args:
+            cache_key: Search cache key
+            
+        Returns:
+            Cached search results or None if they did not appear in time
+        """
+        if not self.cache_enabled or not self.redis_client:
+            return None
+        
+        lock_key = f"{self.lock_prefix}{cache_key}"
+        deadline = time.monotonic() + self.search_lock_ttl
+        
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.search_lock_poll_interval)
+            
+            result = await self.get_cached_search(cache_key)
+            if result is not None:
+                self.metrics.increment_counter("cache_lock_waits", tags={"type": "search", "status": "hit"})
+                return result
+            
+            try:
+                if not await self.redis_client.exists(lock_key):
+                    break
+            except Exception:
+                break
+        
+        self.metrics.increment_counter("cache_lock_waits", tags={"type": "search", "status": "miss"})
+        return None
+    
     async def get_cached_metadata(
         self,
         collection_name: str,
@@ -221,7 +546,7 @@ class CacheManager:
             return None
         
         try:
-            cache_key = f"{self.metadata_prefix}{collection_name}:{vector_id}"
+            cache_key = await self._metadata_cache_key(collection_name, vector_id)
             cached_data = await self.redis_client.get(cache_key)
             
             if cached_data:
@@ -256,7 +581,7 @@ class CacheManager:
             return False
         
         try:
-            cache_key = f"{self.metadata_prefix}{collection_name}:{vector_id}"
+            cache_key = await self._metadata_cache_key(collection_name, vector_id)
             cached_data = json.dumps(metadata)
             
             await self.redis_client.setex(
@@ -342,6 +667,10 @@ class CacheManager:
         """
         Invalidate all cache entries for a collection.
         
+        Bumps the collection generation, which orphans its search and
+        metadata entries (they expire through their TTL), and drops the
+        cached collection info.
+        
         Args:
             collection_name: Collection name
             
@@ -351,21 +680,15 @@ class CacheManager:
         if not self.cache_enabled or not self.redis_client:
             return False
         
+        self._local_generations.pop(collection_name, None)
+        
         try:
-            # Find all keys for this collection
-            patterns = [
-                f"{self.search_prefix}*{collection_name}*",
-                f"{self.metadata_prefix}{collection_name}:*",
-                f"{self.collection_prefix}*{collection_name}*"
-            ]
-            
-            deleted_count = 0
-            for pattern in patterns:
-                keys = await self.redis_client.keys(pattern)
-                if keys:
-                    deleted_count += await self.redis_client.delete(*keys)
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.incr(self._generation_key(collection_name))
+                pipe.delete(f"{self.collection_prefix}info:{collection_name}")
+                await pipe.execute()
             
-            self.metrics.increment_counter("cache_invalidations", deleted_count)
+            self.metrics.increment_counter("cache_invalidations", tags={"type": "collection"})
             return True
             
         except Exception as e:
@@ -389,17 +712,18 @@ class CacheManager:
         if not self.cache_enabled or not self.redis_client:
             return False
         
+        if collection_name:
+            self._local_generations.pop(collection_name, None)
+        else:
+            self._local_generations.clear()
+        
         try:
             if collection_name:
-                pattern = f"{self.search_prefix}*{collection_name}*"
+                await self.redis_client.incr(self._generation_key(collection_name))
             else:
-                pattern = f"{self.search_prefix}*"
-            
-            keys = await self.redis_client.keys(pattern)
-            if keys:
-                deleted_count = await self.redis_client.delete(*keys)
-                self.metrics.increment_counter("cache_invalidations", deleted_count)
+                await self.redis_client.incr(self.global_generation_key)
             
+            self.metrics.increment_counter("cache_invalidations", tags={"type": "search"})
             return True
             
         except Exception as e:
@@ -428,6 +752,8 @@ class CacheManager:
         error_count = 0
         
         try:
+            generation = await self.get_search_generation(collection_name)
+            
             for query in popular_queries:
                 try:
                     # Generate cache key
@@ -436,7 +762,10 @@ class CacheManager:
                         query_vector=query["vector"],
                         limit=query.get("limit", 10),
                         filters=query.get("filters"),
-                        score_threshold=query.get("score_threshold")
+                        score_threshold=query.get("score_threshold"),
+                        generation=generation,
+                        with_vectors=query.get("with_vectors", False),
+                        with_payload=query.get("with_payload", True)
                     )
                     
                     # Check if already cached
@@ -502,6 +831,7 @@ class CacheManager:
                     "collection": collection_keys,
                     "total": search_keys + metadata_keys + collection_keys
                 },
+                "l1": self.l1_cache.get_stats() if self.l1_enabled else {"enabled": False},
                 "configuration": {
                     "default_ttl": self.default_ttl,
                     "search_ttl": self.search_cache_ttl,
@@ -531,11 +861,17 @@ class CacheManager:
             else:
                 keys = await self.redis_client.keys(f"{self.key_prefix}*")
             
+            # Resetting a generation counter would make older entries reachable again
+            keys = [key for key in keys if not self._is_generation_key(key)]
+            
             if keys:
                 cleared_count = await self.redis_client.delete(*keys)
             else:
                 cleared_count = 0
             
+            self.l1_cache.clear()
+            self._local_generations.clear()
+            
             self.metrics.increment_counter("cache_clears", cleared_count)
             
             return {
@@ -547,11 +883,82 @@ class CacheManager:
             self.metrics.increment_counter("cache_errors", tags={"type": "clear"})
             raise VectorOperationError(f"Cache clear failed: {str(e)}")
     
+    def _generation_key(self, collection_name: str) -> str:
+        """Get the Redis key holding a collection's cache generation."""
+        return f"{self.generation_prefix}{collection_name}"
+    
+    def _is_generation_key(self, key: Union[str, bytes]) -> bool:
+        """Check whether a Redis key holds a cache generation counter."""
+        if isinstance(key, bytes):
+            key = key.decode("utf-8", "replace")
+        return key == self.global_generation_key or key.startswith(self.generation_prefix)
+    
+    async def _metadata_cache_key(self, collection_name: str, vector_id: str) -> str:
+        """Build a generation-scoped metadata cache key."""
+        generation = await self.get_search_generation(collection_name)
+        return f"{self.metadata_prefix}{collection_name}:{generation}:{vector_id}"
+    
     def _hash_vector(self, vector: List[float]) -> str:
         """Generate hash for vector data."""
-        # Convert to string and hash
-        vector_str = ",".join(f"{v:.6f}" for v in vector)
-        return hashlib.md5(vector_str.encode()).hexdigest()[:16]
+        # Hash the float32 buffer directly instead of formatting each component
+        vector_bytes = np.asarray(vector, dtype=np.float32).tobytes()
+        return hashlib.blake2b(vector_bytes, digest_size=8).hexdigest()
+    
+    def _search_params_hash(
+        self,
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        score_threshold: Optional[float],
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True,
+        vector_hash: Optional[str] = None
+    ) -> str:
+        """Hash the search parameters that must match for a cache hit."""
+        key_data = {
+            "vector_hash": vector_hash,
+            "limit": limit,
+            "filters": filters,
+            "score_threshold": score_threshold,
+            "with_vectors": with_vectors,
+            "with_payload": with_payload
+        }
+        key_string = json.dumps(key_data, sort_keys=True)
+        return hashlib.md5(key_string.encode()).hexdigest()
+    
+    def _normalize_vector(self, vector: List[float]) -> Optional[np.ndarray]:
+        """Convert a vector to a unit-length float32 array, or None if it is zero."""
+        array = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(array))
+        if norm == 0.0 or not np.isfinite(norm):
+            return None
+        return array / norm
+    
+    def _semantic_bucket_key(
+        self,
+        collection_name: str,
+        vector: np.ndarray,
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        score_threshold: Optional[float],
+        generation: str,
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True
+    ) -> str:
+        """Build the LSH bucket key for a normalized query vector."""
+        dimension = vector.shape[0]
+        planes = self._semantic_planes.get(dimension)
+        if planes is None:
+            # Seeded so that every worker derives the same hyperplanes
+            rng = np.random.default_rng(self.semantic_seed)
+            planes = rng.standard_normal((self.semantic_hash_bits, dimension)).astype(np.float32)
+            self._semantic_planes[dimension] = planes
+        
+        bucket = np.packbits(planes @ vector > 0).tobytes().hex()
+        params_hash = self._search_params_hash(
+            limit, filters, score_threshold, with_vectors, with_payload
+        )
+        
+        return f"{self.semantic_prefix}{collection_name}:{generation}:{params_hash}:{bucket}"
     
     async def _setup_cache_monitoring(self):
         """Setup cache monitoring and cleanup tasks."""
@@ -585,6 +992,12 @@ class CacheManager:
                     await self._evict_old_entries()
                 
                 self.metrics.record_gauge("cache_size", total_keys)
+                
+                if self.l1_enabled:
+                    l1_stats = self.l1_cache.get_stats()
+                    self.metrics.record_gauge("cache_tier_entries", l1_stats["entries"], tags={"tier": "l1"})
+                    self.metrics.record_gauge("cache_tier_bytes", l1_stats["bytes"], tags={"tier": "l1"})
+                    self.metrics.record_gauge("cache_hit_ratio", l1_stats["hit_ratio"], tags={"cache_type": "search_l1"})
                 await asyncio.sleep(300)  # Check every 5 minutes
                 
             except Exception as e:
@@ -594,8 +1007,11 @@ class CacheManager:
     async def _evict_old_entries(self):
         """Evict old cache entries when approaching size limit."""
         try:
-            # Get all keys with TTL info
-            keys = await self.redis_client.keys(f"{self.key_prefix}*")
+            # Get all keys with TTL info; generation counters never expire and are kept
+            keys = [
+                key for key in await self.redis_client.keys(f"{self.key_prefix}*")
+                if not self._is_generation_key(key)
+            ]
             
             # Sort by TTL (evict keys expiring soonest)
             key_ttls = []
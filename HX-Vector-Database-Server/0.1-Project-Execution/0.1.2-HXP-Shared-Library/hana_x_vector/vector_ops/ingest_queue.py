@@ -0,0 +1,350 @@
+"""
+Ingest Queue
+============
+
+Durable queue for asynchronous batch jobs.
+Jobs are appended to a local write-ahead log before they are acknowledged,
+drained by a bounded set of worker tasks and replayed after a restart.
+"""
+
+from typing import Dict, Any, List, Optional, Callable, Awaitable
+import asyncio
+import json
+import os
+import time
+import uuid
+from collections import OrderedDict
+from ..monitoring.metrics import MetricsCollector
+from ..utils.exceptions import RateLimitError
+
+
+class IngestJob:
+    """State of one queued batch job."""
+    
+    def __init__(self, job_id: str, operations: List[Dict[str, Any]], created_at: float):
+        self.job_id = job_id
+        self.operations = operations
+        self.total_operations = len(operations)
+        self.created_at = created_at
+        self.status = "queued"
+        self.processed_count = 0
+        self.error_count = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.error: Optional[str] = None
+        
+        # Collections written by the job, and earlier jobs it must wait for
+        self.collections = {operation.get("collection") for operation in operations}
+        self.predecessors: List["IngestJob"] = []
+        self.finished = asyncio.Event()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Status and progress of the job."""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "total_operations": self.total_operations,
+            "processed_operations": self.processed_count,
+            "error_count": self.error_count,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error
+        }
+
+
+class IngestQueue:
+    """
+    Write-ahead batch job queue.
+    
+    Each job is written to an append-only JSON lines log and fsynced before
+    submit() returns its id. Workers apply jobs in chunks and log progress
+    after each chunk, so a restarted queue resumes unfinished jobs from the
+    last logged chunk. Upserts and deletes are keyed by point id, so a chunk
+    that is replayed after a crash applies idempotently.
+    
+    Jobs run concurrently across workers, but a job starts only after every
+    earlier job writing to one of its collections has finished, so a delete
+    never overtakes an earlier insert into the same collection.
+    """
+    
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        processor: Callable[[List[Dict[str, Any]]], Awaitable[Dict[str, Any]]]
+    ):
+        ingest_config = config.get("ingest", {})
+        self.log_dir = ingest_config.get("log_dir", "/var/lib/qdrant/ingest")
+        self.workers = ingest_config.get("workers", 2)
+        self.chunk_size = ingest_config.get("chunk_size", 1000)
+        self.max_pending_jobs = ingest_config.get("max_pending_jobs", 100)
+        self.max_finished_jobs = ingest_config.get("max_finished_jobs", 1000)
+        self.fsync = ingest_config.get("fsync", True)
+        self.compact_bytes = ingest_config.get("compact_bytes", 64 * 1024 * 1024)
+        
+        self.processor = processor
+        self.metrics = MetricsCollector()
+        self.log_path = os.path.join(self.log_dir, "ingest.log")
+        
+        self.jobs: Dict[str, IngestJob] = {}
+        self.finished_jobs: "OrderedDict[str, IngestJob]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._log_lock: Optional[asyncio.Lock] = None
+        self._log_file = None
+        self._last_jobs: Dict[Any, IngestJob] = {}
+        self._reserved_slots = 0
+        self._compacted_size = 0
+    
+    async def startup(self):
+        """Replay the log, requeue unfinished jobs and start the workers."""
+        self._queue = asyncio.Queue()
+        self._log_lock = asyncio.Lock()
+        
+        os.makedirs(self.log_dir, exist_ok=True)
+        self.jobs = await asyncio.to_thread(self._replay_log)
+        await asyncio.to_thread(self._rewrite_log, self._snapshot_records())
+        self._log_file = open(self.log_path, "a", encoding="utf-8")
+        
+        for job in sorted(self.jobs.values(), key=lambda job: job.created_at):
+            self._enqueue(job)
+        if self.jobs:
+            self.metrics.increment_counter("ingest_jobs_recovered", len(self.jobs))
+        
+        self._worker_tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+        self._record_depth()
+    
+    async def shutdown(self):
+        """Stop the workers; unfinished jobs stay in the log."""
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+    
+    async def submit(self, operations: List[Dict[str, Any]]) -> str:
+        """
+        Durably enqueue a batch job.
+        
+        Args:
+            operations: Batch operations for BatchProcessor.process_batch
+        
+        Returns:
+            Job id
+        
+        Raises:
+            RateLimitError: If the pending job limit is reached
+        """
+        if len(self.jobs) + self._reserved_slots >= self.max_pending_jobs:
+            self.metrics.increment_counter("ingest_jobs_rejected")
+            raise RateLimitError(
+                f"Ingest queue is full ({self.max_pending_jobs} pending jobs)",
+                limit=self.max_pending_jobs
+            )
+        
+        # Hold the slot while the job is logged, so concurrent submits cannot overshoot
+        self._reserved_slots += 1
+        try:
+            job = IngestJob(uuid.uuid4().hex, operations, time.time())
+            await self._append({
+                "type": "job",
+                "job_id": job.job_id,
+                "created_at": job.created_at,
+                "operations": operations
+            })
+        finally:
+            self._reserved_slots -= 1
+        
+        self.jobs[job.job_id] = job
+        self._enqueue(job)
+        self.metrics.increment_counter("ingest_jobs_submitted")
+        self._record_depth()
+        return job.job_id
+    
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get status and progress of a job."""
+        job = self.jobs.get(job_id) or self.finished_jobs.get(job_id)
+        return job.to_dict() if job is not None else None
+    
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """Get status of pending and recently finished jobs."""
+        return [job.to_dict() for job in (*self.jobs.values(), *self.finished_jobs.values())]
+    
+    async def _worker(self):
+        """Apply queued jobs one at a time."""
+        while True:
+            job_id = await self._queue.get()
+            try:
+                job = self.jobs.get(job_id)
+                if job is not None:
+                    await self._run_job(job)
+            finally:
+                self._queue.task_done()
+    
+    def _enqueue(self, job: IngestJob):
+        """Queue a job behind earlier unfinished jobs on the same collections."""
+        job.predecessors = [
+            self._last_jobs[name] for name in job.collections if name in self._last_jobs
+        ]
+        for name in job.collections:
+            self._last_jobs[name] = job
+        self._queue.put_nowait(job.job_id)
+    
+    async def _run_job(self, job: IngestJob):
+        """Apply a job chunk by chunk, logging progress after each chunk."""
+        for predecessor in job.predecessors:
+            await predecessor.finished.wait()
+        job.predecessors = []
+        
+        job.status = "running"
+        job.started_at = time.time()
+        
+        try:
+            while job.processed_count < len(job.operations):
+                chunk = job.operations[job.processed_count:job.processed_count + self.chunk_size]
+                result = await self.processor(chunk)
+                
+                job.processed_count += len(chunk)
+                job.error_count += result.get("total_errors", 0)
+                await self._append({
+                    "type": "progress",
+                    "job_id": job.job_id,
+                    "processed": job.processed_count,
+                    "errors": job.error_count
+                })
+                await self._maybe_compact()
+            
+            job.status = "completed"
+            self.metrics.increment_counter("ingest_jobs_completed")
+        
+        except asyncio.CancelledError:
+            # Shutdown: the job resumes from its last logged chunk on restart
+            job.status = "queued"
+            raise
+        
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            self.metrics.increment_counter("ingest_jobs_failed")
+        
+        job.finished_at = time.time()
+        await self._append({
+            "type": "done",
+            "job_id": job.job_id,
+            "status": job.status,
+            "error": job.error
+        })
+        self._finish(job)
+        self.metrics.record_histogram("ingest_job_duration", job.finished_at - job.started_at)
+        await self._maybe_compact()
+    
+    def _finish(self, job: IngestJob):
+        """Move a job from the pending set to the bounded finished history."""
+        self.jobs.pop(job.job_id, None)
+        job.operations = []
+        job.finished.set()
+        for name in job.collections:
+            if self._last_jobs.get(name) is job:
+                del self._last_jobs[name]
+        self.finished_jobs[job.job_id] = job
+        while len(self.finished_jobs) > self.max_finished_jobs:
+            self.finished_jobs.popitem(last=False)
+        self._record_depth()
+    
+    async def _append(self, record: Dict[str, Any]):
+        """Append a record to the log and flush it to disk."""
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        async with self._log_lock:
+            await asyncio.to_thread(self._write_line, line)
+    
+    async def _maybe_compact(self):
+        """
+        Compact the log once it passes compact_bytes.
+        
+        Only unfinished jobs are kept, so the log stays bounded under steady
+        load. The threshold grows to twice the compacted size, so a backlog
+        larger than compact_bytes is not rewritten on every append.
+        """
+        threshold = max(self.compact_bytes, 2 * self._compacted_size)
+        if os.path.getsize(self.log_path) <= threshold:
+            return
+        
+        async with self._log_lock:
+            # Records are taken on the loop; appends wait for the lock
+            await asyncio.to_thread(self._rewrite_log, self._snapshot_records())
+        self.metrics.increment_counter("ingest_log_compactions")
+    
+    def _write_line(self, line: str):
+        """Write and sync one log line."""
+        self._log_file.write(line)
+        self._log_file.flush()
+        if self.fsync:
+            os.fsync(self._log_file.fileno())
+    
+    def _replay_log(self) -> Dict[str, IngestJob]:
+        """Rebuild unfinished jobs from the log."""
+        jobs: Dict[str, IngestJob] = {}
+        if not os.path.exists(self.log_path):
+            return jobs
+        
+        with open(self.log_path, "r", encoding="utf-8") as log:
+            for line in log:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Torn write at the tail of the log
+                    continue
+                
+                job_id = record.get("job_id")
+                if record.get("type") == "job":
+                    jobs[job_id] = IngestJob(job_id, record["operations"], record["created_at"])
+                elif job_id in jobs and record.get("type") == "progress":
+                    jobs[job_id].processed_count = record["processed"]
+                    jobs[job_id].error_count = record["errors"]
+                elif record.get("type") == "done":
+                    jobs.pop(job_id, None)
+        
+        return jobs
+    
+    def _snapshot_records(self) -> List[Dict[str, Any]]:
+        """Log records of the unfinished jobs and their progress."""
+        records = []
+        for job in self.jobs.values():
+            records.append({
+                "type": "job",
+                "job_id": job.job_id,
+                "created_at": job.created_at,
+                "operations": job.operations
+            })
+            if job.processed_count:
+                records.append({
+                    "type": "progress",
+                    "job_id": job.job_id,
+                    "processed": job.processed_count,
+                    "errors": job.error_count
+                })
+        return records
+    
+    def _rewrite_log(self, records: List[Dict[str, Any]]):
+        """Replace the log with the given records."""
+        temp_path = self.log_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as log:
+            for record in records:
+                log.write(json.dumps(record, separators=(",", ":")) + "\n")
+            log.flush()
+            os.fsync(log.fileno())
+        
+        os.replace(temp_path, self.log_path)
+        self._compacted_size = os.path.getsize(self.log_path)
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = open(self.log_path, "a", encoding="utf-8")
+    
+    def _record_depth(self):
+        """Publish the number of pending jobs."""
+        self.metrics.record_gauge("ingest_pending_jobs", len(self.jobs))
@@ -0,0 +1,119 @@
+"""
+Keyword Index
+=============
+
+In-memory BM25 inverted index used for the keyword side of hybrid search.
+Indexes one text payload field per collection and returns ranked hits.
+"""
+
+from typing import Dict, List, Tuple, Iterable
+from collections import Counter
+import re
+import math
+import heapq
+
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class KeywordIndex:
+    """
+    BM25 inverted index over document text.
+    Supports incremental adds and removals keyed by point id.
+    """
+    
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        
+        # term -> {doc_id: term frequency}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self.doc_terms: Dict[str, Tuple[str, ...]] = {}
+        self.total_length = 0
+    
+    def add(self, doc_id: str, text: str):
+        """
+        Index a document, replacing any previous version.
+        
+        Args:
+            doc_id: Point id
+            text: Document text
+        """
+        if doc_id in self.doc_lengths:
+            self.remove(doc_id)
+        
+        tokens = tokenize(text)
+        frequencies = Counter(tokens)
+        for term, frequency in frequencies.items():
+            self.postings.setdefault(term, {})[doc_id] = frequency
+        
+        self.doc_terms[doc_id] = tuple(frequencies)
+        self.doc_lengths[doc_id] = len(tokens)
+        self.total_length += len(tokens)
+    
+    def add_many(self, documents: Iterable[Tuple[str, str]]):
+        """Index (doc_id, text) pairs."""
+        for doc_id, text in documents:
+            self.add(doc_id, text)
+    
+    def remove(self, doc_id: str):
+        """
+        Remove a document from the index.
+        
+        Args:
+            doc_id: Point id
+        """
+        length = self.doc_lengths.pop(doc_id, None)
+        if length is None:
+            return
+        
+        self.total_length -= length
+        for term in self.doc_terms.pop(doc_id, ()):
+            docs = self.postings.get(term)
+            if docs is None:
+                continue
+            docs.pop(doc_id, None)
+            if not docs:
+                del self.postings[term]
+    
+    def search(self, query: str, limit: int) -> List[Tuple[str, float]]:
+        """
+        Rank documents against a query with BM25.
+        
+        Args:
+            query: Query text
+            limit: Maximum number of hits
+        
+        Returns:
+            (doc_id, score) pairs ordered by descending score
+        """
+        doc_count = len(self.doc_lengths)
+        if not doc_count:
+            return []
+        
+        average_length = self.total_length / doc_count or 1.0
+        scores: Dict[str, float] = {}
+        
+        for term in set(tokenize(query)):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            
+            idf = math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for doc_id, frequency in docs.items():
+                length_norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + length_norm)
+        
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+    
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+    
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.doc_lengths
@@ -14,10 +14,15 @@ from ..qdrant.client import QdrantClient
 from ..external_models.integration_patterns import IntegrationPatternManager
 from ..monitoring.metrics import MetricsCollector
 from ..utils.exceptions import VectorOperationError
-from ..utils.validators import validate_vector_data, validate_collection_name
+from ..utils.validators import validate_collection_name
+from ..utils.vector_batch import VectorBatch
+from ..utils.retry import RetryBudget
 from .search import SearchEngine
 from .batch import BatchProcessor
 from .cache import CacheManager
+from .transfer import CollectionExporter, CollectionImporter, read_manifest
+from .bulk_loader import BulkLoader, VectorFile
+from .write_buffer import WriteBehindBuffer
 
 
 class VectorOperationsManager:
@@ -33,12 +38,21 @@ class VectorOperationsManager:
         self.batch_processor = BatchProcessor(config)
         self.cache_manager = CacheManager(config)
         self.integration_patterns = IntegrationPatternManager(config)
+        self.exporter = CollectionExporter(config, self.qdrant_client)
+        self.importer = CollectionImporter(config, self.batch_processor)
+        self.bulk_loader = BulkLoader(config, self.batch_processor)
+        self.write_buffer = WriteBehindBuffer(config, self._write_vectors)
+        self.collection_registry = self.qdrant_client.collection_registry
         self.metrics = MetricsCollector()
         
+        # In-flight searches keyed by search cache key (single-flight)
+        self._inflight_searches: Dict[str, asyncio.Future] = {}
+        
         # Performance settings
         self.default_batch_size = config.get("vector_ops", {}).get("batch_size", 1000)
         self.max_retries = config.get("vector_ops", {}).get("max_retries", 3)
         self.retry_delay = config.get("vector_ops", {}).get("retry_delay", 1.0)
+        self.retry_budget_ratio = config.get("vector_ops", {}).get("retry_budget_ratio", 0.1)
         
         # Collection configurations for different AI models
         self.model_collections = {
@@ -63,9 +77,17 @@ class VectorOperationsManager:
         
         # Initialize default collections
         await self._initialize_collections()
+        
+        # Warm the collection registry so first writes skip the metadata lookup
+        if self.collection_registry.prefetch_on_startup:
+            try:
+                await self.collection_registry.prefetch()
+            except Exception as e:
+                print(f"Warning: Failed to prefetch collection metadata: {e}")
     
     async def shutdown(self):
         """Cleanup vector operations manager."""
+        await self.write_buffer.shutdown()
         await self.qdrant_client.shutdown()
         await self.search_engine.shutdown()
         await self.batch_processor.shutdown()
@@ -75,57 +97,106 @@ class VectorOperationsManager:
     async def insert_vectors(
         self,
         collection_name: str,
-        vectors: List[Dict[str, Any]],
+        vectors: Union[List[Dict[str, Any]], VectorBatch],
         batch_size: int = None
     ) -> Dict[str, Any]:
         """
         Insert vectors into a collection with batch processing.
         
+        With write-behind enabled, small inserts without an explicit
+        batch_size are coalesced with concurrent inserts into one
+        micro-batch; the call still returns only after the upsert.
+        
         Args:
             collection_name: Name of the collection
-            vectors: List of vector data with metadata
+            vectors: Vector batch, or list of vector data with metadata
             batch_size: Batch size for insertion
             
         Returns:
-            Dict with insertion results and metrics
+            Dict with insertion results, metrics and any failed points
         """
         start_time = time.time()
         
         try:
             # Validate inputs
             validate_collection_name(collection_name)
-            validate_vector_data(vectors)
-            
-            # Use default batch size if not specified
-            if batch_size is None:
-                batch_size = self.default_batch_size
+            batch = VectorBatch.coerce(vectors).validate()
             
-            # Ensure collection exists
-            await self._ensure_collection_exists(collection_name)
+            # Ensure collection exists and matches the vector dimension
+            await self._ensure_collection_exists(collection_name, batch.dimension)
             
-            # Process insertion with retries
-            result = await self._insert_with_retries(
-                collection_name, vectors, batch_size
-            )
+            if (
+                self.write_buffer.enabled
+                and batch_size is None
+                and len(batch) < self.write_buffer.max_batch_points
+            ):
+                result = await self.write_buffer.submit(collection_name, batch)
+            else:
+                result = await self._write_vectors(collection_name, batch, batch_size)
             
             # Update metrics
             duration = time.time() - start_time
             self.metrics.record_histogram("vector_insert_duration", duration)
-            self.metrics.increment_counter("vectors_inserted_total", len(vectors))
-            
-            # Invalidate cache for this collection
-            await self.cache_manager.invalidate_collection_cache(collection_name)
+            self.metrics.increment_counter("vectors_inserted_total", result["inserted_count"])
             
             return {
                 "inserted_count": result["inserted_count"],
+                "error_count": len(result["failed_points"]),
                 "duration": duration,
                 "batch_count": result["batch_count"],
-                "collection": collection_name
+                "collection": collection_name,
+                "failed_points": result["failed_points"]
             }
             
         except Exception as e:
             self.metrics.increment_counter("vector_insert_errors")
-            raise VectorOperationError(f"Vector insertion failed: {str(e)}")
+            raise VectorOperationError(f"Vector insertion failed: {str(e)}", "insert")
+    
+    async def submit_vectors(
+        self,
+        collection_name: str,
+        vectors: Union[List[Dict[str, Any]], VectorBatch]
+    ) -> asyncio.Future:
+        """
+        Queue vectors for the collection's next write-behind micro-batch.
+        
+        Args:
+            collection_name: Name of the collection
+            vectors: Vector batch, or list of vector data with metadata
+            
+        Returns:
+            Future resolving to the insertion results once the micro-batch
+            holding these vectors has been upserted
+        """
+        validate_collection_name(collection_name)
+        batch = VectorBatch.coerce(vectors).validate()
+        await self._ensure_collection_exists(collection_name, batch.dimension)
+        return self.write_buffer.submit(collection_name, batch)
+    
+    async def _write_vectors(
+        self,
+        collection_name: str,
+        batch: VectorBatch,
+        batch_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Upsert a validated batch, then invalidate the cache and index the documents once."""
+        # Use default batch size if not specified and not tuned adaptively
+        if batch_size is None and not self.batch_processor.batch_controller.enabled:
+            batch_size = self.default_batch_size
+        
+        # Process insertion with retries
+        result = await self._insert_with_retries(collection_name, batch, batch_size)
+        self.collection_registry.record_points(collection_name, result["inserted_count"])
+        
+        # Invalidate cache for this collection
+        await self.cache_manager.invalidate_collection_cache(collection_name)
+        failed_ids = {point["id"] for point in result["failed_points"]}
+        self.search_engine.index_documents(collection_name, [
+            record for record in batch.to_records(include_vectors=False)
+            if record["id"] not in failed_ids
+        ])
+        
+        return result
     
     async def similarity_search(
         self,
@@ -133,7 +204,9 @@ class VectorOperationsManager:
         query_vector: List[float],
         limit: int = 10,
         filters: Optional[Dict[str, Any]] = None,
-        score_threshold: Optional[float] = None
+        score_threshold: Optional[float] = None,
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True
     ) -> Dict[str, Any]:
         """
         Perform similarity search in a collection.
@@ -144,6 +217,8 @@ class VectorOperationsManager:
             limit: Maximum number of results
             filters: Metadata filters
             score_threshold: Minimum similarity score
+            with_vectors: Include stored vectors in the results
+            with_payload: Include payloads, or only the listed payload fields
             
         Returns:
             Dict with search results and metrics
@@ -154,11 +229,13 @@ class VectorOperationsManager:
             # Validate inputs
             validate_collection_name(collection_name)
             if not query_vector:
-                raise VectorOperationError("Query vector cannot be empty")
+                raise VectorOperationError("Query vector cannot be empty", "search")
             
             # Check cache first
+            generation = await self.cache_manager.get_search_generation(collection_name)
             cache_key = self.cache_manager.generate_search_cache_key(
-                collection_name, query_vector, limit, filters, score_threshold
+                collection_name, query_vector, limit, filters, score_threshold,
+                generation=generation, with_vectors=with_vectors, with_payload=with_payload
             )
             cached_result = await self.cache_manager.get_cached_search(cache_key)
             
@@ -166,13 +243,156 @@ class VectorOperationsManager:
                 self.metrics.increment_counter("search_cache_hits")
                 return cached_result
             
+            # Fall back to a nearby cached query when semantic caching is on
+            cached_result = await self.cache_manager.get_semantic_search(
+                collection_name, query_vector, limit, filters, score_threshold,
+                generation=generation, with_vectors=with_vectors, with_payload=with_payload
+            )
+            
+            if cached_result:
+                self.metrics.increment_counter("search_cache_hits", tags={"type": "semantic"})
+                return cached_result
+            
+            # Coalesce concurrent identical searches onto one request
+            inflight = self._inflight_searches.get(cache_key)
+            if inflight is not None:
+                try:
+                    result = await asyncio.shield(inflight)
+                    self.metrics.increment_counter("search_coalesced")
+                    return result
+                except asyncio.CancelledError:
+                    # Only fall through when the leading request was cancelled
+                    if not inflight.cancelled():
+                        raise
+            
+            future = asyncio.get_running_loop().create_future()
+            self._inflight_searches[cache_key] = future
+            
+            try:
+                search_result = await self._search_and_cache(
+                    cache_key, generation, collection_name, query_vector,
+                    limit, filters, score_threshold, with_vectors, with_payload,
+                    start_time
+                )
+                future.set_result(search_result)
+                
+            except BaseException as e:
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    # Mark as retrieved when no request is waiting on it
+                    future.exception()
+                raise
+                
+            finally:
+                if self._inflight_searches.get(cache_key) is future:
+                    del self._inflight_searches[cache_key]
+            
+            return search_result
+            
+        except Exception as e:
+            self.metrics.increment_counter("vector_search_errors")
+            raise VectorOperationError(f"Vector search failed: {str(e)}", "search")
+    
+    async def multi_vector_search(
+        self,
+        collection_name: str,
+        query_vectors: List[List[float]],
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        score_threshold: Optional[float] = None,
+        aggregation_method: str = "average",
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True
+    ) -> Dict[str, Any]:
+        """
+        Search with several query vectors and aggregate the results.
+        
+        All query vectors are sent to Qdrant in a single batch request.
+        
+        Args:
+            collection_name: Name of the collection
+            query_vectors: Query vectors
+            limit: Maximum number of aggregated results
+            filters: Metadata filters
+            score_threshold: Minimum similarity score
+            aggregation_method: "average", "max" or "weighted"
+            with_vectors: Include stored vectors in the results
+            with_payload: Include payloads, or only the listed payload fields
+            
+        Returns:
+            Dict with aggregated search results and metrics
+        """
+        try:
+            validate_collection_name(collection_name)
+            if not query_vectors or not all(query_vectors):
+                raise VectorOperationError("Query vectors cannot be empty", "multi_search")
+            if len({len(query_vector) for query_vector in query_vectors}) > 1:
+                raise VectorOperationError(
+                    "Query vectors must have the same dimensions", "multi_search", len(query_vectors)
+                )
+            
+            result = await self.search_engine.multi_vector_search(
+                collection_name=collection_name,
+                query_vectors=query_vectors,
+                limit=limit,
+                filters=filters,
+                score_threshold=score_threshold,
+                aggregation_method=aggregation_method,
+                with_vectors=with_vectors,
+                with_payload=with_payload
+            )
+            
+            self.metrics.record_histogram("vector_multi_search_duration", result["duration"])
+            self.metrics.increment_counter("vector_searches_total", len(query_vectors))
+            
+            return {
+                "results": result["results"],
+                "duration": result["duration"],
+                "collection": collection_name,
+                "count": len(result["results"]),
+                "query_count": result["query_count"],
+                "aggregation_method": aggregation_method
+            }
+            
+        except Exception as e:
+            self.metrics.increment_counter("vector_search_errors")
+            raise VectorOperationError(f"Multi-vector search failed: {str(e)}", "multi_search")
+    
+    async def _search_and_cache(
+        self,
+        cache_key: str,
+        generation: str,
+        collection_name: str,
+        query_vector: List[float],
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        score_threshold: Optional[float],
+        with_vectors: bool,
+        with_payload: Union[bool, List[str]],
+        start_time: float
+    ) -> Dict[str, Any]:
+        """Run a search that missed the cache and publish its result."""
+        lock_token = await self.cache_manager.acquire_search_lock(cache_key)
+        
+        if lock_token is None:
+            # Another worker is computing this result
+            cached_result = await self.cache_manager.wait_for_cached_search(cache_key)
+            if cached_result:
+                self.metrics.increment_counter("search_coalesced", tags={"type": "distributed"})
+                return cached_result
+        
+        try:
             # Perform search using search engine
             result = await self.search_engine.similarity_search(
                 collection_name=collection_name,
                 query_vector=query_vector,
                 limit=limit,
                 filters=filters,
-                score_threshold=score_threshold
+                score_threshold=score_threshold,
+                with_vectors=with_vectors,
+                with_payload=with_payload
             )
             
             # Update metrics
@@ -188,13 +408,17 @@ class VectorOperationsManager:
                 "count": len(result["results"])
             }
             
-            await self.cache_manager.cache_search_result(cache_key, search_result)
+            if await self.cache_manager.cache_search_result(cache_key, search_result):
+                await self.cache_manager.cache_semantic_search(
+                    collection_name, query_vector, limit, filters, score_threshold,
+                    generation, cache_key, with_vectors, with_payload
+                )
             
             return search_result
             
-        except Exception as e:
-            self.metrics.increment_counter("vector_search_errors")
-            raise VectorOperationError(f"Vector search failed: {str(e)}")
+        finally:
+            if lock_token:
+                await self.cache_manager.release_search_lock(cache_key, lock_token)
     
     async def update_vector(
         self,
@@ -221,7 +445,9 @@ class VectorOperationsManager:
             # Validate inputs
             validate_collection_name(collection_name)
             if not vector_id:
-                raise VectorOperationError("Vector ID cannot be empty")
+                raise VectorOperationError("Vector ID cannot be empty", "update")
+            if vector is not None:
+                await self.collection_registry.check_dimension(collection_name, len(vector))
             
             # Perform update
             result = await self.qdrant_client.update_vector(
@@ -238,6 +464,10 @@ class VectorOperationsManager:
             
             # Invalidate cache for this collection
             await self.cache_manager.invalidate_collection_cache(collection_name)
+            if metadata is not None:
+                self.search_engine.index_documents(
+                    collection_name, [{"id": vector_id, "metadata": metadata}]
+                )
             
             return {
                 "updated": result["updated"],
@@ -248,7 +478,7 @@ class VectorOperationsManager:
             
         except Exception as e:
             self.metrics.increment_counter("vector_update_errors")
-            raise VectorOperationError(f"Vector update failed: {str(e)}")
+            raise VectorOperationError(f"Vector update failed: {str(e)}", "update")
     
     async def delete_vector(
         self,
@@ -271,7 +501,7 @@ class VectorOperationsManager:
             # Validate inputs
             validate_collection_name(collection_name)
             if not vector_id:
-                raise VectorOperationError("Vector ID cannot be empty")
+                raise VectorOperationError("Vector ID cannot be empty", "delete")
             
             # Perform deletion
             result = await self.qdrant_client.delete_vector(
@@ -286,6 +516,8 @@ class VectorOperationsManager:
             
             # Invalidate cache for this collection
             await self.cache_manager.invalidate_collection_cache(collection_name)
+            self.search_engine.remove_documents(collection_name, [vector_id])
+            self.collection_registry.record_points(collection_name, -1)
             
             return {
                 "deleted": result["deleted"],
@@ -296,12 +528,14 @@ class VectorOperationsManager:
             
         except Exception as e:
             self.metrics.increment_counter("vector_delete_errors")
-            raise VectorOperationError(f"Vector deletion failed: {str(e)}")
+            raise VectorOperationError(f"Vector deletion failed: {str(e)}", "delete")
     
     async def get_vector(
         self,
         collection_name: str,
-        vector_id: str
+        vector_id: str,
+        with_vectors: bool = True,
+        with_payload: Union[bool, List[str]] = True
     ) -> Dict[str, Any]:
         """
         Get a specific vector by ID.
@@ -309,6 +543,8 @@ class VectorOperationsManager:
         Args:
             collection_name: Name of the collection
             vector_id: ID of the vector to retrieve
+            with_vectors: Include the stored vector
+            with_payload: Include the payload, or only the listed payload fields
             
         Returns:
             Dict with vector data
@@ -317,12 +553,14 @@ class VectorOperationsManager:
             # Validate inputs
             validate_collection_name(collection_name)
             if not vector_id:
-                raise VectorOperationError("Vector ID cannot be empty")
+                raise VectorOperationError("Vector ID cannot be empty", "get")
             
             # Get vector from Qdrant
             result = await self.qdrant_client.get_vector(
                 collection_name=collection_name,
-                vector_id=vector_id
+                vector_id=vector_id,
+                with_vectors=with_vectors,
+                with_payload=with_payload
             )
             
             self.metrics.increment_counter("vector_retrievals_total")
@@ -331,7 +569,7 @@ class VectorOperationsManager:
             
         except Exception as e:
             self.metrics.increment_counter("vector_retrieval_errors")
-            raise VectorOperationError(f"Vector retrieval failed: {str(e)}")
+            raise VectorOperationError(f"Vector retrieval failed: {str(e)}", "get")
     
     async def create_collection(
         self,
@@ -356,7 +594,7 @@ class VectorOperationsManager:
             # Validate inputs
             validate_collection_name(name)
             if vector_size <= 0:
-                raise VectorOperationError("Vector size must be positive")
+                raise VectorOperationError("Vector size must be positive", "create_collection")
             
             # Create collection
             result = await self.qdrant_client.create_collection(
@@ -372,7 +610,7 @@ class VectorOperationsManager:
             
         except Exception as e:
             self.metrics.increment_counter("collection_create_errors")
-            raise VectorOperationError(f"Collection creation failed: {str(e)}")
+            raise VectorOperationError(f"Collection creation failed: {str(e)}", "create_collection")
     
     async def delete_collection(self, name: str) -> Dict[str, Any]:
         """
@@ -393,6 +631,7 @@ class VectorOperationsManager:
             
             # Invalidate all cache for this collection
             await self.cache_manager.invalidate_collection_cache(name)
+            self.search_engine.drop_keyword_index(name)
             
             self.metrics.increment_counter("collections_deleted_total")
             
@@ -400,7 +639,7 @@ class VectorOperationsManager:
             
         except Exception as e:
             self.metrics.increment_counter("collection_delete_errors")
-            raise VectorOperationError(f"Collection deletion failed: {str(e)}")
+            raise VectorOperationError(f"Collection deletion failed: {str(e)}", "delete_collection")
     
     async def list_collections(self) -> Dict[str, Any]:
         """
@@ -414,7 +653,7 @@ class VectorOperationsManager:
             return result
             
         except Exception as e:
-            raise VectorOperationError(f"Collection listing failed: {str(e)}")
+            raise VectorOperationError(f"Collection listing failed: {str(e)}", "list_collections")
     
     async def get_collection_info(self, name: str) -> Dict[str, Any]:
         """
@@ -434,7 +673,7 @@ class VectorOperationsManager:
             return result
             
         except Exception as e:
-            raise VectorOperationError(f"Collection info retrieval failed: {str(e)}")
+            raise VectorOperationError(f"Collection info retrieval failed: {str(e)}", "get_collection_info")
     
     async def batch_insert(
         self,
@@ -450,7 +689,11 @@ class VectorOperationsManager:
             Dict with batch results
         """
         try:
-            result = await self.batch_processor.process_batch(operations)
+            try:
+                result = await self.batch_processor.process_batch(operations)
+            finally:
+                # A failed batch may still have applied some of its operations
+                await self._refresh_after_batch(operations)
             
             self.metrics.increment_counter("batch_operations_total")
             
@@ -458,7 +701,149 @@ class VectorOperationsManager:
             
         except Exception as e:
             self.metrics.increment_counter("batch_operation_errors")
-            raise VectorOperationError(f"Batch operation failed: {str(e)}")
+            raise VectorOperationError(f"Batch operation failed: {str(e)}", "batch")
+    
+    async def _refresh_after_batch(self, operations: List[Dict[str, Any]]):
+        """
+        Invalidate caches and update keyword indexes for a processed batch.
+        
+        Args:
+            operations: Batch operations that were submitted
+        """
+        for collection_name in {op["collection"] for op in operations}:
+            await self.cache_manager.invalidate_collection_cache(collection_name)
+        
+        for op in operations:
+            collection_name = op["collection"]
+            op_type = op.get("type", "insert")
+            if op_type == "insert":
+                self.search_engine.index_documents(collection_name, [op["data"]])
+            elif op_type == "update":
+                if "metadata" in op:
+                    self.search_engine.index_documents(
+                        collection_name, [{"id": op["vector_id"], "metadata": op["metadata"]}]
+                    )
+            elif op_type == "delete":
+                if "filters" in op:
+                    # The deleted IDs are unknown, so rebuild the index on next use
+                    self.search_engine.drop_keyword_index(collection_name)
+                else:
+                    self.search_engine.remove_documents(collection_name, [op["vector_id"]])
+    
+    async def export_collection(
+        self,
+        collection_name: str,
+        directory: str,
+        partitions: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Export a collection to a directory, resuming an unfinished export.
+        
+        Args:
+            collection_name: Name of the collection
+            directory: Export directory
+            partitions: Number of id-range partitions scrolled in parallel
+            
+        Returns:
+            Dict with export results
+        """
+        try:
+            validate_collection_name(collection_name)
+            result = await self.exporter.export_collection(collection_name, directory, partitions)
+            self.metrics.increment_counter("collection_exports_total")
+            return result
+            
+        except VectorOperationError:
+            self.metrics.increment_counter("collection_export_errors")
+            raise
+        except Exception as e:
+            self.metrics.increment_counter("collection_export_errors")
+            raise VectorOperationError(f"Collection export failed: {str(e)}", "export")
+    
+    async def import_collection(
+        self,
+        directory: str,
+        collection_name: Optional[str] = None,
+        parallelism: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Import an exported collection, creating the target if needed.
+        
+        Args:
+            directory: Export directory
+            collection_name: Target collection, defaults to the exported one
+            parallelism: Segments inserted concurrently
+            
+        Returns:
+            Dict with import results
+        """
+        try:
+            manifest = await asyncio.to_thread(read_manifest, directory)
+            collection_name = collection_name or manifest["collection"]
+            validate_collection_name(collection_name)
+            await self._ensure_collection_exists(collection_name, manifest["dimension"])
+            
+            result = await self.importer.import_collection(directory, collection_name, parallelism)
+            
+            await self.cache_manager.invalidate_collection_cache(collection_name)
+            self.search_engine.drop_keyword_index(collection_name)
+            self.metrics.increment_counter("collection_imports_total")
+            return result
+            
+        except VectorOperationError:
+            self.metrics.increment_counter("collection_import_errors")
+            raise
+        except Exception as e:
+            self.metrics.increment_counter("collection_import_errors")
+            raise VectorOperationError(f"Collection import failed: {str(e)}", "import")
+    
+    async def load_vector_file(
+        self,
+        collection_name: str,
+        vector_path: str,
+        payload_path: Optional[str] = None,
+        format: Optional[str] = None,
+        start_id: int = 0,
+        parallelism: Optional[int] = None,
+        distance: str = "Cosine"
+    ) -> Dict[str, Any]:
+        """
+        Bulk load a memory-mapped vector file, creating the collection if needed.
+        
+        Args:
+            collection_name: Name of the collection
+            vector_path: .npy, .fvecs or Arrow IPC vector file
+            payload_path: JSON lines or Parquet payload sidecar
+            format: Vector file format, detected from the extension by default
+            start_id: First id for rows without an id
+            parallelism: Windows inserted concurrently
+            distance: Distance metric if the collection is created
+            
+        Returns:
+            Dict with load results
+        """
+        try:
+            validate_collection_name(collection_name)
+            vector_file = await asyncio.to_thread(
+                VectorFile, vector_path, format, self.bulk_loader.vector_column, self.bulk_loader.id_column
+            )
+            await self._ensure_collection_exists(collection_name, vector_file.dimension, distance)
+            
+            result = await self.bulk_loader.load(
+                collection_name, vector_path, payload_path, format, start_id, parallelism
+            )
+            
+            await self.cache_manager.invalidate_collection_cache(collection_name)
+            self.search_engine.drop_keyword_index(collection_name)
+            self.metrics.increment_counter("bulk_loads_total")
+            return result
+            
+        except VectorOperationError:
+            self.metrics.increment_counter("bulk_load_errors")
+            raise
+        except Exception as e:
+            self.metrics.increment_counter("bulk_load_errors")
+            raise VectorOperationError(f"Bulk load failed: {str(e)}", "bulk_load")
     
     async def _initialize_collections(self):
         """Initialize default collections for AI models."""
@@ -477,49 +862,87 @@ class VectorOperationsManager:
         except Exception as e:
             print(f"Warning: Failed to initialize collections: {e}")
     
-    async def _ensure_collection_exists(self, collection_name: str):
-        """Ensure a collection exists, create if not."""
-        try:
-            await self.get_collection_info(collection_name)
-        except VectorOperationError:
+    async def _ensure_collection_exists(
+        self,
+        collection_name: str,
+        dimension: Optional[int] = None,
+        distance: str = "Cosine"
+    ):
+        """
+        Ensure a collection exists, create if not.
+        
+        Existence and dimension come from the collection registry, so this
+        costs no Qdrant round trip once the collection is cached.
+        """
+        if await self.collection_registry.get(collection_name) is None:
             # Collection doesn't exist, create with default config
-            if collection_name in self.model_collections:
-                config = self.model_collections[collection_name]
+            config = self.model_collections.get(collection_name, {
+                # Use the written vectors' dimension, or the general embeddings config
+                "dimensions": dimension or 1536,
+                "distance": distance
+            })
+            try:
                 await self.create_collection(
                     name=collection_name,
                     vector_size=config["dimensions"],
                     distance=config["distance"]
                 )
-            else:
-                # Use general embeddings config as default
-                await self.create_collection(
-                    name=collection_name,
-                    vector_size=1536,
-                    distance="Cosine"
-                )
+            except VectorOperationError:
+                # Another writer may have created it first
+                self.collection_registry.invalidate(collection_name)
+                await self.collection_registry.require(collection_name)
+        
+        if dimension is not None:
+            await self.collection_registry.check_dimension(collection_name, dimension)
     
     async def _insert_with_retries(
         self,
         collection_name: str,
-        vectors: List[Dict[str, Any]],
-        batch_size: int
+        vectors: VectorBatch,
+        batch_size: Optional[int]
     ) -> Dict[str, Any]:
-        """Insert vectors with retry logic."""
-        for attempt in range(self.max_retries):
-            try:
-                result = await self.batch_processor.insert_batch(
-                    collection_name=collection_name,
-                    vectors=vectors,
-                    batch_size=batch_size
-                )
+        """
+        Insert vectors, resubmitting only points that failed transiently.
+        
+        The client, batch and job layers draw from one retry budget, so a
+        failing point is never retried more than the budget allows.
+        """
+        retry_budget = RetryBudget(
+            min_retries=self.max_retries - 1,
+            ratio=self.retry_budget_ratio,
+            retry_delay=self.retry_delay
+        )
+        result = await self.batch_processor.insert_batch(
+            collection_name=collection_name,
+            vectors=vectors,
+            batch_size=batch_size,
+            retry_budget=retry_budget
+        )
+        
+        rows = None
+        attempt = 0
+        while True:
+            retryable_ids = [point["id"] for point in result["failed_points"] if point["retryable"]]
+            if not retryable_ids or not await retry_budget.acquire(attempt):
                 return result
-                
-            except Exception as e:
-                if attempt == self.max_retries - 1:
-                    raise e
-                
-                # Wait before retry
-                await asyncio.sleep(self.retry_delay * (attempt + 1))
-                
-        # Should never reach here
-        raise VectorOperationError("Max retries exceeded")
+            attempt += 1
+            
+            # Upserts are keyed by point id, so resending the failed points is idempotent
+            if rows is None:
+                rows = {point_id: row for row, point_id in enumerate(vectors.ids)}
+            retry = await self.batch_processor.insert_batch(
+                collection_name=collection_name,
+                vectors=vectors.take([rows[point_id] for point_id in retryable_ids]),
+                batch_size=batch_size,
+                retry_budget=retry_budget
+            )
+            
+            result = {
+                **result,
+                "inserted_count": result["inserted_count"] + retry["inserted_count"],
+                "error_count": result["error_count"] - len(retryable_ids) + retry["error_count"],
+                "batch_count": result["batch_count"] + retry["batch_count"],
+                "failed_points": [
+                    point for point in result["failed_points"] if not point["retryable"]
+                ] + retry["failed_points"]
+            }
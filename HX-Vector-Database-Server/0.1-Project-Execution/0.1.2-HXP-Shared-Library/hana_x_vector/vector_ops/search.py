@@ -6,12 +6,15 @@ Advanced similarity search algorithms and optimization for vector operations.
 Provides multiple search strategies and performance optimizations.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 import time
+import heapq
+import asyncio
 import numpy as np
 from ..qdrant.client import QdrantClient
 from ..monitoring.metrics import MetricsCollector
 from ..utils.exceptions import VectorOperationError
+from .keyword_index import KeywordIndex
 
 
 class SearchEngine:
@@ -35,6 +38,26 @@ class SearchEngine:
         self.use_approximate_search = self.search_config.get("approximate_search", True)
         self.search_timeout = self.search_config.get("timeout", 30.0)
         self.parallel_search_threshold = self.search_config.get("parallel_threshold", 100)
+        # Extra results fetched per page so boundary drift between pages
+        # does not leave gaps after de-duplication
+        self.parallel_page_overlap = self.search_config.get(
+            "parallel_overlap", max(self.parallel_search_threshold // 10, 1)
+        )
+    
+        # Hybrid search settings
+        self.text_field = self.search_config.get("text_field", "text_content")
+        self.hybrid_fusion = self.search_config.get("hybrid_fusion", "rrf")
+        self.rrf_k = self.search_config.get("rrf_k", 60)
+        self.keyword_index_ttl = self.search_config.get("keyword_index_ttl", 300)
+        self.keyword_scroll_size = self.search_config.get("keyword_scroll_size", 1000)
+        
+        # Per-collection BM25 indexes over the text payload field
+        self.keyword_indexes: Dict[str, KeywordIndex] = {}
+        self._keyword_index_built_at: Dict[str, float] = {}
+        self._keyword_index_locks: Dict[str, asyncio.Lock] = {}
+        # Background rebuilds of stale indexes, and the indexes they are building
+        self._keyword_index_refreshes: Dict[str, asyncio.Task] = {}
+        self._keyword_indexes_building: Dict[str, KeywordIndex] = {}
     
     async def startup(self):
         """Initialize search engine."""
@@ -42,6 +65,10 @@ class SearchEngine:
     
     async def shutdown(self):
         """Cleanup search engine."""
+        refreshes = list(self._keyword_index_refreshes.values())
+        for task in refreshes:
+            task.cancel()
+        await asyncio.gather(*refreshes, return_exceptions=True)
         await self.qdrant_client.shutdown()
     
     async def similarity_search(
@@ -51,7 +78,9 @@ class SearchEngine:
         limit: int = None,
         filters: Optional[Dict[str, Any]] = None,
         score_threshold: Optional[float] = None,
-        search_params: Optional[Dict[str, Any]] = None
+        search_params: Optional[Dict[str, Any]] = None,
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True
     ) -> Dict[str, Any]:
         """
         Perform similarity search with advanced optimization.
@@ -63,6 +92,8 @@ class SearchEngine:
             filters: Metadata filters
             score_threshold: Minimum similarity score
             search_params: Additional search parameters
+            with_vectors: Include stored vectors in the results
+            with_payload: Include payloads, or only the listed payload fields
             
         Returns:
             Dict with search results and metadata
@@ -84,13 +115,13 @@ class SearchEngine:
                 # Use parallel search for large result sets
                 results = await self._parallel_search(
                     collection_name, query_vector, limit, filters, 
-                    score_threshold, optimized_params
+                    score_threshold, optimized_params, with_vectors, with_payload
                 )
             else:
                 # Use standard search for smaller result sets
                 results = await self._standard_search(
                     collection_name, query_vector, limit, filters,
-                    score_threshold, optimized_params
+                    score_threshold, optimized_params, with_vectors, with_payload
                 )
             
             # Post-process results
@@ -116,7 +147,7 @@ class SearchEngine:
             
         except Exception as e:
             self.metrics.increment_counter("search_errors")
-            raise VectorOperationError(f"Search failed: {str(e)}")
+            raise VectorOperationError(f"Search failed: {str(e)}", "search")
     
     async def multi_vector_search(
         self,
@@ -125,7 +156,9 @@ class SearchEngine:
         limit: int = None,
         filters: Optional[Dict[str, Any]] = None,
         score_threshold: Optional[float] = None,
-        aggregation_method: str = "average"
+        aggregation_method: str = "average",
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True
     ) -> Dict[str, Any]:
         """
         Perform multi-vector search with result aggregation.
@@ -137,6 +170,8 @@ class SearchEngine:
             filters: Metadata filters
             score_threshold: Minimum similarity score
             aggregation_method: Method for aggregating results
+            with_vectors: Include stored vectors in the results
+            with_payload: Include payloads, or only the listed payload fields
             
         Returns:
             Dict with aggregated search results
@@ -144,17 +179,26 @@ class SearchEngine:
         start_time = time.time()
         
         try:
-            # Perform individual searches
-            individual_results = []
-            for query_vector in query_vectors:
-                result = await self.similarity_search(
-                    collection_name=collection_name,
-                    query_vector=query_vector,
-                    limit=limit,
-                    filters=filters,
-                    score_threshold=score_threshold
-                )
-                individual_results.append(result["results"])
+            limit = min(limit or self.default_limit, self.max_limit)
+            score_threshold = score_threshold or self.default_score_threshold
+            
+            # Send every query vector to Qdrant in one batch request
+            batch_results = await self.qdrant_client.search_vectors_batch(
+                collection_name=collection_name,
+                query_vectors=query_vectors,
+                limit=limit,
+                filters=filters,
+                score_threshold=score_threshold,
+                search_params=self._optimize_search_params(
+                    query_vectors[0], limit, filters, None
+                ) if query_vectors else None,
+                with_vectors=with_vectors,
+                with_payload=with_payload
+            )
+            individual_results = [
+                self._post_process_results(results, score_threshold)
+                for results in batch_results
+            ]
             
             # Aggregate results
             aggregated_results = self._aggregate_search_results(
@@ -174,7 +218,7 @@ class SearchEngine:
             
         except Exception as e:
             self.metrics.increment_counter("multi_vector_search_errors")
-            raise VectorOperationError(f"Multi-vector search failed: {str(e)}")
+            raise VectorOperationError(f"Multi-vector search failed: {str(e)}", "multi_vector_search")
     
     async def hybrid_search(
         self,
@@ -184,11 +228,18 @@ class SearchEngine:
         limit: int = None,
         filters: Optional[Dict[str, Any]] = None,
         vector_weight: float = 0.7,
-        text_weight: float = 0.3
+        text_weight: float = 0.3,
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True
     ) -> Dict[str, Any]:
         """
         Perform hybrid search combining vector and text search.
         
+        Text hits come from a BM25 index over the collection's text field
+        and are fused with the vector ranking by reciprocal rank fusion
+        (search.hybrid_fusion "rrf") or min-max normalized scores
+        ("normalized").
+        
         Args:
             collection_name: Name of the collection to search
             query_vector: Query vector for similarity search
@@ -197,6 +248,8 @@ class SearchEngine:
             filters: Metadata filters
             vector_weight: Weight for vector search results
             text_weight: Weight for text search results
+            with_vectors: Include stored vectors in the results
+            with_payload: Include payloads, or only the listed payload fields
             
         Returns:
             Dict with hybrid search results
@@ -204,20 +257,24 @@ class SearchEngine:
         start_time = time.time()
         
         try:
-            # Perform vector search
-            vector_results = await self.similarity_search(
+            limit = min(limit or self.default_limit, self.max_limit)
+            
+            # Run the vector and keyword searches concurrently
+            vector_task = self.similarity_search(
                 collection_name=collection_name,
                 query_vector=query_vector,
                 limit=limit * 2,  # Get more results for better hybrid ranking
-                filters=filters
+                filters=filters,
+                with_vectors=with_vectors,
+                with_payload=with_payload
             )
-            
-            # Perform text search if text query provided
-            text_results = []
             if text_query:
-                text_results = await self._text_search(
-                    collection_name, text_query, limit * 2, filters
+                vector_results, text_results = await asyncio.gather(
+                    vector_task,
+                    self._text_search(collection_name, text_query, limit * 2, filters)
                 )
+            else:
+                vector_results, text_results = await vector_task, []
             
             # Combine and rank results
             hybrid_results = self._combine_hybrid_results(
@@ -225,6 +282,22 @@ class SearchEngine:
                 vector_weight, text_weight, limit
             )
             
+            # Text-only hits carry no payload or vector yet
+            missing_ids = [r["id"] for r in hybrid_results if r["metadata"] is None]
+            points = {}
+            if missing_ids and (with_vectors or with_payload):
+                retrieved = await self.qdrant_client.retrieve_points(
+                    collection_name, missing_ids,
+                    with_vectors=with_vectors, with_payload=with_payload
+                )
+                points = {point["id"]: point for point in retrieved}
+            for result in hybrid_results:
+                if result["metadata"] is None:
+                    point = points.get(result["id"], {})
+                    result["metadata"] = point.get("metadata", {})
+                    if point.get("vector") is not None:
+                        result["vector"] = point["vector"]
+            
             duration = time.time() - start_time
             self.metrics.record_histogram("hybrid_search_duration", duration)
             
@@ -233,12 +306,59 @@ class SearchEngine:
                 "duration": duration,
                 "collection": collection_name,
                 "search_type": "hybrid",
+                "fusion": self.hybrid_fusion,
                 "weights": {"vector": vector_weight, "text": text_weight}
             }
             
         except Exception as e:
             self.metrics.increment_counter("hybrid_search_errors")
-            raise VectorOperationError(f"Hybrid search failed: {str(e)}")
+            raise VectorOperationError(f"Hybrid search failed: {str(e)}", "hybrid_search")
+    
+    def index_documents(self, collection_name: str, vectors: List[Dict[str, Any]]):
+        """
+        Add inserted points to the collection's keyword index, if built.
+        
+        Args:
+            collection_name: Name of the collection
+            vectors: Inserted vector data with metadata
+        """
+        for index in self._live_keyword_indexes(collection_name):
+            for vector_data in vectors:
+                text = (vector_data.get("metadata") or {}).get(self.text_field)
+                if isinstance(text, str):
+                    index.add(str(vector_data["id"]), text)
+                else:
+                    index.remove(str(vector_data["id"]))
+    
+    def remove_documents(self, collection_name: str, vector_ids: List[str]):
+        """
+        Remove deleted points from the collection's keyword index.
+        
+        Args:
+            collection_name: Name of the collection
+            vector_ids: Deleted point IDs
+        """
+        for index in self._live_keyword_indexes(collection_name):
+            for vector_id in vector_ids:
+                index.remove(str(vector_id))
+    
+    def drop_keyword_index(self, collection_name: str):
+        """Discard a collection's keyword index so it is rebuilt on next use."""
+        refresh = self._keyword_index_refreshes.pop(collection_name, None)
+        if refresh is not None:
+            refresh.cancel()
+        self.keyword_indexes.pop(collection_name, None)
+        self._keyword_index_built_at.pop(collection_name, None)
+    
+    def _live_keyword_indexes(self, collection_name: str) -> List[KeywordIndex]:
+        """The served keyword index and any index being rebuilt, for writes to update."""
+        return [
+            index for index in (
+                self.keyword_indexes.get(collection_name),
+                self._keyword_indexes_building.get(collection_name)
+            )
+            if index is not None
+        ]
     
     async def _standard_search(
         self,
@@ -247,7 +367,9 @@ class SearchEngine:
         limit: int,
         filters: Optional[Dict[str, Any]],
         score_threshold: float,
-        search_params: Dict[str, Any]
+        search_params: Dict[str, Any],
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True
     ) -> List[Dict[str, Any]]:
         """Perform standard vector search."""
         return await self.qdrant_client.search_vectors(
@@ -256,7 +378,9 @@ class SearchEngine:
             limit=limit,
             filters=filters,
             score_threshold=score_threshold,
-            search_params=search_params
+            search_params=search_params,
+            with_vectors=with_vectors,
+            with_payload=with_payload
         )
     
     async def _parallel_search(
@@ -266,36 +390,56 @@ class SearchEngine:
         limit: int,
         filters: Optional[Dict[str, Any]],
         score_threshold: float,
-        search_params: Dict[str, Any]
+        search_params: Dict[str, Any],
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = True
     ) -> List[Dict[str, Any]]:
-        """Perform parallel search for large result sets."""
-        # Split search into multiple smaller searches and combine results
-        chunk_size = self.parallel_search_threshold
-        num_chunks = (limit + chunk_size - 1) // chunk_size
+        """
+        Perform parallel search for large result sets.
+        
+        The ranking is split into offset-based pages that are fetched
+        concurrently, then combined with a k-way merge on score that keeps
+        the first (highest scoring) hit for each point id.
+        """
+        page_size = self.parallel_search_threshold
         
-        # Create search tasks
+        # Create one task per page of the ranking
         search_tasks = []
-        for i in range(num_chunks):
-            chunk_limit = min(chunk_size, limit - i * chunk_size)
-            if chunk_limit > 0:
-                task = self._standard_search(
-                    collection_name, query_vector, chunk_limit,
-                    filters, score_threshold, search_params
-                )
-                search_tasks.append(task)
+        for offset in range(0, limit, page_size):
+            page_limit = min(page_size, limit - offset) + self.parallel_page_overlap
+            
+            # Every page needs a candidate list deep enough for its offset
+            page_params = dict(search_params)
+            page_params["hnsw_ef"] = max(page_params.get("hnsw_ef", 0), offset + page_limit)
+            
+            search_tasks.append(self.qdrant_client.search_vectors(
+                collection_name=collection_name,
+                query_vector=query_vector,
+                limit=page_limit,
+                filters=filters,
+                score_threshold=score_threshold,
+                search_params=page_params,
+                offset=offset,
+                with_vectors=with_vectors,
+                with_payload=with_payload
+            ))
         
         # Execute searches in parallel
-        import asyncio
-        chunk_results = await asyncio.gather(*search_tasks)
-        
-        # Combine and sort results
-        all_results = []
-        for chunk in chunk_results:
-            all_results.extend(chunk)
-        
-        # Sort by score and return top results
-        all_results.sort(key=lambda x: x.get("score", 0), reverse=True)
-        return all_results[:limit]
+        page_results = await asyncio.gather(*search_tasks)
+        
+        # Merge pages (each sorted by descending score) and drop duplicates
+        merged_results = []
+        seen_ids = set()
+        for result in heapq.merge(*page_results, key=lambda x: x.get("score", 0), reverse=True):
+            if result["id"] in seen_ids:
+                continue
+            seen_ids.add(result["id"])
+            merged_results.append(result)
+            if len(merged_results) >= limit:
+                break
+        
+        self.metrics.increment_counter("search_parallel_pages", len(search_tasks))
+        return merged_results
     
     async def _text_search(
         self,
@@ -304,32 +448,105 @@ class SearchEngine:
         limit: int,
         filters: Optional[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """Perform text-based search on metadata."""
-        # Implement text search using Qdrant's payload filtering
-        text_filter = {
-            "must": [
-                {
-                    "key": "text_content",
-                    "match": {
-                        "text": text_query
-                    }
-                }
-            ]
-        }
+        """Rank points against a text query with the BM25 keyword index."""
+        index = await self._get_keyword_index(collection_name)
         
-        # Combine with existing filters
-        if filters:
-            if "must" in filters:
-                text_filter["must"].extend(filters["must"])
-            else:
-                text_filter.update(filters)
+        # Over-fetch when filters may discard some of the hits
+        candidates = index.search(text_query, limit * 4 if filters else limit)
         
-        # Perform search with text filter
-        return await self.qdrant_client.scroll_points(
-            collection_name=collection_name,
-            filters=text_filter,
-            limit=limit
-        )
+        if filters and candidates:
+            # Keep only candidates that also match the metadata filters
+            matching = await self.qdrant_client.scroll_points(
+                collection_name=collection_name,
+                filters=filters,
+                limit=len(candidates),
+                with_vectors=False,
+                with_payload=False,
+                vector_ids=[doc_id for doc_id, _ in candidates]
+            )
+            allowed_ids = {point["id"] for point in matching}
+            candidates = [(doc_id, score) for doc_id, score in candidates if doc_id in allowed_ids]
+        
+        return [
+            {"id": doc_id, "score": score}
+            for doc_id, score in candidates[:limit]
+        ]
+        
+    async def _get_keyword_index(self, collection_name: str) -> KeywordIndex:
+        """
+        Get a collection's keyword index.
+        
+        Only the first use waits for the index to be built. A stale index
+        keeps being served, kept current by index_documents and
+        remove_documents, while a background task rebuilds it.
+        """
+        index = self.keyword_indexes.get(collection_name)
+        if index is not None:
+            built_at = self._keyword_index_built_at[collection_name]
+            if time.time() - built_at >= self.keyword_index_ttl and collection_name not in self._keyword_index_refreshes:
+                task = asyncio.create_task(self._refresh_keyword_index(collection_name))
+                self._keyword_index_refreshes[collection_name] = task
+            return index
+        
+        lock = self._keyword_index_locks.setdefault(collection_name, asyncio.Lock())
+        async with lock:
+            # Another request may have built the index while we waited
+            index = self.keyword_indexes.get(collection_name)
+            if index is None:
+                index = await self._build_keyword_index(collection_name)
+            return index
+    
+    async def _refresh_keyword_index(self, collection_name: str):
+        """Rebuild a stale keyword index in the background."""
+        try:
+            async with self._keyword_index_locks.setdefault(collection_name, asyncio.Lock()):
+                await self._build_keyword_index(collection_name)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Keep serving the stale index; the next search schedules another rebuild
+            self.metrics.increment_counter("keyword_index_refresh_errors")
+        finally:
+            if self._keyword_index_refreshes.get(collection_name) is asyncio.current_task():
+                del self._keyword_index_refreshes[collection_name]
+    
+    async def _build_keyword_index(self, collection_name: str) -> KeywordIndex:
+        """Scroll the collection's text field into a new keyword index and serve it."""
+        start_time = time.time()
+        index = KeywordIndex()
+        # Writes during the scroll are applied to the new index too
+        self._keyword_indexes_building[collection_name] = index
+        offset = None
+        
+        try:
+            # Scroll only the text field; vectors are never fetched
+            while True:
+                page = await self.qdrant_client.scroll_page(
+                    collection_name=collection_name,
+                    limit=self.keyword_scroll_size,
+                    offset=offset,
+                    with_vectors=False,
+                    with_payload=[self.text_field]
+                )
+                for point in page["points"]:
+                    text = point["metadata"].get(self.text_field)
+                    if isinstance(text, str):
+                        index.add(point["id"], text)
+                
+                offset = page["next_offset"]
+                if offset is None:
+                    break
+        finally:
+            if self._keyword_indexes_building.get(collection_name) is index:
+                del self._keyword_indexes_building[collection_name]
+        
+        self.keyword_indexes[collection_name] = index
+        self._keyword_index_built_at[collection_name] = time.time()
+        
+        self.metrics.record_histogram("keyword_index_build_duration", time.time() - start_time)
+        self.metrics.record_gauge("keyword_index_documents", len(index), tags={"collection": collection_name})
+        
+        return index
     
     def _optimize_search_params(
         self,
@@ -354,7 +571,7 @@ class SearchEngine:
         # Vector-specific optimizations
         vector_norm = np.linalg.norm(query_vector)
         if vector_norm < 0.1:  # Very small vector
-            params["rescore"] = True
+            params["quantization"] = {"rescore": True}
         
         return params
     
@@ -389,7 +606,7 @@ class SearchEngine:
         elif aggregation_method == "weighted":
             return self._weighted_aggregation(individual_results, limit)
         else:
-            raise VectorOperationError(f"Unknown aggregation method: {aggregation_method}")
+            raise VectorOperationError(f"Unknown aggregation method: {aggregation_method}", "multi_vector_search")
     
     def _average_aggregation(
         self,
@@ -397,35 +614,14 @@ class SearchEngine:
         limit: int
     ) -> List[Dict[str, Any]]:
         """Aggregate results using average scoring."""
-        # Collect all unique results
-        result_map = {}
+        ids, records, scores = self._build_score_matrix(individual_results)
         
-        for results in individual_results:
-            for result in results:
-                result_id = result["id"]
-                if result_id not in result_map:
-                    result_map[result_id] = {
-                        "id": result_id,
-                        "scores": [],
-                        "metadata": result.get("metadata", {}),
-                        "vector": result.get("vector")
-                    }
-                result_map[result_id]["scores"].append(result["score"])
-        
-        # Calculate average scores
-        aggregated_results = []
-        for result_data in result_map.values():
-            avg_score = sum(result_data["scores"]) / len(result_data["scores"])
-            aggregated_results.append({
-                "id": result_data["id"],
-                "score": avg_score,
-                "metadata": result_data["metadata"],
-                "vector": result_data["vector"]
-            })
-        
-        # Sort by average score and return top results
-        aggregated_results.sort(key=lambda x: x["score"], reverse=True)
-        return aggregated_results[:limit]
+        # Average over the queries that returned each point
+        hits = ~np.isnan(scores)
+        totals = np.where(hits, scores, 0.0).sum(axis=0)
+        aggregated_scores = totals / np.maximum(hits.sum(axis=0), 1)
+        
+        return self._select_top_results(ids, records, aggregated_scores, limit)
     
     def _max_aggregation(
         self,
@@ -433,23 +629,10 @@ class SearchEngine:
         limit: int
     ) -> List[Dict[str, Any]]:
         """Aggregate results using maximum scoring."""
-        # Similar to average but use max score
-        result_map = {}
+        ids, records, scores = self._build_score_matrix(individual_results)
+        aggregated_scores = np.where(np.isnan(scores), -np.inf, scores).max(axis=0)
         
-        for results in individual_results:
-            for result in results:
-                result_id = result["id"]
-                if result_id not in result_map:
-                    result_map[result_id] = result
-                else:
-                    # Keep result with higher score
-                    if result["score"] > result_map[result_id]["score"]:
-                        result_map[result_id] = result
-        
-        # Sort by score and return top results
-        aggregated_results = list(result_map.values())
-        aggregated_results.sort(key=lambda x: x["score"], reverse=True)
-        return aggregated_results[:limit]
+        return self._select_top_results(ids, records, aggregated_scores, limit)
     
     def _weighted_aggregation(
         self,
@@ -462,32 +645,74 @@ class SearchEngine:
             weights = [1.0] * len(individual_results)
         
         # Normalize weights
-        total_weight = sum(weights)
-        weights = [w / total_weight for w in weights]
+        weight_array = np.asarray(weights, dtype=np.float64)
+        weight_array = weight_array / weight_array.sum()
         
-        # Collect weighted results
-        result_map = {}
+        ids, records, scores = self._build_score_matrix(individual_results)
+        aggregated_scores = weight_array @ np.where(np.isnan(scores), 0.0, scores)
         
-        for i, results in enumerate(individual_results):
-            weight = weights[i]
+        return self._select_top_results(ids, records, aggregated_scores, limit)
+    
+    def _build_score_matrix(
+        self,
+        individual_results: List[List[Dict[str, Any]]]
+    ) -> Tuple[List[str], List[Dict[str, Any]], np.ndarray]:
+        """
+        Index results by point id into a (queries x points) score matrix.
+        
+        Points a query did not return are NaN. The first result seen for
+        each id supplies its metadata and vector.
+        """
+        id_index: Dict[str, int] = {}
+        records: List[Dict[str, Any]] = []
+        rows, columns, values = [], [], []
+        
+        for row, results in enumerate(individual_results):
             for result in results:
-                result_id = result["id"]
-                weighted_score = result["score"] * weight
-                
-                if result_id not in result_map:
-                    result_map[result_id] = {
-                        "id": result_id,
-                        "score": weighted_score,
-                        "metadata": result.get("metadata", {}),
-                        "vector": result.get("vector")
-                    }
-                else:
-                    result_map[result_id]["score"] += weighted_score
+                column = id_index.get(result["id"])
+                if column is None:
+                    column = id_index[result["id"]] = len(records)
+                    records.append(result)
+                rows.append(row)
+                columns.append(column)
+                values.append(result["score"])
+        
+        scores = np.full((len(individual_results), len(records)), np.nan)
+        if values:
+            # Keep the best score when a query returns the same id twice
+            np.fmax.at(scores, (np.asarray(rows), np.asarray(columns)), np.asarray(values, dtype=np.float64))
+        
+        return list(id_index), records, scores
+    
+    def _select_top_results(
+        self,
+        ids: List[str],
+        records: List[Dict[str, Any]],
+        aggregated_scores: np.ndarray,
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """Return the top results by aggregated score."""
+        if not ids:
+            return []
+        
+        if len(ids) > limit:
+            top = np.argpartition(-aggregated_scores, limit - 1)[:limit]
+        else:
+            top = np.arange(len(ids))
+        top = top[np.argsort(-aggregated_scores[top], kind="stable")]
+        
+        top_results = []
+        for index in top:
+            result = {
+                "id": ids[index],
+                "score": float(aggregated_scores[index]),
+                "metadata": records[index].get("metadata", {})
+            }
+            if records[index].get("vector") is not None:
+                result["vector"] = records[index]["vector"]
+            top_results.append(result)
         
-        # Sort by weighted score and return top results
-        aggregated_results = list(result_map.values())
-        aggregated_results.sort(key=lambda x: x["score"], reverse=True)
-        return aggregated_results[:limit]
+        return top_results
     
     def _combine_hybrid_results(
         self,
@@ -497,39 +722,61 @@ class SearchEngine:
         text_weight: float,
         limit: int
     ) -> List[Dict[str, Any]]:
-        """Combine vector and text search results."""
-        # Normalize scores and combine
+        """
+        Fuse vector and text rankings.
+        
+        Both input lists must be ordered by descending score. Text-only
+        hits are returned with metadata None for the caller to fill in.
+        """
+        if self.hybrid_fusion == "normalized":
+            vector_scores = self._normalize_scores(vector_results)
+            text_scores = self._normalize_scores(text_results)
+        else:
+            # Reciprocal rank fusion
+            vector_scores = [1.0 / (self.rrf_k + rank) for rank in range(1, len(vector_results) + 1)]
+            text_scores = [1.0 / (self.rrf_k + rank) for rank in range(1, len(text_results) + 1)]
+        
         result_map = {}
         
         # Add vector results
-        for result in vector_results:
-            result_id = result["id"]
-            result_map[result_id] = {
-                "id": result_id,
-                "score": result["score"] * vector_weight,
+        for result, fused_score in zip(vector_results, vector_scores):
+            result_map[result["id"]] = {
+                "id": result["id"],
+                "score": fused_score * vector_weight,
+                "vector_score": result["score"],
+                "text_score": None,
                 "metadata": result.get("metadata", {}),
-                "vector": result.get("vector"),
                 "sources": ["vector"]
             }
+            if result.get("vector") is not None:
+                result_map[result["id"]]["vector"] = result["vector"]
         
         # Add text results
-        for result in text_results:
-            result_id = result["id"]
-            text_score = result.get("score", 1.0) * text_weight
-            
-            if result_id in result_map:
-                result_map[result_id]["score"] += text_score
-                result_map[result_id]["sources"].append("text")
-            else:
-                result_map[result_id] = {
-                    "id": result_id,
-                    "score": text_score,
-                    "metadata": result.get("metadata", {}),
-                    "vector": result.get("vector"),
-                    "sources": ["text"]
+        for result, fused_score in zip(text_results, text_scores):
+            hybrid_result = result_map.get(result["id"])
+            if hybrid_result is None:
+                hybrid_result = result_map[result["id"]] = {
+                    "id": result["id"],
+                    "score": 0.0,
+                    "vector_score": None,
+                    "metadata": None,
+                    "sources": []
                 }
+            hybrid_result["score"] += fused_score * text_weight
+            hybrid_result["text_score"] = result["score"]
+            hybrid_result["sources"].append("text")
         
         # Sort by combined score and return top results
-        hybrid_results = list(result_map.values())
-        hybrid_results.sort(key=lambda x: x["score"], reverse=True)
-        return hybrid_results[:limit]
+        return heapq.nlargest(limit, result_map.values(), key=lambda x: x["score"])
+    
+    def _normalize_scores(self, results: List[Dict[str, Any]]) -> List[float]:
+        """Min-max normalize result scores to [0, 1]."""
+        if not results:
+            return []
+        
+        scores = np.asarray([result["score"] for result in results], dtype=np.float64)
+        score_range = scores.max() - scores.min()
+        if score_range == 0:
+            return [1.0] * len(results)
+        
+        return ((scores - scores.min()) / score_range).tolist()
@@ -0,0 +1,414 @@
+"""
+Collection Transfer
+===================
+
+Checkpointed export and import of whole collections.
+The exporter pages through id-range partitions with scroll cursors and
+writes columnar segments: a float32 .npy vector block plus a JSON lines
+payload table per segment. The importer streams segments back through
+the batch processor without loading the collection into memory.
+"""
+
+from typing import Dict, Any, List, Optional, Union
+import asyncio
+import json
+import os
+import time
+import uuid
+import numpy as np
+from ..qdrant.client import QdrantClient
+from ..monitoring.metrics import MetricsCollector
+from ..utils.exceptions import VectorOperationError
+from ..utils.vector_batch import VectorBatch
+from .batch import BatchProcessor
+
+
+PointId = Union[str, int]
+
+EXPORT_FORMAT = "hana-x-vector-export"
+EXPORT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+
+def uuid_boundaries(partitions: int) -> List[str]:
+    """
+    Split the UUID id space into equal ranges.
+    
+    Args:
+        partitions: Number of partitions
+    
+    Returns:
+        partitions - 1 UUID boundaries in ascending order
+    """
+    step = (1 << 128) // partitions
+    return [str(uuid.UUID(int=step * i)) for i in range(1, partitions)]
+
+
+def _id_key(point_id: PointId):
+    """Sort key matching Qdrant's point order: integer ids before UUIDs."""
+    if isinstance(point_id, int) or str(point_id).isdigit():
+        return (0, int(point_id))
+    return (1, uuid.UUID(str(point_id)).int)
+
+
+def _restore_id(point_id: PointId) -> PointId:
+    """Restore integer ids that were formatted as strings."""
+    if isinstance(point_id, str) and point_id.isdigit():
+        return int(point_id)
+    return point_id
+
+
+def _write_segment(directory: str, name: str, ids: List[PointId], vectors: np.ndarray, payloads: List[Dict[str, Any]]):
+    """Write one segment: vector block first, payload table second."""
+    np.save(os.path.join(directory, f"{name}.npy"), vectors)
+    with open(os.path.join(directory, f"{name}.payload.jsonl"), "w", encoding="utf-8") as table:
+        for point_id, payload in zip(ids, payloads):
+            table.write(json.dumps({"id": point_id, "payload": payload}, separators=(",", ":")) + "\n")
+
+
+def read_segment(directory: str, name: str) -> VectorBatch:
+    """
+    Read a segment as a vector batch.
+    
+    The vector block is memory-mapped; rows are paged in as the batch is sent.
+    
+    Args:
+        directory: Export directory
+        name: Segment name
+    
+    Returns:
+        Vector batch backed by the segment file
+    """
+    vectors = np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+    ids = []
+    payloads = []
+    with open(os.path.join(directory, f"{name}.payload.jsonl"), "r", encoding="utf-8") as table:
+        for line in table:
+            row = json.loads(line)
+            ids.append(row["id"])
+            payloads.append(row["payload"])
+    return VectorBatch(ids, vectors, payloads)
+
+
+def _write_json(path: str, data: Dict[str, Any]):
+    """Atomically replace a JSON file."""
+    _write_text(path, json.dumps(data, indent=2))
+
+
+def _write_text(path: str, text: str):
+    """Atomically replace a text file."""
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        handle.write(text)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temp_path, path)
+
+
+def _read_json(path: str) -> Optional[Dict[str, Any]]:
+    """Read a JSON file, or None if it does not exist."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def read_manifest(directory: str) -> Dict[str, Any]:
+    """
+    Read the manifest of a finished export.
+    
+    Args:
+        directory: Export directory
+    
+    Returns:
+        Export manifest
+    """
+    manifest = _read_json(os.path.join(directory, MANIFEST_NAME))
+    if manifest is None or manifest.get("format") != EXPORT_FORMAT:
+        raise VectorOperationError(f"No collection export found in {directory}", "import")
+    if not manifest.get("done"):
+        raise VectorOperationError(f"Export in {directory} is incomplete", "import")
+    return manifest
+
+
+class CollectionExporter:
+    """
+    Streaming, resumable collection exporter.
+    
+    Each partition covers an id range and follows its own scroll cursor.
+    Pages are buffered up to segment_size points, written as a segment,
+    and the partition's next cursor is checkpointed in the manifest.
+    Re-running an export into the same directory resumes from the
+    checkpoints.
+    """
+    
+    def __init__(self, config: Dict[str, Any], qdrant_client: Optional[QdrantClient] = None):
+        transfer_config = config.get("transfer", {})
+        self.page_size = transfer_config.get("page_size", 1000)
+        self.segment_size = transfer_config.get("segment_size", 10000)
+        self.partitions = transfer_config.get("partitions", 4)
+        self.parallelism = transfer_config.get("parallelism", 4)
+        
+        self.qdrant_client = qdrant_client or QdrantClient(config)
+        self.metrics = MetricsCollector()
+        self._manifest_lock: Optional[asyncio.Lock] = None
+    
+    async def export_collection(
+        self,
+        collection_name: str,
+        directory: str,
+        partitions: Optional[int] = None,
+        boundaries: Optional[List[PointId]] = None
+    ) -> Dict[str, Any]:
+        """
+        Export a collection into a directory of columnar segments.
+        
+        Args:
+            collection_name: Name of the collection
+            directory: Export directory; an unfinished export there is resumed
+            partitions: Number of UUID-range partitions
+            boundaries: Explicit ascending id boundaries, e.g. for integer ids
+        
+        Returns:
+            Dict with export results
+        """
+        start_time = time.time()
+        self._manifest_lock = asyncio.Lock()
+        
+        try:
+            os.makedirs(directory, exist_ok=True)
+            manifest_path = os.path.join(directory, MANIFEST_NAME)
+            manifest = await asyncio.to_thread(_read_json, manifest_path)
+            
+            if manifest is None or manifest.get("collection") != collection_name:
+                manifest = self._new_manifest(collection_name, partitions, boundaries)
+                await self._save_manifest(manifest_path, manifest)
+            elif manifest.get("done"):
+                return self._summary(manifest, time.time() - start_time)
+            
+            semaphore = asyncio.Semaphore(self.parallelism)
+            
+            async def run(partition):
+                async with semaphore:
+                    await self._export_partition(collection_name, directory, manifest_path, manifest, partition)
+            
+            await asyncio.gather(*[
+                run(partition) for partition in manifest["partitions"] if not partition["done"]
+            ])
+            
+            manifest["done"] = True
+            await self._save_manifest(manifest_path, manifest)
+            
+            duration = time.time() - start_time
+            self.metrics.record_histogram("collection_export_duration", duration)
+            return self._summary(manifest, duration)
+        
+        except Exception as e:
+            self.metrics.increment_counter("collection_export_errors")
+            raise VectorOperationError(f"Collection export failed: {str(e)}", "export")
+    
+    def _new_manifest(
+        self,
+        collection_name: str,
+        partitions: Optional[int],
+        boundaries: Optional[List[PointId]]
+    ) -> Dict[str, Any]:
+        """Create the manifest with one entry per id range."""
+        if boundaries is None:
+            boundaries = uuid_boundaries(partitions or self.partitions)
+        boundaries = sorted(boundaries, key=_id_key)
+        starts = [None] + list(boundaries)
+        ends = list(boundaries) + [None]
+        
+        return {
+            "format": EXPORT_FORMAT,
+            "version": EXPORT_VERSION,
+            "collection": collection_name,
+            "dimension": None,
+            "created_at": time.time(),
+            "done": False,
+            "partitions": [
+                {
+                    "index": index,
+                    "start": start,
+                    "end": end,
+                    "next_offset": start,
+                    "segments": [],
+                    "points": 0,
+                    "done": False
+                }
+                for index, (start, end) in enumerate(zip(starts, ends))
+            ]
+        }
+    
+    async def _export_partition(
+        self,
+        collection_name: str,
+        directory: str,
+        manifest_path: str,
+        manifest: Dict[str, Any],
+        partition: Dict[str, Any]
+    ):
+        """Scroll one id range, writing segments and checkpointing the cursor."""
+        end_key = _id_key(partition["end"]) if partition["end"] is not None else None
+        offset = partition["next_offset"]
+        ids, vectors, payloads = [], [], []
+        
+        while True:
+            page = await self.qdrant_client.scroll_page(
+                collection_name,
+                limit=self.page_size,
+                offset=offset,
+                with_vectors=True,
+                with_payload=True
+            )
+            offset = page["next_offset"]
+            finished = offset is None
+            
+            for point in page["points"]:
+                point_id = _restore_id(point["id"])
+                if end_key is not None and _id_key(point_id) >= end_key:
+                    finished = True
+                    break
+                ids.append(point_id)
+                vectors.append(point["vector"])
+                payloads.append(point.get("metadata") or {})
+            
+            if end_key is not None and offset is not None and _id_key(offset) >= end_key:
+                finished = True
+            
+            if len(ids) >= self.segment_size or finished:
+                if ids:
+                    block = np.asarray(vectors, dtype=np.float32)
+                    name = f"part-{partition['index']:04d}-{len(partition['segments']):06d}"
+                    await asyncio.to_thread(_write_segment, directory, name, ids, block, payloads)
+                    
+                    partition["segments"].append({"name": name, "points": len(ids)})
+                    partition["points"] += len(ids)
+                    manifest["dimension"] = manifest["dimension"] or int(block.shape[1])
+                    self.metrics.increment_counter("collection_export_points", len(ids))
+                
+                partition["next_offset"] = offset
+                partition["done"] = finished
+                await self._save_manifest(manifest_path, manifest)
+                ids, vectors, payloads = [], [], []
+            
+            if finished:
+                return
+    
+    async def _save_manifest(self, manifest_path: str, manifest: Dict[str, Any]):
+        """
+        Write the manifest checkpoint.
+        
+        The manifest is serialized on the event loop so the checkpoint is a
+        consistent snapshot; other partitions keep updating the dict while
+        the bytes are written in a worker thread.
+        """
+        async with self._manifest_lock:
+            payload = json.dumps(manifest, indent=2)
+            await asyncio.to_thread(_write_text, manifest_path, payload)
+    
+    def _summary(self, manifest: Dict[str, Any], duration: float) -> Dict[str, Any]:
+        """Export results from a manifest."""
+        return {
+            "collection": manifest["collection"],
+            "exported_count": sum(p["points"] for p in manifest["partitions"]),
+            "segment_count": sum(len(p["segments"]) for p in manifest["partitions"]),
+            "partition_count": len(manifest["partitions"]),
+            "dimension": manifest["dimension"],
+            "duration": duration
+        }
+
+
+class CollectionImporter:
+    """
+    Parallel, resumable importer for exported collections.
+    
+    Segments are memory-mapped and inserted through the batch processor,
+    several at a time. Completed segments are recorded in a checkpoint
+    file next to the manifest, so an interrupted import skips them on the
+    next run.
+    """
+    
+    def __init__(self, config: Dict[str, Any], batch_processor: Optional[BatchProcessor] = None):
+        transfer_config = config.get("transfer", {})
+        self.parallelism = transfer_config.get("parallelism", 4)
+        
+        self.batch_processor = batch_processor or BatchProcessor(config)
+        self.metrics = MetricsCollector()
+    
+    async def import_collection(
+        self,
+        directory: str,
+        collection_name: Optional[str] = None,
+        parallelism: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Import an exported collection.
+        
+        Args:
+            directory: Export directory
+            collection_name: Target collection, defaults to the exported one
+            parallelism: Segments inserted concurrently
+        
+        Returns:
+            Dict with import results
+        """
+        start_time = time.time()
+        
+        try:
+            manifest = await asyncio.to_thread(read_manifest, directory)
+            
+            collection_name = collection_name or manifest["collection"]
+            checkpoint_path = os.path.join(directory, f"import-{collection_name}.json")
+            checkpoint = await asyncio.to_thread(_read_json, checkpoint_path) or {"completed": []}
+            completed = set(checkpoint["completed"])
+            checkpoint_lock = asyncio.Lock()
+            
+            all_segments = [
+                segment["name"]
+                for partition in manifest["partitions"]
+                for segment in partition["segments"]
+            ]
+            segments = [name for name in all_segments if name not in completed]
+            
+            totals = {"inserted_count": 0, "error_count": 0}
+            semaphore = asyncio.Semaphore(parallelism or self.parallelism)
+            
+            async def run(name):
+                async with semaphore:
+                    batch = await asyncio.to_thread(read_segment, directory, name)
+                    result = await self.batch_processor.insert_batch(collection_name, batch)
+                    
+                    totals["inserted_count"] += result["inserted_count"]
+                    totals["error_count"] += result["error_count"]
+                    if result["error_count"]:
+                        return
+                    
+                    async with checkpoint_lock:
+                        completed.add(name)
+                        await asyncio.to_thread(
+                            _write_json, checkpoint_path, {"completed": sorted(completed)}
+                        )
+            
+            await asyncio.gather(*[run(name) for name in segments])
+            
+            duration = time.time() - start_time
+            self.metrics.record_histogram("collection_import_duration", duration)
+            self.metrics.increment_counter("collection_import_points", totals["inserted_count"])
+            
+            return {
+                "collection": collection_name,
+                "inserted_count": totals["inserted_count"],
+                "error_count": totals["error_count"],
+                "segment_count": len(segments),
+                "skipped_segments": len(all_segments) - len(segments),
+                "duration": duration
+            }
+        
+        except VectorOperationError:
+            self.metrics.increment_counter("collection_import_errors")
+            raise
+        except Exception as e:
+            self.metrics.increment_counter("collection_import_errors")
+            raise VectorOperationError(f"Collection import failed: {str(e)}", "import")
@@ -0,0 +1,174 @@
+"""
+Write-Behind Buffer
+===================
+
+Coalesces small inserts into micro-batches per collection.
+Each insert gets a future that resolves once the micro-batch holding it
+has been upserted, so callers keep durable-write semantics while sharing
+one upsert, cache invalidation and index update per micro-batch.
+"""
+
+from typing import Dict, Any, List, Tuple, Set, Callable, Awaitable, Optional
+import asyncio
+from ..monitoring.metrics import MetricsCollector
+from ..utils.exceptions import RateLimitError
+from ..utils.vector_batch import VectorBatch
+
+
+class PendingWrites:
+    """Inserts waiting for the next flush of one collection."""
+    
+    __slots__ = ("entries", "points", "timer")
+    
+    def __init__(self):
+        self.entries: List[Tuple[VectorBatch, asyncio.Future]] = []
+        self.points = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class WriteBehindBuffer:
+    """
+    Per-collection micro-batching of inserts.
+    
+    A collection's pending inserts are flushed when they reach
+    max_batch_points or max_delay after the first of them arrived.
+    Flushes of one collection run one at a time and in arrival order, so
+    later writes to a point id are never overtaken by earlier ones; inserts
+    that arrive during a flush form the next micro-batch. While the buffer
+    is disabled, every insert is written straight through on its own.
+    """
+    
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        flush_func: Callable[[str, VectorBatch], Awaitable[Dict[str, Any]]]
+    ):
+        buffer_config = config.get("write_behind", {})
+        self.enabled = buffer_config.get("enabled", False)
+        self.max_batch_points = buffer_config.get("max_batch_points", 500)
+        self.max_delay = buffer_config.get("max_delay", 0.005)
+        self.max_pending_points = buffer_config.get("max_pending_points", 50000)
+        
+        self.flush_func = flush_func
+        self.metrics = MetricsCollector()
+        
+        self._pending: Dict[str, PendingWrites] = {}
+        self._queued_points: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._flush_tasks: Set[asyncio.Task] = set()
+    
+    def submit(self, collection_name: str, batch: VectorBatch) -> asyncio.Future:
+        """
+        Queue vectors for the collection's next micro-batch.
+        
+        Args:
+            collection_name: Name of the collection
+            batch: Validated vector batch
+        
+        Returns:
+            Future resolving to this insert's results after the upsert
+        
+        Raises:
+            RateLimitError: If the collection has too many unflushed points
+        """
+        queued = self._queued_points.get(collection_name, 0)
+        if queued + len(batch) > self.max_pending_points:
+            self.metrics.increment_counter("write_behind_rejected")
+            raise RateLimitError(
+                f"Write-behind buffer for {collection_name} is full ({queued} points pending)",
+                limit=self.max_pending_points
+            )
+        
+        pending = self._pending.get(collection_name)
+        if pending is not None and pending.entries[0][0].dimension != batch.dimension:
+            # Vectors of one micro-batch share a matrix
+            self._flush(collection_name)
+            pending = None
+        if pending is None:
+            pending = self._pending[collection_name] = PendingWrites()
+        
+        future = asyncio.get_running_loop().create_future()
+        pending.entries.append((batch, future))
+        pending.points += len(batch)
+        self._queued_points[collection_name] = queued + len(batch)
+        
+        if not self.enabled or pending.points >= self.max_batch_points:
+            self._flush(collection_name)
+        elif pending.timer is None:
+            pending.timer = asyncio.get_running_loop().call_later(
+                self.max_delay, self._flush, collection_name
+            )
+        return future
+    
+    async def flush(self):
+        """Flush every collection and wait for all micro-batches to finish."""
+        for collection_name in list(self._pending):
+            self._flush(collection_name)
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+    
+    async def shutdown(self):
+        """Flush pending inserts before the clients close."""
+        await self.flush()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get unflushed points per collection."""
+        return {
+            "enabled": self.enabled,
+            "queued_points": dict(self._queued_points),
+            "flushes_in_progress": len(self._flush_tasks)
+        }
+    
+    def _flush(self, collection_name: str):
+        """Hand the collection's pending inserts to a flush task."""
+        pending = self._pending.pop(collection_name, None)
+        if pending is None:
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+        
+        task = asyncio.create_task(self._write(collection_name, pending))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+    
+    async def _write(self, collection_name: str, pending: PendingWrites):
+        """Upsert one micro-batch and resolve its callers' futures."""
+        lock = self._locks.setdefault(collection_name, asyncio.Lock())
+        
+        try:
+            async with lock:
+                batch = VectorBatch.concat([entry[0] for entry in pending.entries])
+                self.metrics.record_histogram("write_behind_batch_points", len(batch))
+                self.metrics.record_histogram("write_behind_batch_callers", len(pending.entries))
+                result = await self.flush_func(collection_name, batch)
+        
+        except asyncio.CancelledError:
+            # Shutdown: callers must not wait for a write that never completes
+            for _, future in pending.entries:
+                if not future.done():
+                    future.cancel()
+            raise
+        
+        except Exception as e:
+            self.metrics.increment_counter("write_behind_flush_errors")
+            for _, future in pending.entries:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        finally:
+            self._queued_points[collection_name] -= pending.points
+            if not self._queued_points[collection_name]:
+                del self._queued_points[collection_name]
+        
+        failed = {point["id"]: point for point in result.get("failed_points", [])}
+        for entry_batch, future in pending.entries:
+            if future.done():
+                continue
+            failed_points = [failed[point_id] for point_id in entry_batch.ids if point_id in failed]
+            future.set_result({
+                "inserted_count": len(entry_batch) - len(failed_points),
+                "batch_count": result.get("batch_count", 1),
+                "coalesced_count": len(pending.entries),
+                "failed_points": failed_points
+            })
@@ -0,0 +1,151 @@
+"""
+Unit Tests for Embedding Batcher
+================================
+
+Unit tests for the hana_x_vector.external_models.batching module.
+Tests coalescing of concurrent callers, scattering of embeddings,
+real-time priority and batching through ModelClients.
+"""
+
+import asyncio
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from hana_x_vector.external_models.batching import EmbeddingBatcher
+from hana_x_vector.external_models.model_clients import ModelClients
+
+
+def make_batcher(sent, fail=False, **overrides):
+    """Batcher whose requests are recorded and embed text as [len(text)]."""
+    config = {"max_batch_size": 4, "max_delay": 0.01, "realtime_max_delay": 0.001}
+    config.update(overrides)
+
+    async def send(model_name, texts, priority):
+        sent.append((model_name, list(texts), priority))
+        await asyncio.sleep(0)
+        if fail:
+            raise RuntimeError("model server down")
+        return {"embeddings": [[float(len(text))] for text in texts], "model": model_name}
+
+    return EmbeddingBatcher({"embedding_batching": config}, send)
+
+
+class TestCoalescing:
+    """Test micro-batches of concurrent callers."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_a_request(self):
+        """Callers within max_delay are sent together and get their own embeddings."""
+        sent = []
+        batcher = make_batcher(sent)
+
+        results = await asyncio.gather(
+            batcher.submit("phi", ["a"]),
+            batcher.submit("phi", ["bb", "ccc"]),
+            batcher.submit("gemma", ["dddd"])
+        )
+
+        assert sorted(sent) == [("gemma", ["dddd"], "normal"), ("phi", ["a", "bb", "ccc"], "normal")]
+        assert results[0]["embeddings"] == [[1.0]]
+        assert results[1]["embeddings"] == [[2.0], [3.0]]
+        assert results[1]["coalesced_count"] == 2
+        assert results[2]["batch_size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_batch_sent_without_waiting(self):
+        """Reaching max_batch_size sends at once; callers are never split."""
+        sent = []
+        batcher = make_batcher(sent, max_delay=10)
+
+        futures = [batcher.submit("phi", ["a", "b", "c"]), batcher.submit("phi", ["d", "e"])]
+        results = await asyncio.wait_for(asyncio.gather(*futures[:1]), 1)
+
+        assert sent[0][1] == ["a", "b", "c"]
+        assert results[0]["embeddings"] == [[1.0]] * 3
+        assert batcher.get_stats()["queued_texts"] == {"phi": 2}
+
+        await batcher.flush()
+        assert sent[1][1] == ["d", "e"]
+        assert futures[1].result()["embeddings"] == [[1.0], [1.0]]
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_caller(self):
+        """A failed request fails all of its callers."""
+        sent = []
+        batcher = make_batcher(sent, fail=True)
+
+        results = await asyncio.gather(
+            batcher.submit("phi", ["a"]), batcher.submit("phi", ["b"]), return_exceptions=True
+        )
+
+        assert len(sent) == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+
+class TestRealTimeLane:
+    """Test real-time callers."""
+
+    @pytest.mark.asyncio
+    async def test_high_priority_shortens_wait(self):
+        """A real-time caller sends the queue after realtime_max_delay."""
+        sent = []
+        batcher = make_batcher(sent, max_delay=10)
+
+        normal = batcher.submit("phi", ["a"])
+        high = batcher.submit("phi", ["b"], "high")
+        await asyncio.wait_for(asyncio.gather(normal, high), 1)
+
+        assert sent == [("phi", ["b", "a"], "high")]
+        assert normal.result()["embeddings"] == [[1.0]]
+
+    @pytest.mark.asyncio
+    async def test_high_priority_goes_first_into_full_request(self):
+        """Real-time callers take the first places of the next request."""
+        sent = []
+        batcher = make_batcher(sent, max_delay=10)
+
+        futures = [batcher.submit("phi", ["a", "b"]), batcher.submit("phi", ["c"])]
+        futures.append(batcher.submit("phi", ["d", "e"], "high"))
+        await batcher.flush()
+
+        assert [texts for _, texts, _ in sent] == [["d", "e", "a", "b"], ["c"]]
+        assert all(future.done() for future in futures)
+
+
+class TestModelClientBatching:
+    """Test batching through ModelClients against a local server."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_coalesced(self):
+        """Concurrent single-text requests reach the server as few POSTs."""
+        posts = []
+
+        async def embeddings(request):
+            body = await request.json()
+            posts.append(body["input"])
+            data = [{"embedding": [float(text)]} for text in body["input"]]
+            return web.json_response({"data": data, "usage": {"total_tokens": len(data)}})
+
+        app = web.Application()
+        app.router.add_post("/v1/embeddings", embeddings)
+        server = TestServer(app)
+        await server.start_server()
+
+        model_configs = {
+            "phi": {"server": server.host, "port": server.port, "endpoint": "/v1/embeddings", "dimensions": 1}
+        }
+        clients = ModelClients({"embedding_batching": {"max_batch_size": 16}}, model_configs)
+        try:
+            results = await asyncio.gather(*[
+                clients.get_embeddings("phi", [str(i)]) for i in range(40)
+            ])
+            direct = await clients.get_embeddings("phi", [str(i) for i in range(20)])
+        finally:
+            await clients.shutdown()
+            await server.close()
+
+        assert [result["embeddings"] for result in results] == [[[float(i)]] for i in range(40)]
+        assert [len(texts) for texts in posts[:3]] == [16, 16, 8]
+        assert len(direct["embeddings"]) == 20
+        assert len(posts) == 4
@@ -0,0 +1,284 @@
+"""
+Unit Tests for Connection Pool
+==============================
+
+Unit tests for the hana_x_vector.external_models.connection_pool module.
+Tests per-host session sharing, keep-alive reuse against a local server,
+per-model concurrency limits and the priority lanes of waiting requests.
+"""
+
+import asyncio
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from hana_x_vector.external_models.connection_pool import ConnectionPool
+from hana_x_vector.external_models.model_clients import ModelClients
+from hana_x_vector.external_models.integration_patterns import IntegrationPatternManager
+from hana_x_vector.utils.exceptions import ExternalModelError
+
+
+MODEL_CONFIGS = {
+    "mixtral": {"server": "10.0.0.1", "port": 11400, "endpoint": "/v1/embeddings", "dimensions": 4},
+    "hermes": {"server": "10.0.0.1", "port": 11400, "endpoint": "/v1/embeddings", "dimensions": 4},
+    "phi": {"server": "10.0.0.2", "port": 11400, "endpoint": "/v1/embeddings", "dimensions": 4}
+}
+
+
+def make_pool(**pool_config):
+    """Pool over the test models without background tasks."""
+    return ConnectionPool({"connection_pool": pool_config}, MODEL_CONFIGS)
+
+
+class TestSharedSessions:
+    """Test sessions shared per upstream host."""
+
+    @pytest.mark.asyncio
+    async def test_models_on_one_host_share_a_session(self):
+        """Models on the same host:port get the same session."""
+        pool = make_pool()
+        try:
+            mixtral = await pool.get_connection("mixtral")
+            hermes = await pool.get_connection("hermes")
+            phi = await pool.get_connection("phi")
+
+            assert mixtral is hermes
+            assert phi is not mixtral
+            assert len(pool.sessions) == 2
+            assert pool.host_models["10.0.0.1:11400"] == ["mixtral", "hermes"]
+
+            for model_name, session in (("mixtral", mixtral), ("hermes", hermes), ("phi", phi)):
+                await pool.return_connection(model_name, session)
+            assert not mixtral.closed
+        finally:
+            await pool.shutdown()
+
+        assert mixtral.closed
+
+    @pytest.mark.asyncio
+    async def test_host_limit_defaults_to_model_limits(self):
+        """A host's socket limit is the sum of its models' limits."""
+        pool = make_pool(max_connections_per_model=3)
+        try:
+            session = await pool.get_connection("mixtral")
+            assert session.connector.limit == 6
+            assert session.connector.limit_per_host == 6
+            await pool.return_connection("mixtral", session)
+        finally:
+            await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_requests_reuse_keep_alive_connections(self):
+        """Sequential requests through the pool use one socket."""
+        peers = []
+
+        async def embeddings(request):
+            peers.append(request.transport.get_extra_info("peername"))
+            return web.json_response({"data": [{"embedding": [0.1, 0.2]}], "usage": {"total_tokens": 1}})
+
+        app = web.Application()
+        app.router.add_post("/v1/embeddings", embeddings)
+        server = TestServer(app)
+        await server.start_server()
+
+        model_configs = {
+            name: {"server": server.host, "port": server.port, "endpoint": "/v1/embeddings", "dimensions": 2}
+            for name in ("mixtral", "hermes")
+        }
+        clients = ModelClients({}, model_configs)
+        try:
+            for name in ("mixtral", "hermes", "mixtral"):
+                result = await clients.get_embeddings(name, ["text"])
+                assert result["embeddings"] == [[0.1, 0.2]]
+        finally:
+            await clients.shutdown()
+            await server.close()
+
+        assert len(peers) == 3
+        assert len(set(peers)) == 1
+
+
+class TestModelConcurrency:
+    """Test per-model concurrency limits."""
+
+    @pytest.mark.asyncio
+    async def test_waiter_gets_slot_when_returned(self):
+        """A request over the limit waits for a returned slot."""
+        pool = make_pool(max_connections_per_model=2)
+        try:
+            first = await pool.get_connection("mixtral")
+            await pool.get_connection("mixtral")
+            waiter = asyncio.create_task(pool.get_connection("mixtral"))
+            await asyncio.sleep(0.01)
+            assert not waiter.done()
+
+            # Another model on the same host is not blocked
+            other = await pool.get_connection("hermes")
+            await pool.return_connection("hermes", other)
+
+            await pool.return_connection("mixtral", first)
+            assert await asyncio.wait_for(waiter, 1) is first
+            status = await pool.get_pool_status("mixtral")
+            assert status["active_connections"] == 2
+            assert status["available_connections"] == 0
+        finally:
+            await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out(self):
+        """Waiting longer than acquire_timeout fails."""
+        pool = make_pool(max_connections_per_model=1, acquire_timeout=0.02)
+        try:
+            await pool.get_connection("phi")
+            with pytest.raises(ExternalModelError, match="Timeout waiting"):
+                await pool.get_connection("phi")
+            assert (await pool.get_pool_status("phi"))["active_connections"] == 1
+        finally:
+            await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_failed_requests_counted(self):
+        """Connections returned as failed count towards the failure rate."""
+        pool = make_pool()
+        try:
+            session = await pool.get_connection("phi")
+            await pool.return_connection("phi", session, failed=True)
+            session = await pool.get_connection("phi")
+            await pool.return_connection("phi", session)
+
+            status = await pool.get_pool_status("phi")
+            assert status["total_requests"] == 2
+            assert status["success_rate"] == 0.5
+        finally:
+            await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_scale_pool_wakes_waiters(self):
+        """Raising a model's limit lets waiting requests through."""
+        pool = make_pool(max_connections_per_model=4)
+        try:
+            await pool.scale_pool("phi", 1)
+            await pool.get_connection("phi")
+            waiter = asyncio.create_task(pool.get_connection("phi"))
+            await asyncio.sleep(0.01)
+            assert not waiter.done()
+
+            await pool.scale_pool("phi", 2)
+            await asyncio.wait_for(waiter, 1)
+            assert (await pool.get_pool_status("phi"))["max_connections"] == 2
+        finally:
+            await pool.shutdown()
+
+
+class TestWaiterQueue:
+    """Test the FIFO waiter lanes of saturated models."""
+
+    async def saturate(self, pool, model_name):
+        """Take the model's only slot."""
+        await pool.scale_pool(model_name, 1)
+        return await pool.get_connection(model_name)
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_in_arrival_order(self):
+        """Returned slots go to waiters first come, first served."""
+        pool = make_pool()
+        order = []
+
+        async def request(tag):
+            session = await pool.get_connection("phi")
+            order.append(tag)
+            await asyncio.sleep(0)
+            await pool.return_connection("phi", session)
+
+        try:
+            session = await self.saturate(pool, "phi")
+            tasks = [asyncio.create_task(request(tag)) for tag in range(5)]
+            await asyncio.sleep(0.01)
+            assert (await pool.get_pool_status("phi"))["waiting"]["normal"] == 5
+
+            await pool.return_connection("phi", session)
+            await asyncio.wait_for(asyncio.gather(*tasks), 1)
+            assert order == [0, 1, 2, 3, 4]
+        finally:
+            await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_high_priority_lane_served_first(self):
+        """High priority waiters overtake queued normal and low ones."""
+        pool = make_pool()
+        order = []
+
+        async def request(priority):
+            session = await pool.get_connection("phi", priority)
+            order.append(priority)
+            await pool.return_connection("phi", session)
+
+        try:
+            session = await self.saturate(pool, "phi")
+            tasks = []
+            for priority in ("low", "normal", "high"):
+                tasks.append(asyncio.create_task(request(priority)))
+                await asyncio.sleep(0)
+
+            await pool.return_connection("phi", session)
+            await asyncio.wait_for(asyncio.gather(*tasks), 1)
+            assert order == ["high", "normal", "low"]
+        finally:
+            await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_newcomer_does_not_overtake_waiter(self):
+        """A slot freed while others wait is not taken by a new request."""
+        pool = make_pool()
+        try:
+            session = await self.saturate(pool, "phi")
+            waiter = asyncio.create_task(pool.get_connection("phi"))
+            await asyncio.sleep(0)
+
+            await pool.return_connection("phi", session)
+            newcomer = asyncio.create_task(pool.get_connection("phi"))
+            await asyncio.sleep(0.01)
+
+            assert waiter.done()
+            assert not newcomer.done()
+            newcomer.cancel()
+        finally:
+            await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_timed_out_waiter_leaves_queue(self):
+        """A waiter that times out neither holds a slot nor stays queued."""
+        pool = make_pool(acquire_timeout=0.02)
+        try:
+            session = await self.saturate(pool, "phi")
+            with pytest.raises(ExternalModelError):
+                await pool.get_connection("phi", "high")
+
+            status = await pool.get_pool_status("phi")
+            assert status["waiting"] == {"high": 0, "normal": 0, "low": 0}
+
+            await pool.return_connection("phi", session)
+            assert (await pool.get_pool_status("phi"))["active_connections"] == 0
+        finally:
+            await pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_wait_time_recorded(self):
+        """Every acquisition records its wait time."""
+        pool = make_pool()
+        try:
+            session = await pool.get_connection("phi", "high")
+            await pool.return_connection("phi", session)
+            assert len(pool.metrics.histograms["model_connection_wait_latency"]) == 1
+        finally:
+            await pool.shutdown()
+
+
+class TestSinglePool:
+    """Test that integration components share one pool."""
+
+    def test_pattern_manager_uses_client_pool(self):
+        """IntegrationPatternManager does not build a second pool."""
+        manager = IntegrationPatternManager({})
+        assert manager.connection_pool is manager.model_clients.connection_pool
+        assert len(manager.connection_pool.host_models) == 2
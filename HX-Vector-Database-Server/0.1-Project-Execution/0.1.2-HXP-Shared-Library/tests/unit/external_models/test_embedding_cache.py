@@ -0,0 +1,114 @@
+"""
+Unit Tests for Embedding Cache
+==============================
+
+Unit tests for the hana_x_vector.external_models.embedding_cache module.
+Tests content-addressed keys, the LRU and Redis tiers, and cache lookups
+in front of the integration patterns.
+"""
+
+import pytest
+import numpy as np
+from fakeredis import FakeAsyncRedis
+from unittest.mock import AsyncMock
+
+from hana_x_vector.external_models.embedding_cache import EmbeddingCache
+from hana_x_vector.external_models.integration_patterns import IntegrationPatternManager, IntegrationPattern
+
+
+@pytest.fixture
+def embedding_cache():
+    """Embedding cache with a fake Redis tier."""
+    cache = EmbeddingCache({})
+    cache.redis_client = FakeAsyncRedis()
+    return cache
+
+
+class TestCacheKeys:
+    """Test content-addressed keys."""
+
+    def test_normalized_texts_share_a_key(self, embedding_cache):
+        """Whitespace and Unicode composition do not change the key."""
+        assert embedding_cache.cache_key("phi", "café  menu\n") == embedding_cache.cache_key("phi", "café menu")
+
+    def test_keys_scoped_by_model(self, embedding_cache):
+        """The same text has a key per model."""
+        phi_key = embedding_cache.cache_key("phi", "text")
+        assert phi_key != embedding_cache.cache_key("gemma", "text")
+        assert phi_key.startswith("hana_x_vector:embedding:phi:")
+
+
+class TestTiers:
+    """Test the in-process and Redis tiers."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_as_float32(self, embedding_cache):
+        """Stored embeddings come back as float32 from either tier."""
+        await embedding_cache.put_many("phi", ["a", "b"], [[0.1, 0.2], [0.3, 0.4]])
+
+        l1 = await embedding_cache.get_many("phi", ["a", "b", "c"])
+        embedding_cache.clear_local()
+        l2 = await embedding_cache.get_many("phi", ["b", "a"])
+
+        assert l1[2] is None
+        assert l1[0].dtype == np.float32
+        np.testing.assert_allclose(l2[0], [0.3, 0.4], rtol=1e-6)
+        assert await embedding_cache.redis_client.get(embedding_cache.cache_key("phi", "a")) == \
+            np.array([0.1, 0.2], dtype=np.float32).tobytes()
+        assert embedding_cache.get_stats()["hits"] == 4
+        assert embedding_cache.get_stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_fall_back_to_misses(self, embedding_cache):
+        """An unreachable Redis tier reads as misses."""
+        embedding_cache.redis_client.mget = AsyncMock(side_effect=ConnectionError("down"))
+
+        assert await embedding_cache.get_many("phi", ["a"]) == [None]
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_misses(self):
+        """A disabled cache neither stores nor finds entries."""
+        cache = EmbeddingCache({"embedding_cache": {"enabled": False}})
+
+        assert await cache.put_many("phi", ["a"], [[1.0]]) == 0
+        assert await cache.get_many("phi", ["a"]) == [None]
+
+
+class TestCachedRequests:
+    """Test the cache in front of embedding requests."""
+
+    @pytest.fixture
+    def manager(self, embedding_cache):
+        """Pattern manager whose model requests are recorded."""
+        manager = IntegrationPatternManager({})
+        manager.embedding_cache = embedding_cache
+        sent = []
+
+        async def get_embeddings(model_name, text_data, priority="normal", coalesce=True):
+            sent.append(list(text_data))
+            return {"embeddings": [[float(len(text))] for text in text_data]}
+
+        manager.model_clients.get_embeddings = get_embeddings
+        manager.sent = sent
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_only_misses_sent_upstream(self, manager):
+        """Cached and repeated texts are not sent to the model."""
+        first = await manager.process_embedding_request("phi", ["a", "bb"], IntegrationPattern.REAL_TIME)
+        second = await manager.process_embedding_request(
+            "phi", ["bb", "ccc", "ccc ", "a"], IntegrationPattern.BULK
+        )
+
+        assert manager.sent == [["a", "bb"], ["ccc"]]
+        assert first["cache_hits"] == 0
+        assert second["cache_hits"] == 2
+        assert second["embeddings"] == [[2.0], [3.0], [3.0], [1.0]]
+
+    @pytest.mark.asyncio
+    async def test_cache_can_be_skipped(self, manager):
+        """use_cache=False sends every text."""
+        await manager.process_embedding_request("phi", ["a"])
+        await manager.process_embedding_request("phi", ["a"], options={"use_cache": False})
+
+        assert manager.sent == [["a"], ["a"]]
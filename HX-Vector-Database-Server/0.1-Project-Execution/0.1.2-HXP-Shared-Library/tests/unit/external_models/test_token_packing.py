@@ -0,0 +1,188 @@
+"""
+Unit Tests for Token Packing
+============================
+
+Unit tests for the hana_x_vector.external_models.token_packing module.
+Tests token budgets per request, length sorting, deterministic chunking
+of long texts and packed requests in the BULK and STREAMING patterns.
+"""
+
+import pytest
+import numpy as np
+
+from hana_x_vector.external_models.token_packing import TokenPacker
+from hana_x_vector.external_models.integration_patterns import IntegrationPatternManager, IntegrationPattern
+
+
+def word_tokenizer(text):
+    """One token per word."""
+    return max(len(text.split()), 1)
+
+
+def words(count, word="w"):
+    """Text of count words."""
+    return " ".join([word] * count)
+
+
+class TestPacking:
+    """Test packing of texts into requests."""
+
+    def test_requests_stay_within_budget(self):
+        """Padded request size never exceeds the request budget."""
+        packer = TokenPacker({"token_packing": {"fill_ratio": 1.0, "batch_tokens": 64}}, word_tokenizer)
+        texts = [words(n) for n in (5, 30, 8, 25, 5, 12, 40, 7)]
+
+        plan = packer.pack("general", texts, max_tokens=64)
+
+        for request in plan.requests:
+            assert len(request) * max(word_tokenizer(text) for text in request) <= 64
+        assert sorted(text for request in plan.requests for text in request) == sorted(texts)
+
+    def test_similar_lengths_share_requests(self):
+        """Texts are sorted by length before packing."""
+        packer = TokenPacker({"token_packing": {"fill_ratio": 1.0, "batch_tokens": 64}}, word_tokenizer)
+        texts = [words(30), words(2), words(30), words(2)]
+
+        plan = packer.pack("general", texts, max_tokens=64)
+
+        assert [[word_tokenizer(text) for text in request] for request in plan.requests] == [[2, 2], [30, 30]]
+
+    def test_max_texts_caps_requests(self):
+        """No request holds more than max_texts pieces."""
+        packer = TokenPacker({}, word_tokenizer)
+
+        plan = packer.pack("claude", ["a"] * 10, max_tokens=8192, max_texts=4)
+
+        assert [len(request) for request in plan.requests] == [4, 4, 2]
+
+    def test_per_model_request_budget(self):
+        """request_tokens sets a model's budget, overriding batch_tokens."""
+        config = {"token_packing": {"fill_ratio": 1.0, "batch_tokens": 20, "request_tokens": {"general": 100}}}
+        packer = TokenPacker(config, word_tokenizer)
+
+        general = packer.pack("general", [words(10)] * 10, max_tokens=20)
+        gte = packer.pack("gte", [words(10)] * 10, max_tokens=20)
+
+        assert [len(request) for request in general.requests] == [10]
+        assert [len(request) for request in gte.requests] == [2] * 5
+
+    def test_input_limit_is_not_a_request_budget(self):
+        """Without a configured budget, short texts fill requests up to max_texts."""
+        packer = TokenPacker({})
+
+        plan = packer.pack("general", [f"text {i}" for i in range(1000)], max_tokens=512, max_texts=1000)
+
+        assert plan.request_count == 1
+
+    def test_estimate_without_tokenizer(self):
+        """The default estimate counts characters and words."""
+        packer = TokenPacker({})
+
+        assert packer.count_tokens("abcdefgh") == 2
+        assert packer.count_tokens("a b c") == 3
+        assert packer.count_tokens("") == 1
+
+
+class TestLongTexts:
+    """Test texts over the model's limit."""
+
+    def test_long_text_chunked_and_pooled(self):
+        """Chunks are embedded separately and pooled back into one embedding."""
+        packer = TokenPacker({"token_packing": {"fill_ratio": 1.0}}, word_tokenizer)
+        texts = ["short", words(25, "x")]
+
+        plan = packer.pack("general", texts, max_tokens=10)
+        pieces = [piece for request in plan.requests for piece in request]
+        assert all(word_tokenizer(piece) <= 10 for piece in pieces)
+        assert sum(word_tokenizer(piece) for piece in pieces if "x" in piece) == 25
+
+        # Each piece embeds as [1, 0] when short, [0, 1] otherwise
+        embeddings = plan.assemble([
+            [[1.0, 0.0] if piece == "short" else [0.0, 1.0] for piece in request]
+            for request in plan.requests
+        ])
+        assert embeddings[0] == [1.0, 0.0]
+        np.testing.assert_allclose(embeddings[1], [0.0, 1.0])
+
+    def test_chunking_is_deterministic(self):
+        """The same text always splits the same way."""
+        packer = TokenPacker({}, word_tokenizer)
+        text = " ".join(f"w{i}" for i in range(50))
+
+        assert packer.pack("general", [text], 16).requests == packer.pack("general", [text], 16).requests
+
+    def test_truncate_keeps_first_chunk(self):
+        """overflow=truncate sends only the start of a long text."""
+        packer = TokenPacker({"token_packing": {"overflow": "truncate", "fill_ratio": 1.0}}, word_tokenizer)
+
+        plan = packer.pack("general", [words(25)], max_tokens=10)
+
+        assert plan.requests == [[words(10)]]
+
+    def test_long_whitespace_text_gets_one_piece(self):
+        """Whitespace-only text over the limit still maps to one embedding."""
+        plan = TokenPacker({}).pack("general", ["a b", " " * 5000], max_tokens=512, max_texts=50)
+
+        embeddings = plan.assemble([[[1.0, 0.0]] * len(request) for request in plan.requests])
+
+        assert sorted(piece for request in plan.requests for piece in request) == ["", "a b"]
+        assert embeddings == [[1.0, 0.0], [1.0, 0.0]]
+
+    def test_assemble_rejects_text_without_pieces(self):
+        """A text with no embedded pieces is an error, not a NaN."""
+        plan = TokenPacker({}).pack("general", ["a b"], max_tokens=512)
+        plan.text_count = 2
+
+        with pytest.raises(ValueError):
+            plan.assemble([[[1.0, 0.0]]])
+
+    def test_unbroken_text_sliced(self):
+        """Text without whitespace is cut into slices that fit."""
+        packer = TokenPacker({"token_packing": {"fill_ratio": 1.0}})
+
+        plan = packer.pack("general", ["x" * 1000], max_tokens=64)
+
+        pieces = [piece for request in plan.requests for piece in request]
+        assert "".join(pieces) == "x" * 1000
+        assert all(packer.count_tokens(piece) <= 64 for piece in pieces)
+
+
+class TestPackedPatterns:
+    """Test packing in the BULK and STREAMING patterns."""
+
+    @pytest.fixture
+    def manager(self):
+        """Pattern manager whose model requests are recorded."""
+        manager = IntegrationPatternManager({"embedding_cache": {"enabled": False}})
+        sent = []
+
+        async def get_embeddings(model_name, text_data, priority="normal", coalesce=True):
+            sent.append((list(text_data), coalesce))
+            return {"embeddings": [[float(len(text))] for text in text_data]}
+
+        manager.model_clients.get_embeddings = get_embeddings
+        manager.sent = sent
+        return manager
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("pattern", [IntegrationPattern.BULK, IntegrationPattern.STREAMING])
+    async def test_requests_fit_model_limit(self, manager, pattern):
+        """Inputs respect max_tokens and results keep input order."""
+        texts = [words(n) for n in (100, 3, 200, 50, 3)]
+
+        result = await manager.process_embedding_request("general", texts, pattern)
+
+        assert result["embeddings"] == [[float(len(text))] for text in texts]
+        packer = manager.token_packer
+        for request, coalesce in manager.sent:
+            assert not coalesce
+            assert all(packer.count_tokens(text) <= 512 for text in request)
+
+    @pytest.mark.asyncio
+    async def test_short_texts_share_one_request(self, manager):
+        """Bulk requests of short texts are not split by the input limit."""
+        texts = [f"text {i}" for i in range(1000)]
+
+        await manager.process_embedding_request("general", texts, IntegrationPattern.BULK)
+
+        assert [len(request) for request, _ in manager.sent] == [1000]
@@ -0,0 +1,101 @@
+"""
+Unit Tests for REST Handler
+===========================
+
+Unit tests for the hana_x_vector.gateway.rest_handler module.
+Tests that online inserts reach the write-behind buffer and that query
+vectors are checked against the collection registry.
+"""
+
+import asyncio
+import pytest
+import httpx
+from fastapi import FastAPI
+from unittest.mock import AsyncMock, patch
+
+from hana_x_vector.gateway.rest_handler import RestHandler
+from hana_x_vector.qdrant.registry import CollectionInfo, CollectionRegistry
+
+
+@pytest.fixture
+def rest_handler(temp_directory):
+    """REST handler with write-behind enabled and Qdrant clients patched out."""
+    config = {
+        "write_behind": {"enabled": True, "max_delay": 0.01},
+        "ingest": {"log_dir": temp_directory}
+    }
+    with patch("hana_x_vector.vector_ops.operations.QdrantClient"), \
+         patch("hana_x_vector.vector_ops.search.QdrantClient"), \
+         patch("hana_x_vector.vector_ops.batch.QdrantClient"):
+        handler = RestHandler(config)
+
+    vector_ops = handler.vector_ops
+    vector_ops._ensure_collection_exists = AsyncMock()
+    vector_ops.cache_manager.invalidate_collection_cache = AsyncMock()
+    vector_ops._insert_with_retries = AsyncMock(
+        side_effect=lambda collection_name, batch, batch_size: {
+            "inserted_count": len(batch), "error_count": 0, "batch_count": 1, "failed_points": []
+        }
+    )
+    return handler
+
+
+class TestInsertEndpoint:
+    """Test cases for POST /vectors/insert."""
+
+    @pytest.mark.asyncio
+    async def test_small_inserts_are_coalesced_by_write_behind(self, rest_handler):
+        """Test that inserts without batch_size share one micro-batch upsert."""
+        app = FastAPI()
+        app.include_router(rest_handler.router)
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            responses = await asyncio.gather(*[
+                client.post("/vectors/insert", json={
+                    "collection": "docs",
+                    "vectors": [{"id": f"vec_{i}", "vector": [0.1, 0.2, 0.3]}]
+                })
+                for i in range(3)
+            ])
+
+        assert [r.json()["inserted_count"] for r in responses] == [1, 1, 1]
+        assert rest_handler.vector_ops._insert_with_retries.await_count == 1
+
+
+class TestSearchEndpoint:
+    """Test cases for POST /vectors/search."""
+
+    @pytest.mark.asyncio
+    async def test_query_dimension_checked_against_registry(self, rest_handler):
+        """Test that a mismatched query vector is rejected before searching."""
+        loader = AsyncMock(return_value=CollectionInfo("docs", 4, "Cosine"))
+        rest_handler.vector_ops.collection_registry = CollectionRegistry({}, loader, AsyncMock(return_value=[]))
+        rest_handler.vector_ops.similarity_search = AsyncMock()
+        app = FastAPI()
+        app.include_router(rest_handler.router)
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            responses = [
+                await client.post("/vectors/search", json={"collection": "docs", "query_vector": [0.1, 0.2, 0.3]})
+                for _ in range(2)
+            ]
+
+        assert [r.status_code for r in responses] == [400, 400]
+        assert "dimension mismatch" in responses[0].json()["detail"]
+        assert loader.await_count == 1
+        rest_handler.vector_ops.similarity_search.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_aggregation_rejected(self, rest_handler):
+        """Test that multi-vector search only accepts the supported aggregations."""
+        rest_handler.vector_ops.multi_vector_search = AsyncMock()
+        app = FastAPI()
+        app.include_router(rest_handler.router)
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/vectors/search/multi", json={
+                "collection": "docs", "query_vectors": [[0.1, 0.2]], "aggregation": "sum"
+            })
+
+        assert response.status_code == 422
+        rest_handler.vector_ops.multi_vector_search.assert_not_called()
@@ -0,0 +1,276 @@
+"""
+Unit Tests for Qdrant Client
+============================
+
+Unit tests for the hana_x_vector.qdrant.client module.
+Tests the execution engines, per-class thread pools, retry budgets,
+bulk update and delete requests, and single-point error reporting.
+"""
+
+import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, AsyncMock, patch
+
+from hana_x_vector.qdrant.client import QdrantClient
+from hana_x_vector.utils.retry import RetryBudget
+from hana_x_vector.utils.exceptions import VectorOperationError
+
+
+def make_client(qdrant_config):
+    """Create a client with its collection and index helpers patched out."""
+    with patch("hana_x_vector.qdrant.client.CollectionManager"), \
+         patch("hana_x_vector.qdrant.client.IndexOptimizer"), \
+         patch("hana_x_vector.qdrant.client.QdrantConfigManager"):
+        client = QdrantClient({"qdrant": qdrant_config})
+    client.metrics = Mock()
+    return client
+
+
+@pytest.fixture
+def executor_client():
+    """Client on the executor engine with its pools started."""
+    client = make_client({"executor_workers": {"search": 2, "write": 1}, "retry_delay": 0})
+    client.client = Mock()
+    client.executors = {
+        name: ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"qdrant-{name}")
+        for name, workers in client.executor_workers.items()
+    }
+    yield client
+    for executor in client.executors.values():
+        executor.shutdown(wait=True)
+
+
+class TestExecutionEngine:
+    """Test cases for operation-class executors and the async engine."""
+
+    def test_executor_workers_from_config(self):
+        """Test pool sizes per operation class."""
+        client = make_client({"executor_workers": {"search": 32}})
+
+        assert client.engine == "executor"
+        assert client.executor_workers == {"search": 32, "write": 4, "admin": 2}
+
+    @pytest.mark.asyncio
+    async def test_calls_run_on_their_class_pool(self, executor_client):
+        """Test that searches and writes use separate named pools."""
+        thread_names = {}
+
+        def _search_points(client, name):
+            thread_names[name] = threading.current_thread().name
+            return name
+
+        def _insert_points(client, name):
+            thread_names[name] = threading.current_thread().name
+            return name
+
+        assert await executor_client._execute_with_retry(_search_points, "search") == "search"
+        assert await executor_client._execute_with_retry(_insert_points, "write") == "write"
+
+        assert thread_names["search"].startswith("qdrant-search")
+        assert thread_names["write"].startswith("qdrant-write")
+
+    @pytest.mark.asyncio
+    async def test_queue_metrics_published(self, executor_client):
+        """Test in-flight and queue-depth gauges and queue wait timings."""
+        def _search_points(client):
+            return True
+
+        await executor_client._execute_with_retry(_search_points)
+
+        gauges = [call.args for call in executor_client.metrics.record_gauge.call_args_list]
+        assert ("qdrant_executor_in_flight", 1) in [args[:2] for args in gauges]
+        assert gauges[-1][:2] == ("qdrant_executor_queue_depth", 0)
+        executor_client.metrics.record_histogram.assert_called_once()
+        assert executor_client.get_executor_stats()["pools"]["search"]["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_retries_then_raises(self, executor_client):
+        """Test that retry semantics are unchanged."""
+        attempts = []
+
+        def _delete_point(client):
+            attempts.append(1)
+            raise RuntimeError("unavailable")
+
+        with pytest.raises(RuntimeError):
+            await executor_client._execute_with_retry(_delete_point)
+
+        assert len(attempts) == executor_client.max_retries
+        executor_client.metrics.increment_counter.assert_called_with("qdrant_retry_failures")
+
+    @pytest.mark.asyncio
+    async def test_rejected_requests_are_not_retried(self, executor_client):
+        """Test that client errors fail on the first attempt."""
+        attempts = []
+
+        def _insert_points(client):
+            attempts.append(1)
+            raise ValueError("invalid point id")
+
+        with pytest.raises(ValueError):
+            await executor_client._execute_with_retry(_insert_points)
+
+        assert len(attempts) == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_budget_limits_retries(self, executor_client):
+        """Test that calls sharing a budget stop retrying once it is spent."""
+        attempts = []
+        budget = RetryBudget(min_retries=1, ratio=0.0, retry_delay=0)
+
+        def _insert_points(client):
+            attempts.append(1)
+            raise RuntimeError("unavailable")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await executor_client._execute_with_retry(_insert_points, retry_budget=budget)
+
+        assert len(attempts) == 3
+        assert budget.retries == 1
+
+    @pytest.mark.asyncio
+    async def test_async_engine_awaits_native_calls(self):
+        """Test that the async engine awaits client coroutines without threads."""
+        client = make_client({"engine": "async"})
+        client.async_client = Mock()
+        client.async_client.search = AsyncMock(return_value=["hit"])
+
+        result = await client._execute_with_retry(
+            client._search_points, "docs", [0.1], 5, None, None, {}
+        )
+
+        assert result == ["hit"]
+        assert client.async_client.search.await_args.kwargs["collection_name"] == "docs"
+        assert client.get_executor_stats()["engine"] == "async"
+
+    @pytest.mark.asyncio
+    async def test_async_engine_skips_sync_clients(self):
+        """Test that the async engine neither builds sync clients nor pools."""
+        client = make_client({"engine": "async"})
+        async_client = Mock()
+        async_client.get_collections = AsyncMock(return_value=[])
+
+        with patch("hana_x_vector.qdrant.client.QdrantClientBase") as sync_client_class, \
+             patch("hana_x_vector.qdrant.client.AsyncQdrantClient", return_value=async_client):
+            await client.startup()
+
+        sync_client_class.assert_not_called()
+        async_client.get_collections.assert_awaited_once()
+        assert client.client is None and client.grpc_client is None
+        assert client.executors == {}
+
+    @pytest.mark.asyncio
+    async def test_executor_engine_checks_on_admin_pool(self):
+        """Test that the executor engine health-checks both clients on the admin pool."""
+        client = make_client({"executor_workers": {"admin": 1}})
+        thread_names = []
+
+        def get_collections():
+            thread_names.append(threading.current_thread().name)
+
+        with patch("hana_x_vector.qdrant.client.QdrantClientBase") as sync_client_class:
+            sync_client_class.return_value.get_collections = get_collections
+            await client.startup()
+        for executor in client.executors.values():
+            executor.shutdown(wait=True)
+
+        assert len(thread_names) == 2
+        assert all(name.startswith("qdrant-admin") for name in thread_names)
+
+
+class TestBulkOperations:
+    """Test cases for grouped updates and selector-based deletes."""
+
+    @pytest.mark.asyncio
+    async def test_updates_grouped_into_one_request(self, executor_client):
+        """Test that vectors and shared payloads become a few operations in one call."""
+        executor_client.client.batch_update_points.return_value = [Mock(operation_id=7)]
+        updates = [
+            {"vector_id": "a", "vector": [0.1, 0.2]},
+            {"vector_id": "b", "metadata": {"tag": "x"}},
+            {"vector_id": "c", "vector": [0.3, 0.4], "metadata": {"tag": "x"}},
+            {"vector_id": "d", "metadata": {"tag": "y"}}
+        ]
+
+        result = await executor_client.update_points("docs", updates)
+
+        assert result == {"updated_count": 4, "operation_id": 7}
+        executor_client.client.batch_update_points.assert_called_once()
+        operations = executor_client.client.batch_update_points.call_args.kwargs["update_operations"]
+        vectors, shared, single = operations
+        assert [p.id for p in vectors.update_vectors.points] == ["a", "c"]
+        assert shared.overwrite_payload.points == ["b", "c"]
+        assert single.overwrite_payload.payload == {"tag": "y"}
+
+    @pytest.mark.asyncio
+    async def test_merge_payload_uses_set_payload(self, executor_client):
+        """Test that merge mode sends set_payload operations."""
+        executor_client.client.batch_update_points.return_value = []
+
+        await executor_client.update_points("docs", [{"vector_id": "a", "metadata": {"k": 1}}], merge_payload=True)
+
+        operation = executor_client.client.batch_update_points.call_args.kwargs["update_operations"][0]
+        assert operation.set_payload.points == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_repeated_updates_keep_submission_order(self, executor_client):
+        """Test that the last update of a point wins after grouping by payload."""
+        executor_client.client.batch_update_points.return_value = []
+        updates = [
+            {"vector_id": "p2", "metadata": {"v": "A"}},
+            {"vector_id": "p1", "metadata": {"v": "B"}},
+            {"vector_id": "p1", "metadata": {"v": "A"}}
+        ]
+
+        await executor_client.update_points("docs", updates)
+
+        operations = executor_client.client.batch_update_points.call_args.kwargs["update_operations"]
+        assert len(operations) == 1
+        assert operations[0].overwrite_payload.payload == {"v": "A"}
+        assert operations[0].overwrite_payload.points == ["p2", "p1"]
+
+    @pytest.mark.asyncio
+    async def test_repeated_merges_combine_in_order(self, executor_client):
+        """Test that merged payloads of one point are combined in submission order."""
+        executor_client.client.batch_update_points.return_value = []
+        updates = [
+            {"vector_id": "p1", "metadata": {"a": 1, "b": 1}},
+            {"vector_id": "p1", "metadata": {"b": 2}}
+        ]
+
+        await executor_client.update_points("docs", updates, merge_payload=True)
+
+        operation = executor_client.client.batch_update_points.call_args.kwargs["update_operations"][0]
+        assert operation.set_payload.payload == {"a": 1, "b": 2}
+
+    @pytest.mark.asyncio
+    async def test_delete_by_ids_and_by_filter(self, executor_client):
+        """Test that deletes use a single id list or filter selector."""
+        by_ids = await executor_client.delete_points("docs", vector_ids=["a", "b"])
+        await executor_client.delete_points("docs", filters={"source": "old"})
+
+        first, second = executor_client.client.delete.call_args_list
+        assert first.kwargs["points_selector"].points == ["a", "b"]
+        assert second.kwargs["points_selector"].filter.must[0].key == "source"
+        assert by_ids["deleted_count"] == 2
+
+
+class TestPointErrors:
+    """Test cases for errors of single-point operations."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method, args, operation", [
+        ("get_vector", ("docs", "a"), "get"),
+        ("update_vector", ("docs", "a", [0.1, 0.2]), "update"),
+        ("delete_vector", ("docs", "a"), "delete")
+    ])
+    async def test_failures_name_their_operation(self, executor_client, method, args, operation):
+        """Test that failures are raised as VectorOperationError for their operation."""
+        executor_client._execute_with_retry = AsyncMock(side_effect=RuntimeError("unavailable"))
+
+        with pytest.raises(VectorOperationError) as error:
+            await getattr(executor_client, method)(*args)
+
+        assert error.value.operation == operation
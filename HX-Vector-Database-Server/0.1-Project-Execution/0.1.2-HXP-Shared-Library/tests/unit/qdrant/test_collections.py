@@ -0,0 +1,187 @@
+"""
+Unit Tests for Collection Management
+====================================
+
+Unit tests for the hana_x_vector.qdrant.collections and
+hana_x_vector.qdrant.registry modules.
+Tests the shared collection registry and its updates on collection changes.
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, AsyncMock
+
+from hana_x_vector.qdrant.collections import CollectionManager
+from hana_x_vector.qdrant.registry import CollectionInfo, CollectionRegistry
+from hana_x_vector.utils.exceptions import CollectionNotFoundError, VectorValidationError
+
+
+def make_registry(collections, **config):
+    """Registry over a dict of known collections, counting loads."""
+    loads = []
+
+    async def loader(name):
+        loads.append(name)
+        await asyncio.sleep(0)
+        return collections.get(name)
+
+    async def lister():
+        return list(collections)
+
+    registry = CollectionRegistry({"collection_registry": config}, loader, lister)
+    registry.metrics = Mock()
+    return registry, loads
+
+
+class TestCollectionRegistry:
+    """Test cases for TTL, negative and event-driven registry caching."""
+
+    @pytest.mark.asyncio
+    async def test_hits_do_not_reload(self):
+        """Test that cached metadata is served without a load."""
+        registry, loads = make_registry({"docs": CollectionInfo("docs", 3, "Cosine")})
+
+        await registry.get("docs")
+        info = await registry.get("docs")
+
+        assert info.vector_size == 3
+        assert loads == ["docs"]
+
+    @pytest.mark.asyncio
+    async def test_missing_collections_are_cached_briefly(self):
+        """Test negative caching with its own TTL."""
+        registry, loads = make_registry({}, negative_ttl=0)
+
+        assert await registry.get("ghost") is None
+        assert await registry.get("ghost") is None
+        assert loads == ["ghost", "ghost"]
+
+        registry.negative_ttl = 60
+        await registry.get("ghost")
+        await registry.get("ghost")
+        assert len(loads) == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self):
+        """Test single-flight loading of an uncached collection."""
+        registry, loads = make_registry({"docs": CollectionInfo("docs", 3, "Cosine")})
+
+        results = await asyncio.gather(*[registry.get("docs") for _ in range(5)])
+
+        assert all(result is results[0] for result in results)
+        assert loads == ["docs"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_load_does_not_strand_waiters(self):
+        """Test that cancelling the loading caller releases concurrent callers."""
+        release = asyncio.Event()
+
+        async def loader(name):
+            await release.wait()
+            return CollectionInfo(name, 3, "Cosine")
+
+        registry = CollectionRegistry({}, loader, AsyncMock(return_value=[]))
+        first = asyncio.ensure_future(registry.get("docs"))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(registry.get("docs"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        results = await asyncio.wait_for(asyncio.gather(first, second, return_exceptions=True), timeout=1.0)
+
+        assert all(isinstance(result, asyncio.CancelledError) for result in results)
+        assert registry.get_stats()["loading"] == 0
+        release.set()
+        assert (await registry.get("docs")).vector_size == 3
+
+    @pytest.mark.asyncio
+    async def test_create_during_load_is_not_overwritten(self):
+        """Test that a stale load does not replace a newer event."""
+        registry, loads = make_registry({})
+        pending = asyncio.ensure_future(registry.get("docs"))
+        await asyncio.sleep(0)
+
+        registry.put(CollectionInfo("docs", 8, "Dot"))
+        await pending
+
+        assert (await registry.get("docs")).vector_size == 8
+
+    @pytest.mark.asyncio
+    async def test_dimension_check(self):
+        """Test dimension validation from cached metadata."""
+        registry, _ = make_registry({"docs": CollectionInfo("docs", 3, "Cosine")})
+
+        await registry.check_dimension("docs", 3)
+        with pytest.raises(VectorValidationError):
+            await registry.check_dimension("docs", 4)
+        with pytest.raises(CollectionNotFoundError):
+            await registry.check_dimension("ghost", 3)
+
+    @pytest.mark.asyncio
+    async def test_prefetch_and_point_estimate(self):
+        """Test startup prefetch and point count tracking."""
+        registry, loads = make_registry({
+            "a": CollectionInfo("a", 3, "Cosine", points_count=10),
+            "b": CollectionInfo("b", 3, "Cosine")
+        })
+
+        assert await registry.prefetch() == 2
+        registry.record_points("a", 5)
+
+        assert (await registry.get("a")).points_count == 15
+        assert sorted(loads) == ["a", "b"]
+
+
+@pytest.fixture
+def collection_manager():
+    """Collection manager over a mocked client call path."""
+    qdrant_client = Mock()
+    qdrant_client._execute_with_retry = AsyncMock(return_value=True)
+    manager = CollectionManager(qdrant_client, {})
+    manager.registry.metrics = Mock()
+    return manager
+
+
+class TestCollectionManager:
+    """Test cases for registry updates on collection lifecycle events."""
+
+    @pytest.mark.asyncio
+    async def test_create_and_delete_update_registry(self, collection_manager):
+        """Test that lifecycle events replace cached entries without a load."""
+        await collection_manager.create_collection("docs", 4, "cosine")
+
+        info = await collection_manager.get_collection_info("docs")
+        assert info["info"]["vector_size"] == 4
+        assert info["info"]["distance"] == "Cosine"
+
+        result = await collection_manager.delete_collection("docs")
+        assert result["deleted"] is True
+        assert await collection_manager.collection_exists("docs") is False
+        assert collection_manager.qdrant_client._execute_with_retry.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_not_found_loads_as_missing(self, collection_manager):
+        """Test that a 404 from Qdrant is cached as a missing collection."""
+        collection_manager.qdrant_client._execute_with_retry = AsyncMock(
+            side_effect=type("UnexpectedResponse", (Exception,), {"status_code": 404})()
+        )
+
+        with pytest.raises(CollectionNotFoundError):
+            await collection_manager.get_collection_info("ghost")
+
+    @pytest.mark.asyncio
+    async def test_load_reads_vector_params(self, collection_manager):
+        """Test conversion of a Qdrant collection description."""
+        params = SimpleNamespace(
+            vectors=SimpleNamespace(size=768, distance=SimpleNamespace(value="Dot")),
+            shard_number=2, replication_factor=1, write_consistency_factor=1
+        )
+        collection_manager.qdrant_client._execute_with_retry = AsyncMock(return_value=SimpleNamespace(
+            config=SimpleNamespace(params=params), points_count=42, status=SimpleNamespace(value="green")
+        ))
+
+        info = await collection_manager.load_collection("docs")
+
+        assert (info.vector_size, info.distance, info.points_count, info.status) == (768, "Dot", 42, "green")
+        assert info.config["shard_number"] == 2
@@ -0,0 +1,108 @@
+"""
+Unit Tests for Cache Codec
+==========================
+
+Unit tests for the hana_x_vector.utils.codec module.
+Tests round trips, float32 vector packing, compression, and legacy entries.
+"""
+
+import json
+import pytest
+import numpy as np
+
+from hana_x_vector.utils.codec import CacheCodec
+from hana_x_vector.utils.exceptions import SerializationError
+
+
+@pytest.fixture
+def search_result():
+    """Search result with full vectors attached."""
+    rng = np.random.default_rng(0)
+    return {
+        "results": [
+            {
+                "id": f"vec_{i}",
+                "score": 0.9 - i * 0.01,
+                "metadata": {"source": "test"},
+                "vector": rng.standard_normal(384).astype(np.float32).tolist()
+            }
+            for i in range(5)
+        ],
+        "collection": "test_collection",
+        "count": 5
+    }
+
+
+class TestCacheCodec:
+    """Test cases for CacheCodec."""
+
+    @pytest.mark.parametrize("serializer", ["json", "msgpack"])
+    @pytest.mark.parametrize("compression", ["none", "zlib"])
+    def test_round_trip(self, search_result, serializer, compression):
+        """Test that encoded results decode to the original values."""
+        codec = CacheCodec(serializer=serializer, compression=compression, compression_threshold=0)
+
+        assert codec.decode(codec.encode(search_result)) == search_result
+
+    def test_header_records_format(self, search_result):
+        """Test the format version, serializer and compression header."""
+        codec = CacheCodec(serializer="json", compression="zlib", compression_threshold=0)
+        payload = codec.encode(search_result)
+
+        assert payload[0] == CacheCodec.FORMAT_VERSION
+        assert payload[1] == CacheCodec.SERIALIZERS["json"]
+        assert payload[2] == CacheCodec.COMPRESSIONS["zlib"]
+
+    def test_small_payloads_are_not_compressed(self):
+        """Test that payloads below the threshold skip compression."""
+        codec = CacheCodec(serializer="json", compression="zlib", compression_threshold=1024)
+
+        assert codec.encode({"count": 0})[2] == CacheCodec.COMPRESSIONS["none"]
+
+    def test_vectors_packed_smaller_than_json(self, search_result):
+        """Test that float32 packing shrinks vector-heavy payloads."""
+        codec = CacheCodec(serializer="json")
+
+        assert len(codec.encode(search_result)) * 2 < len(json.dumps(search_result))
+
+    def test_bytes_values_round_trip(self):
+        """Test that raw response bodies survive the JSON fallback."""
+        codec = CacheCodec(serializer="json")
+        data = {"content": b'{"ok": true}', "status_code": 200}
+
+        assert codec.decode(codec.encode(data)) == data
+
+    def test_decodes_legacy_json_entries(self):
+        """Test that plain JSON entries written before the codec still decode."""
+        codec = CacheCodec()
+
+        assert codec.decode('{"count": 1}') == {"count": 1}
+
+    def test_rejects_newer_format_version(self):
+        """Test that entries from a newer format version are rejected."""
+        codec = CacheCodec()
+
+        with pytest.raises(SerializationError):
+            codec.decode(bytes((CacheCodec.FORMAT_VERSION + 1, 0, 0)) + b"{}")
+
+    def test_metadata_vectors_not_packed(self):
+        """Test that only result vectors are packed, not user metadata fields."""
+        codec = CacheCodec(serializer="json")
+        data = {"results": [{"vector": [0.5, 0.25], "metadata": {"vector": [0.1, 0.2]}}]}
+
+        payload = codec.encode(data)
+
+        assert codec.decode(payload) == data
+        assert b"0.1,0.2" in payload
+
+    def test_config_compresses_by_default(self, search_result):
+        """Test that configured codecs compress large entries with zlib."""
+        codec = CacheCodec.from_config({})
+
+        assert codec.encode(search_result)[2] == CacheCodec.COMPRESSIONS["zlib"]
+        assert codec.decode(codec.encode(search_result)) == search_result
+
+    def test_unknown_compression_rejected(self):
+        """Test configuration validation."""
+        with pytest.raises(SerializationError):
+            CacheCodec(compression="brotli")
@@ -0,0 +1,124 @@
+"""
+Unit Tests for Vector Batch
+===========================
+
+Unit tests for the hana_x_vector.utils.vector_batch module.
+Tests record and buffer decoding, vectorized validation, and zero-copy slicing.
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import Mock, AsyncMock, patch
+
+from hana_x_vector.utils.vector_batch import VectorBatch
+from hana_x_vector.utils.exceptions import VectorValidationError
+from hana_x_vector.qdrant.client import QdrantClient, models
+
+
+@pytest.fixture
+def records():
+    """Vector records as decoded from a JSON request."""
+    return [
+        {"id": f"vec_{i}", "vector": [float(i), 0.5, -1.0], "metadata": {"n": i}}
+        for i in range(5)
+    ]
+
+
+class TestVectorBatch:
+    """Test cases for VectorBatch."""
+
+    def test_from_records(self, records):
+        """Test that records become one contiguous float32 matrix."""
+        batch = VectorBatch.from_records(records)
+
+        assert batch.vectors.dtype == np.float32
+        assert batch.vectors.flags["C_CONTIGUOUS"]
+        assert batch.vectors.shape == (5, 3)
+        assert batch.ids == [f"vec_{i}" for i in range(5)]
+        assert batch.payloads[2] == {"n": 2}
+
+    def test_from_buffer_does_not_copy(self):
+        """Test that packed float32 bytes are wrapped in place."""
+        matrix = np.arange(12, dtype="<f4").reshape(4, 3)
+        buffer = matrix.tobytes()
+
+        batch = VectorBatch.from_buffer(["a", "b", "c", "d"], buffer, 3)
+
+        assert np.shares_memory(batch.vectors, np.frombuffer(buffer, dtype="<f4"))
+        assert batch.vectors.tolist() == matrix.tolist()
+        assert batch.payloads == [{}, {}, {}, {}]
+
+    def test_from_buffer_rejects_partial_rows(self):
+        """Test that a buffer must hold whole vectors."""
+        with pytest.raises(VectorValidationError):
+            VectorBatch.from_buffer(["a"], b"\x00" * 10, 3)
+
+    def test_ragged_records_rejected(self, records):
+        """Test that vectors of different dimensions are rejected."""
+        records[1]["vector"] = [1.0, 2.0]
+
+        with pytest.raises(VectorValidationError):
+            VectorBatch.from_records(records)
+
+    def test_validate_reports_first_non_finite_element(self, records):
+        """Test vectorized finiteness checks."""
+        records[3]["vector"][1] = float("nan")
+        batch = VectorBatch.from_records(records)
+
+        with pytest.raises(VectorValidationError, match="index 3 .* index 1"):
+            batch.validate()
+
+    def test_validate_checks_dimension(self, records):
+        """Test the expected dimension check."""
+        batch = VectorBatch.from_records(records)
+
+        assert batch.validate(expected_dimension=3) is batch
+        with pytest.raises(VectorValidationError):
+            batch.validate(expected_dimension=4)
+
+    def test_split_shares_buffer(self, records):
+        """Test that sub-batches are views of the original matrix."""
+        batch = VectorBatch.from_records(records)
+
+        chunks = list(batch.split(2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert all(np.shares_memory(chunk.vectors, batch.vectors) for chunk in chunks)
+        assert chunks[2].ids == ["vec_4"]
+
+    def test_concat_joins_in_order(self, records):
+        """Test that concatenated batches keep ids, vectors and payloads aligned."""
+        chunks = list(VectorBatch.from_records(records).split(2))
+
+        joined = VectorBatch.concat(chunks)
+
+        assert joined.ids == [f"vec_{i}" for i in range(5)]
+        assert joined.payloads[4] == {"n": 4}
+        np.testing.assert_array_equal(joined.vectors, VectorBatch.from_records(records).vectors)
+
+    def test_to_records_without_vectors(self, records):
+        """Test conversion back to records for payload-only consumers."""
+        batch = VectorBatch.from_records(records)
+
+        assert batch.to_records(include_vectors=False)[0] == {"id": "vec_0", "metadata": {"n": 0}}
+        assert batch.to_records()[0]["vector"] == [0.0, 0.5, -1.0]
+
+
+class TestQdrantBatchInsert:
+    """Test cases for columnar inserts in the Qdrant client."""
+
+    @pytest.mark.asyncio
+    async def test_insert_sends_single_batch_struct(self, records):
+        """Test that inserts send a columnar Batch instead of per-point structs."""
+        with patch.object(QdrantClient, "__init__", return_value=None):
+            client = QdrantClient({})
+        client.metrics = Mock()
+        client._execute_with_retry = AsyncMock(return_value=None)
+
+        result = await client.insert_vectors("docs", VectorBatch.from_records(records))
+
+        points = client._execute_with_retry.await_args.args[2]
+        assert isinstance(points, models.Batch)
+        assert points.ids == [f"vec_{i}" for i in range(5)]
+        assert points.vectors[1] == [1.0, 0.5, -1.0]
+        assert result["inserted_count"] == 5
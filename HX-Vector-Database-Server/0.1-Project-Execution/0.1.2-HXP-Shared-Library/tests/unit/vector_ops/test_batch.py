@@ -0,0 +1,369 @@
+"""
+Unit Tests for Batch Processor
+==============================
+
+Unit tests for the hana_x_vector.vector_ops.batch module.
+Tests the pipelined streaming ingest path, bulk updates and deletes,
+adaptive batch sizing, and per-point failure handling.
+"""
+
+import asyncio
+import pytest
+import numpy as np
+from unittest.mock import Mock, AsyncMock, patch
+
+from hana_x_vector.vector_ops.batch import BatchProcessor
+from hana_x_vector.vector_ops.batch_tuning import AdaptiveBatchController
+from hana_x_vector.utils.vector_batch import VectorBatch
+
+
+@pytest.fixture
+def batch_processor():
+    """Batch processor with the Qdrant client patched out."""
+    with patch("hana_x_vector.vector_ops.batch.QdrantClient"):
+        processor = BatchProcessor({"batch": {"stream_max_in_flight": 3}})
+    return processor
+
+
+class ResponseError(Exception):
+    """Error response of the Qdrant REST API."""
+
+    def __init__(self, status_code, message):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def make_stream(count, consumed=None):
+    """Async generator of vector records, optionally recording consumption."""
+    async def stream():
+        for i in range(count):
+            if consumed is not None:
+                consumed.append(i)
+            yield {"id": f"vec_{i}", "vector": [0.1, 0.2, 0.3], "metadata": {}}
+    return stream()
+
+
+class TestStreamInsert:
+    """Test cases for pipelined stream insertion."""
+
+    @pytest.mark.asyncio
+    async def test_results_acknowledged_in_batch_order(self, batch_processor):
+        """Test that out-of-order completions are yielded in batch order."""
+        delays = iter([0.03, 0.01, 0.02, 0.0])
+
+        async def insert_vectors(collection_name, vectors, wait=True, retry_budget=None):
+            await asyncio.sleep(next(delays))
+            return {"status": "completed"}
+
+        batch_processor.qdrant_client.insert_vectors = insert_vectors
+
+        results = [r async for r in batch_processor.stream_insert("docs", make_stream(7), batch_size=2)]
+
+        assert [r["sequence"] for r in results] == [0, 1, 2, 3]
+        assert [r["inserted_count"] for r in results] == [2, 2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_in_flight_upserts_are_bounded(self, batch_processor):
+        """Test that upserts overlap but never exceed the in-flight limit."""
+        active = 0
+        peak = 0
+
+        async def insert_vectors(collection_name, vectors, wait=True, retry_budget=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"status": "completed"}
+
+        batch_processor.qdrant_client.insert_vectors = insert_vectors
+
+        results = [r async for r in batch_processor.stream_insert("docs", make_stream(20), batch_size=2)]
+
+        assert len(results) == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_source_is_not_read_ahead_of_the_pipeline(self, batch_processor):
+        """Test that a full pipeline stops reading from the stream."""
+        consumed = []
+        release = asyncio.Event()
+
+        async def insert_vectors(collection_name, vectors, wait=True, retry_budget=None):
+            await release.wait()
+            return {"status": "completed"}
+
+        batch_processor.qdrant_client.insert_vectors = insert_vectors
+
+        stream = batch_processor.stream_insert("docs", make_stream(100, consumed), batch_size=2)
+        first = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.01)
+
+        assert len(consumed) == 6
+
+        release.set()
+        await first
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unwaited_upserts_end_with_barrier(self, batch_processor):
+        """Test that only the final upsert waits, after all others are acknowledged."""
+        calls = []
+
+        async def insert_vectors(collection_name, vectors, wait=True, retry_budget=None):
+            calls.append((vectors[0]["id"], wait))
+            await asyncio.sleep(0.01)
+            return {"status": "completed"}
+
+        batch_processor.qdrant_client.insert_vectors = insert_vectors
+
+        results = [
+            r async for r in batch_processor.stream_insert("docs", make_stream(8), batch_size=2, wait=False)
+        ]
+
+        assert [r["sequence"] for r in results] == [0, 1, 2, 3]
+        assert calls == [("vec_0", False), ("vec_2", False), ("vec_4", False), ("vec_6", True)]
+
+
+class TestBulkUpdateDelete:
+    """Test cases for chunked bulk updates and deletes."""
+
+    @pytest.mark.asyncio
+    async def test_updates_sent_one_request_per_chunk(self, batch_processor):
+        """Test that updates are grouped per collection and chunk."""
+        batch_processor.bulk_chunk_size = 2
+        batch_processor.qdrant_client.update_points = AsyncMock(
+            side_effect=lambda collection_name, updates, merge_payload: {"updated_count": len(updates)}
+        )
+        operations = [{"collection": "docs", "vector_id": f"vec_{i}", "metadata": {"i": i}} for i in range(5)]
+
+        result = await batch_processor.update_batch(operations)
+
+        assert result["updated_count"] == 5
+        assert batch_processor.qdrant_client.update_points.await_count == 3
+        batch_processor.qdrant_client.update_vector.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deletes_by_id_and_filter(self, batch_processor):
+        """Test that id deletes are chunked and filter deletes run once each."""
+        batch_processor.qdrant_client.delete_points = AsyncMock(
+            side_effect=lambda collection_name, vector_ids=None, filters=None: {
+                "deleted_count": len(vector_ids) if vector_ids else None
+            }
+        )
+        operations = [{"collection": "docs", "vector_id": f"vec_{i}"} for i in range(3)]
+        operations.append({"collection": "docs", "filters": {"source": "old"}})
+
+        result = await batch_processor.delete_batch(operations)
+
+        assert result["deleted_count"] == 3
+        assert result["filters_applied"] == 1
+        assert batch_processor.qdrant_client.delete_points.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_counts_as_errors(self, batch_processor):
+        """Test that a failed bulk request marks its whole chunk as errors."""
+        batch_processor.qdrant_client.delete_points = AsyncMock(side_effect=Exception("unavailable"))
+
+        result = await batch_processor.delete_batch([{"collection": "docs", "vector_id": "a"}])
+
+        assert result["deleted_count"] == 0
+        assert result["error_count"] == 1
+
+
+@pytest.fixture
+def controller():
+    """Adaptive controller with small, easy-to-follow bounds."""
+    return AdaptiveBatchController(
+        {"enabled": True, "target_latency": 0.5, "min_batch_size": 10, "increase_step": 10, "max_request_bytes": 4000},
+        default_batch_size=100,
+        max_batch_size=200,
+        default_parallelism=2,
+        metrics=Mock()
+    )
+
+
+class TestAdaptiveBatchController:
+    """Test cases for AIMD batch size and parallelism tuning."""
+
+    def test_fast_upserts_grow_batch_size(self, controller):
+        """Test additive increase while latency stays under target."""
+        controller.observe("docs", 100, 0.1, 100)
+        controller.observe("docs", 110, 0.1, 110)
+
+        assert controller.batch_size("docs") == 120
+        controller.metrics.record_gauge.assert_any_call("adaptive_batch_size", 120, {"collection": "docs"})
+
+    def test_slow_or_failed_upserts_shrink(self, controller):
+        """Test multiplicative decrease on slow and failed upserts."""
+        controller.observe("docs", 100, 2.0, 100)
+        assert controller.batch_size("docs") == 50
+        assert controller.parallelism("docs") == 1
+
+        controller.observe("docs", 50, 0.1, 50, success=False)
+        assert controller.batch_size("docs") == 25
+
+    def test_byte_budget_caps_batch_then_parallelism_grows(self, controller):
+        """Test that the request byte budget bounds the batch size."""
+        controller.observe("docs", 100, 0.1, 4000)
+
+        assert controller.batch_size("docs") == 100
+        assert controller.parallelism("docs") == 3
+
+    def test_seed_respects_dimension(self, controller):
+        """Test that a new collection starts within the byte budget."""
+        assert controller.batch_size("wide", dimension=100) == 10
+
+    @pytest.mark.asyncio
+    async def test_insert_batch_follows_controller(self, batch_processor):
+        """Test that batch sizes change mid-insert as the controller adapts."""
+        sizes = []
+
+        async def insert_vectors(collection_name, vectors, wait=True, retry_budget=None):
+            sizes.append(len(vectors))
+            return {"status": "completed"}
+
+        batch_processor.qdrant_client.insert_vectors = insert_vectors
+        batch_processor.use_parallel_processing = False
+        batch_processor.batch_controller.enabled = True
+        batch_processor.batch_controller.increase_step = 100
+        batch_processor.batch_controller.min_batch_size = 100
+        vectors = VectorBatch([f"vec_{i}" for i in range(2500)], np.ones((2500, 4), dtype=np.float32))
+
+        result = await batch_processor.insert_batch("docs", vectors)
+
+        assert result["inserted_count"] == 2500
+        assert sizes == [1000, 1100, 400]
+
+    @pytest.mark.asyncio
+    async def test_configured_batch_size_fixed_by_default(self, batch_processor):
+        """Test that the configured batch size is used unless tuning is enabled."""
+        sizes = []
+
+        async def insert_vectors(collection_name, vectors, wait=True, retry_budget=None):
+            sizes.append(len(vectors))
+            return {"status": "completed"}
+
+        batch_processor.qdrant_client.insert_vectors = insert_vectors
+        batch_processor.use_parallel_processing = False
+        vectors = VectorBatch([f"vec_{i}" for i in range(2500)], np.ones((2500, 4), dtype=np.float32))
+
+        await batch_processor.insert_batch("docs", vectors)
+
+        assert sizes == [1000, 1000, 500]
+
+
+class TestPartialFailures:
+    """Test cases for per-point results and bisection of rejected batches."""
+
+    @pytest.mark.asyncio
+    async def test_bisection_isolates_rejected_point(self, batch_processor):
+        """Test that one rejected point does not fail the rest of its batch."""
+        sent = []
+
+        async def insert_vectors(collection_name, vectors, wait=True, retry_budget=None):
+            sent.append(len(vectors))
+            if "vec_5" in vectors.ids:
+                raise ValueError("invalid point id")
+            return {"status": "completed"}
+
+        batch_processor.qdrant_client.insert_vectors = insert_vectors
+        vectors = VectorBatch([f"vec_{i}" for i in range(8)], np.ones((8, 4), dtype=np.float32))
+
+        result = await batch_processor.insert_batch("docs", vectors, batch_size=8)
+
+        assert result["inserted_count"] == 7
+        assert result["failed_points"] == [{"id": "vec_5", "error": "invalid point id", "retryable": False}]
+        assert sent == [8, 4, 4, 2, 2, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_bisected_rejection_does_not_shrink_tuned_batch_size(self, batch_processor):
+        """Test that isolating a poison point does not feed failures to the controller."""
+        async def insert_vectors(collection_name, vectors, wait=True, retry_budget=None):
+            if "vec_700" in vectors.ids:
+                raise ResponseError(400, "Wrong input: invalid payload")
+            return {"status": "completed"}
+
+        batch_processor.qdrant_client.insert_vectors = insert_vectors
+        batch_processor.batch_controller.enabled = True
+        vectors = VectorBatch([f"vec_{i}" for i in range(1000)], np.ones((1000, 4), dtype=np.float32))
+
+        result = await batch_processor.insert_batch("docs", vectors, batch_size=1000)
+
+        assert [p["id"] for p in result["failed_points"]] == ["vec_700"]
+        assert batch_processor.batch_controller.batch_size("docs") >= 1000
+
+        batch_processor.qdrant_client.insert_vectors = AsyncMock(side_effect=ResponseError(503, "Service unavailable"))
+        await batch_processor.insert_batch("docs", vectors.slice(0, 10), batch_size=10)
+
+        assert batch_processor.batch_controller.batch_size("docs") < 1000
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code", [401, 403, 404])
+    async def test_batch_wide_rejection_is_not_bisected(self, batch_processor, status_code):
+        """Test that missing collections and auth failures are not split."""
+        insert = AsyncMock(side_effect=ResponseError(status_code, "Not found: Collection `docs` doesn't exist"))
+        batch_processor.qdrant_client.insert_vectors = insert
+        vectors = VectorBatch([f"vec_{i}" for i in range(1000)], np.ones((1000, 4), dtype=np.float32))
+
+        result = await batch_processor.insert_batch("docs", vectors, batch_size=1000)
+
+        assert insert.await_count == 1
+        assert result["error_count"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_bisection_stops_when_halves_fail_like_parent(self, batch_processor):
+        """Test that a rejection repeated by both halves is not split further."""
+        sent = []
+
+        async def insert_vectors(collection_name, vectors, wait=True, retry_budget=None):
+            sent.append(len(vectors))
+            raise ResponseError(400, "Wrong input: Vector dimension error: expected dim: 8, got 4")
+
+        batch_processor.qdrant_client.insert_vectors = insert_vectors
+        vectors = VectorBatch([f"vec_{i}" for i in range(1000)], np.ones((1000, 4), dtype=np.float32))
+
+        result = await batch_processor.insert_batch("docs", vectors, batch_size=1000)
+
+        assert sent == [1000, 500, 500]
+        assert result["error_count"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_bisection_depth_is_capped(self, batch_processor):
+        """Test that bisection stops at bisect_max_depth."""
+        sent = []
+
+        async def insert_vectors(collection_name, vectors, wait=True, retry_budget=None):
+            sent.append(len(vectors))
+            if "vec_0" in vectors.ids:
+                raise ValueError("invalid point id")
+            return {"status": "completed"}
+
+        batch_processor.bisect_max_depth = 2
+        batch_processor.qdrant_client.insert_vectors = insert_vectors
+        vectors = VectorBatch([f"vec_{i}" for i in range(16)], np.ones((16, 4), dtype=np.float32))
+
+        result = await batch_processor.insert_batch("docs", vectors, batch_size=16)
+
+        assert sent == [16, 8, 8, 4, 4]
+        assert result["inserted_count"] == 12
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_not_resent_by_batch_layer(self, batch_processor):
+        """Test that transient failures are reported per point without local retries."""
+        insert = AsyncMock(side_effect=ConnectionError("unavailable"))
+        batch_processor.qdrant_client.insert_vectors = insert
+        vectors = VectorBatch(["a", "b"], np.ones((2, 4), dtype=np.float32))
+
+        result = await batch_processor.insert_batch("docs", vectors)
+
+        assert insert.await_count == 1
+        assert [p["retryable"] for p in result["failed_points"]] == [True, True]
+
+    def test_operation_id_is_stable(self, batch_processor):
+        """Test that a batch keeps its operation id across resubmissions."""
+        first = batch_processor._operation_id("docs", ["a", "b"])
+
+        assert first == batch_processor._operation_id("docs", ["a", "b"])
+        assert first != batch_processor._operation_id("docs", ["a", "c"])
+        assert first != batch_processor._operation_id("other", ["a", "b"])
@@ -0,0 +1,173 @@
+"""
+Unit Tests for Bulk Loader
+==========================
+
+Unit tests for the hana_x_vector.vector_ops.bulk_loader module.
+Tests memory-mapped vector files, payload sidecars and windowed loading.
+"""
+
+import asyncio
+import json
+import pytest
+import numpy as np
+from unittest.mock import Mock
+
+from hana_x_vector.vector_ops.bulk_loader import BulkLoader, VectorFile
+from hana_x_vector.utils.exceptions import VectorOperationError
+
+
+def write_fvecs(path, matrix):
+    """Write vectors in .fvecs layout: int32 dimension, then float32 components."""
+    rows, dimension = matrix.shape
+    words = np.empty((rows, dimension + 1), dtype="<f4")
+    words[:, 0] = np.full(rows, dimension, dtype="<i4").view("<f4")
+    words[:, 1:] = matrix
+    words.tofile(path)
+
+
+def write_jsonl(path, rows):
+    """Write payload rows as JSON lines."""
+    with open(path, "w") as sidecar:
+        for row in rows:
+            sidecar.write(json.dumps(row) + "\n")
+
+
+def make_loader(window_size=4, parallelism=2):
+    """Loader with a recording batch processor."""
+    inserted = []
+
+    async def insert_batch(collection_name, batch):
+        inserted.append(batch)
+        await asyncio.sleep(0)
+        return {"inserted_count": len(batch), "error_count": 0, "failed_points": []}
+
+    processor = Mock()
+    processor.insert_batch = insert_batch
+    loader = BulkLoader({"bulk_load": {"window_size": window_size, "parallelism": parallelism}}, processor)
+    return loader, inserted
+
+
+class TestVectorFile:
+    """Test cases for memory-mapped vector files."""
+
+    def test_npy_windows_are_views_of_the_mapping(self, tmp_path):
+        """Test that .npy windows are not copied."""
+        matrix = np.arange(20, dtype=np.float32).reshape(10, 2)
+        np.save(tmp_path / "vectors.npy", matrix)
+
+        vector_file = VectorFile(str(tmp_path / "vectors.npy"))
+        window = vector_file.window(2, 5)
+
+        assert (vector_file.rows, vector_file.dimension) == (10, 2)
+        assert isinstance(window, np.memmap)
+        np.testing.assert_array_equal(window, matrix[2:5])
+
+    def test_fvecs_rows_skip_dimension_word(self, tmp_path):
+        """Test that the .fvecs row header is not part of the vector."""
+        matrix = np.random.rand(6, 3).astype(np.float32)
+        write_fvecs(tmp_path / "vectors.fvecs", matrix)
+
+        vector_file = VectorFile(str(tmp_path / "vectors.fvecs"))
+
+        assert vector_file.dimension == 3
+        np.testing.assert_array_equal(vector_file.window(1, 4), matrix[1:4])
+
+    def test_truncated_fvecs_is_rejected(self, tmp_path):
+        """Test that a file with a partial row is rejected."""
+        (tmp_path / "bad.fvecs").write_bytes(np.array([3, 0, 0], dtype="<i4").tobytes())
+
+        with pytest.raises(VectorOperationError):
+            VectorFile(str(tmp_path / "bad.fvecs"))
+
+    def test_arrow_record_batches(self, tmp_path):
+        """Test Arrow IPC vectors and ids across record batches."""
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.ipc
+
+        matrix = np.random.rand(6, 2).astype(np.float32)
+        vectors = pa.FixedSizeListArray.from_arrays(pa.array(matrix.ravel()), 2)
+        table = pa.table({"id": list(range(100, 106)), "vector": vectors})
+        with pa.OSFile(str(tmp_path / "vectors.arrow"), "wb") as sink:
+            with pyarrow.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table, max_chunksize=4)
+
+        vector_file = VectorFile(str(tmp_path / "vectors.arrow"))
+
+        np.testing.assert_array_equal(vector_file.window(2, 6), matrix[2:6])
+        assert vector_file.ids(2, 6) == [102, 103, 104, 105]
+
+
+class TestBulkLoader:
+    """Test cases for windowed bulk loading."""
+
+    @pytest.mark.asyncio
+    async def test_windows_carry_sidecar_ids_and_payloads(self, tmp_path):
+        """Test that each window pairs vectors with its sidecar rows."""
+        np.save(tmp_path / "vectors.npy", np.ones((10, 2), dtype=np.float32))
+        write_jsonl(tmp_path / "payloads.jsonl", [{"id": f"doc_{i}", "n": i} for i in range(10)])
+        loader, inserted = make_loader()
+
+        result = await loader.load(
+            "docs", str(tmp_path / "vectors.npy"), str(tmp_path / "payloads.jsonl")
+        )
+
+        assert result["inserted_count"] == 10
+        assert result["window_count"] == 3
+        assert [len(batch) for batch in inserted] == [4, 4, 2]
+        assert inserted[2].ids == ["doc_8", "doc_9"]
+        assert inserted[2].payloads == [{"n": 8}, {"n": 9}]
+
+    @pytest.mark.asyncio
+    async def test_rows_without_ids_are_numbered(self, tmp_path):
+        """Test sequential ids from start_id without a sidecar."""
+        np.save(tmp_path / "vectors.npy", np.ones((5, 2), dtype=np.float32))
+        loader, inserted = make_loader()
+
+        await loader.load("docs", str(tmp_path / "vectors.npy"), start_id=1000)
+
+        assert [point_id for batch in inserted for point_id in batch.ids] == list(range(1000, 1005))
+
+    @pytest.mark.asyncio
+    async def test_short_sidecar_is_rejected(self, tmp_path):
+        """Test that vectors without payload rows fail the load."""
+        np.save(tmp_path / "vectors.npy", np.ones((6, 2), dtype=np.float32))
+        write_jsonl(tmp_path / "payloads.jsonl", [{"n": i} for i in range(5)])
+        loader, inserted = make_loader()
+
+        with pytest.raises(VectorOperationError):
+            await loader.load("docs", str(tmp_path / "vectors.npy"), str(tmp_path / "payloads.jsonl"))
+        assert inserted == []
+
+    @pytest.mark.asyncio
+    async def test_long_sidecar_is_rejected_before_inserting(self, tmp_path):
+        """Test that extra payload rows fail the load before any window is inserted."""
+        np.save(tmp_path / "vectors.npy", np.ones((6, 2), dtype=np.float32))
+        write_jsonl(tmp_path / "payloads.jsonl", [{"n": i} for i in range(7)])
+        loader, inserted = make_loader()
+
+        with pytest.raises(VectorOperationError, match="has 7 rows"):
+            await loader.load("docs", str(tmp_path / "vectors.npy"), str(tmp_path / "payloads.jsonl"))
+        assert inserted == []
+
+    @pytest.mark.asyncio
+    async def test_windows_in_flight_are_bounded(self, tmp_path):
+        """Test that no more than `parallelism` windows are inserted at once."""
+        np.save(tmp_path / "vectors.npy", np.ones((20, 2), dtype=np.float32))
+        active = 0
+        peak = 0
+
+        async def insert_batch(collection_name, batch):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"inserted_count": len(batch), "error_count": 0}
+
+        loader, _ = make_loader(window_size=2, parallelism=3)
+        loader.batch_processor.insert_batch = insert_batch
+
+        result = await loader.load("docs", str(tmp_path / "vectors.npy"))
+
+        assert result["inserted_count"] == 20
+        assert peak == 3
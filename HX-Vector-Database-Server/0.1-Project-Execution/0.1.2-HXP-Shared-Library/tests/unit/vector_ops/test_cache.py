@@ -0,0 +1,252 @@
+"""
+Unit Tests for Cache Manager
+============================
+
+Unit tests for the hana_x_vector.vector_ops.cache module.
+Tests search cache keys, generation-based invalidation, and the in-process L1 tier.
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import Mock, AsyncMock, MagicMock
+from fakeredis import FakeAsyncRedis
+
+from hana_x_vector.vector_ops.cache import CacheManager, LocalResultCache
+
+
+@pytest.fixture
+def cache_manager(mock_redis_client):
+    """Cache manager wired to a mock Redis client."""
+    manager = CacheManager({"cache": {"enabled": True}})
+    mock_redis_client.mget = AsyncMock(return_value=[None, None])
+    mock_redis_client.incr = AsyncMock(return_value=1)
+    mock_redis_client.setex = AsyncMock(return_value=True)
+    manager.redis_client = mock_redis_client
+    return manager
+
+
+class TestSearchCacheKeys:
+    """Test cases for search cache key generation."""
+
+    def test_key_contains_collection_and_generation(self, cache_manager):
+        """Test that search keys are scoped by collection and generation."""
+        key = cache_manager.generate_search_cache_key(
+            "test_collection", [0.1, 0.2, 0.3], 10, generation="2.5"
+        )
+
+        assert key.startswith(f"{cache_manager.search_prefix}test_collection:2.5:")
+
+    def test_generation_change_changes_key(self, cache_manager):
+        """Test that a new generation produces a different key."""
+        vector = [0.1, 0.2, 0.3]
+        old_key = cache_manager.generate_search_cache_key("docs", vector, 10, generation="0.1")
+        new_key = cache_manager.generate_search_cache_key("docs", vector, 10, generation="0.2")
+
+        assert old_key != new_key
+
+    def test_projection_changes_key(self, cache_manager):
+        """Test that results with different projections are cached separately."""
+        vector = [0.1, 0.2, 0.3]
+        default_key = cache_manager.generate_search_cache_key("docs", vector, 10)
+        vectors_key = cache_manager.generate_search_cache_key("docs", vector, 10, with_vectors=True)
+        fields_key = cache_manager.generate_search_cache_key("docs", vector, 10, with_payload=["title"])
+
+        assert len({default_key, vectors_key, fields_key}) == 3
+
+    @pytest.mark.asyncio
+    async def test_get_search_generation_defaults_to_zero(self, cache_manager):
+        """Test that missing generation counters read as zero."""
+        assert await cache_manager.get_search_generation("docs") == "0.0"
+
+    @pytest.mark.asyncio
+    async def test_get_search_generation_combines_counters(self, cache_manager):
+        """Test that the global and collection counters form the token."""
+        cache_manager.redis_client.mget = AsyncMock(return_value=["3", "7"])
+
+        assert await cache_manager.get_search_generation("docs") == "3.7"
+
+    @pytest.mark.asyncio
+    async def test_generation_disabled_cache(self):
+        """Test generation lookup when caching is disabled."""
+        manager = CacheManager({"cache": {"enabled": False}})
+
+        assert await manager.get_search_generation("docs") == "0.0"
+
+
+class TestCacheInvalidation:
+    """Test cases for generation-based invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_search_cache_for_collection(self, cache_manager):
+        """Test that collection invalidation is a single INCR."""
+        assert await cache_manager.invalidate_search_cache("docs") is True
+
+        cache_manager.redis_client.incr.assert_awaited_once_with(
+            f"{cache_manager.generation_prefix}docs"
+        )
+        cache_manager.redis_client.keys.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_search_cache_global(self, cache_manager):
+        """Test that global invalidation bumps the global generation."""
+        assert await cache_manager.invalidate_search_cache() is True
+
+        cache_manager.redis_client.incr.assert_awaited_once_with(
+            cache_manager.global_generation_key
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalidate_collection_cache_uses_pipeline(self, cache_manager):
+        """Test that collection invalidation bumps the generation in one round trip."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[1, 1])
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=False)
+        cache_manager.redis_client.pipeline = Mock(return_value=pipe)
+
+        assert await cache_manager.invalidate_collection_cache("docs") is True
+
+        pipe.incr.assert_called_once_with(f"{cache_manager.generation_prefix}docs")
+        pipe.delete.assert_called_once_with(f"{cache_manager.collection_prefix}info:docs")
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_eviction_keeps_generation_counters(self):
+        """Test that eviction and clears never reset generation counters."""
+        manager = CacheManager({"cache": {"enabled": True}})
+        manager.redis_client = FakeAsyncRedis()
+        await manager.redis_client.set(manager.global_generation_key, 1)
+        await manager.redis_client.set(manager._generation_key("docs"), 4)
+        for i in range(20):
+            await manager.redis_client.set(f"{manager.search_prefix}docs:1.4:{i}", "result", ex=60 + i)
+
+        await manager._evict_old_entries()
+        assert len(await manager.redis_client.keys(f"{manager.search_prefix}*")) == 18
+        await manager.clear_cache()
+
+        assert await manager.redis_client.keys(f"{manager.search_prefix}*") == []
+        assert await manager.get_search_generation("docs") == "1.4"
+
+
+class TestLocalResultCache:
+    """Test cases for the in-process L1 cache."""
+
+    def test_evicts_least_recently_used_entry(self):
+        """Test LRU eviction when the entry limit is reached."""
+        cache = LocalResultCache(max_entries=2, max_bytes=1024, ttl=60)
+        cache.put("a", {"v": 1}, 10)
+        cache.put("b", {"v": 2}, 10)
+        cache.get("a")
+        cache.put("c", {"v": 3}, 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": 1}
+        assert cache.get("c") == {"v": 3}
+
+    def test_evicts_to_stay_within_byte_budget(self):
+        """Test size-based eviction."""
+        cache = LocalResultCache(max_entries=100, max_bytes=100, ttl=60)
+        cache.put("a", "x", 60)
+        cache.put("b", "y", 60)
+
+        assert len(cache) == 1
+        assert cache.total_bytes == 60
+        assert cache.get("a") is None
+
+    def test_expired_entries_are_misses(self):
+        """Test that entries past their TTL are not served."""
+        cache = LocalResultCache(max_entries=10, max_bytes=1024, ttl=-1)
+        cache.put("a", "x", 1)
+
+        assert cache.get("a") is None
+        assert cache.total_bytes == 0
+
+
+class TestSearchCacheTiers:
+    """Test cases for L1/L2 search cache lookups."""
+
+    @pytest.mark.asyncio
+    async def test_cached_result_served_from_l1(self, cache_manager):
+        """Test that a written result is served without touching Redis."""
+        await cache_manager.cache_search_result("key", {"results": [], "count": 0})
+
+        result = await cache_manager.get_cached_search("key")
+
+        assert result["count"] == 0
+        cache_manager.redis_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_populates_l1(self, cache_manager):
+        """Test that a Redis hit is promoted into the L1 tier."""
+        cache_manager.redis_client.get = AsyncMock(return_value='{"count": 3}')
+
+        assert await cache_manager.get_cached_search("key") == {"count": 3}
+        assert await cache_manager.get_cached_search("key") == {"count": 3}
+        cache_manager.redis_client.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_generation_reused_until_invalidated(self, cache_manager):
+        """Test that generation tokens are cached locally and dropped on invalidation."""
+        await cache_manager.get_search_generation("docs")
+        await cache_manager.get_search_generation("docs")
+        assert cache_manager.redis_client.mget.await_count == 1
+
+        await cache_manager.invalidate_search_cache("docs")
+        await cache_manager.get_search_generation("docs")
+        assert cache_manager.redis_client.mget.await_count == 2
+
+
+class TestSemanticCache:
+    """Test cases for the approximate-key semantic search cache."""
+
+    @pytest.fixture
+    def semantic_manager(self, cache_manager):
+        """Cache manager with semantic caching enabled and a recording pipeline."""
+        cache_manager.semantic_enabled = True
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[1, True, True])
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=False)
+        cache_manager.redis_client.pipeline = Mock(return_value=pipe)
+        return cache_manager
+
+    def test_hash_vector_ignores_sub_float32_drift(self, cache_manager):
+        """Test that vector hashing operates on float32 values."""
+        assert cache_manager._hash_vector([0.1, 0.2]) == cache_manager._hash_vector([0.1 + 1e-12, 0.2])
+        assert cache_manager._hash_vector([0.1, 0.2]) != cache_manager._hash_vector([0.1, 0.3])
+
+    @pytest.mark.asyncio
+    async def test_nearby_query_hits_within_tolerance(self, semantic_manager):
+        """Test that a slightly different query reuses the cached result."""
+        rng = np.random.default_rng(0)
+        vector = rng.standard_normal(64).tolist()
+        nearby = (np.asarray(vector) + rng.normal(0, 1e-4, 64)).tolist()
+
+        await semantic_manager.cache_search_result("exact-key", {"results": [], "count": 0})
+        await semantic_manager.cache_semantic_search("docs", vector, 10, None, None, "0.0", "exact-key")
+
+        pipe = semantic_manager.redis_client.pipeline.return_value
+        bucket_key, entry = pipe.lpush.call_args.args
+        semantic_manager.redis_client.lrange = AsyncMock(return_value=[entry])
+
+        result = await semantic_manager.get_semantic_search("docs", nearby, 10)
+
+        assert result == {"results": [], "count": 0, "cached_at": result["cached_at"]}
+        semantic_manager.redis_client.lrange.assert_awaited_once_with(bucket_key, 0, -1)
+
+    @pytest.mark.asyncio
+    async def test_distant_query_misses(self, semantic_manager):
+        """Test that queries outside the tolerance are not served."""
+        vector = [1.0, 0.0, 0.0]
+        await semantic_manager.cache_semantic_search("docs", vector, 10, None, None, "0.0", "exact-key")
+
+        entry = semantic_manager.redis_client.pipeline.return_value.lpush.call_args.args[1]
+        semantic_manager.redis_client.lrange = AsyncMock(return_value=[entry])
+
+        assert await semantic_manager.get_semantic_search("docs", [0.9, 0.4, 0.0], 10) is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, cache_manager):
+        """Test that semantic lookups are skipped unless enabled."""
+        assert await cache_manager.get_semantic_search("docs", [1.0, 0.0], 10) is None
+        cache_manager.redis_client.lrange.assert_not_called()
@@ -0,0 +1,217 @@
+"""
+Unit Tests for Ingest Queue
+===========================
+
+Unit tests for the hana_x_vector.vector_ops.ingest_queue module.
+Tests durable job submission, progress tracking, backpressure and
+recovery of unfinished jobs from the log.
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock
+
+from hana_x_vector.vector_ops.ingest_queue import IngestQueue
+from hana_x_vector.utils.exceptions import RateLimitError
+
+
+def make_operations(count, collection="docs", operation_type="insert"):
+    """Operations for one collection."""
+    return [
+        {"type": operation_type, "collection": collection, "data": {"id": f"vec_{i}", "vector": [0.1, 0.2]}}
+        for i in range(count)
+    ]
+
+
+def make_queue(tmp_path, processor, **overrides):
+    """Queue logging under a temporary directory."""
+    config = {"log_dir": str(tmp_path), "workers": 1, "chunk_size": 2, "fsync": False}
+    config.update(overrides)
+    return IngestQueue({"ingest": config}, processor)
+
+
+async def wait_until_finished(queue, job_id):
+    """Poll until a job leaves the pending set."""
+    for _ in range(200):
+        if queue.get_job(job_id)["status"] in ("completed", "failed"):
+            return queue.get_job(job_id)
+        await asyncio.sleep(0.005)
+    raise AssertionError("job did not finish")
+
+
+class TestIngestQueue:
+    """Test cases for the write-ahead batch job queue."""
+
+    @pytest.mark.asyncio
+    async def test_job_applied_in_chunks(self, tmp_path):
+        """Test that a submitted job is drained chunk by chunk."""
+        processor = AsyncMock(return_value={"total_errors": 0})
+        queue = make_queue(tmp_path, processor)
+        await queue.startup()
+
+        job_id = await queue.submit(make_operations(5))
+        job = await wait_until_finished(queue, job_id)
+        await queue.shutdown()
+
+        assert job["status"] == "completed"
+        assert job["processed_operations"] == 5
+        assert job["total_operations"] == 5
+        assert [len(call.args[0]) for call in processor.await_args_list] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_job_is_logged_before_acknowledgement(self, tmp_path):
+        """Test that the job record is on disk when submit returns."""
+        release = asyncio.Event()
+
+        async def processor(operations):
+            await release.wait()
+            return {"total_errors": 0}
+
+        queue = make_queue(tmp_path, processor)
+        await queue.startup()
+
+        job_id = await queue.submit(make_operations(1))
+        records = [json.loads(line) for line in open(queue.log_path)]
+
+        assert records[0]["type"] == "job"
+        assert records[0]["job_id"] == job_id
+        release.set()
+        await wait_until_finished(queue, job_id)
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_unfinished_job_resumes_after_restart(self, tmp_path):
+        """Test crash recovery from the last logged chunk."""
+        log = tmp_path / "ingest.log"
+        log.write_text(
+            json.dumps({"type": "job", "job_id": "j1", "created_at": 1.0, "operations": make_operations(5)}) + "\n"
+            + json.dumps({"type": "progress", "job_id": "j1", "processed": 2, "errors": 0}) + "\n"
+            + json.dumps({"type": "job", "job_id": "j2", "created_at": 2.0, "operations": make_operations(1)}) + "\n"
+            + json.dumps({"type": "done", "job_id": "j2", "status": "completed", "error": None}) + "\n"
+            + '{"type": "job", "job_id": "torn"'
+        )
+        processor = AsyncMock(return_value={"total_errors": 0})
+        queue = make_queue(tmp_path, processor)
+        await queue.startup()
+
+        job = await wait_until_finished(queue, "j1")
+        await queue.shutdown()
+
+        assert job["processed_operations"] == 5
+        sent = [op["data"]["id"] for call in processor.await_args_list for op in call.args[0]]
+        assert sent == ["vec_2", "vec_3", "vec_4"]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_jobs(self, tmp_path):
+        """Test backpressure once the pending job limit is reached."""
+        release = asyncio.Event()
+
+        async def processor(operations):
+            await release.wait()
+            return {"total_errors": 0}
+
+        queue = make_queue(tmp_path, processor, max_pending_jobs=1)
+        await queue.startup()
+        job_id = await queue.submit(make_operations(1))
+
+        with pytest.raises(RateLimitError):
+            await queue.submit(make_operations(1))
+
+        release.set()
+        await wait_until_finished(queue, job_id)
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submits_respect_limit(self, tmp_path):
+        """Test that submits awaiting the log cannot exceed the pending job limit."""
+        release = asyncio.Event()
+
+        async def processor(operations):
+            await release.wait()
+            return {"total_errors": 0}
+
+        queue = make_queue(tmp_path, processor, max_pending_jobs=2)
+        await queue.startup()
+
+        results = await asyncio.gather(
+            *[queue.submit(make_operations(1)) for _ in range(5)], return_exceptions=True
+        )
+
+        job_ids = [result for result in results if isinstance(result, str)]
+        assert len(job_ids) == 2
+        assert sum(isinstance(result, RateLimitError) for result in results) == 3
+        release.set()
+        for job_id in job_ids:
+            await wait_until_finished(queue, job_id)
+        await queue.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_jobs_on_a_collection_keep_submission_order(self, tmp_path):
+        """Test that workers > 1 never run a later job on a collection first."""
+        release = asyncio.Event()
+        applied = []
+
+        async def processor(operations):
+            if operations[0]["type"] == "insert":
+                await release.wait()
+            applied.append((operations[0]["type"], operations[0]["collection"]))
+            return {"total_errors": 0}
+
+        queue = make_queue(tmp_path, processor, workers=3)
+        await queue.startup()
+
+        insert_id = await queue.submit(make_operations(1))
+        delete_id = await queue.submit(make_operations(1, operation_type="delete"))
+        other_id = await queue.submit(make_operations(1, "other", "delete"))
+        await wait_until_finished(queue, other_id)
+        release.set()
+        await wait_until_finished(queue, delete_id)
+        await queue.shutdown()
+
+        assert applied == [("delete", "other"), ("insert", "docs"), ("delete", "docs")]
+        assert queue.get_job(insert_id)["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_log_compacted_while_jobs_are_pending(self, tmp_path):
+        """Test that the log stays bounded when the queue never drains."""
+        release = asyncio.Event()
+
+        async def processor(operations):
+            if operations[0]["collection"] == "slow":
+                await release.wait()
+            return {"total_errors": 0}
+
+        queue = make_queue(tmp_path, processor, workers=2, compact_bytes=2000)
+        await queue.startup()
+        slow_id = await queue.submit(make_operations(3, "slow"))
+
+        sizes = []
+        for _ in range(30):
+            await wait_until_finished(queue, await queue.submit(make_operations(3)))
+            sizes.append((tmp_path / "ingest.log").stat().st_size)
+        records = [json.loads(line) for line in open(queue.log_path)]
+        recovered = queue._replay_log()
+        release.set()
+        await wait_until_finished(queue, slow_id)
+        await queue.shutdown()
+
+        assert max(sizes) < 4000
+        assert records[0] == {
+            "type": "job", "job_id": slow_id, "created_at": records[0]["created_at"],
+            "operations": make_operations(3, "slow")
+        }
+        assert list(recovered) == [slow_id]
+
+    @pytest.mark.asyncio
+    async def test_failed_job_reports_error(self, tmp_path):
+        """Test that a processor failure marks the job failed."""
+        processor = AsyncMock(side_effect=RuntimeError("qdrant unavailable"))
+        queue = make_queue(tmp_path, processor)
+        await queue.startup()
+
+        job = await wait_until_finished(queue, await queue.submit(make_operations(1)))
+        await queue.shutdown()
+
+        assert job["status"] == "failed"
+        assert job["error"] == "qdrant unavailable"
@@ -0,0 +1,246 @@
+"""
+Unit Tests for Vector Operations Manager
+========================================
+
+Unit tests for the hana_x_vector.vector_ops.operations module.
+Tests search request coalescing on cache misses, resumable inserts,
+write-behind insert coalescing, registry-backed collection checks,
+cache/keyword index upkeep for batch jobs and transfer error wrapping.
+"""
+
+import asyncio
+import pytest
+import numpy as np
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hana_x_vector.vector_ops.operations import VectorOperationsManager
+from hana_x_vector.qdrant.registry import CollectionInfo, CollectionRegistry
+from hana_x_vector.utils.vector_batch import VectorBatch
+from hana_x_vector.utils.exceptions import VectorOperationError
+
+
+@pytest.fixture
+def operations_manager(mock_redis_client):
+    """Operations manager with Qdrant clients patched out."""
+    with patch("hana_x_vector.vector_ops.operations.QdrantClient"), \
+         patch("hana_x_vector.vector_ops.search.QdrantClient"), \
+         patch("hana_x_vector.vector_ops.batch.QdrantClient"):
+        manager = VectorOperationsManager({"cache": {"enabled": True}})
+
+    mock_redis_client.mget = AsyncMock(return_value=[None, None])
+    mock_redis_client.setex = AsyncMock(return_value=True)
+    manager.cache_manager.redis_client = mock_redis_client
+    return manager
+
+
+class TestSearchCoalescing:
+    """Test cases for single-flight search coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_share_one_request(self, operations_manager):
+        """Test that concurrent cache misses for one key run a single search."""
+        async def slow_search(**kwargs):
+            await asyncio.sleep(0.01)
+            return {"results": [{"id": "1", "score": 0.9}]}
+
+        search = AsyncMock(side_effect=slow_search)
+        operations_manager.search_engine.similarity_search = search
+
+        results = await asyncio.gather(*[
+            operations_manager.similarity_search("docs", [0.1, 0.2, 0.3], limit=5)
+            for _ in range(5)
+        ])
+
+        assert search.await_count == 1
+        assert all(result is results[0] for result in results)
+        assert operations_manager._inflight_searches == {}
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_to_waiters(self, operations_manager):
+        """Test that a failed search is reported to every coalesced caller."""
+        async def failing_search(**kwargs):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("qdrant unavailable")
+
+        operations_manager.search_engine.similarity_search = AsyncMock(side_effect=failing_search)
+
+        results = await asyncio.gather(*[
+            operations_manager.similarity_search("docs", [0.1, 0.2, 0.3])
+            for _ in range(3)
+        ], return_exceptions=True)
+
+        assert all("qdrant unavailable" in str(result) for result in results)
+        assert operations_manager._inflight_searches == {}
+
+    @pytest.mark.asyncio
+    async def test_waits_for_result_when_another_worker_holds_lock(self, operations_manager):
+        """Test that a held cross-worker lock defers to the other worker's result."""
+        cache_manager = operations_manager.cache_manager
+        cache_manager.search_lock_enabled = True
+        cache_manager.redis_client.set = AsyncMock(return_value=None)
+        cache_manager.wait_for_cached_search = AsyncMock(return_value={"results": [], "count": 0})
+        search = AsyncMock()
+        operations_manager.search_engine.similarity_search = search
+
+        result = await operations_manager.similarity_search("docs", [0.1, 0.2, 0.3])
+
+        assert result == {"results": [], "count": 0}
+        search.assert_not_called()
+
+
+class TestResumableInsert:
+    """Test cases for resubmitting only failed points."""
+
+    @pytest.mark.asyncio
+    async def test_only_transient_failures_are_resubmitted(self, operations_manager):
+        """Test that a job retry sends the failed points, not the whole job."""
+        operations_manager.retry_delay = 0
+        calls = []
+
+        async def insert_batch(collection_name, vectors, batch_size, retry_budget):
+            calls.append(list(vectors.ids))
+            if len(calls) == 1:
+                return {
+                    "inserted_count": 2,
+                    "error_count": 2,
+                    "batch_count": 1,
+                    "failed_points": [
+                        {"id": "c", "error": "timeout", "retryable": True},
+                        {"id": "d", "error": "bad payload", "retryable": False}
+                    ]
+                }
+            return {"inserted_count": len(vectors), "error_count": 0, "batch_count": 1, "failed_points": []}
+
+        operations_manager.batch_processor.insert_batch = insert_batch
+        vectors = VectorBatch(["a", "b", "c", "d"], np.ones((4, 3), dtype=np.float32))
+
+        result = await operations_manager._insert_with_retries("docs", vectors, None)
+
+        assert calls == [["a", "b", "c", "d"], ["c"]]
+        assert result["inserted_count"] == 3
+        assert result["error_count"] == 1
+        assert [p["id"] for p in result["failed_points"]] == ["d"]
+
+
+class TestWriteBehindInsert:
+    """Test cases for coalescing small inserts through the write-behind buffer."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_small_inserts_share_one_upsert(self, operations_manager):
+        """Test that concurrent inserts pay the per-insert overhead once."""
+        operations_manager.write_buffer.enabled = True
+        operations_manager._ensure_collection_exists = AsyncMock()
+        operations_manager.cache_manager.invalidate_collection_cache = AsyncMock()
+        operations_manager._insert_with_retries = AsyncMock(
+            side_effect=lambda collection_name, batch, batch_size: {
+                "inserted_count": len(batch), "error_count": 0, "batch_count": 1, "failed_points": []
+            }
+        )
+
+        results = await asyncio.gather(*[
+            operations_manager.insert_vectors("docs", [{"id": f"vec_{i}", "vector": [0.1, 0.2, 0.3]}])
+            for i in range(5)
+        ])
+
+        assert [r["inserted_count"] for r in results] == [1] * 5
+        assert operations_manager._insert_with_retries.await_count == 1
+        assert operations_manager.cache_manager.invalidate_collection_cache.await_count == 1
+
+
+class TestCollectionRegistryChecks:
+    """Test cases for insert-time collection checks served by the registry."""
+
+    @pytest.mark.asyncio
+    async def test_inserts_skip_metadata_round_trips(self, operations_manager):
+        """Test that only the first insert loads collection metadata."""
+        loader = AsyncMock(return_value=CollectionInfo("docs", 3, "Cosine"))
+        operations_manager.collection_registry = CollectionRegistry({}, loader, AsyncMock(return_value=[]))
+        operations_manager._insert_with_retries = AsyncMock(return_value={
+            "inserted_count": 1, "error_count": 0, "batch_count": 1, "failed_points": []
+        })
+        operations_manager.cache_manager.invalidate_collection_cache = AsyncMock()
+
+        for i in range(3):
+            await operations_manager.insert_vectors("docs", [{"id": f"vec_{i}", "vector": [0.1, 0.2, 0.3]}])
+
+        assert loader.await_count == 1
+        operations_manager.qdrant_client.get_collection_info.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_dimension_mismatch_rejected_before_upsert(self, operations_manager):
+        """Test that the cached dimension rejects mismatched vectors."""
+        loader = AsyncMock(return_value=CollectionInfo("docs", 4, "Cosine"))
+        operations_manager.collection_registry = CollectionRegistry({}, loader, AsyncMock(return_value=[]))
+        operations_manager._insert_with_retries = AsyncMock()
+
+        with pytest.raises(VectorOperationError, match="dimension mismatch"):
+            await operations_manager.insert_vectors("docs", [{"id": "a", "vector": [0.1, 0.2, 0.3]}])
+
+        operations_manager._insert_with_retries.assert_not_called()
+
+
+class TestBatchJobs:
+    """Test cases for cache and keyword index upkeep after batch jobs."""
+
+    @pytest.mark.asyncio
+    async def test_batch_invalidates_caches_and_updates_keyword_indexes(self, operations_manager):
+        """Test that a batch chunk refreshes every collection it touched."""
+        operations_manager.batch_processor.process_batch = AsyncMock(return_value={"total_processed": 4})
+        operations_manager.cache_manager.invalidate_collection_cache = AsyncMock()
+        operations_manager.search_engine = MagicMock()
+
+        await operations_manager.batch_insert([
+            {"type": "insert", "collection": "docs", "data": {"id": "a", "vector": [0.1], "metadata": {"text": "x"}}},
+            {"type": "update", "collection": "docs", "vector_id": "b", "metadata": {"text": "y"}},
+            {"type": "delete", "collection": "notes", "vector_id": "c"},
+            {"type": "delete", "collection": "logs", "filters": {"level": "debug"}}
+        ])
+
+        invalidated = {c.args[0] for c in operations_manager.cache_manager.invalidate_collection_cache.await_args_list}
+        assert invalidated == {"docs", "notes", "logs"}
+        operations_manager.search_engine.index_documents.assert_any_call(
+            "docs", [{"id": "a", "vector": [0.1], "metadata": {"text": "x"}}]
+        )
+        operations_manager.search_engine.index_documents.assert_any_call(
+            "docs", [{"id": "b", "metadata": {"text": "y"}}]
+        )
+        operations_manager.search_engine.remove_documents.assert_called_once_with("notes", ["c"])
+        operations_manager.search_engine.drop_keyword_index.assert_called_once_with("logs")
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_still_invalidates(self, operations_manager):
+        """Test that a partly applied batch does not leave stale cache entries."""
+        operations_manager.batch_processor.process_batch = AsyncMock(side_effect=RuntimeError("boom"))
+        operations_manager.cache_manager.invalidate_collection_cache = AsyncMock()
+
+        with pytest.raises(VectorOperationError):
+            await operations_manager.batch_insert([{"type": "delete", "collection": "docs", "vector_id": "a"}])
+
+        operations_manager.cache_manager.invalidate_collection_cache.assert_awaited_once_with("docs")
+
+
+class TestTransferErrors:
+    """Test cases for error reporting from export, import and bulk loads."""
+
+    @pytest.mark.asyncio
+    async def test_import_failure_is_wrapped(self, operations_manager, tmp_path):
+        """Test that a missing manifest surfaces as an import operation error."""
+        with pytest.raises(VectorOperationError) as exc_info:
+            await operations_manager.import_collection(str(tmp_path / "missing"))
+
+        assert exc_info.value.operation == "import"
+        assert operations_manager.metrics.counters["collection_import_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_operation_errors_pass_through_unchanged(self, operations_manager, tmp_path):
+        """Test that loader errors keep their own message and operation."""
+        error = VectorOperationError("Unsupported vector file format", "bulk_load")
+        operations_manager.bulk_loader.load = AsyncMock(side_effect=error)
+        operations_manager._ensure_collection_exists = AsyncMock()
+        np.save(tmp_path / "vectors.npy", np.ones((2, 3), dtype=np.float32))
+
+        with pytest.raises(VectorOperationError) as exc_info:
+            await operations_manager.load_vector_file("docs", str(tmp_path / "vectors.npy"))
+
+        assert exc_info.value is error
+        assert operations_manager.metrics.counters["bulk_load_errors"] == 1
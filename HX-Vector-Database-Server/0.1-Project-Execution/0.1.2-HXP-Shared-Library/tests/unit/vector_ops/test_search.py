@@ -0,0 +1,317 @@
+"""
+Unit Tests for Search Engine
+============================
+
+Unit tests for the hana_x_vector.vector_ops.search module.
+Tests partitioned retrieval, batched multi-vector search, aggregation,
+and BM25-backed hybrid search.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from hana_x_vector.vector_ops.search import SearchEngine
+from hana_x_vector.vector_ops.keyword_index import KeywordIndex
+from hana_x_vector.utils.exceptions import VectorOperationError
+
+
+@pytest.fixture
+def search_engine():
+    """Search engine with the Qdrant client patched out."""
+    with patch("hana_x_vector.vector_ops.search.QdrantClient"):
+        engine = SearchEngine({"search": {"parallel_threshold": 100, "parallel_overlap": 5}})
+    return engine
+
+
+@pytest.fixture
+def ranking():
+    """Ground-truth ranking of 2000 points by descending score."""
+    return [{"id": f"vec_{i}", "score": 1.0 - i * 0.0001, "metadata": {}} for i in range(2000)]
+
+
+class TestParallelSearch:
+    """Test cases for offset-partitioned parallel search."""
+
+    @pytest.mark.asyncio
+    async def test_large_limit_returns_distinct_top_k(self, search_engine, ranking):
+        """Test that pages are merged into the true top-k without duplicates."""
+        async def search_vectors(limit, offset=None, **kwargs):
+            offset = offset or 0
+            return [dict(result) for result in ranking[offset:offset + limit]]
+
+        search_engine.qdrant_client.search_vectors = AsyncMock(side_effect=search_vectors)
+
+        result = await search_engine.similarity_search("docs", [0.1, 0.2, 0.3], limit=500)
+        ids = [r["id"] for r in result["results"]]
+
+        assert ids == [f"vec_{i}" for i in range(500)]
+        assert search_engine.qdrant_client.search_vectors.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_pages_use_offsets_and_deep_enough_ef(self, search_engine, ranking):
+        """Test that each page is requested at its own offset."""
+        search_engine.qdrant_client.search_vectors = AsyncMock(return_value=[])
+
+        await search_engine.similarity_search("docs", [0.1, 0.2, 0.3], limit=250)
+
+        calls = search_engine.qdrant_client.search_vectors.await_args_list
+        assert [call.kwargs["offset"] for call in calls] == [0, 100, 200]
+        assert [call.kwargs["limit"] for call in calls] == [105, 105, 55]
+        assert all(
+            call.kwargs["search_params"]["hnsw_ef"] >= call.kwargs["offset"] + call.kwargs["limit"]
+            for call in calls
+        )
+
+    @pytest.mark.asyncio
+    async def test_drifting_pages_are_deduplicated(self, search_engine, ranking):
+        """Test that a hit returned by two pages appears once."""
+        async def search_vectors(limit, offset=None, **kwargs):
+            # Each page drifts back by three results, overlapping its predecessor
+            start = max((offset or 0) - 3, 0)
+            return [dict(result) for result in ranking[start:start + limit]]
+
+        search_engine.qdrant_client.search_vectors = AsyncMock(side_effect=search_vectors)
+
+        result = await search_engine.similarity_search("docs", [0.1, 0.2, 0.3], limit=300)
+        ids = [r["id"] for r in result["results"]]
+
+        assert len(ids) == len(set(ids)) == 300
+        assert ids == [f"vec_{i}" for i in range(300)]
+
+
+class TestMultiVectorSearch:
+    """Test cases for batched multi-vector search and aggregation."""
+
+    @pytest.fixture
+    def batch_results(self):
+        """Per-query results for two query vectors."""
+        return [
+            [{"id": "a", "score": 0.9, "metadata": {"n": 1}}, {"id": "b", "score": 0.5, "metadata": {}}],
+            [{"id": "b", "score": 0.7, "metadata": {}}, {"id": "c", "score": 0.55, "metadata": {}}]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_queries_sent_in_one_batch(self, search_engine, batch_results):
+        """Test that all query vectors go to Qdrant in a single request."""
+        search_engine.qdrant_client.search_vectors_batch = AsyncMock(return_value=batch_results)
+
+        result = await search_engine.multi_vector_search(
+            "docs", [[0.1, 0.2], [0.3, 0.4]], limit=3, aggregation_method="max"
+        )
+
+        search_engine.qdrant_client.search_vectors_batch.assert_awaited_once()
+        assert result["query_count"] == 2
+        assert [(r["id"], r["score"]) for r in result["results"]] == [("a", 0.9), ("b", 0.7), ("c", 0.55)]
+
+    @pytest.mark.asyncio
+    async def test_unknown_aggregation_raises_operation_error(self, search_engine, batch_results):
+        """Test that an unknown aggregation method is reported as a search error."""
+        search_engine.qdrant_client.search_vectors_batch = AsyncMock(return_value=batch_results)
+
+        with pytest.raises(VectorOperationError) as error:
+            await search_engine.multi_vector_search("docs", [[0.1, 0.2], [0.3, 0.4]], aggregation_method="sum")
+
+        assert error.value.operation == "multi_vector_search"
+
+    def test_average_aggregation(self, search_engine, batch_results):
+        """Test that averages only count queries that returned the point."""
+        results = search_engine._average_aggregation(batch_results, limit=2)
+
+        assert [r["id"] for r in results] == ["a", "b"]
+        assert results[0]["score"] == pytest.approx(0.9)
+        assert results[0]["metadata"] == {"n": 1}
+
+    def test_weighted_aggregation(self, search_engine, batch_results):
+        """Test weighted aggregation with normalized weights."""
+        results = search_engine._weighted_aggregation(batch_results, limit=3, weights=[3.0, 1.0])
+        scores = {r["id"]: r["score"] for r in results}
+
+        assert scores["a"] == pytest.approx(0.675)
+        assert scores["b"] == pytest.approx(0.55)
+        assert scores["c"] == pytest.approx(0.1375)
+
+    def test_empty_results(self, search_engine):
+        """Test aggregation with no hits."""
+        assert search_engine._max_aggregation([[], []], limit=5) == []
+
+    def test_vector_only_copied_when_returned(self, search_engine, batch_results):
+        """Test that aggregated results carry vectors only when Qdrant returned them."""
+        batch_results[0][0]["vector"] = [0.1, 0.2]
+
+        results = {r["id"]: r for r in search_engine._max_aggregation(batch_results, limit=3)}
+
+        assert results["a"]["vector"] == [0.1, 0.2]
+        assert "vector" not in results["b"]
+
+
+class TestSearchProjection:
+    """Test cases for vector/payload projection."""
+
+    @pytest.mark.asyncio
+    async def test_vectors_excluded_by_default(self, search_engine):
+        """Test that searches do not request stored vectors unless asked."""
+        search_engine.qdrant_client.search_vectors = AsyncMock(return_value=[])
+
+        await search_engine.similarity_search("docs", [0.1, 0.2], limit=5)
+
+        kwargs = search_engine.qdrant_client.search_vectors.await_args.kwargs
+        assert kwargs["with_vectors"] is False
+        assert kwargs["with_payload"] is True
+
+    @pytest.mark.asyncio
+    async def test_projection_forwarded_to_every_page(self, search_engine):
+        """Test that parallel pages and batch searches honor the projection."""
+        search_engine.qdrant_client.search_vectors = AsyncMock(return_value=[])
+        search_engine.qdrant_client.search_vectors_batch = AsyncMock(return_value=[[]])
+
+        await search_engine.similarity_search(
+            "docs", [0.1, 0.2], limit=250, with_vectors=True, with_payload=["title"]
+        )
+        await search_engine.multi_vector_search("docs", [[0.1, 0.2]], with_payload=False)
+
+        for call in search_engine.qdrant_client.search_vectors.await_args_list:
+            assert call.kwargs["with_vectors"] is True
+            assert call.kwargs["with_payload"] == ["title"]
+        assert search_engine.qdrant_client.search_vectors_batch.await_args.kwargs["with_payload"] is False
+
+
+class TestKeywordIndex:
+    """Test cases for the BM25 keyword index."""
+
+    def test_ranks_rarer_terms_higher(self):
+        """Test that documents matching rarer query terms rank first."""
+        index = KeywordIndex()
+        index.add("a", "vector database server")
+        index.add("b", "vector search engine")
+        index.add("c", "relational database")
+
+        hits = index.search("vector engine", 10)
+
+        assert [doc_id for doc_id, _ in hits] == ["b", "a"]
+
+    def test_readd_and_remove_update_postings(self):
+        """Test that re-indexing replaces and removal drops a document."""
+        index = KeywordIndex()
+        index.add("a", "alpha beta")
+        index.add("a", "gamma")
+
+        assert index.search("alpha", 10) == []
+        assert index.search("gamma", 10)[0][0] == "a"
+
+        index.remove("a")
+
+        assert len(index) == 0
+        assert index.postings == {}
+        assert index.total_length == 0
+
+
+class TestHybridSearch:
+    """Test cases for hybrid search rank fusion."""
+
+    @pytest.fixture
+    def hybrid_engine(self, search_engine):
+        """Search engine over a small text corpus."""
+        search_engine.qdrant_client.scroll_page = AsyncMock(return_value={
+            "points": [
+                {"id": "a", "metadata": {"text_content": "quarterly revenue report"}},
+                {"id": "b", "metadata": {"text_content": "revenue forecast"}},
+                {"id": "c", "metadata": {"text_content": "team offsite agenda"}},
+            ],
+            "next_offset": None
+        })
+        search_engine.qdrant_client.search_vectors = AsyncMock(return_value=[
+            {"id": "c", "score": 0.9, "metadata": {"text_content": "team offsite agenda"}},
+            {"id": "a", "score": 0.5, "metadata": {"text_content": "quarterly revenue report"}},
+        ])
+        search_engine.qdrant_client.retrieve_points = AsyncMock(return_value=[
+            {"id": "b", "metadata": {"text_content": "revenue forecast"}}
+        ])
+        return search_engine
+
+    @pytest.mark.asyncio
+    async def test_rrf_rewards_agreement_between_rankers(self, hybrid_engine):
+        """Test that a hit found by both rankers outranks single-source hits."""
+        result = await hybrid_engine.hybrid_search(
+            "docs", [0.1, 0.2], text_query="quarterly revenue", limit=3,
+            vector_weight=0.5, text_weight=0.5
+        )
+        ids = [r["id"] for r in result["results"]]
+
+        assert ids[0] == "a"
+        assert set(ids) == {"a", "b", "c"}
+        assert result["results"][0]["sources"] == ["vector", "text"]
+        assert result["fusion"] == "rrf"
+
+    @pytest.mark.asyncio
+    async def test_text_only_hits_receive_metadata(self, hybrid_engine):
+        """Test that payloads are fetched for hits the vector search missed."""
+        result = await hybrid_engine.hybrid_search("docs", [0.1, 0.2], text_query="forecast", limit=3)
+        text_only = next(r for r in result["results"] if r["id"] == "b")
+
+        assert text_only["metadata"] == {"text_content": "revenue forecast"}
+        assert text_only["vector_score"] is None
+        hybrid_engine.qdrant_client.retrieve_points.assert_awaited_once_with(
+            "docs", ["b"], with_vectors=False, with_payload=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_keyword_index_built_once_and_updated_incrementally(self, hybrid_engine):
+        """Test that the index is scrolled once and kept current by writes."""
+        await hybrid_engine._text_search("docs", "revenue", 10, None)
+        hybrid_engine.index_documents("docs", [{"id": "d", "metadata": {"text_content": "revenue audit"}}])
+        hybrid_engine.remove_documents("docs", ["a"])
+
+        hits = await hybrid_engine._text_search("docs", "revenue", 10, None)
+
+        assert {hit["id"] for hit in hits} == {"b", "d"}
+        hybrid_engine.qdrant_client.scroll_page.assert_awaited_once()
+        assert hybrid_engine.qdrant_client.scroll_page.await_args.kwargs["with_vectors"] is False
+
+    @pytest.mark.asyncio
+    async def test_stale_index_served_while_rebuilt_in_background(self, hybrid_engine):
+        """Test that an expired index is refreshed without blocking searches."""
+        await hybrid_engine._text_search("docs", "revenue", 10, None)
+        hybrid_engine.keyword_index_ttl = 0
+        release = asyncio.Event()
+
+        async def slow_scroll(**kwargs):
+            await release.wait()
+            return {"points": [{"id": "e", "metadata": {"text_content": "revenue plan"}}], "next_offset": None}
+
+        hybrid_engine.qdrant_client.scroll_page = AsyncMock(side_effect=slow_scroll)
+
+        stale = await asyncio.wait_for(hybrid_engine._text_search("docs", "revenue", 10, None), timeout=1.0)
+        await asyncio.sleep(0)
+        hybrid_engine.index_documents("docs", [{"id": "d", "metadata": {"text_content": "revenue audit"}}])
+        await hybrid_engine._text_search("docs", "revenue", 10, None)
+        release.set()
+        await asyncio.gather(*hybrid_engine._keyword_index_refreshes.values())
+        hybrid_engine.keyword_index_ttl = 300
+
+        fresh = await hybrid_engine._text_search("docs", "revenue", 10, None)
+
+        assert {hit["id"] for hit in stale} == {"a", "b"}
+        assert {hit["id"] for hit in fresh} == {"d", "e"}
+        hybrid_engine.qdrant_client.scroll_page.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_filters_restrict_text_hits(self, hybrid_engine):
+        """Test that keyword hits are checked against the metadata filters."""
+        hybrid_engine.qdrant_client.scroll_points = AsyncMock(return_value=[{"id": "b", "metadata": {}}])
+
+        hits = await hybrid_engine._text_search("docs", "revenue", 10, {"must": []})
+
+        assert [hit["id"] for hit in hits] == ["b"]
+
+    def test_normalized_fusion(self, search_engine):
+        """Test min-max normalized score fusion."""
+        search_engine.hybrid_fusion = "normalized"
+        combined = search_engine._combine_hybrid_results(
+            [{"id": "a", "score": 0.9}, {"id": "b", "score": 0.3}],
+            [{"id": "b", "score": 12.0}, {"id": "c", "score": 4.0}],
+            0.5, 0.5, 10
+        )
+        scores = {r["id"]: r["score"] for r in combined}
+
+        assert scores == {"a": 0.5, "b": 0.5, "c": 0.0}
@@ -0,0 +1,179 @@
+"""
+Unit Tests for Collection Transfer
+==================================
+
+Unit tests for the hana_x_vector.vector_ops.transfer module.
+Tests partitioned scroll export, checkpoint resume, and segment import.
+"""
+
+import json
+import time
+import uuid
+import pytest
+import numpy as np
+from unittest.mock import Mock
+
+from hana_x_vector.vector_ops import transfer
+from hana_x_vector.vector_ops.transfer import (
+    CollectionExporter,
+    CollectionImporter,
+    read_segment,
+    uuid_boundaries
+)
+from hana_x_vector.utils.exceptions import VectorOperationError
+
+
+class FakeCollection:
+    """In-memory collection that scrolls in Qdrant id order."""
+
+    def __init__(self, count, fail_after=None):
+        ids = sorted((str(uuid.UUID(int=(i * 7919) << 100)) for i in range(count)), key=lambda i: uuid.UUID(i).int)
+        self.points = [
+            {"id": point_id, "vector": [float(n), 0.5], "metadata": {"n": n}}
+            for n, point_id in enumerate(ids)
+        ]
+        self.calls = 0
+        self.fail_after = fail_after
+
+    async def scroll_page(self, collection_name, limit=100, offset=None, **kwargs):
+        self.calls += 1
+        if self.fail_after is not None and self.calls > self.fail_after:
+            raise ConnectionError("scroll interrupted")
+
+        start = 0
+        if offset is not None:
+            start = next(
+                (i for i, p in enumerate(self.points) if uuid.UUID(p["id"]).int >= uuid.UUID(offset).int),
+                len(self.points)
+            )
+        page = self.points[start:start + limit]
+        following = self.points[start + limit:start + limit + 1]
+        return {"points": page, "next_offset": following[0]["id"] if following else None}
+
+
+def make_exporter(collection, **overrides):
+    """Exporter with small pages and segments."""
+    config = {"page_size": 3, "segment_size": 4, "partitions": 2, "parallelism": 2}
+    config.update(overrides)
+    client = Mock()
+    client.scroll_page = collection.scroll_page
+    return CollectionExporter({"transfer": config}, client)
+
+
+class TestCollectionExport:
+    """Test cases for the partitioned, checkpointed exporter."""
+
+    def test_uuid_boundaries_split_evenly(self):
+        """Test UUID range boundaries."""
+        assert uuid_boundaries(2) == ["80000000-0000-0000-0000-000000000000"]
+        assert len(uuid_boundaries(4)) == 3
+
+    @pytest.mark.asyncio
+    async def test_export_writes_every_point_once(self, tmp_path):
+        """Test that partitions cover the collection without overlap."""
+        collection = FakeCollection(20)
+
+        result = await make_exporter(collection).export_collection("docs", str(tmp_path))
+
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        exported = [
+            point_id
+            for partition in manifest["partitions"]
+            for segment in partition["segments"]
+            for point_id in read_segment(str(tmp_path), segment["name"]).ids
+        ]
+        assert result["exported_count"] == 20
+        assert result["dimension"] == 2
+        assert sorted(exported) == sorted(p["id"] for p in collection.points)
+        assert all(partition["done"] for partition in manifest["partitions"])
+
+    @pytest.mark.asyncio
+    async def test_interrupted_export_resumes_from_checkpoint(self, tmp_path):
+        """Test that a rerun continues from the saved cursors."""
+        with pytest.raises(VectorOperationError):
+            await make_exporter(FakeCollection(20, fail_after=3), parallelism=1).export_collection("docs", str(tmp_path))
+
+        collection = FakeCollection(20)
+        result = await make_exporter(collection, parallelism=1).export_collection("docs", str(tmp_path))
+
+        assert result["exported_count"] == 20
+        assert collection.calls < 9
+
+    @pytest.mark.asyncio
+    async def test_every_checkpoint_matches_its_segments(self, tmp_path, monkeypatch):
+        """Test that concurrent partitions never save a cursor ahead of its segments."""
+        collection = FakeCollection(20)
+        order = [uuid.UUID(p["id"]).int for p in collection.points]
+        snapshots = []
+        write_text = transfer._write_text
+
+        def slow_write(path, text):
+            time.sleep(0.005)
+            snapshots.append(json.loads(text))
+            write_text(path, text)
+
+        monkeypatch.setattr(transfer, "_write_text", slow_write)
+        await make_exporter(collection, page_size=2, segment_size=2).export_collection("docs", str(tmp_path))
+
+        assert len(snapshots) > 4
+        for manifest in snapshots:
+            for partition in manifest["partitions"]:
+                low = uuid.UUID(partition["start"]).int if partition["start"] else 0
+                if partition["next_offset"] is not None:
+                    high = uuid.UUID(partition["next_offset"]).int
+                elif partition["done"] and partition["end"]:
+                    high = uuid.UUID(partition["end"]).int
+                elif partition["done"]:
+                    high = 1 << 128
+                else:
+                    high = low
+                covered = sum(1 for key in order if low <= key < high)
+                assert partition["points"] == covered
+                assert sum(s["points"] for s in partition["segments"]) == covered
+
+    @pytest.mark.asyncio
+    async def test_segments_are_float32_blocks(self, tmp_path):
+        """Test the columnar segment layout."""
+        await make_exporter(FakeCollection(5), partitions=1, page_size=4).export_collection("docs", str(tmp_path))
+
+        vectors = np.load(tmp_path / "part-0000-000000.npy")
+        rows = [json.loads(line) for line in open(tmp_path / "part-0000-000000.payload.jsonl")]
+
+        assert vectors.dtype == np.float32
+        assert vectors.shape == (4, 2)
+        assert rows[0]["payload"] == {"n": 0}
+
+
+class TestCollectionImport:
+    """Test cases for the parallel, resumable importer."""
+
+    @pytest.mark.asyncio
+    async def test_import_feeds_batch_processor_and_skips_done_segments(self, tmp_path):
+        """Test segment import and checkpoint-based resume."""
+        await make_exporter(FakeCollection(10)).export_collection("docs", str(tmp_path))
+        inserted = []
+
+        async def insert_batch(collection_name, batch):
+            inserted.extend(batch.ids)
+            return {"inserted_count": len(batch), "error_count": 0}
+
+        processor = Mock()
+        processor.insert_batch = insert_batch
+        importer = CollectionImporter({"transfer": {"parallelism": 2}}, processor)
+
+        first = await importer.import_collection(str(tmp_path), "copy")
+        second = await importer.import_collection(str(tmp_path), "copy")
+
+        assert first["inserted_count"] == 10
+        assert len(set(inserted)) == 10
+        assert second["inserted_count"] == 0
+        assert second["skipped_segments"] == first["segment_count"]
+
+    @pytest.mark.asyncio
+    async def test_incomplete_export_is_rejected(self, tmp_path):
+        """Test that an unfinished export cannot be imported."""
+        (tmp_path / "manifest.json").write_text(json.dumps({"format": "hana-x-vector-export", "done": False}))
+        importer = CollectionImporter({}, Mock())
+
+        with pytest.raises(VectorOperationError):
+            await importer.import_collection(str(tmp_path))
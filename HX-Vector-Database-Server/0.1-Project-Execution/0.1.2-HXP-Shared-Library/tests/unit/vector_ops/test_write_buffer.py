@@ -0,0 +1,167 @@
+"""
+Unit Tests for Write-Behind Buffer
+==================================
+
+Unit tests for the hana_x_vector.vector_ops.write_buffer module.
+Tests micro-batch coalescing, per-caller results and flush ordering.
+"""
+
+import asyncio
+import pytest
+import numpy as np
+
+from hana_x_vector.vector_ops.write_buffer import WriteBehindBuffer
+from hana_x_vector.utils.vector_batch import VectorBatch
+from hana_x_vector.utils.exceptions import RateLimitError
+
+
+def make_batch(*ids):
+    """Small batch of 3-dimensional vectors."""
+    return VectorBatch(list(ids), np.ones((len(ids), 3), dtype=np.float32))
+
+
+def make_buffer(flushed, failed_ids=(), **overrides):
+    """Buffer whose flushes are recorded and fail the given ids."""
+    config = {"enabled": True, "max_batch_points": 4, "max_delay": 0.01}
+    config.update(overrides)
+
+    async def flush(collection_name, batch):
+        flushed.append((collection_name, list(batch.ids)))
+        await asyncio.sleep(0)
+        return {
+            "inserted_count": len(batch),
+            "batch_count": 1,
+            "failed_points": [
+                {"id": point_id, "error": "rejected", "retryable": False}
+                for point_id in batch.ids if point_id in failed_ids
+            ]
+        }
+
+    return WriteBehindBuffer({"write_behind": config}, flush)
+
+
+class TestWriteBehindBuffer:
+    """Test cases for write-behind micro-batching."""
+
+    @pytest.mark.asyncio
+    async def test_small_inserts_flush_together_at_deadline(self):
+        """Test that inserts arriving within max_delay share one upsert."""
+        flushed = []
+        buffer = make_buffer(flushed)
+
+        results = await asyncio.gather(
+            buffer.submit("docs", make_batch("a")),
+            buffer.submit("docs", make_batch("b")),
+            buffer.submit("other", make_batch("c"))
+        )
+
+        assert sorted(flushed) == [("docs", ["a", "b"]), ("other", ["c"])]
+        assert [r["inserted_count"] for r in results] == [1, 1, 1]
+        assert results[0]["coalesced_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_full_micro_batch_flushes_without_waiting(self):
+        """Test that reaching max_batch_points flushes before the deadline."""
+        flushed = []
+        buffer = make_buffer(flushed, max_delay=10.0)
+
+        first = buffer.submit("docs", make_batch("a", "b"))
+        second = buffer.submit("docs", make_batch("c", "d"))
+        await asyncio.wait_for(asyncio.gather(first, second), timeout=1.0)
+
+        assert flushed == [("docs", ["a", "b", "c", "d"])]
+
+    @pytest.mark.asyncio
+    async def test_failed_points_go_to_their_caller(self):
+        """Test that each future only reports its own failed points."""
+        buffer = make_buffer([], failed_ids={"b"})
+
+        first, second = await asyncio.gather(
+            buffer.submit("docs", make_batch("a")),
+            buffer.submit("docs", make_batch("b", "c"))
+        )
+
+        assert first["failed_points"] == []
+        assert second["inserted_count"] == 1
+        assert [p["id"] for p in second["failed_points"]] == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_flush_error_fails_every_caller(self):
+        """Test that a failed upsert is raised to all callers of the micro-batch."""
+        async def flush(collection_name, batch):
+            raise ConnectionError("unavailable")
+
+        buffer = WriteBehindBuffer({"write_behind": {"enabled": True, "max_delay": 0.001}}, flush)
+        futures = [buffer.submit("docs", make_batch(i)) for i in ("a", "b")]
+
+        results = await asyncio.gather(*futures, return_exceptions=True)
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert buffer.get_stats()["queued_points"] == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_cancels_callers(self):
+        """Test that a flush cancelled on shutdown does not leave callers waiting."""
+        started = asyncio.Event()
+
+        async def flush(collection_name, batch):
+            started.set()
+            await asyncio.sleep(10)
+
+        buffer = WriteBehindBuffer({"write_behind": {"enabled": True, "max_delay": 0.001}}, flush)
+        future = buffer.submit("docs", make_batch("a"))
+        await started.wait()
+
+        for task in list(buffer._flush_tasks):
+            task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(future, timeout=1.0)
+        assert buffer.get_stats()["queued_points"] == {}
+
+    @pytest.mark.asyncio
+    async def test_disabled_buffer_writes_through(self):
+        """Test that a disabled buffer upserts each insert without waiting."""
+        flushed = []
+        buffer = make_buffer(flushed, enabled=False, max_delay=10.0)
+
+        await asyncio.wait_for(
+            asyncio.gather(buffer.submit("docs", make_batch("a")), buffer.submit("docs", make_batch("b"))),
+            timeout=1.0
+        )
+
+        assert flushed == [("docs", ["a"]), ("docs", ["b"])]
+
+    @pytest.mark.asyncio
+    async def test_flushes_of_a_collection_run_in_order(self):
+        """Test that a later micro-batch waits for the earlier one."""
+        order = []
+        release = asyncio.Event()
+
+        async def flush(collection_name, batch):
+            order.append(("start", batch.ids[0]))
+            if batch.ids[0] == "a":
+                await release.wait()
+            order.append(("end", batch.ids[0]))
+            return {"inserted_count": len(batch), "batch_count": 1, "failed_points": []}
+
+        buffer = WriteBehindBuffer({"write_behind": {"max_batch_points": 1}}, flush)
+        first = buffer.submit("docs", make_batch("a"))
+        second = buffer.submit("docs", make_batch("b"))
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(first, second)
+
+        assert order == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_rejects_inserts(self):
+        """Test backpressure once too many points are unflushed."""
+        buffer = make_buffer([], max_pending_points=2, max_delay=10.0)
+        buffer.submit("docs", make_batch("a", "b"))
+
+        with pytest.raises(RateLimitError):
+            buffer.submit("docs", make_batch("c"))
+
+        await buffer.flush()
+        assert buffer.get_stats()["queued_points"] == {}